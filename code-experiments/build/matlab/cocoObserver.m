@@ -66,6 +66,32 @@
 %                              of integer variables (in mixed-integer problems)
 %                              are logged as integers (1) or not (0 - in this case 
 %                              they are logged as doubles). The default value is 0.
+%                      "crash_safe: VALUE" determines whether the loggers flush
+%                              their files after each written line (1), such
+%                              that all lines written before a crash of the
+%                              process are in the files, or buffer their output
+%                              (0). A run is only complete in the .info files
+%                              once its problem is freed. The bbob logger lists
+%                              a run in its .info file when the run starts, such
+%                              that runs interrupted by a crash are listed
+%                              without their final number of evaluations and
+%                              f-value. The default value is 0.
+%                      "output_buffer_size: VALUE" defines the size in bytes of
+%                              the output buffer of each file written by a
+%                              logger when not in the crash-safe mode. The
+%                              default value is 65536.
+%                      "flush_interval: VALUE" defines the number of seconds
+%                              after which buffered output is written to the
+%                              files at the latest. If VALUE is 0, files are only
+%                              written when their buffer is full or when the
+%                              problem is freed. The default value is 10.
+%                      "timing: VALUE" determines whether the time spent
+%                              evaluating each observed problem and the time
+%                              spent by its logger are measured (1) or not (0).
+%                              The bbob observer writes them, together with the
+%                              time spent constructing the problem, into the
+%                              comment lines of the .info files. The default
+%                              value is 0.
 %
 % Returns:
 %   The constructed observer object or NULL if observer_name equals NULL, "" or
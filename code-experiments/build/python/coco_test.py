@@ -111,6 +111,7 @@ def run_doctests():
         print("  CAVEAT: doctest OF cocoex.interface IS, FOR SOME REASON, " +
               "INEFFECTIVE IN PYTHON 2 ")
     testmod(interface)
+    testmod(ex.parallel)
     testmod(example_experiment)
 
 
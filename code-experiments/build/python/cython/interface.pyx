@@ -2,6 +2,7 @@
 #cython: c_string_type=str, c_string_encoding=ascii
 from __future__ import absolute_import, division, print_function, unicode_literals
 import sys
+import threading
 import numpy as np
 cimport numpy as np
 
@@ -41,16 +42,18 @@ cdef extern from "coco.h":
     void coco_problem_free(coco_problem_t *problem)
 
     void coco_problem_get_initial_solution(coco_problem_t *problem, double *x)
-    void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y)
-    void coco_evaluate_constraint(coco_problem_t *problem, const double *x, double *y)
+    void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y) nogil
+    void coco_evaluate_constraint(coco_problem_t *problem, const double *x, double *y) nogil
     void coco_recommend_solution(coco_problem_t *problem, const double *x)
 
     int coco_logger_biobj_feed_solution(coco_problem_t *problem, const size_t evaluation, const double *y)
+    size_t coco_logger_biobj_feed_solutions(coco_problem_t *problem, const size_t number_of_solutions,
+                                            const size_t *evaluations, const double *y, int *updates) nogil
     coco_problem_t *coco_suite_get_problem_by_function_dimension_instance(coco_suite_t *suite, const size_t function,
                                                                           const size_t dimension, const size_t instance)
 
     coco_problem_t* coco_suite_get_next_problem(coco_suite_t*, coco_observer_t*)
-    coco_problem_t* coco_suite_get_problem(coco_suite_t *, const size_t)
+    coco_problem_t* coco_suite_get_problem(coco_suite_t *, const size_t) nogil
 
     size_t coco_problem_get_suite_dep_index(const coco_problem_t* problem)
     size_t coco_problem_get_dimension(const coco_problem_t *problem)
@@ -65,11 +68,21 @@ cdef extern from "coco.h":
     # double coco_problem_get_final_target_fvalue1(const coco_problem_t *problem)
     size_t coco_problem_get_evaluations(const coco_problem_t *problem)
     size_t coco_problem_get_evaluations_constraints(const coco_problem_t *problem)
+    double coco_problem_get_construction_time(const coco_problem_t *problem)
+    double coco_problem_get_evaluation_time(const coco_problem_t *problem)
+    double coco_problem_get_logging_time(const coco_problem_t *problem)
     double coco_problem_get_best_observed_fvalue1(const coco_problem_t *problem)
     int coco_problem_final_target_hit(const coco_problem_t *problem)
     void bbob_problem_best_parameter_print(const coco_problem_t *problem)
     void bbob_biobj_problem_best_parameter_print(const coco_problem_t *problem)
 
+cdef _parse_id(id, substr):
+    "search `substr` in `id` and return converted `int` up to '_'"
+    i = id.find(substr)
+    if i < 0:
+        raise ValueError()
+    return int(id[i + len(substr):].split('_')[0])
+
 cdef bytes _bstring(s):
     if type(s) is bytes:
         return <bytes>s
@@ -78,8 +91,6 @@ cdef bytes _bstring(s):
     else:
         raise TypeError("expect a string, got %s" % str(type(s)))
 
-cdef coco_observer_t* _current_observer
-
 cdef class Suite:
     """see __init__.py"""
     cdef coco_suite_t* suite  # AKA _self
@@ -90,13 +101,21 @@ cdef class Suite:
     cdef current_problem_  # name _current_problem is taken
     cdef _current_index
     cdef _ids
+    cdef _ids_array  # for vectorized searches in `ids`
+    cdef _index_of_id
+    cdef _index_of_fdi  # (function, dimension, instance) -> index
+    cdef _problem_table
     cdef _indices
     cdef _names
     cdef _dimensions
     cdef _number_of_objectives
     cdef initialized
+    cdef _prefetch
+    cdef _prefetch_thread
+    cdef coco_problem_t* _prefetched_problem
+    cdef _prefetched_index
 
-    def __cinit__(self, suite_name, suite_instance, suite_options):
+    def __cinit__(self, suite_name, suite_instance, suite_options, prefetch=False):
         cdef np.npy_intp shape[1]  # probably completely useless
         self._name = _bstring(suite_name)
         self._instance = _bstring(suite_instance if suite_instance is not None else "")
@@ -104,6 +123,10 @@ cdef class Suite:
         self._current_problem = NULL
         self.current_problem_ = None
         self._current_index = None
+        self._prefetch = bool(prefetch)
+        self._prefetch_thread = None
+        self._prefetched_problem = NULL
+        self._prefetched_index = None
         self.initialized = False
         self._initialize()
         assert self.initialized
@@ -155,11 +178,56 @@ also report back a missing name to https://github.com/numbbo/coco/issues
             self._number_of_objectives.append(coco_problem_get_number_of_objectives(p))
         coco_suite_free(suite)
         self.suite = coco_suite(self._name, self._instance, self._options)
+        self._initialize_index()
         self.initialized = True
         return self
+    cdef _initialize_index(self):
+        """precompute the lookup tables for `get_problem` and `ids` and the
+        `problem_table`"""
+        def parse(id, substr):
+            try:
+                return _parse_id(id, substr)
+            except ValueError:
+                return 0
+        self._ids_array = np.array(self._ids, dtype=str)
+        self._index_of_id = dict((id, index) for index, id in enumerate(self._ids))
+        table = np.zeros(len(self._ids), dtype=[('index', np.intp), ('function', np.intp),
+                                                ('dimension', np.intp), ('instance', np.intp)])
+        table['index'] = np.arange(len(self._ids))
+        table['function'] = [parse(id, '_f') for id in self._ids]
+        table['dimension'] = self._dimensions
+        table['instance'] = [parse(id, '_i') for id in self._ids]
+        table.flags.writeable = False
+        self._problem_table = table
+        self._index_of_fdi = {}
+        for index, function, dimension, instance in table.tolist():
+            self._index_of_fdi.setdefault((function, dimension, instance), index)
+    def _prefetch_problem(self, size_t index):
+        """construct the problem with C index `index` without observer,
+        executed in the background thread started by `next_problem`"""
+        cdef coco_suite_t* suite = self.suite
+        cdef coco_problem_t* problem
+        with nogil:
+            problem = coco_suite_get_problem(suite, index)
+        self._prefetched_problem = problem
+    cdef _join_prefetch(self, free=True):
+        """wait for the background construction of the next problem to finish
+        and, if `free`, free the prefetched problem.
+
+        Every method which constructs problems or frees the suite calls this
+        first, such that at most one problem is constructed at a time.
+        """
+        if self._prefetch_thread is not None:
+            self._prefetch_thread.join()
+            self._prefetch_thread = None
+        if free and self._prefetched_problem != NULL:
+            coco_problem_free(self._prefetched_problem)
+            self._prefetched_problem = NULL
+            self._prefetched_index = None
     def reset(self):
         """reset to original state, affecting `next_problem()`,
         `current_problem`, `current_index`"""
+        self._join_prefetch()
         self._current_index = None
         if self.current_problem_:
             self.current_problem_.free()
@@ -170,9 +238,13 @@ also report back a missing name to https://github.com/numbbo/coco/issues
         `Suite`, on the first call or after `reset()` the first problem.
 
         `next_problem` serves to sweep through the `Suite` smoothly.
+
+        With ``prefetch=True``, the problem after the returned one is
+        constructed in a background thread while the returned one is
+        solved. The observer is only added when the prefetched problem is
+        returned by the next call.
         """
         cdef size_t index
-        global _current_observer
         if not self.initialized:
             raise ValueError("Suite has been finalized/free'ed")
         if self.current_problem_:
@@ -180,22 +252,37 @@ also report back a missing name to https://github.com/numbbo/coco/issues
         if self._current_index is None:
             self._current_index = -1
         self._current_index += 1
+        self._join_prefetch(free=False)
         if self._current_index >= len(self):
+            self._join_prefetch()
             self._current_problem = NULL
             self.current_problem_ = None
             # self._current_index = -1  # or use reset?
         else:
-            index = self.indices[self._current_index]  # "conversion" to size_t
-            self._current_problem = coco_suite_get_problem(
-                                        self.suite, index)
+            if self._prefetched_index == self._current_index:
+                self._current_problem = self._prefetched_problem
+                self._prefetched_problem = NULL
+                self._prefetched_index = None
+            else:
+                self._join_prefetch()
+                index = self._indices[self._current_index]  # "conversion" to size_t
+                self._current_problem = coco_suite_get_problem(
+                                            self.suite, index)
             self.current_problem_ = Problem_init(self._current_problem,
                                                 True, self._name)
+            if self._prefetch and self._current_index + 1 < len(self):
+                self._prefetched_index = self._current_index + 1
+                self._prefetch_thread = threading.Thread(
+                    target=self._prefetch_problem,
+                    args=(self._indices[self._prefetched_index],))
+                self._prefetch_thread.daemon = True
+                self._prefetch_thread.start()
             self.current_problem_.observe_with(observer)
         return self.current_problem_
     def get_problem(self, id, observer=None):
         """`get_problem(self, id, observer=None)` returns a `Problem` instance,
-        by default unobserved, using `id: str` or index (where `id: int`) to
-        identify the desired problem.
+        by default unobserved, using `id: str`, index (where `id: int`) or
+        `(function, dimension, instance)` tuple to identify the desired problem.
 
         All values between zero and `len(self) - 1` are valid index values::
 
@@ -225,11 +312,17 @@ also report back a missing name to https://github.com/numbbo/coco/issues
         """
         if not self.initialized:
             raise ValueError("Suite has been finalized/free'ed")
-        index = id
-        try:
-            1 / (id == int(id))  # int(id) might raise an exception
-        except:
-            index = self._ids.index(id)
+        self._join_prefetch(free=False)
+        if isinstance(id, tuple):
+            index = self._index_of_fdi.get(tuple(int(i) for i in id))
+        else:
+            index = id
+            try:
+                1 / (id == int(id))  # int(id) might raise an exception
+            except:
+                index = self._index_of_id.get(id)
+        if index is None:
+            raise ValueError("%s is not a problem of the suite" % repr(id))
         try:
             return Problem_init(coco_suite_get_problem(self.suite, self._indices[index]),
                                 True, self._name).observe_with(observer)
@@ -266,6 +359,7 @@ also report back a missing name to https://github.com/numbbo/coco/issues
 
         if not self.initialized:
             raise ValueError("Suite has been finalized/free'ed")
+        self._join_prefetch(free=False)
         try:
             return Problem_init(coco_suite_get_problem_by_function_dimension_instance(self.suite, _function,
                                                                                       _dimension, _instance),
@@ -282,11 +376,13 @@ also report back a missing name to https://github.com/numbbo/coco/issues
 
     def free(self):
         """free underlying C structures"""
+        self._join_prefetch()
         if self.suite:  # for some reason __dealloc__ cannot be called here
             coco_suite_free(self.suite)
         self.suite = NULL
         self.initialized = False  # not (yet) visible from outside
     def __dealloc__(self):
+        self._join_prefetch()
         if self.suite:
             coco_suite_free(self.suite)
 
@@ -335,11 +431,14 @@ also report back a missing name to https://github.com/numbbo/coco/issues
 
         """
         res = []
-        for idx, id in enumerate(self._ids):
-            if all([id.find(i) >= 0 for i in id_snippets]):
-                if verbose:
-                    print("  id=%s, index=%d" % (id, idx))
-                res.append(id)
+        is_match = np.ones(len(self._ids), dtype=bool)
+        for snippet in id_snippets:
+            is_match &= np.char.find(self._ids_array, snippet) >= 0
+        for idx in np.nonzero(is_match)[0]:
+            id = self._ids[idx]
+            if verbose:
+                print("  id=%s, index=%d" % (id, idx))
+            res.append(id)
         if get_problem:
             return self.get_problem(res[0])
         return res
@@ -379,6 +478,15 @@ also report back a missing name to https://github.com/numbbo/coco/issues
         """list of number of objectives occuring in this `Suite`"""
         return sorted(set(self._number_of_objectives))
     @property
+    def problem_table(self):
+        """see __init__.py"""
+        return self._problem_table
+    @property
+    def prefetch(self):
+        """whether `next_problem` constructs the next problem in the
+        background, see `__init__`"""
+        return self._prefetch
+    @property
     def indices(self):
         """list of all problem indices, deprecated.
 
@@ -405,6 +513,8 @@ also report back a missing name to https://github.com/numbbo/coco/issues
     def info(self):
         return str(self)
     def __repr__(self):
+        if self._prefetch:
+            return 'Suite(%r, %r, %r, prefetch=True)'  % (self.name, self.instance, self.options)
         return 'Suite(%r, %r, %r)'  % (self.name, self.instance, self.options)  # angled brackets
     def __str__(self):
         return 'Suite("%s", "%s", "%s") with %d problem%s in dimension%s %s' \
@@ -460,12 +570,6 @@ cdef class Observer:
         self._observer = coco_observer(self._name, self._options)
         self._state = 'initialized'
 
-    def _update_current_observer_global(self):
-        """assign the global _current_observer variable to self._observer,
-        for purely technical reasons"""
-        global _current_observer
-        _current_observer = self._observer
-
     def observe(self, problem):
         """`observe(problem)` let `self` observe the `problem: Problem` by
         calling `problem.observe_with(self)`.
@@ -490,7 +594,8 @@ cdef class Observer:
         return coco_observer_get_result_folder(self._observer)
 
     def free(self):
-        self.__dealloc__()
+        if self._observer != NULL:
+            coco_observer_free(self._observer)
         self._observer = NULL
         self._state = 'deactivated'
     def __dealloc__(self):
@@ -624,6 +729,49 @@ cdef class Problem:
             raise InvalidProblemException()
         return coco_logger_biobj_feed_solution(self.problem, _evaluation, <double *>np.PyArray_DATA(_y))
 
+    def logger_biobj_feed_solutions(self, evaluations, Y):
+        """Feed the given solutions to logger_biobj in order to reconstruct its
+        output, like `logger_biobj_feed_solution` but in a single call.
+
+        `evaluations` are the increasing evaluation numbers of the solutions
+        and `Y` their objective vectors, one per row. Return an `int` array
+        with 1 for each solution that updated the archive and 0 otherwise.
+
+        The solutions are fed in a loop in C without holding the GIL, which
+        is much faster than calling `logger_biobj_feed_solution` for each
+        solution.
+        """
+        cdef np.ndarray[np.uintp_t, ndim=1, mode="c"] _evaluations
+        cdef np.ndarray[double, ndim=2, mode="c"] _Y
+        cdef np.ndarray[int, ndim=1, mode="c"] _updates
+        cdef coco_problem_t *problem = self.problem
+        cdef size_t number_of_solutions
+        cdef size_t *evaluations_data
+        cdef double *y
+        cdef int *updates
+        evaluations = np.asarray(evaluations)
+        Y = np.array(Y, copy=False, dtype=np.double, order='C', ndmin=2)
+        if evaluations.ndim != 1 or Y.shape != (len(evaluations), self.number_of_objectives):
+            raise ValueError(
+                "Shape, `np.shape(Y)==%s`, of input `Y` does not match " % str(Y.shape) +
+                "the number of evaluations `len(evaluations)==%d` " % len(evaluations) +
+                "and the number of objectives `number_of_objectives==%d`."
+                % self.number_of_objectives)
+        if len(evaluations) and (evaluations[0] < 1 or np.any(np.diff(evaluations) <= 0)):
+            raise ValueError("the evaluation numbers must be positive and increasing")
+        if problem is NULL:
+            raise InvalidProblemException()
+        _evaluations = np.ascontiguousarray(evaluations, dtype=np.uintp)
+        _Y = Y
+        _updates = np.zeros(len(evaluations), dtype=np.intc)
+        number_of_solutions = len(evaluations)
+        evaluations_data = <size_t *>np.PyArray_DATA(_evaluations)
+        y = <double *>np.PyArray_DATA(_Y)
+        updates = <int *>np.PyArray_DATA(_updates)
+        with nogil:
+            coco_logger_biobj_feed_solutions(problem, number_of_solutions, evaluations_data, y, updates)
+        return _updates
+
 
     def add_observer(self, observer):
         """`add_observer(self, observer: Observer)`, see `observe_with`.
@@ -642,10 +790,11 @@ cdef class Problem:
 
         See also: class `Observer`
         """
+        cdef Observer _observer
         if observer:
             assert self.problem
-            observer._update_current_observer_global()
-            self.problem = coco_problem_add_observer(self.problem, _current_observer)
+            _observer = observer
+            self.problem = coco_problem_add_observer(self.problem, _observer._observer)
             self._list_of_observers.append(observer)
         return self
 
@@ -745,6 +894,25 @@ cdef class Problem:
     def evaluations_constraints(self):
         return coco_problem_get_evaluations_constraints(self.problem)
     @property
+    def construction_time(self):
+        """seconds spent in the C code to construct the problem"""
+        assert(self.problem)
+        return coco_problem_get_construction_time(self.problem)
+    @property
+    def evaluation_time(self):
+        """seconds spent in the C code to evaluate the problem, measured
+        only if the problem is observed with the observer option ``timing: 1``
+        """
+        assert(self.problem)
+        return coco_problem_get_evaluation_time(self.problem)
+    @property
+    def logging_time(self):
+        """seconds spent by the logger of the observer, measured only if the
+        problem is observed with the observer option ``timing: 1``
+        """
+        assert(self.problem)
+        return coco_problem_get_logging_time(self.problem)
+    @property
     def final_target_hit(self):
         """return 1 if the final target is known and has been hit, 0 otherwise
         """
@@ -815,6 +983,66 @@ cdef class Problem:
             return self.y_values[0]
         return np.array(self.y_values, copy=True)
 
+    cdef np.ndarray _batch_arguments(self, X, out, size_t number_of_values):
+        """return `X` as C-contiguous 2-D array of doubles and check the
+        dimension of `X` and, if given, size and type of `out`"""
+        X = np.array(X, copy=False, dtype=np.double, order='C', ndmin=2)
+        if X.ndim != 2 or X.shape[1] != self.number_of_variables:
+            raise ValueError(
+                "Shape, `np.shape(X)==%s`, of input `X` does " % str(np.shape(X)) +
+                "not match `(n, number_of_variables)` with `number_of_variables==%d`."
+                             % self.number_of_variables)
+        if out is not None and not (
+                isinstance(out, np.ndarray) and out.dtype == np.double
+                and out.flags['C_CONTIGUOUS'] and out.flags['WRITEABLE']
+                and out.size == X.shape[0] * number_of_values):
+            raise ValueError(
+                "`out` must be a writeable C-contiguous array of doubles " +
+                "with %d elements" % (X.shape[0] * number_of_values))
+        if self.problem is NULL:
+            raise InvalidProblemException()
+        return X
+
+    def evaluate_batch(self, X, out=None):
+        """see __init__.py"""
+        cdef np.ndarray[double, ndim=2, mode="c"] _X
+        cdef coco_problem_t *problem = self.problem
+        cdef size_t i, n, dim = self._number_of_variables
+        cdef size_t m = self._number_of_objectives
+        cdef double *x
+        cdef double *y
+        assert self.initialized
+        _X = self._batch_arguments(X, out, m)  # this is the final type conversion
+        n = _X.shape[0]
+        if out is None:
+            out = np.empty(n) if m == 1 else np.empty((n, m))
+        x = <double *>np.PyArray_DATA(_X)
+        y = <double *>np.PyArray_DATA(out)
+        with nogil:
+            for i in range(n):
+                coco_evaluate_function(problem, x + i * dim, y + i * m)
+        return out
+    def constraint_batch(self, X, out=None):
+        """see __init__.py"""
+        if self.number_of_constraints <= 0:
+            return  # like constraint
+        cdef np.ndarray[double, ndim=2, mode="c"] _X
+        cdef coco_problem_t *problem = self.problem
+        cdef size_t i, n, dim = self._number_of_variables
+        cdef size_t m = self._number_of_constraints
+        cdef double *x
+        cdef double *y
+        _X = self._batch_arguments(X, out, m)  # this is the final type conversion
+        n = _X.shape[0]
+        if out is None:
+            out = np.empty((n, m))
+        x = <double *>np.PyArray_DATA(_X)
+        y = <double *>np.PyArray_DATA(out)
+        with nogil:
+            for i in range(n):
+                coco_evaluate_constraint(problem, x + i * dim, y + i * m)
+        return out
+
     @property
     def id(self):
         "id as string without spaces or weird characters"
@@ -825,10 +1053,7 @@ cdef class Problem:
         "search `substr` in `id` and return converted `int` up to '_'"
         if self.problem is NULL:
             return None
-        i = self.id.find(substr)
-        if i < 0:
-            raise ValueError()
-        return int(self.id[i + len(substr):].split('_')[0])
+        return _parse_id(self.id, substr)
 
     @property
     def id_function(self):
@@ -18,6 +18,8 @@ f-evaluations::
 runs the first of 20 batches with maximal budget of
 1000 * dimension f-evaluations on the bbob-biobj suite.
 All batches must be run to generate a complete data set.
+Alternatively, `cocoex.run_parallel` runs all problems on a pool of
+processes and merges the results into a single folder.
 
 Usage from a python shell:
 
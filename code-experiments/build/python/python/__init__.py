@@ -16,7 +16,8 @@ A more complete example use case can be found in the `example_experiment.py`
 file.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
-from . import solvers, utilities
+from . import solvers, utilities, parallel
+from .parallel import run_parallel
 try:
     from . import _interface
     from ._interface import Suite as _Suite, Observer as _Observer
@@ -31,7 +32,7 @@ del absolute_import, division, print_function, unicode_literals
 # from .utilities import about_equal
 # from .exceptions import NoSuchProblemException, InvalidProblemException
 
-__all__ = ['Observer', 'Suite', 'known_suite_names', 'default_observers']
+__all__ = ['Observer', 'Suite', 'known_suite_names', 'default_observers', 'run_parallel']
 
 def default_observers(update=None):
     """return a map from suite names to default observer names.
@@ -150,6 +151,19 @@ class Suite(_Suite):
 
     See file `example_experiment.py` for a full example use case.
 
+    With ``prefetch=True``, sweeping through the suite constructs the next
+    problem in a background thread while the current problem is solved,
+    which saves wall clock time when the budget per problem is small:
+
+    >>> import cocoex as ex
+    >>> suite = ex.Suite("bbob", "", "dimensions:40 instance_indices:1", prefetch=True)
+    >>> observer = ex.Observer("bbob", "result_folder:doctest")
+    >>> for fun in suite:
+    ...     _ = fun.observe_with(observer)  # added after the construction
+    ...     _ = fun(fun.initial_solution)
+    >>> suite.prefetch, suite.current_problem is None
+    (True, True)
+
     Details: depending on the benchmark suite and observer, only one problem can
     be open at a time. Using `get_problem` without `free` or mixing the use of
     `next_problem` and `get_problem` may not be possible. For example, in this
@@ -158,8 +172,13 @@ class Suite(_Suite):
 
     See also `Observer` and `example_experiment.py`.
     """
-    def __init__(self, suite_name, suite_instance, suite_options):
-        """``suite_instance`` and ``suite_options`` can be empty strings."""
+    def __init__(self, suite_name, suite_instance, suite_options, prefetch=False):
+        """``suite_instance`` and ``suite_options`` can be empty strings.
+
+        If ``prefetch``, `next_problem` and iterating over the suite construct
+        the problem after the returned one in a background thread. The
+        observer is added only when the prefetched problem is returned.
+        """
         # this __init__ defines the arguments for _Suite.__cinit__,
         # which is called implicitly. Calling the super class init fails in Python 3.
         # super(Suite, self).__init__(suite_name, suite_instance, suite_options)
@@ -178,8 +197,9 @@ class Suite(_Suite):
         """
         return super(Suite, self).next_problem(observer)
     def get_problem(self, id, observer=None):
-        """return a `Problem` instance, by default unobserved, using ``id: str``
-        or index (where ``id: int``) to identify the desired problem.
+        """return a `Problem` instance, by default unobserved, using ``id: str``,
+        index (where ``id: int``) or ``(function, dimension, instance)`` tuple
+        to identify the desired problem.
 
         All values between zero and `len(self) - 1` are valid index values:
 
@@ -193,6 +213,20 @@ class Suite(_Suite):
         A shortcut for `suite.get_problem(index)` is `suite[index]`, they are
         synonym.
 
+        Looking up a problem by id or by function, dimension and instance
+        uses precomputed tables and does not search the suite:
+
+        >>> suite = ex.Suite("bbob", "", "")
+        >>> suite.get_problem((10, 20, 3)).id
+        'bbob_f010_i03_d20'
+        >>> suite.get_problem('bbob_f010_i03_d20').index
+        1577
+        >>> try:
+        ...     suite.get_problem((10, 20, 99))
+        ... except ValueError:
+        ...     print('unknown problem')
+        unknown problem
+
         Details:
             - Here an `index` takes values between 0 and `len(self) - 1` and can in
               principle be different from the problem index in the benchmark suite.
@@ -325,6 +359,24 @@ class Suite(_Suite):
         """list of number of objectives occuring in this `Suite`"""
         return super(Suite, self).number_of_objectives
     @property
+    def problem_table(self):
+        """read-only `numpy` structured array with fields ``'index'``,
+        ``'function'``, ``'dimension'`` and ``'instance'`` for all problems
+        of this `Suite`, in the order of the indices used in `get_problem`.
+
+        The table serves to select many problems at once without
+        constructing them:
+
+        >>> import cocoex as ex
+        >>> suite = ex.Suite("bbob", "", "")
+        >>> table = suite.problem_table
+        >>> selected = table[(table['function'] == 10) & (table['dimension'] == 20)]
+        >>> list(selected['index'][:3]), list(selected['instance'][:3])
+        ([1575, 1576, 1577], [1, 2, 3])
+
+        """
+        return super(Suite, self).problem_table
+    @property
     def indices(self):
         """list of all problem indices, deprecated.
         
@@ -372,13 +424,36 @@ class Observer(_Observer):
     Details
     -------
 
-        - ``f.free()`` in the above example must be called before to observe
-          another problem with the "bbob" observer. Otherwise the Python
-          interpreter will crash due to an error raised from the C code.
-    
-        - Due to technical sublties between Python/Cython/C, the pointer to the
-          underlying C observer is passed by global assignment with
-          `_update_current_observer_global()`
+        - Observing a problem wraps a logger around it, which writes the
+          data of this problem only. The logger finalizes its output, for
+          example the entry of the run in the ``.info`` file of the "bbob"
+          observer, when the problem is freed, with ``f.free()`` as above or
+          when it is garbage collected. The observer can be freed before its
+          problems.
+
+        - Several problems can be observed with the same observer at the same
+          time, also from different threads. With the "bbob" observer, a
+          problem of the same function and dimension as a problem that is
+          still observed is logged into ``.info`` and data files of its own,
+          the names of which end in ``-<k>``, and which
+          `cocoex.parallel.merge_result_folders` merges.
+
+        - With the option ``timing: 1``, the seconds spent evaluating the
+          problem and the seconds spent by the logger are accumulated in the
+          C code and available as `Problem.evaluation_time` and
+          `Problem.logging_time`. The "bbob" observer also writes them,
+          together with `Problem.construction_time`, into the comment lines
+          of the ``.info`` files. For example
+
+          >>> import numpy as np
+          >>> observer = ex.Observer("bbob", "result_folder: doctest timing: 1")
+          >>> f = suite.get_problem(33)
+          >>> _ = f.observe_with(observer)
+          >>> for x in f.lower_bounds + np.random.rand(100, f.dimension):
+          ...     _ = f(x)
+          >>> f.evaluation_time > 0 and f.logging_time > 0
+          True
+          >>> f.free()
 
     """
 
@@ -435,6 +510,35 @@ class Problem(_interface.Problem):
         """
         return super(Problem, self).constraint(x)
 
+    def evaluate_batch(self, X, out=None):
+        """return objective function values of the rows of `X`.
+
+        `X` is an ``(n, dimension)`` array of candidate solutions. The
+        evaluations are done in a single C loop without holding the GIL
+        and are observed exactly like ``n`` consecutive calls ``self(x)``.
+        The values are written into `out`, if given, which must be a
+        C-contiguous array of ``n * number_of_objectives`` doubles,
+        otherwise into a new array of shape ``(n,)`` for single-objective
+        and ``(n, number_of_objectives)`` for multi-objective problems.
+
+        >>> import numpy as np
+        >>> import cocoex as ex
+        >>> f = ex.Suite("bbob", "", "").next_problem()
+        >>> X = np.array([[1, 2], [0, 0], [-1, 3]])
+        >>> assert np.all(f.evaluate_batch(X) == [f(x) for x in X])
+        >>> assert f.evaluations == 6
+
+        The same problem must not be evaluated concurrently from several
+        threads.
+        """
+        return super(Problem, self).evaluate_batch(X, out)
+
+    def constraint_batch(self, X, out=None):
+        """return constraint values of the rows of `X` as array of shape
+        ``(n, number_of_constraints)``, see `evaluate_batch` and
+        `constraint`."""
+        return super(Problem, self).constraint_batch(X, out)
+
     def logger_biobj_feed_solution(self, evaluation, y):
         """Feed the given solution to logger_biobj in order to reconstruct its
         output.
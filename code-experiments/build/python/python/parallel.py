@@ -0,0 +1,281 @@
+"""Run a benchmarking experiment on several processes.
+
+`run_parallel` distributes the problems of a `Suite` over a pool of
+worker processes and merges the output of all problems into a single
+result folder, which can be directly post-processed with `cocopp`.
+
+>>> import cocoex as ex
+>>> def solver(problem):
+...     ex.solvers.random_search(problem, problem.lower_bounds,
+...                              problem.upper_bounds, 10 * problem.dimension)
+>>> folder = ex.run_parallel(solver, "bbob",
+...     "dimensions: 2,3 function_indices: 1,2 instance_indices: 1-3",
+...     {"result_folder": "doctest_parallel", "algorithm_name": "RS"},
+...     workers=2, verbose=0)
+>>> sorted(name for name in os.listdir(folder) if name.endswith('.info'))
+['bbobexp_f1.info', 'bbobexp_f2.info']
+"""
+from __future__ import absolute_import, division, print_function
+import os
+import re
+import shutil
+import sys
+import time
+import traceback
+import warnings
+import multiprocessing
+from collections import OrderedDict
+
+__all__ = ['run_parallel', 'merge_result_folders']
+
+_data_file_extensions = ('.dat', '.tdat', '.rdat', '.mdat')
+"""extensions of the data files which belong to an entry of an .info file"""
+
+
+def _unique_folder(path):
+    """return `path` or, if it exists, `path` with the first free suffix
+    ``-001``, ``-002``,... like the C observer does"""
+    new_path, counter = path, 1
+    while os.path.exists(new_path):
+        new_path = '%s-%03d' % (path, counter)
+        counter += 1
+    return new_path
+
+
+def _worker(connection, solver, suite_args, observer_name, observer_options):
+    """evaluate the problems received via `connection` with `solver`.
+
+    Send back ``('done', result_folder)`` or ``('error', message)`` for
+    each problem index received until `None` is received.
+    """
+    from . import Suite, Observer
+    suite = Suite(*suite_args)
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        index, task_folder = task
+        options = dict(observer_options)
+        options['result_folder'] = task_folder
+        observer = problem = None
+        try:
+            observer = Observer(observer_name, options)
+            problem = suite.get_problem(index, observer)
+            solver(problem)
+        except Exception:
+            connection.send(('error', traceback.format_exc()))
+        else:
+            connection.send(('done', observer.result_folder))
+        finally:
+            if problem is not None:
+                problem.free()  # finishes the run in the .info file
+            del problem, observer  # closes the files of the observer
+    suite.free()
+
+
+class _Worker(object):
+    """a worker process with a pipe and the task it is working on"""
+    def __init__(self, *args):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker,
+                                               args=(child_connection,) + args)
+        self.process.daemon = True
+        self.process.start()
+        self.task = None
+    def send(self, task):
+        self.task = task
+        self.connection.send(task)
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (IOError, OSError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+def run_parallel(solver, suite_name, suite_options="", observer_options=None,
+                 workers=None, suite_instance="", observer_name=None,
+                 retries=1, verbose=1):
+    """benchmark `solver` on all problems of a `Suite` using `workers`
+    processes and return the result folder.
+
+    `solver` is called as ``solver(problem)`` with an observed `Problem`
+    and must respect the budget by itself. Where processes are spawned
+    rather than forked, like under Windows, `solver` must be picklable.
+
+    `observer_options` is a `dict` of options for `Observer`, its
+    ``'result_folder'`` becomes the name of the merged result folder
+    within ``exdata``. `observer_name` defaults to the default observer
+    of `suite_name`, `workers` defaults to the number of CPUs.
+
+    Problems are scheduled in order of decreasing dimension, such that
+    the most expensive problems do not end up last. Each problem writes
+    its output into a folder of its own, which are merged into the result
+    folder by `merge_result_folders` when all problems are done. A
+    problem whose worker crashed, for example because the solver caused a
+    segmentation fault, is restarted on a new worker up to `retries`
+    times. Problems which finally failed are reported in a warning and
+    are missing in the result folder.
+    """
+    from . import Suite, default_observers
+    if observer_name is None:
+        observer_name = default_observers()[suite_name]
+    observer_options = dict(observer_options or {})
+    result_folder = str(observer_options.get('result_folder', 'default')).strip('"\'')
+    workers = workers or multiprocessing.cpu_count()
+    suite_args = (suite_name, suite_instance, suite_options)
+
+    suite = Suite(*suite_args)
+    ids = suite.ids()
+    suite.free()
+    tasks_folder = _unique_folder(os.path.join('exdata', result_folder + '_tasks'))
+    os.makedirs(tasks_folder)
+
+    def dimension(index):
+        match = re.search(r'_d(\d+)', ids[index])
+        return int(match.group(1)) if match else 0
+    pending = sorted(range(len(ids)), key=lambda i: (-dimension(i), i))
+    attempts = dict((index, 0) for index in pending)
+    folders, errors = {}, {}
+
+    def task_of(index):
+        attempts[index] += 1
+        # relative to the exdata folder, in which the observer writes
+        return index, os.path.join(os.path.basename(tasks_folder),
+                                   '%s-%d' % (ids[index], attempts[index]))
+
+    def fail(index, message):
+        errors[index] = message
+        if attempts[index] <= retries:
+            pending.insert(0, index)
+
+    pool = [_Worker(solver, suite_args, observer_name, observer_options)
+            for _ in range(min(workers, len(pending)))]
+    t0 = time.time()
+    try:
+        while pending or any(worker.task is not None for worker in pool):
+            idle = True
+            for i, worker in enumerate(pool):
+                if worker.task is None:
+                    if pending:
+                        worker.send(task_of(pending.pop(0)))
+                        idle = False
+                    continue
+                index = worker.task[0]
+                if worker.connection.poll():
+                    try:
+                        status, message = worker.connection.recv()
+                    except EOFError:  # the process died while sending
+                        status, message = 'crash', 'worker died'
+                else:
+                    if worker.process.is_alive():
+                        continue
+                    status, message = 'crash', 'worker died with exit code %s' % str(
+                        worker.process.exitcode)
+                idle = False
+                if status == 'done':
+                    folders[index] = message
+                    errors.pop(index, None)
+                    worker.task = None
+                    if verbose:
+                        print('%s done (%d/%d, %s)' % (ids[index], len(folders), len(ids),
+                                                      time.strftime('%H:%M:%S')))
+                        sys.stdout.flush()
+                elif status == 'error':  # the solver raised, the worker is fine
+                    worker.task = None
+                    fail(index, message)
+                else:
+                    worker.stop()
+                    pool[i] = _Worker(solver, suite_args, observer_name, observer_options)
+                    fail(index, message)
+            if idle:
+                time.sleep(0.01)
+    finally:
+        for worker in pool:
+            worker.stop()
+    if errors:
+        warnings.warn('%d problem(s) failed and are missing in the results: %s\n%s'
+                      % (len(errors), ', '.join(ids[index] for index in sorted(errors)),
+                         errors[sorted(errors)[0]]))
+
+    target = _unique_folder(os.path.join('exdata', result_folder))
+    merge_result_folders([folders[index] for index in sorted(folders)], target)
+    shutil.rmtree(tasks_folder)
+    if verbose:
+        print('%d problems on %d workers done in %.1f seconds, data written to %s'
+              % (len(folders), len(pool), time.time() - t0, target))
+    return target
+
+
+def _read_info_entries(filename):
+    """return the list of ``[header, comment, data_file, instances]``
+    entries of a bbob .info file, or `None` if the format is unknown"""
+    with open(filename, 'r') as f:
+        lines = [line.rstrip('\n') for line in f if line.strip()]
+    if len(lines) % 3:
+        return None
+    entries = []
+    for header, comment, data in zip(lines[::3], lines[1::3], lines[2::3]):
+        if not comment.startswith('%') or header.startswith('%') or ', ' not in data:
+            return None
+        data_file, instances = data.split(', ', 1)
+        entries.append([header, comment, data_file, instances])
+    return entries
+
+
+def merge_result_folders(folders, target):
+    """merge the result folders `folders` of the bbob logger into the new
+    folder `target`.
+
+    Entries of .info files with the same header line (that is, the same
+    function, dimension, algorithm...) are merged into a single entry,
+    the instances of which are the instances of all `folders` in the
+    given order and the data files of which are the concatenated data
+    files of all `folders`. Folders with a different layout, like those
+    of the bbob-biobj logger, are copied as subfolder of `target`, which
+    `cocopp` reads as well.
+    """
+    os.makedirs(target)
+    info_files = OrderedDict()  # relative info file name -> OrderedDict of entries
+    for folder in folders:
+        infos = []
+        for root, _, files in os.walk(folder):
+            for name in sorted(files):
+                if name.endswith('.info'):
+                    infos.append((os.path.relpath(os.path.join(root, name), folder),
+                                  _read_info_entries(os.path.join(root, name))))
+        if not infos or any(entries is None for _, entries in infos):
+            shutil.copytree(folder, os.path.join(target, os.path.basename(folder)))
+            continue
+        for info_name, entries in infos:
+            # the instance and the suffix of concurrently written entries
+            # in the name are meaningless after merging
+            merged_info_name = re.sub(r'_i\d+(-\d+)?\.info$', '.info', info_name)
+            merged_entries = info_files.setdefault(merged_info_name, OrderedDict())
+            info_dir = os.path.dirname(info_name)
+            for header, comment, data_file, instances in entries:
+                source = os.path.join(folder, info_dir, data_file)
+                if header in merged_entries:
+                    merged_entries[header][3] += ', ' + instances
+                    # the times measured with the timing option
+                    if ', ' in comment:
+                        merged_entries[header][1] += ', ' + comment.split(', ', 1)[1]
+                    destination = os.path.join(target, info_dir, merged_entries[header][2])
+                else:
+                    merged_data_file = re.sub(r'_i\d+(-\d+)?\.dat$', '.dat', data_file)
+                    merged_entries[header] = [header, comment, merged_data_file, instances]
+                    destination = os.path.join(target, info_dir, merged_data_file)
+                    if not os.path.exists(os.path.dirname(destination)):
+                        os.makedirs(os.path.dirname(destination))
+                for extension in _data_file_extensions:
+                    name = source[:-len('.dat')] + extension
+                    if os.path.exists(name):
+                        with open(destination[:-len('.dat')] + extension, 'a') as f_out:
+                            with open(name, 'r') as f_in:
+                                shutil.copyfileobj(f_in, f_out)
+    for info_name, entries in info_files.items():
+        with open(os.path.join(target, info_name), 'w') as f:
+            f.write('\n'.join('%s\n%s\n%s, %s' % tuple(entry)
+                              for entry in entries.values()) + '\n')
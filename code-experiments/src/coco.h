@@ -355,6 +355,21 @@ size_t coco_problem_get_evaluations(const coco_problem_t *problem);
  */
 size_t coco_problem_get_evaluations_constraints(const coco_problem_t *problem);
 
+/**
+ * @brief Returns the number of seconds spent constructing the problem.
+ */
+double coco_problem_get_construction_time(const coco_problem_t *problem);
+
+/**
+ * @brief Returns the number of seconds spent evaluating the problem, if measured by its observer.
+ */
+double coco_problem_get_evaluation_time(const coco_problem_t *problem);
+
+/**
+ * @brief Returns the number of seconds spent by the logger of the problem, if measured by its observer.
+ */
+double coco_problem_get_logging_time(const coco_problem_t *problem);
+
 /**
  * @brief Returns 1 if the final target was hit, 0 otherwise.
  */
@@ -544,6 +559,15 @@ void coco_archive_free(coco_archive_t *archive);
  * @brief Feeds the solution to the bi-objective logger for logger output reconstruction purposes.
  */
 int coco_logger_biobj_feed_solution(coco_problem_t *problem, const size_t evaluation, const double *y);
+
+/**
+ * @brief Feeds the solutions to the bi-objective logger for logger output reconstruction purposes.
+ */
+size_t coco_logger_biobj_feed_solutions(coco_problem_t *problem,
+                                        const size_t number_of_solutions,
+                                        const size_t *evaluations,
+                                        const double *y,
+                                        int *updates);
 /**@}*/
 
 /***********************************************************************************************************/
@@ -0,0 +1,210 @@
+/**
+ * @file coco_cache.c
+ * @brief A bounded in-process cache of the random data needed to construct problems.
+ *
+ * The rotation matrices and peaks of a problem are computed from the seed of its
+ * instance each time the problem is constructed, which in large dimensions can take longer than a short
+ * run of an optimizer on the problem. Because the same problems are constructed over and over, for
+ * example when a suite is iterated repeatedly or when coco_suite_get_problem is called in parallel runs,
+ * these data are kept in a cache shared by all threads of the process.
+ *
+ * The data are vectors of doubles identified by a key that contains their kind and everything they
+ * depend on, like "rotation_s<seed>_d<dimension>". Only data that are expensive to compute are cached,
+ * namely the rotation matrices and the peaks of the Gallagher functions. The entries are found through a
+ * hash table and are kept in a doubly linked list ordered from the most to the least recently used one.
+ * When the total number of cached doubles exceeds coco_cache_max_size, the least recently used entries
+ * are dropped from the end of the list. Getting and adding data thus take constant time.
+ *
+ * Problems are constructed only through suites and the cached data are copied into the problems, so
+ * the cache is cleared when the last suite is freed.
+ */
+
+#include <string.h>
+
+#include "coco.h"
+#include "coco_utilities.c"
+
+/** @brief The default maximal number of doubles kept in the cache (32 MB). */
+#define COCO_CACHE_MAX_SIZE 4194304
+
+/** @brief The number of buckets of the hash table of the cache. */
+#define COCO_CACHE_NUMBER_OF_BUCKETS 1024
+
+/**
+ * @brief An entry of the cache.
+ */
+typedef struct coco_cache_entry_s {
+  char *key;                           /**< @brief Identifies the data. */
+  double *values;                      /**< @brief The cached data. */
+  size_t number_of_values;             /**< @brief The number of cached doubles. */
+  struct coco_cache_entry_s *previous; /**< @brief The next more recently used entry. */
+  struct coco_cache_entry_s *next;     /**< @brief The next less recently used entry. */
+  struct coco_cache_entry_s *next_in_bucket; /**< @brief The next entry in the same hash bucket. */
+} coco_cache_entry_t;
+
+static coco_mutex_t coco_cache_mutex = COCO_MUTEX_INITIALIZER;
+static coco_cache_entry_t *coco_cache_buckets[COCO_CACHE_NUMBER_OF_BUCKETS] = { NULL };
+static coco_cache_entry_t *coco_cache_first = NULL; /* the most recently used entry */
+static coco_cache_entry_t *coco_cache_last = NULL;  /* the least recently used entry */
+static size_t coco_cache_size = 0;
+static size_t coco_cache_max_size = COCO_CACHE_MAX_SIZE;
+static size_t coco_cache_number_of_suites = 0; /* the number of suites that construct problems */
+
+/**
+ * @brief Returns the hash table bucket of the key (djb2 string hash).
+ */
+static coco_cache_entry_t **coco_cache_bucket(const char *key) {
+  unsigned long hash = 5381;
+  while (*key != '\0')
+    hash = hash * 33 + (unsigned char) *key++;
+  return &coco_cache_buckets[hash % COCO_CACHE_NUMBER_OF_BUCKETS];
+}
+
+/**
+ * @brief Removes the entry from the list of entries.
+ */
+static void coco_cache_unlink(coco_cache_entry_t *entry) {
+  if (entry->previous != NULL)
+    entry->previous->next = entry->next;
+  else
+    coco_cache_first = entry->next;
+  if (entry->next != NULL)
+    entry->next->previous = entry->previous;
+  else
+    coco_cache_last = entry->previous;
+}
+
+/**
+ * @brief Inserts the entry at the front of the list of entries.
+ */
+static void coco_cache_push_front(coco_cache_entry_t *entry) {
+  entry->previous = NULL;
+  entry->next = coco_cache_first;
+  if (coco_cache_first != NULL)
+    coco_cache_first->previous = entry;
+  else
+    coco_cache_last = entry;
+  coco_cache_first = entry;
+}
+
+/**
+ * @brief Removes the entry from the cache and frees it.
+ */
+static void coco_cache_remove(coco_cache_entry_t *entry) {
+
+  coco_cache_entry_t **link = coco_cache_bucket(entry->key);
+
+  while (*link != entry)
+    link = &(*link)->next_in_bucket;
+  *link = entry->next_in_bucket;
+  coco_cache_unlink(entry);
+  coco_cache_size -= entry->number_of_values;
+  coco_free_memory(entry->key);
+  coco_free_memory(entry->values);
+  coco_free_memory(entry);
+}
+
+/**
+ * @brief Returns the entry of the key or NULL if the key is not cached.
+ */
+static coco_cache_entry_t *coco_cache_find(const char *key) {
+
+  coco_cache_entry_t *entry;
+
+  for (entry = *coco_cache_bucket(key); entry != NULL; entry = entry->next_in_bucket) {
+    if (strcmp(entry->key, key) == 0)
+      return entry;
+  }
+  return NULL;
+}
+
+/**
+ * @brief Copies the data identified by key into values if they are cached.
+ *
+ * @return 1 if the data were found in the cache and 0 otherwise.
+ */
+static int coco_cache_get(const char *key, double *values, const size_t number_of_values) {
+
+  coco_cache_entry_t *entry;
+  int is_found = 0;
+
+  coco_mutex_lock(&coco_cache_mutex);
+  entry = coco_cache_find(key);
+  if (entry != NULL && entry->number_of_values == number_of_values) {
+    memcpy(values, entry->values, number_of_values * sizeof(double));
+    coco_cache_unlink(entry);
+    coco_cache_push_front(entry);
+    is_found = 1;
+  }
+  coco_mutex_unlock(&coco_cache_mutex);
+  return is_found;
+}
+
+/**
+ * @brief Adds a copy of the data identified by key to the cache and drops the least recently used
+ * entries if the cache is full.
+ *
+ * Data larger than the whole cache are not added. Data of the same key replace the cached ones.
+ */
+static void coco_cache_put(const char *key, const double *values, const size_t number_of_values) {
+
+  coco_cache_entry_t *entry, *old_entry, **bucket;
+
+  if (number_of_values > coco_cache_max_size)
+    return;
+
+  entry = (coco_cache_entry_t *) coco_allocate_memory(sizeof(*entry));
+  entry->key = coco_strdup(key);
+  entry->values = coco_duplicate_vector(values, number_of_values);
+  entry->number_of_values = number_of_values;
+
+  coco_mutex_lock(&coco_cache_mutex);
+  /* Another thread may have added the same data in the meantime */
+  old_entry = coco_cache_find(key);
+  if (old_entry != NULL)
+    coco_cache_remove(old_entry);
+  bucket = coco_cache_bucket(key);
+  entry->next_in_bucket = *bucket;
+  *bucket = entry;
+  coco_cache_push_front(entry);
+  coco_cache_size += number_of_values;
+  /* Keep the entries at the front of the list that fit into the cache */
+  while (coco_cache_size > coco_cache_max_size)
+    coco_cache_remove(coco_cache_last);
+  coco_mutex_unlock(&coco_cache_mutex);
+}
+
+/**
+ * @brief Removes all entries from the cache.
+ */
+static void coco_cache_clear(void) {
+
+  coco_mutex_lock(&coco_cache_mutex);
+  while (coco_cache_first != NULL)
+    coco_cache_remove(coco_cache_first);
+  coco_mutex_unlock(&coco_cache_mutex);
+}
+
+/**
+ * @brief Registers a newly allocated suite, the problems of which can use the cache.
+ */
+static void coco_cache_retain(void) {
+
+  coco_mutex_lock(&coco_cache_mutex);
+  coco_cache_number_of_suites++;
+  coco_mutex_unlock(&coco_cache_mutex);
+}
+
+/**
+ * @brief Unregisters a freed suite and clears the cache if it was the last one.
+ */
+static void coco_cache_release(void) {
+
+  size_t number_of_suites;
+
+  coco_mutex_lock(&coco_cache_mutex);
+  number_of_suites = --coco_cache_number_of_suites;
+  coco_mutex_unlock(&coco_cache_mutex);
+  if (number_of_suites == 0)
+    coco_cache_clear();
+}
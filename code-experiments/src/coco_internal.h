@@ -148,6 +148,17 @@ struct coco_problem_s {
 
   size_t evaluations;                  /**< @brief Number of objective function evaluations performed on the problem. */
   size_t evaluations_constraints;      /**< @brief Number of constraint function evaluations performed on the problem. */
+  double *constraint_values;           /**< @brief Preallocated vector for the constraint values computed internally,
+                                       for example in feasibility checks (NULL if there are no constraints). */
+
+  /* Timing fields, the evaluation and logging times are measured only for problems observed with the
+   * observer option "timing: 1" */
+
+  double construction_time;            /**< @brief Seconds spent constructing the problem. */
+  double evaluation_time;              /**< @brief Seconds spent evaluating the (inner) problem. */
+  double logging_time;                 /**< @brief Seconds spent by the logger of an observed problem. */
+  coco_problem_t *timed_problem;       /**< @brief The observed problem, to which the time spent in
+                                       coco_evaluate_function is added (NULL if it is not measured). */
 
   /* Convenience fields for output generation */
   /* If at some point in time these arrays are changed to pointers, checks need to be added in the code to make sure
@@ -194,6 +205,10 @@ struct coco_observer_s {
   int precision_f;           /**< @brief Output precision for function values. */
   int precision_g;           /**< @brief Output precision for constraint values. */
   int log_discrete_as_int;   /**< @brief Whether to output discrete variables in int or double format. */
+  int crash_safe;            /**< @brief Whether the loggers flush their files after each written line. */
+  size_t output_buffer_size; /**< @brief Size of the output buffer of each file written by a logger. */
+  double flush_interval;     /**< @brief Seconds after which buffered output is flushed (0 for never). */
+  int timing;                /**< @brief Whether the evaluation and logging times of the problems are measured. */
   void *data;                /**< @brief Void pointer that can be used to point to data specific to an observer. */
 
   coco_data_free_function_t data_free_function;             /**< @brief  The function for freeing this observer. */
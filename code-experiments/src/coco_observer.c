@@ -8,6 +8,7 @@
 #include <limits.h>
 #include <float.h>
 #include <math.h>
+#include <time.h>
 
 /**
  * @brief The type for triggers based on target values.
@@ -282,6 +283,65 @@ static void coco_observer_evaluations_free(coco_observer_evaluations_t *evaluati
 
 /***********************************************************************************************************/
 
+/**
+ * @name Methods regarding the buffering of the files written by loggers.
+ *
+ * Unless the observer is crash-safe, the files written by loggers are fully buffered in large buffers and
+ * written when a buffer is full, when the flush interval has passed, when the file is closed (that is, when
+ * the problem is freed) and, for files that are still open, when the process exits normally. In the
+ * crash-safe mode, all files of a logger are flushed after each written line.
+ */
+/**@{*/
+
+/**
+ * @brief Sets the output buffer of the newly opened file according to the observer options.
+ *
+ * The observer options are passed as values, because loggers can open their files after their observer
+ * has been freed.
+ *
+ * @return The buffer, which must be freed with coco_free_memory after the file has been closed, or NULL in
+ * the crash-safe mode, where the default buffering is kept.
+ */
+static char *coco_observer_buffer_file(const int crash_safe, const size_t output_buffer_size, FILE *file) {
+
+  char *buffer;
+
+  if (crash_safe || file == NULL)
+    return NULL;
+  buffer = (char *) coco_allocate_memory(output_buffer_size);
+  if (setvbuf(file, buffer, _IOFBF, output_buffer_size) != 0) {
+    coco_free_memory(buffer);
+    return NULL;
+  }
+  return buffer;
+}
+
+/**
+ * @brief Returns 1 if a logger that has just written a line should flush its files and 0 otherwise.
+ *
+ * The files need to be flushed in the crash-safe mode and when the flush interval has passed since
+ * last_flush, which is then updated. The observer options are passed as values, because loggers can
+ * outlive their observer.
+ */
+static int coco_observer_flush_due(const int crash_safe, const double flush_interval, time_t *last_flush) {
+
+  time_t now;
+
+  if (crash_safe)
+    return 1;
+  if (flush_interval <= 0)
+    return 0;
+  time(&now);
+  if (difftime(now, *last_flush) < flush_interval)
+    return 0;
+  *last_flush = now;
+  return 1;
+}
+
+/**@}*/
+
+/***********************************************************************************************************/
+
 /**
  * @brief Allocates memory for a coco_observer_t instance.
  */
@@ -296,7 +356,11 @@ static coco_observer_t *coco_observer_allocate(const char *result_folder,
                                                const int precision_x,
                                                const int precision_f,
                                                const int precision_g,
-                                               const int log_discrete_as_int) {
+                                               const int log_discrete_as_int,
+                                               const int crash_safe,
+                                               const size_t output_buffer_size,
+                                               const double flush_interval,
+                                               const int timing) {
 
   coco_observer_t *observer;
   observer = (coco_observer_t *) coco_allocate_memory(sizeof(*observer));
@@ -313,6 +377,10 @@ static coco_observer_t *coco_observer_allocate(const char *result_folder,
   observer->precision_f = precision_f;
   observer->precision_g = precision_g;
   observer->log_discrete_as_int = log_discrete_as_int;
+  observer->crash_safe = crash_safe;
+  observer->output_buffer_size = output_buffer_size;
+  observer->flush_interval = flush_interval;
+  observer->timing = timing;
   observer->data = NULL;
   observer->data_free_function = NULL;
   observer->logger_allocate_function = NULL;
@@ -397,6 +465,20 @@ void coco_observer_free(coco_observer_t *observer) {
  * of digits to be printed after the decimal point. The default value is 3.
  * - "log_discrete_as_int: VALUE" determines whether the values of integer variables (in mixed-integer problems)
  * are logged as integers (1) or not (0 - in this case they are logged as doubles). The default value is 0.
+ * - "crash_safe: VALUE" determines whether the loggers flush their files after each written line (1), such that
+ * all lines written before a crash of the process are in the files, or buffer their output (0). A run is only
+ * complete in the .info files once its problem is freed. The bbob logger lists a run in its .info file when
+ * the run starts, such that runs interrupted by a crash are listed without their final number of evaluations
+ * and f-value. The default value is 0.
+ * - "output_buffer_size: VALUE" defines the size in bytes of the output buffer of each file written by a logger
+ * when not in the crash-safe mode. The default value is 65536.
+ * - "flush_interval: VALUE" defines the number of seconds after which buffered output is written to the files
+ * at the latest, such that the progress can be followed. If VALUE is 0, files are only written when their
+ * buffer is full or when the problem is freed. The default value is 10.
+ * - "timing: VALUE" determines whether the time spent evaluating each observed problem and the time spent by
+ * its logger are measured (1) or not (0). The times can be retrieved with coco_problem_get_evaluation_time
+ * and coco_problem_get_logging_time and the bbob observer also writes them, together with the time spent
+ * constructing the problem, into the comment lines of the .info files. The default value is 0.
  *
  * @return The constructed observer object or NULL if observer_name equals NULL, "" or "no_observer".
  */
@@ -405,12 +487,14 @@ coco_observer_t *coco_observer(const char *observer_name, const char *observer_o
   coco_observer_t *observer;
   char *path, *result_folder, *algorithm_name, *algorithm_info;
   const char *outer_folder_name = "exdata";
-  int precision_x, precision_f, precision_g, log_discrete_as_int;
+  int precision_x, precision_f, precision_g, log_discrete_as_int, crash_safe, timing;
 
   size_t number_target_triggers;
   size_t number_evaluation_triggers;
   double target_precision;
   char *base_evaluation_triggers;
+  size_t output_buffer_size;
+  double flush_interval;
 
   coco_option_keys_t *known_option_keys, *given_option_keys, *additional_option_keys, *redundant_option_keys;
 
@@ -418,7 +502,8 @@ coco_observer_t *coco_observer(const char *observer_name, const char *observer_o
    * IMPORTANT: This list should be up-to-date with the code and the documentation */
   const char *known_keys[] = { "result_folder", "algorithm_name", "algorithm_info",
       "number_target_triggers", "target_precision", "number_evaluation_triggers", "base_evaluation_triggers",
-      "precision_x", "precision_f", "precision_g", "log_discrete_as_int" };
+      "precision_x", "precision_f", "precision_g", "log_discrete_as_int", "crash_safe", "output_buffer_size",
+      "flush_interval", "timing" };
   additional_option_keys = NULL; /* To be set by the chosen observer */
 
   if (0 == strcmp(observer_name, "no_observer")) {
@@ -498,9 +583,34 @@ coco_observer_t *coco_observer(const char *observer_name, const char *observer_o
       log_discrete_as_int = 0;
   }
 
+  crash_safe = 0;
+  if (coco_options_read_int(observer_options, "crash_safe", &crash_safe) != 0) {
+    if ((crash_safe < 0) || (crash_safe > 1))
+      crash_safe = 0;
+  }
+
+  output_buffer_size = 65536;
+  if (coco_options_read_size_t(observer_options, "output_buffer_size", &output_buffer_size) != 0) {
+    if (output_buffer_size < 1024)
+      output_buffer_size = 65536;
+  }
+
+  flush_interval = 10;
+  if (coco_options_read_double(observer_options, "flush_interval", &flush_interval) != 0) {
+    if (flush_interval < 0)
+      flush_interval = 10;
+  }
+
+  timing = 0;
+  if (coco_options_read_int(observer_options, "timing", &timing) != 0) {
+    if ((timing < 0) || (timing > 1))
+      timing = 0;
+  }
+
   observer = coco_observer_allocate(path, observer_name, algorithm_name, algorithm_info,
       number_target_triggers, target_precision, number_evaluation_triggers, base_evaluation_triggers,
-      precision_x, precision_f, precision_g, log_discrete_as_int);
+      precision_x, precision_f, precision_g, log_discrete_as_int, crash_safe, output_buffer_size,
+      flush_interval, timing);
 
   coco_free_memory(path);
   coco_free_memory(result_folder);
@@ -577,6 +687,8 @@ coco_observer_t *coco_observer(const char *observer_name, const char *observer_o
  */
 coco_problem_t *coco_problem_add_observer(coco_problem_t *problem, coco_observer_t *observer) {
 
+  coco_problem_t *observed_problem;
+
   if (problem == NULL)
 	  return NULL;
 
@@ -587,7 +699,15 @@ coco_problem_t *coco_problem_add_observer(coco_problem_t *problem, coco_observer
   }
 
   assert(observer->logger_allocate_function);
-  return observer->logger_allocate_function(observer, problem);
+  observed_problem = observer->logger_allocate_function(observer, problem);
+
+  /* The times are added to the observed problem, both when evaluating it and when evaluating the inner
+   * problem (unless the inner problem is itself observed with timing) */
+  if (observer->timing && (problem->timed_problem == NULL)) {
+    problem->timed_problem = observed_problem;
+    observed_problem->timed_problem = observed_problem;
+  }
+  return observed_problem;
 }
 
 /**
@@ -623,6 +743,11 @@ coco_problem_t *coco_problem_remove_observer(coco_problem_t *problem, coco_obser
 
   /* Keep the inner problem and remove the logger data */
   problem_unobserved = coco_problem_transformed_get_inner_problem(problem);
+  if (problem_unobserved->timed_problem == problem) {
+    problem_unobserved->timed_problem = NULL;
+    problem_unobserved->evaluation_time = problem->evaluation_time;
+    problem_unobserved->logging_time = problem->logging_time;
+  }
   coco_problem_transformed_free_data(problem);
   problem = NULL;
 
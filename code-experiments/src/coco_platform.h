@@ -84,6 +84,46 @@ int mkdir(const char *pathname, mode_t mode);
 #define S_IRWXU 0700
 #endif
 
+/* Definition of a mutex that protects data shared by problems which are evaluated in different threads,
+ * like the entries of an observer. A static mutex can be initialized with COCO_MUTEX_INITIALIZER. The
+ * mutex is only compiled in if COCO_THREAD_SAFE is defined (on POSIX systems, the program must then be
+ * linked with -lpthread), otherwise locking it does nothing. */
+#if !defined(COCO_THREAD_SAFE)
+typedef int coco_mutex_t;
+#define COCO_MUTEX_INITIALIZER 0
+#define coco_mutex_init(mutex) (*(mutex) = 0)
+#define coco_mutex_lock(mutex) ((void) (mutex))
+#define coco_mutex_unlock(mutex) ((void) (mutex))
+#define coco_mutex_destroy(mutex) ((void) (mutex))
+#elif defined(_WIN32) || defined(_WIN64) || defined(__MINGW64__) || defined(__CYGWIN__)
+typedef SRWLOCK coco_mutex_t;
+#define COCO_MUTEX_INITIALIZER SRWLOCK_INIT
+#define coco_mutex_init(mutex) InitializeSRWLock(mutex)
+#define coco_mutex_lock(mutex) AcquireSRWLockExclusive(mutex)
+#define coco_mutex_unlock(mutex) ReleaseSRWLockExclusive(mutex)
+#define coco_mutex_destroy(mutex) ((void) (mutex))
+#else
+#include <pthread.h>
+typedef pthread_mutex_t coco_mutex_t;
+#define COCO_MUTEX_INITIALIZER PTHREAD_MUTEX_INITIALIZER
+#define coco_mutex_init(mutex) pthread_mutex_init(mutex, NULL)
+#define coco_mutex_lock(mutex) pthread_mutex_lock(mutex)
+#define coco_mutex_unlock(mutex) pthread_mutex_unlock(mutex)
+#define coco_mutex_destroy(mutex) pthread_mutex_destroy(mutex)
+#endif
+
+/* Definitions needed for measuring elapsed times with coco_get_time(). A monotonic clock is used where
+ * it is available, which is not the case for POSIX systems when compiling in strict C89 mode. */
+#if defined(_WIN32) || defined(_WIN64) || defined(__MINGW64__) || defined(__CYGWIN__)
+#define HAVE_QUERY_PERFORMANCE_COUNTER 1
+#else
+#include <time.h>
+#include <sys/time.h>
+#if defined(CLOCK_MONOTONIC)
+#define HAVE_CLOCK_MONOTONIC 1
+#endif
+#endif
+
 /* To silence the Visual Studio compiler (C4996 warnings in the python build). */
 #ifdef _MSC_VER
 #pragma warning(disable:4996)
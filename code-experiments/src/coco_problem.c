@@ -15,6 +15,28 @@
  * @name Methods regarding the basic COCO problem
  */
 /**@{*/
+
+/**
+ * @brief Calls the evaluate function of the problem and adds the time spent in it to the timings of the
+ * observed problem.
+ *
+ * The time spent in the observed problem that is not spent in its inner problem is logging time.
+ */
+static void coco_problem_evaluate_timed(coco_problem_t *problem,
+                                        coco_evaluate_function_t evaluate_function,
+                                        const double *x,
+                                        double *y) {
+  coco_problem_t *timed_problem = problem->timed_problem;
+  const double evaluation_time = timed_problem->evaluation_time;
+  const double start = coco_get_time();
+
+  evaluate_function(problem, x, y);
+  if (timed_problem == problem)
+    problem->logging_time += coco_get_time() - start - (problem->evaluation_time - evaluation_time);
+  else
+    timed_problem->evaluation_time += coco_get_time() - start;
+}
+
 /**
  * Evaluates the problem function, increases the number of evaluations and updates the best observed value
  * and the best observed evaluation number.
@@ -30,7 +52,6 @@ void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y)
   /* implements a safer version of problem->evaluate(problem, x, y) */
   size_t i, j;
   int is_feasible;
-  double *z;
   
   assert(problem != NULL);
   assert(problem->evaluate_function != NULL);
@@ -51,17 +72,17 @@ void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y)
     return;
   }
 
-  problem->evaluate_function(problem, x, y);
+  if (problem->timed_problem == NULL)
+    problem->evaluate_function(problem, x, y);
+  else
+    coco_problem_evaluate_timed(problem, problem->evaluate_function, x, y);
   problem->evaluations++; /* each derived class has its own counter, only the most outer will be visible */
 
   /* A little bit of bookkeeping */
   if (y[0] < problem->best_observed_fvalue[0]) {
     is_feasible = 1;
-    if (coco_problem_get_number_of_constraints(problem) > 0) {
-      z = coco_allocate_vector(coco_problem_get_number_of_constraints(problem));
-      is_feasible = coco_is_feasible(problem, x, z);
-      coco_free_memory(z);
-    }
+    if (coco_problem_get_number_of_constraints(problem) > 0)
+      is_feasible = coco_is_feasible(problem, x, NULL);
     if (is_feasible) {
       problem->best_observed_fvalue[0] = y[0];
       problem->best_observed_evaluation[0] = problem->evaluations;
@@ -103,7 +124,10 @@ void coco_evaluate_constraint(coco_problem_t *problem, const double *x, double *
     return;
   }
   
-  problem->evaluate_constraint(problem, x, y);
+  if (problem->timed_problem == NULL)
+    problem->evaluate_constraint(problem, x, y);
+  else
+    coco_problem_evaluate_timed(problem, problem->evaluate_constraint, x, y);
   problem->evaluations_constraints++;
 }
 
@@ -184,6 +208,13 @@ static coco_problem_t *coco_problem_allocate(const size_t number_of_variables,
   problem->problem_type = NULL;
   problem->evaluations = 0;
   problem->evaluations_constraints = 0;
+  problem->constraint_values = NULL;
+  if (number_of_constraints > 0)
+    problem->constraint_values = coco_allocate_vector(number_of_constraints);
+  problem->construction_time = 0;
+  problem->evaluation_time = 0;
+  problem->logging_time = 0;
+  problem->timed_problem = NULL;
   problem->final_target_delta[0] = 1e-8; /* in case to be modified by the benchmark */
   problem->best_observed_fvalue[0] = DBL_MAX;
   problem->best_observed_evaluation[0] = 0;
@@ -239,6 +270,7 @@ static coco_problem_t *coco_problem_duplicate(const coco_problem_t *other) {
 
   problem->evaluations = other->evaluations;
   problem->evaluations_constraints = other->evaluations_constraints;
+  problem->construction_time = other->construction_time;
   problem->final_target_delta[0] = other->final_target_delta[0];
   problem->best_observed_fvalue[0] = other->best_observed_fvalue[0];
   problem->best_observed_evaluation[0] = other->best_observed_evaluation[0];
@@ -309,6 +341,8 @@ void coco_problem_free(coco_problem_t *problem) {
       coco_free_memory(problem->data);
     if (problem->initial_solution != NULL)
       coco_free_memory(problem->initial_solution);
+    if (problem->constraint_values != NULL)
+      coco_free_memory(problem->constraint_values);
     problem->smallest_values_of_interest = NULL;
     problem->largest_values_of_interest = NULL;
     problem->best_parameter = NULL;
@@ -317,6 +351,7 @@ void coco_problem_free(coco_problem_t *problem) {
     problem->suite = NULL;
     problem->data = NULL;
     problem->initial_solution = NULL;
+    problem->constraint_values = NULL;
     coco_free_memory(problem);
   }
 }
@@ -412,6 +447,21 @@ size_t coco_problem_get_evaluations_constraints(const coco_problem_t *problem) {
   return problem->evaluations_constraints;
 }
 
+double coco_problem_get_construction_time(const coco_problem_t *problem) {
+  assert(problem != NULL);
+  return problem->construction_time;
+}
+
+double coco_problem_get_evaluation_time(const coco_problem_t *problem) {
+  assert(problem != NULL);
+  return problem->evaluation_time;
+}
+
+double coco_problem_get_logging_time(const coco_problem_t *problem) {
+  assert(problem != NULL);
+  return problem->logging_time;
+}
+
 /**
  * @brief Returns 1 if the best parameter is not (close to) zero and 0 otherwise.
  */
@@ -791,6 +841,21 @@ static coco_problem_t *coco_problem_transformed_allocate(coco_problem_t *inner_p
 
   return inner_copy;
 }
+
+/**
+ * @brief Asserts that the function value y[0] at x is not lower than the optimal value if x is feasible.
+ *
+ * Problems without constraints are always feasible. As the constraints are evaluated only for this check,
+ * it compiles away when assertions are disabled (that is, when NDEBUG is defined), as assert itself does.
+ */
+#ifndef NDEBUG
+static void coco_problem_assert_feasible_above_optimum(coco_problem_t *problem, const double *x, const double *y) {
+  if (problem->number_of_constraints == 0 || coco_is_feasible(problem, x, NULL))
+    assert(y[0] + 1e-13 >= problem->best_value[0]);
+}
+#else
+#define coco_problem_assert_feasible_above_optimum(problem, x, y) ((void) 0)
+#endif
 /**@}*/
 
 /***********************************************************************************************************/
@@ -808,8 +873,6 @@ static void coco_problem_stacked_evaluate_function(coco_problem_t *problem, cons
 
   const size_t number_of_objectives_problem1 = coco_problem_get_number_of_objectives(data->problem1);
   const size_t number_of_objectives_problem2 = coco_problem_get_number_of_objectives(data->problem2);
-  double *cons_values = NULL;
-  int is_feasible;
     
   assert(coco_problem_get_number_of_objectives(problem)
       == number_of_objectives_problem1 + number_of_objectives_problem2);
@@ -822,13 +885,8 @@ static void coco_problem_stacked_evaluate_function(coco_problem_t *problem, cons
   /* Make sure that no feasible point has a function value lower
    * than the minimum's.
    */
-  if (problem->number_of_constraints > 0) {
-    cons_values = coco_allocate_vector(problem->number_of_constraints);
-    is_feasible = coco_is_feasible(problem, x, cons_values);
-    coco_free_memory(cons_values);   
-    if (is_feasible)
-      assert(y[0] + 1e-13 >= problem->best_value[0]);
-  }
+  if (problem->number_of_constraints > 0)
+    coco_problem_assert_feasible_above_optimum(problem, x, y);
 }
 
 /**
@@ -40,7 +40,8 @@ static char *coco_strdup(const char *string) {
  * @brief Formatted string duplication, with va_list arguments.
  */
 static char *coco_vstrdupf(const char *str, va_list args) {
-  static char buf[COCO_VSTRDUPF_BUFLEN];
+  /* not static, such that strings can be formatted in different threads at the same time */
+  char buf[COCO_VSTRDUPF_BUFLEN];
   long written;
   /* apparently args can only be used once, therefore
    * len = vsnprintf(NULL, 0, str, args) to find out the
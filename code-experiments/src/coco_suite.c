@@ -14,6 +14,7 @@
 #include "coco.h"
 #include "coco_internal.h"
 #include "coco_utilities.c"
+#include "coco_cache.c"
 
 #include "suite_bbob.c"
 #include "suite_bbob_mixint.c"
@@ -101,6 +102,7 @@ static coco_problem_t *coco_suite_get_problem_from_indices(coco_suite_t *suite,
                                                            const size_t instance_idx) {
 
   coco_problem_t *problem;
+  double start;
   
   if ((suite->functions[function_idx] == 0) ||
       (suite->dimensions[dimension_idx] == 0) ||
@@ -108,6 +110,7 @@ static coco_problem_t *coco_suite_get_problem_from_indices(coco_suite_t *suite,
     return NULL;
   }
 
+  start = coco_get_time();
   if (strcmp(suite->suite_name, "toy") == 0) {
     problem = suite_toy_get_problem(suite, function_idx, dimension_idx, instance_idx);
   } else if (strcmp(suite->suite_name, "bbob") == 0) {
@@ -129,6 +132,7 @@ static coco_problem_t *coco_suite_get_problem_from_indices(coco_suite_t *suite,
   }
 
   coco_problem_set_suite(problem, suite);
+  problem->construction_time = coco_get_time() - start;
 
   return problem;
 }
@@ -217,6 +221,7 @@ static coco_suite_t *coco_suite_allocate(const char *suite_name,
   size_t i;
 
   suite = (coco_suite_t *) coco_allocate_memory(sizeof(*suite));
+  coco_cache_retain();
 
   suite->suite_name = coco_strdup(suite_name);
 
@@ -417,6 +422,7 @@ void coco_suite_free(coco_suite_t *suite) {
 
     coco_free_memory(suite);
     suite = NULL;
+    coco_cache_release();
   }
 }
 
@@ -989,9 +989,10 @@ static int coco_vector_isfinite(const double *x, const size_t dim) {
 /**
  * @brief Returns 1 if the point x is feasible, and 0 otherwise.
  *
- * Allows constraint_values == NULL, otherwise constraint_values
- * must be a valid double* pointer and contains the g-values of x
- * on "return".
+ * Allows constraint_values == NULL, in which case the g-values are
+ * computed into the preallocated problem->constraint_values, otherwise
+ * constraint_values must be a valid double* pointer and contains the
+ * g-values of x on "return".
  * 
  * Any point x containing NaN or inf values is considered infeasible.
  *
@@ -1021,7 +1022,9 @@ static int coco_is_feasible(coco_problem_t *problem,
   assert(problem->evaluate_constraint != NULL);
   
   if (constraint_values == NULL)
-     cons_values = coco_allocate_vector(problem->number_of_constraints);
+    cons_values = problem->constraint_values;
+  if (cons_values == NULL) /* the number of constraints was changed after the allocation */
+    cons_values = coco_allocate_vector(problem->number_of_constraints);
 
   problem->evaluate_constraint(problem, x, cons_values);
   /* coco_evaluate_constraint(problem, x, cons_values) increments problem->evaluations_constraints counter */
@@ -1033,7 +1036,7 @@ static int coco_is_feasible(coco_problem_t *problem,
     }
   }
 
-  if (constraint_values == NULL)
+  if (cons_values != constraint_values && cons_values != problem->constraint_values)
     coco_free_memory(cons_values);
   return ret_val;
 }
@@ -1063,6 +1066,37 @@ static char *coco_current_time_get_string(void) {
   return time_string;
 }
 
+/**
+ * @brief Returns the time in seconds elapsed since an arbitrary point in the past.
+ *
+ * Meant for measuring short durations as differences of two calls, which is done with a monotonic
+ * clock if the platform provides one.
+ */
+static double coco_get_time(void) {
+#if defined(HAVE_QUERY_PERFORMANCE_COUNTER)
+  LARGE_INTEGER counter, frequency;
+  QueryPerformanceCounter(&counter);
+  QueryPerformanceFrequency(&frequency);
+  return (double) counter.QuadPart / (double) frequency.QuadPart;
+#elif defined(HAVE_CLOCK_MONOTONIC)
+  struct timespec now;
+  clock_gettime(CLOCK_MONOTONIC, &now);
+  return (double) now.tv_sec + 1e-9 * (double) now.tv_nsec;
+#else
+  struct timeval now;
+  gettimeofday(&now, NULL);
+  return (double) now.tv_sec + 1e-6 * (double) now.tv_usec;
+#endif
+}
+
+/**
+ * @brief Returns 1 if the platform stores numbers in little-endian byte order and 0 otherwise.
+ */
+static int coco_is_little_endian(void) {
+  const unsigned int one = 1;
+  return *((const unsigned char *) &one) == 1;
+}
+
 /**
  * @brief Returns the number of positive numbers pointed to by numbers (the count stops when the first
  * 0 is encountered of max_count numbers have been read).
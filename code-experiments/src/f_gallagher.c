@@ -38,6 +38,7 @@ typedef struct {
   double **rotation, **x_local, **arr_scales;
   size_t number_of_peaks;
   double *peak_values;
+  double *tmx;
   coco_problem_free_function_t old_free_problem;
 } f_gallagher_data_t;
 
@@ -59,7 +60,7 @@ static int f_gallagher_compare_doubles(const void *a, const void *b) {
  */
 static double f_gallagher_raw(const double *x, const size_t number_of_variables, f_gallagher_data_t *data) {
   size_t i, j; /* Loop over dim */
-  double *tmx;
+  double *tmx = data->tmx;
   double a = 0.1;
   double tmp2, f = 0., f_add, tmp, f_pen = 0., f_true = 0.;
   double fac;
@@ -80,7 +81,6 @@ static double f_gallagher_raw(const double *x, const size_t number_of_variables,
   f_add = f_pen;
   /* Transformation in search space */
   /* TODO: this should rather be done in f_gallagher */
-  tmx = coco_allocate_vector(number_of_variables);
   for (i = 0; i < number_of_variables; i++) {
     tmx[i] = 0;
     for (j = 0; j < number_of_variables; ++j) {
@@ -111,7 +111,6 @@ static double f_gallagher_raw(const double *x, const size_t number_of_variables,
   f_true *= f_true;
   f_true += f_add;
   result = f_true;
-  coco_free_memory(tmx);
   return result;
 }
 
@@ -132,6 +131,7 @@ static void f_gallagher_free(coco_problem_t *problem) {
   data = (f_gallagher_data_t *) problem->data;
   coco_free_memory(data->xopt);
   coco_free_memory(data->peak_values);
+  coco_free_memory(data->tmx);
   bbob2009_free_matrix(data->rotation, problem->number_of_variables);
   bbob2009_free_matrix(data->x_local, problem->number_of_variables);
   bbob2009_free_matrix(data->arr_scales, data->number_of_peaks);
@@ -140,63 +140,49 @@ static void f_gallagher_free(coco_problem_t *problem) {
 }
 
 /**
- * @brief Creates the BBOB Gallagher problem.
+ * @brief Computes the peak values, the scales and the locations of the peaks and xopt.
  *
- * @note There is no separate basic allocate function.
+ * The rotation must have been computed before. The results are cached, such that constructing the same
+ * problem again does not recompute them.
  */
-static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
-                                                         const size_t dimension,
-                                                         const size_t instance,
-                                                         const long rseed,
-                                                         const size_t number_of_peaks,
-                                                         const char *problem_id_template,
-                                                         const char *problem_name_template) {
-
-  f_gallagher_data_t *data;
-  /* problem_name and best_parameter will be overwritten below */
-  coco_problem_t *problem = coco_problem_allocate_from_scalars("Gallagher function",
-      f_gallagher_evaluate, f_gallagher_free, dimension, -5.0, 5.0, 0.0);
-
-  const size_t peaks_21 = 21;
-  const size_t peaks_101 = 101;
-
-  double fopt;
+static void f_gallagher_compute_peaks(f_gallagher_data_t *data,
+                                      const size_t dimension,
+                                      const size_t number_of_peaks,
+                                      const double maxcondition1,
+                                      const double b,
+                                      const double c) {
   size_t i, j, k;
   double maxcondition = 1000.;
-  /* maxcondition1 satisfies the old code and the doc but seems wrong in that it is, with very high
-   * probability, not the largest condition level!!! */
-  double maxcondition1 = 1000.;
   double *arrCondition;
   double fitvalues[2] = { 1.1, 9.1 };
-  /* Parameters for generating local optima. In the old code, they are different in f21 and f22 */
-  double b = 0, c = 0;
   /* Random permutation */
   f_gallagher_permutation_t *rperm;
   double *random_numbers;
-
-  data = (f_gallagher_data_t *) coco_allocate_memory(sizeof(*data));
-  /* Allocate temporary storage and space for the rotation matrices */
-  data->number_of_peaks = number_of_peaks;
-  data->xopt = coco_allocate_vector(dimension);
-  data->rotation = bbob2009_allocate_matrix(dimension, dimension);
-  data->x_local = bbob2009_allocate_matrix(dimension, number_of_peaks);
-  data->arr_scales = bbob2009_allocate_matrix(number_of_peaks, dimension);
-
-  if (number_of_peaks == peaks_101) {
-    maxcondition1 = sqrt(maxcondition1);
-    b = 10.;
-    c = 5.;
-  } else if (number_of_peaks == peaks_21) {
-    b = 9.8;
-    c = 4.9;
-  } else {
-    coco_error("f_gallagher_bbob_problem_allocate(): '%lu' is a non-supported number of peaks",
-    		(unsigned long) number_of_peaks);
+  /* The cached data consist of the peak values, the rows of arr_scales and x_local and xopt */
+  const size_t peak_data_size = number_of_peaks * (2 * dimension + 1) + dimension;
+  double *peak_data, *current;
+  char *key;
+
+  key = coco_strdupf("gallagher_s%ld_d%lu_p%lu", data->rseed, (unsigned long) dimension,
+      (unsigned long) number_of_peaks);
+  peak_data = coco_allocate_vector(peak_data_size);
+  if (coco_cache_get(key, peak_data, peak_data_size)) {
+    current = peak_data;
+    for (i = 0; i < number_of_peaks; ++i)
+      data->peak_values[i] = *current++;
+    for (i = 0; i < number_of_peaks; ++i)
+      for (j = 0; j < dimension; ++j)
+        data->arr_scales[i][j] = *current++;
+    for (i = 0; i < dimension; ++i)
+      for (j = 0; j < number_of_peaks; ++j)
+        data->x_local[i][j] = *current++;
+    for (i = 0; i < dimension; ++i)
+      data->xopt[i] = *current++;
+    coco_free_memory(peak_data);
+    coco_free_memory(key);
+    return;
   }
-  data->rseed = rseed;
-  bbob2009_compute_rotation(data->rotation, rseed, dimension);
 
-  /* Initialize all the data of the inner problem */
   random_numbers = coco_allocate_vector(number_of_peaks * dimension); /* This is large enough for all cases below */
   bbob2009_unif(random_numbers, number_of_peaks - 1, data->rseed);
   rperm = (f_gallagher_permutation_t *) coco_allocate_memory(sizeof(*rperm) * (number_of_peaks - 1));
@@ -209,7 +195,6 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
   /* Random permutation */
   arrCondition = coco_allocate_vector(number_of_peaks);
   arrCondition[0] = maxcondition1;
-  data->peak_values = coco_allocate_vector(number_of_peaks);
   data->peak_values[0] = 10;
   for (i = 1; i < number_of_peaks; ++i) {
     arrCondition[i] = pow(maxcondition, (double) (rperm[i - 1].index) / ((double) (number_of_peaks - 2)));
@@ -236,7 +221,6 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
   bbob2009_unif(random_numbers, dimension * number_of_peaks, data->rseed);
   for (i = 0; i < dimension; ++i) {
     data->xopt[i] = 0.8 * (b * random_numbers[i] - c);
-    problem->best_parameter[i] = 0.8 * (b * random_numbers[i] - c);
     for (j = 0; j < number_of_peaks; ++j) {
       data->x_local[i][j] = 0.;
       for (k = 0; k < dimension; ++k) {
@@ -250,6 +234,80 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
   coco_free_memory(arrCondition);
   coco_free_memory(random_numbers);
 
+  current = peak_data;
+  for (i = 0; i < number_of_peaks; ++i)
+    *current++ = data->peak_values[i];
+  for (i = 0; i < number_of_peaks; ++i)
+    for (j = 0; j < dimension; ++j)
+      *current++ = data->arr_scales[i][j];
+  for (i = 0; i < dimension; ++i)
+    for (j = 0; j < number_of_peaks; ++j)
+      *current++ = data->x_local[i][j];
+  for (i = 0; i < dimension; ++i)
+    *current++ = data->xopt[i];
+  coco_cache_put(key, peak_data, peak_data_size);
+  coco_free_memory(peak_data);
+  coco_free_memory(key);
+}
+
+/**
+ * @brief Creates the BBOB Gallagher problem.
+ *
+ * @note There is no separate basic allocate function.
+ */
+static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
+                                                         const size_t dimension,
+                                                         const size_t instance,
+                                                         const long rseed,
+                                                         const size_t number_of_peaks,
+                                                         const char *problem_id_template,
+                                                         const char *problem_name_template) {
+
+  f_gallagher_data_t *data;
+  /* problem_name and best_parameter will be overwritten below */
+  coco_problem_t *problem = coco_problem_allocate_from_scalars("Gallagher function",
+      f_gallagher_evaluate, f_gallagher_free, dimension, -5.0, 5.0, 0.0);
+
+  const size_t peaks_21 = 21;
+  const size_t peaks_101 = 101;
+
+  double fopt;
+  size_t i;
+  /* maxcondition1 satisfies the old code and the doc but seems wrong in that it is, with very high
+   * probability, not the largest condition level!!! */
+  double maxcondition1 = 1000.;
+  /* Parameters for generating local optima. In the old code, they are different in f21 and f22 */
+  double b = 0, c = 0;
+
+  data = (f_gallagher_data_t *) coco_allocate_memory(sizeof(*data));
+  /* Allocate temporary storage and space for the rotation matrices */
+  data->number_of_peaks = number_of_peaks;
+  data->xopt = coco_allocate_vector(dimension);
+  data->tmx = coco_allocate_vector(dimension);
+  data->rotation = bbob2009_allocate_matrix(dimension, dimension);
+  data->x_local = bbob2009_allocate_matrix(dimension, number_of_peaks);
+  data->arr_scales = bbob2009_allocate_matrix(number_of_peaks, dimension);
+  data->peak_values = coco_allocate_vector(number_of_peaks);
+
+  if (number_of_peaks == peaks_101) {
+    maxcondition1 = sqrt(maxcondition1);
+    b = 10.;
+    c = 5.;
+  } else if (number_of_peaks == peaks_21) {
+    b = 9.8;
+    c = 4.9;
+  } else {
+    coco_error("f_gallagher_bbob_problem_allocate(): '%lu' is a non-supported number of peaks",
+    		(unsigned long) number_of_peaks);
+  }
+  data->rseed = rseed;
+  bbob2009_compute_rotation(data->rotation, rseed, dimension);
+
+  /* Initialize all the data of the inner problem */
+  f_gallagher_compute_peaks(data, dimension, number_of_peaks, maxcondition1, b, c);
+  for (i = 0; i < dimension; ++i)
+    problem->best_parameter[i] = data->xopt[i];
+
   problem->data = data;
 
   /* Compute best solution */
@@ -319,18 +377,13 @@ static double f_gallagher_core(const double *x, size_t number_of_variables, f_ga
   coco_problem_t *problem_i;
   double result = 0;
   double y, w_i;
-  size_t i,j;
+  size_t i;
   double maxf = DBL_MAX;
-  double *x_local;
-  x_local = coco_allocate_vector(number_of_variables);
-
 
+  /* The sub-problems do not modify their argument, such that x needs not be copied */
   for (i = 0; i < versatile_data->number_of_peaks; i++) {
-    for (j = 0; j < number_of_variables; j++) {
-      x_local[j] = x[j];/*versatile_data->rotated_x[j];*/
-    }
     problem_i = versatile_data->sub_problems[i];
-    problem_i->evaluate_function(problem_i, x_local, &y);
+    problem_i->evaluate_function(problem_i, x, &y);
     if (i == 0) {
       w_i = 10;
     } else {
@@ -342,7 +395,6 @@ static double f_gallagher_core(const double *x, size_t number_of_variables, f_ga
     }
   }
   result = 10.0 - maxf;
-  coco_free_memory(x_local);
   return result;
 }
 
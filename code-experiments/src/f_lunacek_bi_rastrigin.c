@@ -19,7 +19,7 @@
  * @brief Data type for the Lunacek bi-Rastrigin problem.
  */
 typedef struct {
-  double *x_hat, *z;
+  double *x_hat, *z, *tmpvect;
   double *xopt, fopt;
   double **rot1, **rot2;
   long rseed;
@@ -40,7 +40,7 @@ static double f_lunacek_bi_rastrigin_raw(const double *x,
   static const double d = 1.;
   const double s = 1. - 0.5 / (sqrt((double) (number_of_variables + 20)) - 4.1);
   const double mu1 = -sqrt((mu0 * mu0 - d) / s);
-  double *tmpvect, sum1 = 0., sum2 = 0., sum3 = 0.;
+  double *tmpvect = data->tmpvect, sum1 = 0., sum2 = 0., sum3 = 0.;
 
   assert(number_of_variables > 1);
 
@@ -62,7 +62,6 @@ static double f_lunacek_bi_rastrigin_raw(const double *x,
     }
   }
 
-  tmpvect = coco_allocate_vector(number_of_variables);
   /* affine transformation */
   for (i = 0; i < number_of_variables; ++i) {
     double c1;
@@ -86,7 +85,6 @@ static double f_lunacek_bi_rastrigin_raw(const double *x,
   }
   result = coco_double_min(sum1, d * (double) number_of_variables + s * sum2)
       + 10. * ((double) number_of_variables - sum3) + 1e4 * penalty;
-  coco_free_memory(tmpvect);
 
   return result;
 }
@@ -108,6 +106,7 @@ static void f_lunacek_bi_rastrigin_free(coco_problem_t *problem) {
   data = (f_lunacek_bi_rastrigin_data_t *) problem->data;
   coco_free_memory(data->x_hat);
   coco_free_memory(data->z);
+  coco_free_memory(data->tmpvect);
   coco_free_memory(data->xopt);
   bbob2009_free_matrix(data->rot1, problem->number_of_variables);
   bbob2009_free_matrix(data->rot2, problem->number_of_variables);
@@ -144,6 +143,7 @@ static coco_problem_t *f_lunacek_bi_rastrigin_bbob_problem_allocate(const size_t
   /* Allocate temporary storage and space for the rotation matrices */
   data->x_hat = coco_allocate_vector(dimension);
   data->z = coco_allocate_vector(dimension);
+  data->tmpvect = coco_allocate_vector(dimension);
   data->xopt = coco_allocate_vector(dimension);
   data->rot1 = bbob2009_allocate_matrix(dimension, dimension);
   data->rot2 = bbob2009_allocate_matrix(dimension, dimension);
@@ -31,42 +31,27 @@ static const double fvalue_logged_for_nan = 2e21;
 /* static const double fvalue_logged_for_infeasible = 1e21;  only in first evaluation */
 static const double weight_constraints = 1e0;  /* factor used in logged indicator (f-f*)^+ + sum_i g_i^+ in front of the sum */
 
-/*static const size_t bbob_nbpts_nbevals = 20; Wassim: tentative, are now observer options with these default values*/
-/*static const size_t bbob_nbpts_fval = 5;*/
-static size_t bbob_current_dim = 0;
-static size_t bbob_current_funId = 0;
-static size_t bbob_infoFile_firstInstance = 0;
-char *bbob_infoFile_firstInstance_char;
-/* a possible solution: have a list of dims that are already in the file, if the ones we're about to log
- * is != bbob_current_dim and the funId is currend_funId, create a new .info file with as suffix the
- * number of the first instance */
-static const int bbob_number_of_dimensions = 6;
-static size_t bbob_dimensions_in_current_infoFile[6] = { 0, 0, 0, 0, 0, 0 }; /* TODO should use dimensions from the suite */
-
-/* The current_... mechanism fails if several problems are open.
- * For the time being this should lead to an error.
- *
- * A possible solution: bbob_logger_is_open becomes a reference
- * counter and as long as another logger is open, always a new info
- * file is generated.
- * TODO: Shouldn't the new way of handling observers already fix this?
- */
-static int bbob_logger_is_open = 0; /* this could become lock-list of .info files */
-
 /* TODO: add possibility of adding a prefix to the index files (easy to do through observer options) */
 
 /**
  * @brief The bbob logger data type.
  */
 typedef struct {
-  coco_observer_t *observer;
+  observer_bbob_entries_t *entries; /* entries of the observer, which are kept until the logger is freed */
+  coco_problem_t *problem; /* the observed problem, which holds the times measured with the timing option */
   int is_initialized;
   /*char *path;// relative path to the data folder. //Wassim: now fetched from the observer */
   /*const char *alg_name; the alg name, for now, temporarily the same as the path. Wassim: Now in the observer */
-  FILE *index_file; /* index file */
+  observer_bbob_entry_t *entry; /* entry of the index file, shared with loggers of the same function and dimension */
   FILE *fdata_file; /* function value aligned data file */
   FILE *tdata_file; /* number of function evaluations aligned data file */
   FILE *rdata_file; /* restart info data file */
+  char *fdata_buffer; /* output buffer of the .dat file, NULL in the crash-safe mode */
+  char *tdata_buffer; /* output buffer of the .tdat file, NULL in the crash-safe mode */
+  int crash_safe; /* whether to flush the data files after each written line */
+  size_t output_buffer_size; /* size of the output buffers of the data files */
+  double flush_interval; /* seconds after which the buffered output is flushed */
+  time_t last_flush; /* time when the data files were last flushed */
   size_t number_of_evaluations;
   size_t number_of_evaluations_constraints;
   double best_fvalue;
@@ -181,11 +166,16 @@ static void logger_bbob_write_data(FILE *target_file,
     }
   }
   fprintf(target_file, "\n");
+}
 
-  /* Flush output so that impatient users can see progress.
-   * Otherwise it can take a long time until the output appears.
-   */
-  fflush(target_file);
+/**
+ * Flushes the data files if the observer asks for it, such that impatient users can see progress
+ */
+static void logger_bbob_flush(logger_bbob_data_t *logger) {
+  if (coco_observer_flush_due(logger->crash_safe, logger->flush_interval, &logger->last_flush)) {
+    fflush(logger->fdata_file);
+    fflush(logger->tdata_file);
+  }
 }
 
 /**
@@ -249,181 +239,60 @@ static void logger_bbob_open_dataFile(FILE **target_file,
   }
 }*/
 
-/**
- * Creates the index file fileName_prefix+problem_id+file_extension in
- * folder_path
- */
-static void logger_bbob_openIndexFile(logger_bbob_data_t *logger,
-                                      const char *folder_path,
-                                      const char *indexFile_prefix,
-                                      const char *function_id,
-                                      const char *dataFile_path,
-                                      const char *suite_name) {
-  /* to add the instance number TODO: this should be done outside to avoid redoing this for the .*dat files */
-  char used_dataFile_path[COCO_PATH_MAX + 2] = { 0 };
-  int errnum, newLine = 0; /* newLine is at 1 if we need a new line in the info file */
-  char *function_id_char; /* TODO: consider adding them to logger */
-  char file_name[COCO_PATH_MAX + 2] = { 0 };
-  char file_path[COCO_PATH_MAX + 2] = { 0 };
-  FILE **target_file;
-  FILE *tmp_file;
-  strncpy(used_dataFile_path, dataFile_path, COCO_PATH_MAX - strlen(used_dataFile_path) - 1);
-  if (bbob_infoFile_firstInstance == 0) {
-    bbob_infoFile_firstInstance = logger->instance_id;
-  }
-  function_id_char = coco_strdupf("%lu", (unsigned long) logger->function_id);
-  bbob_infoFile_firstInstance_char = coco_strdupf("%lu", (unsigned long) bbob_infoFile_firstInstance);
-  target_file = &(logger->index_file);
-  tmp_file = NULL; /* to check whether the file already exists. Don't want to use target_file */
-  strncpy(file_name, indexFile_prefix, COCO_PATH_MAX - strlen(file_name) - 1);
-  strncat(file_name, "_f", COCO_PATH_MAX - strlen(file_name) - 1);
-  strncat(file_name, function_id_char, COCO_PATH_MAX - strlen(file_name) - 1);
-  strncat(file_name, "_i", COCO_PATH_MAX - strlen(file_name) - 1);
-  strncat(file_name, bbob_infoFile_firstInstance_char, COCO_PATH_MAX - strlen(file_name) - 1);
-  strncat(file_name, ".info", COCO_PATH_MAX - strlen(file_name) - 1);
-  coco_join_path(file_path, sizeof(file_path), folder_path, file_name, NULL);
-  if (*target_file == NULL) {
-    tmp_file = fopen(file_path, "r"); /* to check for existence */
-    if ((tmp_file) && (bbob_current_dim == logger->number_of_variables)
-        && (bbob_current_funId == logger->function_id)) {
-        /* new instance of current funId and current dim */
-      newLine = 0;
-      *target_file = fopen(file_path, "a+");
-      if (*target_file == NULL) {
-        errnum = errno;
-        logger_bbob_error_io(*target_file, errnum);
-      }
-      fclose(tmp_file);
-    } else { /* either file doesn't exist (new funId) or new Dim */
-      /* check that the dim was not already present earlier in the file, if so, create a new info file */
-      if (bbob_current_dim != logger->number_of_variables) {
-        int i, j;
-        for (i = 0;
-            i < bbob_number_of_dimensions && bbob_dimensions_in_current_infoFile[i] != 0
-                && bbob_dimensions_in_current_infoFile[i] != logger->number_of_variables; i++) {
-          ; /* checks whether dimension already present in the current infoFile */
-        }
-        if (i < bbob_number_of_dimensions && bbob_dimensions_in_current_infoFile[i] == 0) {
-          /* new dimension seen for the first time */
-          bbob_dimensions_in_current_infoFile[i] = logger->number_of_variables;
-          newLine = 1;
-        } else {
-          if (i < bbob_number_of_dimensions) { /* dimension already present, need to create a new file */
-            newLine = 0;
-            file_path[strlen(file_path) - strlen(bbob_infoFile_firstInstance_char) - 7] = 0; /* truncate the instance part */
-            bbob_infoFile_firstInstance = logger->instance_id;
-            coco_free_memory(bbob_infoFile_firstInstance_char);
-            bbob_infoFile_firstInstance_char = coco_strdupf("%lu", (unsigned long) bbob_infoFile_firstInstance);
-            strncat(file_path, "_i", COCO_PATH_MAX - strlen(file_name) - 1);
-            strncat(file_path, bbob_infoFile_firstInstance_char, COCO_PATH_MAX - strlen(file_name) - 1);
-            strncat(file_path, ".info", COCO_PATH_MAX - strlen(file_name) - 1);
-          } else { /* we have all dimensions */
-            newLine = 1;
-          }
-          for (j = 0; j < bbob_number_of_dimensions; j++) { /* new info file, reinitialize list of dims */
-            bbob_dimensions_in_current_infoFile[j] = 0;
-          }
-          bbob_dimensions_in_current_infoFile[i] = logger->number_of_variables;
-        }
-      } else {
-        if ( bbob_current_funId != logger->function_id ) {
-          /*new function in the same file */
-          newLine = 1;
-        }
-      }
-      *target_file = fopen(file_path, "a+"); /* in any case, we append */
-      if (*target_file == NULL) {
-        errnum = errno;
-        logger_bbob_error_io(*target_file, errnum);
-      }
-      if (tmp_file) { /* File already exists, new dim so just a new line. Also, close the tmp_file */
-        if (newLine) {
-          fprintf(*target_file, "\n");
-        }
-        fclose(tmp_file);
-      }
-      /* data_format = coco_strdup("bbob-constrained"); */
-      fprintf(*target_file,
-              "suite = '%s', funcId = %d, DIM = %lu, Precision = %.3e, algId = '%s', coco_version = '%s', logger = '%s', data_format = '%s'\n",
-              suite_name,
-              (int) strtol(function_id, NULL, 10),
-              (unsigned long) logger->number_of_variables,
-              pow(10, -8),
-              logger->observer->algorithm_name,
-              coco_version,
-              logger_name,
-              data_format);
-
-      fprintf(*target_file, "%%\n");
-      strncat(used_dataFile_path, "_i", COCO_PATH_MAX - strlen(used_dataFile_path) - 1);
-      strncat(used_dataFile_path, bbob_infoFile_firstInstance_char,
-      COCO_PATH_MAX - strlen(used_dataFile_path) - 1);
-      fprintf(*target_file, "%s.dat", used_dataFile_path); /* dataFile_path does not have the extension */
-      bbob_current_dim = logger->number_of_variables;
-      bbob_current_funId = logger->function_id;
-    }
-  }
-  coco_free_memory(function_id_char);
-}
-
 /**
  * Generates the different files and folder needed by the logger to store the
  * data if these don't already exist
  */
 static void logger_bbob_initialize(logger_bbob_data_t *logger, coco_problem_t *inner_problem) {
   /*
-   Creates/opens the data and index files
+   Creates/opens the data files and gets the entry of the index file
    */
-  char dataFile_path[COCO_PATH_MAX + 2] = { 0 }; /* relative path to the .dat file from where the .info file is */
   char folder_path[COCO_PATH_MAX + 2] = { 0 };
-  char *tmpc_funId; /* serves to extract the function id as a char *. There should be a better way of doing this! */
-  char *tmpc_dim; /* serves to extract the dimension as a char *. There should be a better way of doing this! */
-  char indexFile_prefix[10] = "bbobexp"; /* TODO (minor): make the prefix bbobexp a parameter that the user can modify */
+  char *header, *folder_name;
 
   assert(logger != NULL);
   assert(inner_problem != NULL);
   assert(inner_problem->problem_id != NULL);
+  assert(coco_problem_get_suite(inner_problem));
 
-  tmpc_funId = coco_strdupf("%lu", (unsigned long) coco_problem_get_suite_dep_function(inner_problem));
-  tmpc_dim = coco_strdupf("%lu", (unsigned long) inner_problem->number_of_variables);
-
-  /* prepare paths and names */
-  strncpy(dataFile_path, "data_f", COCO_PATH_MAX);
-  strncat(dataFile_path, tmpc_funId,
-  COCO_PATH_MAX - strlen(dataFile_path) - 1);
-  coco_join_path(folder_path, sizeof(folder_path), logger->observer->result_folder, dataFile_path,
-  NULL);
+  header = coco_strdupf("suite = '%s', funcId = %d, DIM = %lu, Precision = %.3e, algId = '%s', "
+      "coco_version = '%s', logger = '%s', data_format = '%s'\n",
+      coco_problem_get_suite(inner_problem)->suite_name,
+      (int) logger->function_id,
+      (unsigned long) logger->number_of_variables,
+      pow(10, -8),
+      logger->entries->algorithm_name,
+      coco_version,
+      logger_name,
+      data_format);
+
+  /* the entry decides on the data files, its data files are written only by this logger until it is freed */
+  coco_mutex_lock(&logger->entries->mutex);
+  logger->entry = observer_bbob_open_entry(logger->entries, logger->function_id,
+      logger->number_of_variables, logger->instance_id, header);
+  observer_bbob_start_run(logger->entries, logger->entry, logger->instance_id);
+  coco_mutex_unlock(&logger->entries->mutex);
+  coco_free_memory(header);
+
+  folder_name = coco_strdupf("data_f%lu", (unsigned long) logger->function_id);
+  coco_join_path(folder_path, sizeof(folder_path), logger->entries->result_folder, folder_name, NULL);
   coco_create_directory(folder_path);
-  strncat(dataFile_path, "/bbobexp_f",
-  COCO_PATH_MAX - strlen(dataFile_path) - 1);
-  strncat(dataFile_path, tmpc_funId,
-  COCO_PATH_MAX - strlen(dataFile_path) - 1);
-  strncat(dataFile_path, "_DIM", COCO_PATH_MAX - strlen(dataFile_path) - 1);
-  strncat(dataFile_path, tmpc_dim, COCO_PATH_MAX - strlen(dataFile_path) - 1);
-
-  /* index/info file */
-  assert(coco_problem_get_suite(inner_problem));
-  logger_bbob_openIndexFile(logger, logger->observer->result_folder, indexFile_prefix, tmpc_funId,
-      dataFile_path, coco_problem_get_suite(inner_problem)->suite_name);
-  fprintf(logger->index_file, ", %lu", (unsigned long) coco_problem_get_suite_dep_instance(inner_problem));
-  /* data files */
-  /* TODO: definitely improvable but works for now */
-  strncat(dataFile_path, "_i", COCO_PATH_MAX - strlen(dataFile_path) - 1);
-  strncat(dataFile_path, bbob_infoFile_firstInstance_char,
-  COCO_PATH_MAX - strlen(dataFile_path) - 1);
-
-  logger_bbob_open_dataFile(&(logger->fdata_file), logger->observer->result_folder, dataFile_path, ".dat");
+  coco_free_memory(folder_name);
+
+  logger_bbob_open_dataFile(&(logger->fdata_file), logger->entries->result_folder, logger->entry->data_file_name, ".dat");
+  logger->fdata_buffer = coco_observer_buffer_file(logger->crash_safe, logger->output_buffer_size,
+      logger->fdata_file);
   fprintf(logger->fdata_file, bbob_file_header_str, logger->optimal_fvalue);
 
-  logger_bbob_open_dataFile(&(logger->tdata_file), logger->observer->result_folder, dataFile_path, ".tdat");
+  logger_bbob_open_dataFile(&(logger->tdata_file), logger->entries->result_folder, logger->entry->data_file_name, ".tdat");
+  logger->tdata_buffer = coco_observer_buffer_file(logger->crash_safe, logger->output_buffer_size,
+      logger->tdata_file);
   fprintf(logger->tdata_file, bbob_file_header_str, logger->optimal_fvalue);
 
-  logger_bbob_open_dataFile(&(logger->rdata_file), logger->observer->result_folder, dataFile_path, ".rdat");
+  logger_bbob_open_dataFile(&(logger->rdata_file), logger->entries->result_folder, logger->entry->data_file_name, ".rdat");
   fprintf(logger->rdata_file, bbob_file_header_str, logger->optimal_fvalue);
+  time(&logger->last_flush);
   logger->is_initialized = 1;
-  coco_free_memory(tmpc_dim);
-  coco_free_memory(tmpc_funId);
-  coco_free_memory(bbob_infoFile_firstInstance_char);
 }
 
 /**
@@ -433,10 +302,9 @@ static void logger_bbob_evaluate(coco_problem_t *problem, const double *x, doubl
   size_t i;
   double y_logged, max_fvalue, sum_cons;
   double *cons = NULL;
+  int is_written = 0, is_feasible = 1;
   logger_bbob_data_t *logger = (logger_bbob_data_t *) coco_problem_transformed_get_data(problem);
   coco_problem_t *inner_problem = coco_problem_transformed_get_inner_problem(problem);
-  const int is_feasible = problem->number_of_constraints <= 0
-                            || coco_is_feasible(inner_problem, x, NULL);
 
   if (!logger->is_initialized) {
     logger_bbob_initialize(logger, inner_problem);
@@ -453,6 +321,17 @@ static void logger_bbob_evaluate(coco_problem_t *problem, const double *x, doubl
   logger->written_last_eval = 0; /* flag whether the current evaluation was logged? */
   logger->last_fvalue = y[0]; /* asma: should be: max(y[0], logger->optimal_fvalue) */
 
+  /* Evaluate the constraints once, for the feasibility check and for the logged sum */
+  if (problem->number_of_constraints > 0) {
+    cons = problem->constraint_values;
+    inner_problem->evaluate_constraint(inner_problem, x, cons);
+    is_feasible = coco_vector_isfinite(x, problem->number_of_variables);
+    for (i = 0; i < problem->number_of_constraints; ++i) {
+      if (cons[i] > 0.0)
+        is_feasible = 0;
+    }
+  }
+
   y_logged = y[0];
   if (coco_is_nan(y_logged))
     y_logged = fvalue_logged_for_nan;
@@ -462,12 +341,6 @@ static void logger_bbob_evaluate(coco_problem_t *problem, const double *x, doubl
   if (is_feasible)  /* infeasible solutions can have much better y0 values */
     assert(y_logged + 1e-13 >= logger->optimal_fvalue);
 
-  /* Evaluate the constraints */
-  if (problem->number_of_constraints > 0) {
-    cons = coco_allocate_vector(problem->number_of_constraints);
-    inner_problem->evaluate_constraint(inner_problem, x, cons);
-  }
-
   /* Compute the sum of positive constraint values */
   sum_cons = 0;
   for (i = 0; i < problem->number_of_constraints; ++i) {
@@ -509,6 +382,7 @@ static void logger_bbob_evaluate(coco_problem_t *problem, const double *x, doubl
           cons,
           problem->number_of_constraints,
           logger->log_discrete_as_int);
+      is_written = 1;
     }
   }
 
@@ -529,11 +403,10 @@ static void logger_bbob_evaluate(coco_problem_t *problem, const double *x, doubl
         problem->number_of_constraints,
         logger->log_discrete_as_int);
     logger->written_last_eval = 1;
+    is_written = 1;
   }
-
-  /* Free allocated memory */
-  if (problem->number_of_constraints > 0)
-    coco_free_memory(cons);
+  if (is_written)
+    logger_bbob_flush(logger);
 
 }  /* end logger_bbob_evaluate */
 
@@ -554,17 +427,14 @@ static void logger_bbob_free(void *stuff) {
     coco_debug("best f=%e after %lu fevals (done observing)\n", logger->best_fvalue,
     		(unsigned long) logger->number_of_evaluations);
   }
-  if (logger->index_file != NULL) {
-    fprintf(logger->index_file, ":%lu|%.1e",
-            (unsigned long) logger->number_of_evaluations,
-            logger->best_fvalue - logger->optimal_fvalue);
-    fclose(logger->index_file);
-    logger->index_file = NULL;
-  }
   if (logger->fdata_file != NULL) {
     fclose(logger->fdata_file);
     logger->fdata_file = NULL;
   }
+  if (logger->fdata_buffer != NULL) {
+    coco_free_memory(logger->fdata_buffer);
+    logger->fdata_buffer = NULL;
+  }
   if (logger->tdata_file != NULL) {
     /* TODO: make sure it handles restarts well. i.e., it writes
      * at the end of a single run, not all the runs on a given
@@ -588,12 +458,33 @@ static void logger_bbob_free(void *stuff) {
     fclose(logger->tdata_file);
     logger->tdata_file = NULL;
   }
+  if (logger->tdata_buffer != NULL) {
+    coco_free_memory(logger->tdata_buffer);
+    logger->tdata_buffer = NULL;
+  }
 
   if (logger->rdata_file != NULL) {
     fclose(logger->rdata_file);
     logger->rdata_file = NULL;
   }
 
+  /* the run, which is in the index file since the initialization, is completed only now */
+  if (logger->entry != NULL) {
+    char *result = coco_strdupf(":%lu|%.1e", (unsigned long) logger->number_of_evaluations,
+        logger->best_fvalue - logger->optimal_fvalue);
+    /* the times are written only if measured */
+    char *timing = (logger->problem->timed_problem != logger->problem) ? coco_strdup("") :
+        coco_strdupf(", %lu:%.1e|%.1e|%.1e", (unsigned long) logger->instance_id,
+            logger->problem->construction_time, logger->problem->evaluation_time,
+            logger->problem->logging_time);
+    coco_mutex_lock(&logger->entries->mutex);
+    observer_bbob_close_entry(logger->entries, logger->entry, result, timing);
+    coco_mutex_unlock(&logger->entries->mutex);
+    coco_free_memory(result);
+    coco_free_memory(timing);
+    logger->entry = NULL;
+  }
+
   if (logger->best_solution != NULL) {
     coco_free_memory(logger->best_solution);
     logger->best_solution = NULL;
@@ -609,7 +500,10 @@ static void logger_bbob_free(void *stuff) {
     logger->evaluations = NULL;
   }
 
-  bbob_logger_is_open = 0;
+  if (logger->entries != NULL) {
+    observer_bbob_entries_release(logger->entries);
+    logger->entries = NULL;
+  }
 }
 
 static coco_problem_t *logger_bbob(coco_observer_t *observer, coco_problem_t *inner_problem) {
@@ -617,21 +511,21 @@ static coco_problem_t *logger_bbob(coco_observer_t *observer, coco_problem_t *in
   coco_problem_t *problem;
 
   logger_data = (logger_bbob_data_t *) coco_allocate_memory(sizeof(*logger_data));
-  logger_data->observer = observer;
+  logger_data->entries = observer_bbob_entries_retain(((observer_bbob_data_t *) observer->data)->entries);
 
   if (inner_problem->number_of_objectives != 1) {
     coco_warning("logger_bbob(): The bbob logger shouldn't be used to log a problem with %d objectives",
         inner_problem->number_of_objectives);
   }
 
-  if (bbob_logger_is_open)
-    coco_error("The current bbob_logger (observer) must be closed before a new one is opened");
   /* This is the name of the folder which happens to be the algName */
   /*logger->path = coco_strdup(observer->output_folder);*/
-  logger_data->index_file = NULL;
+  logger_data->entry = NULL;
   logger_data->fdata_file = NULL;
   logger_data->tdata_file = NULL;
   logger_data->rdata_file = NULL;
+  logger_data->fdata_buffer = NULL;
+  logger_data->tdata_buffer = NULL;
   logger_data->number_of_variables = inner_problem->number_of_variables;
   logger_data->number_of_integer_variables = inner_problem->number_of_integer_variables;
   if (inner_problem->best_value == NULL) {
@@ -656,14 +550,17 @@ static coco_problem_t *logger_bbob(coco_observer_t *observer, coco_problem_t *in
   logger_data->last_fvalue = DBL_MAX;
   logger_data->is_initialized = 0;
   logger_data->log_discrete_as_int = observer->log_discrete_as_int;
+  logger_data->crash_safe = observer->crash_safe;
+  logger_data->output_buffer_size = observer->output_buffer_size;
+  logger_data->flush_interval = observer->flush_interval;
     
   /* Initialize triggers based on target values and number of evaluations */
   logger_data->targets = coco_observer_targets(observer->number_target_triggers, observer->target_precision);
   logger_data->evaluations = coco_observer_evaluations(observer->base_evaluation_triggers, inner_problem->number_of_variables);
 
   problem = coco_problem_transformed_allocate(inner_problem, logger_data, logger_bbob_free, observer->observer_name);
+  logger_data->problem = problem;
 
   problem->evaluate_function = logger_bbob_evaluate;
-  bbob_logger_is_open = 1;
   return problem;
 }
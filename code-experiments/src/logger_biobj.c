@@ -21,6 +21,22 @@
  * observer_biobj() for more information. One .adat file is created for each problem function, dimension
  * and instance.
  *
+ * The .adat files are written either as text (one line per solution) or, with the observer option
+ * "archive_format: binary", in a binary format of the following layout, in which all integers are unsigned
+ * 32-bit and all doubles are IEEE 754 64-bit values, both stored in little-endian byte order:
+ * - The file header, written only when the file is created, consists of the 8 characters "COCOADAT"
+ * followed by the version number of the format (currently 1) as an integer.
+ * - The header is followed by a sequence of records, each starting with a one-character tag:
+ *   - 'C' (comment): an integer length followed by that many characters of a comment line exactly as it
+ *   appears in the text format (including the leading '%' and the trailing newline).
+ *   - 'F' (format): four integers giving the number k of logged decision values per solution (0 if the
+ *   decision variables are not logged), the number of leading decision values that are output as integers
+ *   in the text format, precision_f and precision_x. It precedes the solutions of each problem.
+ *   - 'S' (solution): 3 + k doubles, namely the evaluation number, the two objective values and the k
+ *   decision values of the solution.
+ * The comments and solutions appear in the same order as the lines of the text format. Since the solutions
+ * following a format record have a fixed size, they can be read in bulk, without any parsing of text.
+ *
  * @note Whenever in this file a ROI is mentioned, it means the (normalized) region of interest in the
  * objective space. The non-normalized ROI is a rectangle with the ideal and nadir points as its two
  * opposite vertices, while the normalized ROI is the square [0, 1]^2. If not specifically mentioned, the
@@ -81,6 +97,8 @@ typedef struct {
   FILE *dat_file;            /**< @brief File for logging indicator values at predefined values. */
   FILE *tdat_file;           /**< @brief File for logging indicator values at predefined evaluations. */
   FILE *info_file;           /**< @brief File for logging summary information on algorithm performance. */
+  char *dat_buffer;          /**< @brief Output buffer of the dat file, NULL in the crash-safe mode. */
+  char *tdat_buffer;         /**< @brief Output buffer of the tdat file, NULL in the crash-safe mode. */
 
   int target_hit;            /**< @brief Whether the target was hit in the latest evaluation. */
   coco_observer_targets_t *targets;
@@ -107,7 +125,14 @@ typedef struct {
 typedef struct {
   observer_biobj_log_nondom_e log_nondom_mode;
                                       /**< @brief Mode for archiving nondominated solutions. */
+  observer_biobj_archive_format_e archive_format;
+                                      /**< @brief Format of the archive file. */
   FILE *adat_file;                    /**< @brief File for archiving nondominated solutions (all or final). */
+  char *adat_buffer;                  /**< @brief Output buffer of the archive file, NULL if not buffered. */
+
+  int crash_safe;                     /**< @brief Whether to flush the files after each written line. */
+  double flush_interval;              /**< @brief Seconds after which the buffered output is flushed. */
+  time_t last_flush;                  /**< @brief Time when the files were last flushed. */
 
   int log_vars;                       /**< @brief Whether to log the decision values. */
 
@@ -238,7 +263,122 @@ static int avl_tree_compare_by_eval_number(const logger_biobj_avl_item_t *item1,
 }
 
 /**
- * @brief Outputs the AVL tree to the given file. Returns the number of nodes in the tree.
+ * @brief Stores the given integer in the first four bytes of buffer in little-endian byte order.
+ */
+static void logger_biobj_binary_put_integer(unsigned char *buffer, const unsigned long value) {
+  size_t i;
+  for (i = 0; i < 4; i++)
+    buffer[i] = (unsigned char) ((value >> (8 * i)) & 0xFF);
+}
+
+/**
+ * @brief Stores the given double in the first eight bytes of buffer in little-endian byte order.
+ */
+static void logger_biobj_binary_put_double(unsigned char *buffer, const double value) {
+  unsigned char tmp;
+  size_t i;
+  memcpy(buffer, &value, sizeof(double));
+  if (!coco_is_little_endian()) {
+    for (i = 0; i < sizeof(double) / 2; i++) {
+      tmp = buffer[i];
+      buffer[i] = buffer[sizeof(double) - 1 - i];
+      buffer[sizeof(double) - 1 - i] = tmp;
+    }
+  }
+}
+
+/**
+ * @brief Outputs the header of the binary archive format if the file is empty.
+ */
+static void logger_biobj_binary_header_output(FILE *file) {
+  unsigned char buffer[12];
+  fseek(file, 0, SEEK_END);
+  if (ftell(file) > 0)
+    return;
+  memcpy(buffer, "COCOADAT", 8);
+  logger_biobj_binary_put_integer(buffer + 8, 1);
+  fwrite(buffer, 1, sizeof(buffer), file);
+}
+
+/**
+ * @brief Outputs the given comment line (including the trailing newline) to the archive file in the given
+ * format.
+ */
+static void logger_biobj_comment_output(FILE *file,
+                                        const observer_biobj_archive_format_e archive_format,
+                                        const char *comment) {
+  unsigned char buffer[5];
+  if (archive_format == ARCHIVE_FORMAT_BINARY) {
+    buffer[0] = 'C';
+    logger_biobj_binary_put_integer(buffer + 1, (unsigned long) strlen(comment));
+    fwrite(buffer, 1, sizeof(buffer), file);
+  }
+  fputs(comment, file);
+}
+
+/**
+ * @brief Outputs the format record of the binary archive format that precedes the solutions of a problem.
+ */
+static void logger_biobj_binary_format_output(FILE *file,
+                                              const size_t dim,
+                                              const size_t num_int_vars,
+                                              const int log_vars,
+                                              const int precision_x,
+                                              const int precision_f,
+                                              const int log_discrete_as_int) {
+  unsigned char buffer[17];
+  buffer[0] = 'F';
+  logger_biobj_binary_put_integer(buffer + 1, (unsigned long) (log_vars ? dim : 0));
+  logger_biobj_binary_put_integer(buffer + 5, (unsigned long) ((log_vars && log_discrete_as_int) ? num_int_vars : 0));
+  logger_biobj_binary_put_integer(buffer + 9, (unsigned long) precision_f);
+  logger_biobj_binary_put_integer(buffer + 13, (unsigned long) precision_x);
+  fwrite(buffer, 1, sizeof(buffer), file);
+}
+
+/**
+ * @brief Outputs the AVL tree to the given file in the binary archive format. Returns the number of nodes in
+ * the tree.
+ */
+static size_t logger_biobj_tree_output_binary(FILE *file,
+                                              const avl_tree_t *tree,
+                                              const size_t dim,
+                                              const size_t num_obj,
+                                              const int log_vars) {
+
+  avl_node_t *solution;
+  logger_biobj_avl_item_t *item;
+  const size_t number_of_values = 1 + num_obj + (log_vars ? dim : 0);
+  const size_t record_size = 1 + number_of_values * sizeof(double);
+  unsigned char *record;
+  size_t i;
+  size_t number_of_nodes = 0;
+
+  if (!tree->tail)
+    return 0;
+
+  record = (unsigned char *) coco_allocate_memory(record_size);
+  record[0] = 'S';
+  solution = tree->head;
+  while (solution != NULL) {
+    item = (logger_biobj_avl_item_t*) solution->item;
+    logger_biobj_binary_put_double(record + 1, (double) item->evaluation_number);
+    for (i = 0; i < num_obj; i++)
+      logger_biobj_binary_put_double(record + 1 + (1 + i) * sizeof(double), item->y[i]);
+    if (log_vars) {
+      for (i = 0; i < dim; i++)
+        logger_biobj_binary_put_double(record + 1 + (1 + num_obj + i) * sizeof(double), item->x[i]);
+    }
+    fwrite(record, 1, record_size, file);
+    solution = solution->next;
+    number_of_nodes++;
+  }
+  coco_free_memory(record);
+
+  return number_of_nodes;
+}
+
+/**
+ * @brief Outputs the AVL tree to the given file in the given format. Returns the number of nodes in the tree.
  */
 static size_t logger_biobj_tree_output(FILE *file,
                                        const avl_tree_t *tree,
@@ -248,13 +388,17 @@ static size_t logger_biobj_tree_output(FILE *file,
                                        const int log_vars,
                                        const int precision_x,
                                        const int precision_f,
-                                       const int log_discrete_as_int) {
+                                       const int log_discrete_as_int,
+                                       const observer_biobj_archive_format_e archive_format) {
 
   avl_node_t *solution;
   size_t i;
   size_t j;
   size_t number_of_nodes = 0;
 
+  if (archive_format == ARCHIVE_FORMAT_BINARY)
+    return logger_biobj_tree_output_binary(file, tree, dim, num_obj, log_vars);
+
   if (tree->tail) {
     /* There is at least a solution in the tree to output */
     solution = tree->head;
@@ -491,6 +635,8 @@ static logger_biobj_indicator_t *logger_biobj_indicator(const logger_biobj_data_
     coco_error("logger_biobj_indicator() failed to open file '%s'.", path_name);
     return NULL; /* Never reached */
   }
+  indicator->tdat_buffer = coco_observer_buffer_file(observer->crash_safe, observer->output_buffer_size,
+      indicator->tdat_file);
   coco_free_memory(file_name);
   coco_free_memory(path_name);
 
@@ -506,6 +652,8 @@ static logger_biobj_indicator_t *logger_biobj_indicator(const logger_biobj_data_
     coco_error("logger_biobj_indicator() failed to open file '%s'.", path_name);
     return NULL; /* Never reached */
   }
+  indicator->dat_buffer = coco_observer_buffer_file(observer->crash_safe, observer->output_buffer_size,
+      indicator->dat_file);
 
   /* Output header information to the info file */
   if (!info_file_exists) {
@@ -590,11 +738,21 @@ static void logger_biobj_indicator_free(void *stuff) {
     indicator->dat_file = NULL;
   }
 
+  if (indicator->dat_buffer != NULL) {
+    coco_free_memory(indicator->dat_buffer);
+    indicator->dat_buffer = NULL;
+  }
+
   if (indicator->tdat_file != NULL) {
     fclose(indicator->tdat_file);
     indicator->tdat_file = NULL;
   }
 
+  if (indicator->tdat_buffer != NULL) {
+    coco_free_memory(indicator->tdat_buffer);
+    indicator->tdat_buffer = NULL;
+  }
+
   if (indicator->info_file != NULL) {
     fclose(indicator->info_file);
     indicator->info_file = NULL;
@@ -625,13 +783,16 @@ static void logger_biobj_indicator_free(void *stuff) {
  * best_value - current_value + additional_penalty <= relative_target_value
  *
  * The relative_target_value is a target for indicator difference, not the actual indicator value!
+ *
+ * Returns 1 if any output was written and 0 otherwise.
  */
-static void logger_biobj_output(logger_biobj_data_t *logger,
-                                const int update_performed,
-                                const logger_biobj_avl_item_t *node_item) {
+static int logger_biobj_output(logger_biobj_data_t *logger,
+                               const int update_performed,
+                               const logger_biobj_avl_item_t *node_item) {
 
   size_t i, j;
   logger_biobj_indicator_t *indicator;
+  int is_written = 0;
 
   if (logger->compute_indicators) {
     for (i = 0; i < LOGGER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
@@ -669,6 +830,7 @@ static void logger_biobj_output(logger_biobj_data_t *logger,
         fprintf(indicator->dat_file, "%lu\t%.*e\t%.*e\n", (unsigned long) logger->number_of_evaluations,
             logger->precision_f, indicator->overall_value, logger->precision_f,
             ((coco_observer_targets_t *) indicator->targets)->value);
+        is_written = 1;
       }
 
       if (logger->log_nondom_mode == LOG_NONDOM_READ) {
@@ -679,6 +841,7 @@ static void logger_biobj_output(logger_biobj_data_t *logger,
           if (indicator->evaluation_logged) {
             fprintf(indicator->tdat_file, "%lu\t%.*e\n", (unsigned long) j, logger->precision_f,
                 indicator->previous_value);
+            is_written = 1;
           }
         }
       }
@@ -689,10 +852,32 @@ static void logger_biobj_output(logger_biobj_data_t *logger,
       if (indicator->evaluation_logged) {
         fprintf(indicator->tdat_file, "%lu\t%.*e\n", (unsigned long) logger->number_of_evaluations,
             logger->precision_f, indicator->overall_value);
+        is_written = 1;
       }
 
     }
   }
+  return is_written;
+}
+
+/**
+ * @brief Flushes the files of the logger if the observer options ask for it, such that impatient users can
+ * see progress.
+ */
+static void logger_biobj_flush(logger_biobj_data_t *logger) {
+
+  size_t i;
+
+  if (!coco_observer_flush_due(logger->crash_safe, logger->flush_interval, &logger->last_flush))
+    return;
+  if ((logger->log_nondom_mode == LOG_NONDOM_ALL) || (logger->log_nondom_mode == LOG_NONDOM_FINAL))
+    fflush(logger->adat_file);
+  if (logger->compute_indicators) {
+    for (i = 0; i < LOGGER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
+      fflush(logger->indicators[i]->dat_file);
+      fflush(logger->indicators[i]->tdat_file);
+    }
+  }
 }
 
 /**
@@ -703,7 +888,7 @@ static void logger_biobj_evaluate(coco_problem_t *problem, const double *x, doub
 
   logger_biobj_data_t *logger;
   logger_biobj_avl_item_t *node_item;
-  int update_performed;
+  int update_performed, is_written;
   coco_problem_t *inner_problem;
 
   logger = (logger_biobj_data_t *) coco_problem_transformed_get_data(problem);
@@ -725,41 +910,30 @@ static void logger_biobj_evaluate(coco_problem_t *problem, const double *x, doub
   if (update_performed && (logger->log_nondom_mode == LOG_NONDOM_ALL)) {
     logger_biobj_tree_output(logger->adat_file, logger->buffer_tree, logger->number_of_variables,
         logger->number_of_integer_variables, logger->number_of_objectives, logger->log_vars,
-        logger->precision_x, logger->precision_f, logger->log_discrete_as_int);
+        logger->precision_x, logger->precision_f, logger->log_discrete_as_int, logger->archive_format);
     avl_tree_purge(logger->buffer_tree);
-
-    /* Flush output so that impatient users can see progress. */
-    fflush(logger->adat_file);
   }
 
   /* Output according to observer options */
-  logger_biobj_output(logger, update_performed, node_item);
+  is_written = logger_biobj_output(logger, update_performed, node_item);
+
+  /* Flush output so that impatient users can see progress. */
+  if (update_performed || is_written)
+    logger_biobj_flush(logger);
 }
 
 /**
- * Sets the number of evaluations, adds the objective vector to the archive and outputs information according
- * to observer options (but does not output the archive).
- *
- * @note Vector y must point to a correctly sized allocated memory region and the given evaluation number must
- * be larger than the existing one.
- *
- * @param problem The given COCO problem.
- * @param evaluation The number of evaluations.
- * @param y The objective vector.
- * @return 1 if archive was updated was done and 0 otherwise.
+ * @brief Sets the number of evaluations, adds the objective vector with the decision vector x to the archive
+ * and outputs information according to observer options (but does not output the archive).
  */
-int coco_logger_biobj_feed_solution(coco_problem_t *problem, const size_t evaluation, const double *y) {
+static int logger_biobj_feed(coco_problem_t *problem, const size_t evaluation, const double *x,
+                             const double *y) {
 
   logger_biobj_data_t *logger;
   logger_biobj_avl_item_t *node_item;
   int update_performed;
-  coco_problem_t *inner_problem;
-  double *x;
-  size_t i;
 
-  assert(problem != NULL);
   logger = (logger_biobj_data_t *) coco_problem_transformed_get_data(problem);
-  inner_problem = coco_problem_transformed_get_inner_problem(problem);
   assert(logger->log_nondom_mode == LOG_NONDOM_READ);
 
   /* Set the number of evaluations */
@@ -770,22 +944,80 @@ int coco_logger_biobj_feed_solution(coco_problem_t *problem, const size_t evalua
   logger->number_of_evaluations = evaluation;
 
   /* Update the archive with the new solution */
-  x = coco_allocate_vector(problem->number_of_variables);
-  for (i = 0; i < problem->number_of_variables; i++)
-    x[i] = 0;
-  node_item = logger_biobj_node_create(inner_problem, x, y, logger->number_of_evaluations,
-      logger->number_of_variables, logger->number_of_objectives);
-  coco_free_memory(x);
+  node_item = logger_biobj_node_create(coco_problem_transformed_get_inner_problem(problem), x, y,
+      logger->number_of_evaluations, logger->number_of_variables, logger->number_of_objectives);
 
   /* Update the archive */
   update_performed = logger_biobj_tree_update(logger, node_item);
 
   /* Output according to observer options */
-  logger_biobj_output(logger, update_performed, node_item);
+  if (logger_biobj_output(logger, update_performed, node_item))
+    logger_biobj_flush(logger);
+
+  return update_performed;
+}
+
+/**
+ * Sets the number of evaluations, adds the objective vector to the archive and outputs information according
+ * to observer options (but does not output the archive).
+ *
+ * @note Vector y must point to a correctly sized allocated memory region and the given evaluation number must
+ * be larger than the existing one.
+ *
+ * @param problem The given COCO problem.
+ * @param evaluation The number of evaluations.
+ * @param y The objective vector.
+ * @return 1 if archive was updated was done and 0 otherwise.
+ */
+int coco_logger_biobj_feed_solution(coco_problem_t *problem, const size_t evaluation, const double *y) {
+
+  int update_performed;
+  double *x;
+
+  assert(problem != NULL);
+  x = coco_allocate_vector_with_value(problem->number_of_variables, 0);
+  update_performed = logger_biobj_feed(problem, evaluation, x, y);
+  coco_free_memory(x);
 
   return update_performed;
 }
 
+/**
+ * Feeds the given solutions to the logger as coco_logger_biobj_feed_solution, but in one call, which avoids
+ * the overhead of calling coco_logger_biobj_feed_solution for each solution from other languages.
+ *
+ * @note The evaluation numbers must be increasing and larger than the existing one.
+ *
+ * @param problem The given COCO problem.
+ * @param number_of_solutions The number of solutions.
+ * @param evaluations The numbers of evaluations of the solutions.
+ * @param y The objective vectors of the solutions, one after the other.
+ * @param updates If not NULL, it is set to 1 for each solution that updated the archive and to 0 otherwise.
+ * @return The number of solutions that updated the archive.
+ */
+size_t coco_logger_biobj_feed_solutions(coco_problem_t *problem,
+                                        const size_t number_of_solutions,
+                                        const size_t *evaluations,
+                                        const double *y,
+                                        int *updates) {
+
+  size_t i, number_of_updates = 0;
+  int update_performed;
+  double *x;
+
+  assert(problem != NULL);
+  x = coco_allocate_vector_with_value(problem->number_of_variables, 0);
+  for (i = 0; i < number_of_solutions; i++) {
+    update_performed = logger_biobj_feed(problem, evaluations[i], x, y + i * problem->number_of_objectives);
+    number_of_updates += (size_t) update_performed;
+    if (updates != NULL)
+      updates[i] = update_performed;
+  }
+  coco_free_memory(x);
+
+  return number_of_updates;
+}
+
 /**
  * @brief Outputs the final nondominated solutions to the archive file.
  */
@@ -808,7 +1040,7 @@ static void logger_biobj_finalize(logger_biobj_data_t *logger) {
 
   logger_biobj_tree_output(logger->adat_file, resorted_tree, logger->number_of_variables,
       logger->number_of_integer_variables, logger->number_of_objectives, logger->log_vars,
-      logger->precision_x, logger->precision_f, logger->log_discrete_as_int);
+      logger->precision_x, logger->precision_f, logger->log_discrete_as_int, logger->archive_format);
 
   avl_tree_destruct(resorted_tree);
 }
@@ -819,6 +1051,7 @@ static void logger_biobj_finalize(logger_biobj_data_t *logger) {
 static void logger_biobj_free(void *stuff) {
 
   logger_biobj_data_t *logger;
+  char *comment;
   size_t i;
 
   assert(stuff != NULL);
@@ -837,10 +1070,16 @@ static void logger_biobj_free(void *stuff) {
 
   if (((logger->log_nondom_mode == LOG_NONDOM_ALL) || (logger->log_nondom_mode == LOG_NONDOM_FINAL)) &&
       (logger->adat_file != NULL)) {
-    fprintf(logger->adat_file, "%% evaluations = %lu\n", (unsigned long) logger->number_of_evaluations);
+    comment = coco_strdupf("%% evaluations = %lu\n", (unsigned long) logger->number_of_evaluations);
+    logger_biobj_comment_output(logger->adat_file, logger->archive_format, comment);
+    coco_free_memory(comment);
     fclose(logger->adat_file);
     logger->adat_file = NULL;
   }
+  if (logger->adat_buffer != NULL) {
+    coco_free_memory(logger->adat_buffer);
+    logger->adat_buffer = NULL;
+  }
 
   avl_tree_destruct(logger->archive_tree);
   avl_tree_destruct(logger->buffer_tree);
@@ -862,7 +1101,7 @@ static coco_problem_t *logger_biobj(coco_observer_t *observer, coco_problem_t *i
   logger_biobj_data_t *logger_data;
   observer_biobj_data_t *observer_data;
   const char nondom_folder_name[] = "archive";
-  char *path_name, *file_name = NULL;
+  char *path_name, *file_name = NULL, *comment;
   size_t i;
 
   if (inner_problem->number_of_objectives != 2) {
@@ -883,10 +1122,15 @@ static coco_problem_t *logger_biobj(coco_observer_t *observer, coco_problem_t *i
   observer_data = (observer_biobj_data_t *) observer->data;
   /* Copy values from the observes that you might need even if they do not exist any more */
   logger_data->log_nondom_mode = observer_data->log_nondom_mode;
+  logger_data->archive_format = observer_data->archive_format;
   logger_data->compute_indicators = observer_data->compute_indicators;
   logger_data->precision_x = observer->precision_x;
   logger_data->precision_f = observer->precision_f;
   logger_data->log_discrete_as_int = observer->log_discrete_as_int;
+  logger_data->crash_safe = observer->crash_safe;
+  logger_data->flush_interval = observer->flush_interval;
+  logger_data->adat_buffer = NULL;
+  time(&logger_data->last_flush);
 
   if (((observer_data->log_vars_mode == LOG_VARS_LOW_DIM) && (inner_problem->number_of_variables > 5))
       || (observer_data->log_vars_mode == LOG_VARS_NEVER))
@@ -913,24 +1157,37 @@ static coco_problem_t *logger_biobj(coco_observer_t *observer, coco_problem_t *i
     coco_free_memory(file_name);
 
     /* Open and initialize the archive file */
-    logger_data->adat_file = fopen(path_name, "a");
+    logger_data->adat_file = fopen(path_name,
+        (logger_data->archive_format == ARCHIVE_FORMAT_BINARY) ? "ab" : "a");
     if (logger_data->adat_file == NULL) {
       coco_error("logger_biobj() failed to open file '%s'.", path_name);
       return NULL; /* Never reached */
     }
+    logger_data->adat_buffer = coco_observer_buffer_file(observer->crash_safe, observer->output_buffer_size,
+        logger_data->adat_file);
     coco_free_memory(path_name);
 
     /* Output header information */
-    fprintf(logger_data->adat_file, "%% instance = %lu, name = %s\n",
+    if (logger_data->archive_format == ARCHIVE_FORMAT_BINARY)
+      logger_biobj_binary_header_output(logger_data->adat_file);
+    comment = coco_strdupf("%% instance = %lu, name = %s\n",
         (unsigned long) inner_problem->suite_dep_instance, inner_problem->problem_name);
+    logger_biobj_comment_output(logger_data->adat_file, logger_data->archive_format, comment);
+    coco_free_memory(comment);
     if (logger_data->log_vars) {
-      fprintf(logger_data->adat_file, "%% function evaluation | %lu objectives | %lu variables\n",
+      comment = coco_strdupf("%% function evaluation | %lu objectives | %lu variables\n",
           (unsigned long) inner_problem->number_of_objectives,
           (unsigned long) inner_problem->number_of_variables);
     } else {
-      fprintf(logger_data->adat_file, "%% function evaluation | %lu objectives \n",
+      comment = coco_strdupf("%% function evaluation | %lu objectives \n",
           (unsigned long) inner_problem->number_of_objectives);
     }
+    logger_biobj_comment_output(logger_data->adat_file, logger_data->archive_format, comment);
+    coco_free_memory(comment);
+    if (logger_data->archive_format == ARCHIVE_FORMAT_BINARY)
+      logger_biobj_binary_format_output(logger_data->adat_file, logger_data->number_of_variables,
+          logger_data->number_of_integer_variables, logger_data->log_vars, logger_data->precision_x,
+          logger_data->precision_f, logger_data->log_discrete_as_int);
   }
 
   /* Initialize the AVL trees */
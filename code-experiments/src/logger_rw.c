@@ -32,6 +32,10 @@
  */
 typedef struct {
   FILE *out_file;                /**< @brief File for logging. */
+  char *out_buffer;              /**< @brief Output buffer of the file, NULL in the crash-safe mode. */
+  int crash_safe;                /**< @brief Whether to flush the file after each written line. */
+  double flush_interval;         /**< @brief Seconds after which the buffered output is flushed. */
+  time_t last_flush;             /**< @brief Time when the file was last flushed. */
   size_t number_of_evaluations;  /**< @brief The number of evaluations performed so far. */
 
   double best_value;             /**< @brief The best-so-far value. */
@@ -74,9 +78,9 @@ static void logger_rw_evaluate(coco_problem_t *problem, const double *x, double
   if (problem->number_of_objectives == 1)
     logger->current_value = y[0];
 
-  /* Evaluate the constraints */
+  /* Evaluate the constraints into the preallocated vector of the problem */
   if (problem->number_of_constraints > 0) {
-    constraints = coco_allocate_vector(problem->number_of_constraints);
+    constraints = problem->constraint_values;
     inner_problem->evaluate_constraint(inner_problem, x, constraints);
   }
 
@@ -108,11 +112,9 @@ static void logger_rw_evaluate(coco_problem_t *problem, const double *x, double
     if (logger->log_time)
       fprintf(logger->out_file, "%.0f\t", difftime(end, start));
     fprintf(logger->out_file, "\n");
+    if (coco_observer_flush_due(logger->crash_safe, logger->flush_interval, &logger->last_flush))
+      fflush(logger->out_file);
   }
-  fflush(logger->out_file);
-
-  if (problem->number_of_constraints > 0)
-    coco_free_memory(constraints);
 }
 
 /**
@@ -129,6 +131,10 @@ static void logger_rw_free(void *stuff) {
     fclose(logger->out_file);
     logger->out_file = NULL;
   }
+  if (logger->out_buffer != NULL) {
+    coco_free_memory(logger->out_buffer);
+    logger->out_buffer = NULL;
+  }
 }
 
 /**
@@ -156,6 +162,8 @@ static coco_problem_t *logger_rw(coco_observer_t *observer, coco_problem_t *inne
   logger_data->precision_f = observer->precision_f;
   logger_data->precision_g = observer->precision_g;
   logger_data->log_discrete_as_int = observer->log_discrete_as_int;
+  logger_data->crash_safe = observer->crash_safe;
+  logger_data->flush_interval = observer->flush_interval;
 
   if (((observer_data->log_vars_mode == LOG_LOW_DIM) &&
       (inner_problem->number_of_variables > observer_data->low_dim_vars))
@@ -192,6 +200,9 @@ static coco_problem_t *logger_rw(coco_observer_t *observer, coco_problem_t *inne
     coco_error("logger_rw() failed to open file '%s'.", path_name);
     return NULL; /* Never reached */
   }
+  logger_data->out_buffer = coco_observer_buffer_file(observer->crash_safe, observer->output_buffer_size,
+      logger_data->out_file);
+  time(&logger_data->last_flush);
   coco_free_memory(path_name);
   coco_free_memory(file_name);
 
@@ -9,26 +9,341 @@
 static coco_problem_t *logger_bbob(coco_observer_t *observer, coco_problem_t *problem);
 static void logger_bbob_free(void *logger);
 
+/**
+ * @brief An entry of a bbob .info file.
+ *
+ * An entry lists the started runs on (instances of) one function in one dimension, the data of
+ * which are written into the same data files. Only one logger at a time writes into the data
+ * files of an entry, such that the data of the runs appear in the same order as in the entry.
+ *
+ * The entries of a function are written into the .info file bbobexp_f<f>_i<i>.info, where <i> is the
+ * instance of the first run in the file, and their data into data_f<f>/bbobexp_f<f>_DIM<d>_i<i>.
+ * When a dimension is observed again after another dimension of the same function, a new .info file
+ * is started. An entry that is created while the entry of the same function and dimension is open
+ * (that is, when several problems are observed at the same time) is concurrent and gets its own .info
+ * and data files, the names of which end in -<k>.
+ */
+typedef struct observer_bbob_entry_s {
+  char *info_file_name;        /**< @brief Name of the .info file within the result folder. */
+  char *data_file_name;        /**< @brief Path of the data files without extension relative to the
+                                           result folder. */
+  char *header;                /**< @brief First line of the entry. */
+  char *runs;                  /**< @brief The ", instance:evaluations|f-value" records of the
+                                           runs, the last of which lacks ":evaluations|f-value"
+                                           while the entry is open. */
+  char *timings;               /**< @brief The ", instance:construction|evaluation|logging" times in
+                                           seconds of the finished runs (if measured). */
+  size_t function_id;          /**< @brief Function of the entry. */
+  size_t number_of_variables;  /**< @brief Dimension of the entry. */
+  size_t first_instance;       /**< @brief Instance in the names of the .info and data files. */
+  int is_concurrent;           /**< @brief Whether the entry has .info and data files of its own. */
+  int is_open;                 /**< @brief Whether a logger currently writes into the data files. */
+  struct observer_bbob_entry_s *next;
+} observer_bbob_entry_t;
+
+/**
+ * @brief The entries of the .info files of a bbob observer.
+ *
+ * They are shared by the observer and its loggers, such that several problems can be observed at the
+ * same time, also from different threads (if compiled with COCO_THREAD_SAFE). The entries are freed
+ * when the observer and all its loggers have released them, because the loggers can outlive their
+ * observer. The mutex protects the entries, the reference count and the .info files.
+ */
+typedef struct {
+  coco_mutex_t mutex;
+  size_t number_of_references;     /**< @brief Number of the observer and loggers holding the entries. */
+  size_t number_of_concurrent;     /**< @brief Number of concurrent entries created so far. */
+  char *result_folder;             /**< @brief Result folder of the observer. */
+  char *algorithm_name;            /**< @brief Algorithm name of the observer. */
+  observer_bbob_entry_t *first;    /**< @brief Entries of all .info files in order of creation. */
+} observer_bbob_entries_t;
+
 /**
  * @brief The bbob observer data type.
  */
 typedef struct {
-  /* TODO: Can be used to store variables that need to be accessible during one run (i.e. for multiple
-   * problems). For example, the following global variables from logger_bbob.c could be stored here: */
-  size_t current_dim;
-  size_t current_fun_id;
-  /* ... and others */
+  observer_bbob_entries_t *entries;
 } observer_bbob_data_t;
 
+/**
+ * @brief Adds a reference to the entries and returns them.
+ */
+static observer_bbob_entries_t *observer_bbob_entries_retain(observer_bbob_entries_t *entries) {
+
+  coco_mutex_lock(&entries->mutex);
+  entries->number_of_references++;
+  coco_mutex_unlock(&entries->mutex);
+  return entries;
+}
+
+/**
+ * @brief Removes a reference to the entries and frees them if it was the last one.
+ */
+static void observer_bbob_entries_release(observer_bbob_entries_t *entries) {
+
+  observer_bbob_entry_t *entry;
+  size_t number_of_references;
+
+  coco_mutex_lock(&entries->mutex);
+  number_of_references = --entries->number_of_references;
+  coco_mutex_unlock(&entries->mutex);
+  if (number_of_references > 0)
+    return;
+
+  while (entries->first != NULL) {
+    entry = entries->first;
+    entries->first = entry->next;
+    coco_free_memory(entry->info_file_name);
+    coco_free_memory(entry->data_file_name);
+    coco_free_memory(entry->header);
+    coco_free_memory(entry->runs);
+    coco_free_memory(entry->timings);
+    coco_free_memory(entry);
+  }
+  coco_free_memory(entries->result_folder);
+  coco_free_memory(entries->algorithm_name);
+  coco_mutex_destroy(&entries->mutex);
+  coco_free_memory(entries);
+}
+
+/**
+ * @brief Releases the entries held by the bbob observer.
+ */
+static void observer_bbob_free(void *stuff) {
+
+  observer_bbob_data_t *data = (observer_bbob_data_t *) stuff;
+
+  observer_bbob_entries_release(data->entries);
+  data->entries = NULL;
+}
+
+/**
+ * @brief Appends a new entry, the files of which are named after the given instance, and returns it.
+ */
+static observer_bbob_entry_t *observer_bbob_add_entry(observer_bbob_entries_t *entries,
+                                                      const size_t function_id,
+                                                      const size_t number_of_variables,
+                                                      const size_t first_instance,
+                                                      const int is_concurrent,
+                                                      const char *header) {
+
+  observer_bbob_entry_t *entry, **last = &entries->first;
+  char *suffix;
+
+  while (*last != NULL)
+    last = &(*last)->next;
+
+  if (is_concurrent) {
+    entries->number_of_concurrent++;
+    suffix = coco_strdupf("_i%lu-%lu", (unsigned long) first_instance,
+        (unsigned long) entries->number_of_concurrent);
+  } else {
+    suffix = coco_strdupf("_i%lu", (unsigned long) first_instance);
+  }
+  entry = (observer_bbob_entry_t *) coco_allocate_memory(sizeof(*entry));
+  entry->info_file_name = coco_strdupf("bbobexp_f%lu%s.info", (unsigned long) function_id, suffix);
+  entry->data_file_name = coco_strdupf("data_f%lu/bbobexp_f%lu_DIM%lu%s", (unsigned long) function_id,
+      (unsigned long) function_id, (unsigned long) number_of_variables, suffix);
+  coco_free_memory(suffix);
+  entry->header = coco_strdup(header);
+  entry->runs = coco_strdup("");
+  entry->timings = coco_strdup("");
+  entry->function_id = function_id;
+  entry->number_of_variables = number_of_variables;
+  entry->first_instance = first_instance;
+  entry->is_concurrent = is_concurrent;
+  entry->is_open = 1;
+  entry->next = NULL;
+  *last = entry;
+  return entry;
+}
+
+/**
+ * @brief Returns the entry of the function and dimension into which the run on the given instance is
+ * logged and marks it as open.
+ *
+ * The run continues the entry of the last observed dimension of the function. Another dimension is
+ * added to the current .info file of the function if it is not yet in it and starts a new .info file
+ * otherwise. If the entry of the dimension is open, a concurrent entry of the function and dimension
+ * that is not open is used instead or, if there is none, a new concurrent entry is appended. Must be
+ * called with the mutex locked.
+ */
+static observer_bbob_entry_t *observer_bbob_open_entry(observer_bbob_entries_t *entries,
+                                                       const size_t function_id,
+                                                       const size_t number_of_variables,
+                                                       const size_t instance_id,
+                                                       const char *header) {
+
+  observer_bbob_entry_t *entry, *last = NULL, *current = NULL;
+
+  /* the last sequential entry of the function is in its current .info file */
+  for (entry = entries->first; entry != NULL; entry = entry->next) {
+    if (entry->function_id == function_id && !entry->is_concurrent)
+      last = entry;
+  }
+  for (entry = entries->first; last != NULL && entry != NULL; entry = entry->next) {
+    if (entry->function_id == function_id && entry->number_of_variables == number_of_variables
+        && !entry->is_concurrent && entry->first_instance == last->first_instance)
+      current = entry;
+  }
+
+  if (current == NULL) {
+    if (last != NULL) /* new dimension in the current .info file */
+      return observer_bbob_add_entry(entries, function_id, number_of_variables, last->first_instance,
+          0, header);
+    return observer_bbob_add_entry(entries, function_id, number_of_variables, instance_id, 0, header);
+  }
+  if (!current->is_open) {
+    if (current == last) {
+      current->is_open = 1;
+      return current;
+    }
+    /* the dimension is already in the current .info file */
+    return observer_bbob_add_entry(entries, function_id, number_of_variables, instance_id, 0, header);
+  }
+
+  /* the files of the entry are in use */
+  for (entry = entries->first; entry != NULL; entry = entry->next) {
+    if (entry->is_concurrent && !entry->is_open && entry->function_id == function_id
+        && entry->number_of_variables == number_of_variables) {
+      entry->is_open = 1;
+      return entry;
+    }
+  }
+  return observer_bbob_add_entry(entries, function_id, number_of_variables, instance_id, 1, header);
+}
+
+/**
+ * @brief Writes the entry with the given separator into the .info file.
+ *
+ * The timings of the runs, if measured, are written into the comment line of the entry.
+ */
+static void observer_bbob_write_entry(FILE *info_file, const observer_bbob_entry_t *entry,
+                                      const char *separator) {
+  fprintf(info_file, "%s%s%%%s%s\n%s.dat%s", separator, entry->header,
+      strlen(entry->timings) == 0 ? "" : " timing (instance:construction|evaluation|logging seconds)",
+      entry->timings, entry->data_file_name, entry->runs);
+}
+
+/**
+ * @brief Adds the record to the runs of the entry and writes it into the .info file.
+ *
+ * The .info file contains the entries with at least one started run in order of their creation. If
+ * the entry is the last one in its file and no times were measured, the record is appended to the
+ * file, preceded by the entry itself if it is its first record. Otherwise, the .info file is
+ * rewritten. Must be called with the mutex locked.
+ */
+static void observer_bbob_write_record(observer_bbob_entries_t *entries,
+                                       observer_bbob_entry_t *entry,
+                                       const char *record) {
+
+  observer_bbob_entry_t *other;
+  char file_path[COCO_PATH_MAX + 2] = { 0 };
+  char *runs;
+  FILE *info_file;
+  int is_first_record = (strlen(entry->runs) == 0), is_last = 1;
+
+  runs = coco_strdupf("%s%s", entry->runs, record);
+  coco_free_memory(entry->runs);
+  entry->runs = runs;
+
+  for (other = entry->next; other != NULL; other = other->next) {
+    if (strlen(other->runs) > 0 && strcmp(other->info_file_name, entry->info_file_name) == 0)
+      is_last = 0;
+  }
+
+  coco_join_path(file_path, sizeof(file_path), entries->result_folder, entry->info_file_name, NULL);
+  if (is_last && strlen(entry->timings) == 0) {
+    info_file = fopen(file_path, "a");
+    if (info_file == NULL) {
+      coco_error("observer_bbob_write_record(): failed to open file %s.", file_path);
+      return; /* Never reached */
+    }
+    if (is_first_record) {
+      fseek(info_file, 0, SEEK_END);
+      observer_bbob_write_entry(info_file, entry, ftell(info_file) > 0 ? "\n" : "");
+    } else {
+      fprintf(info_file, "%s", record);
+    }
+    fclose(info_file);
+    return;
+  }
+
+  info_file = fopen(file_path, "w");
+  if (info_file == NULL) {
+    coco_error("observer_bbob_write_record(): failed to open file %s.", file_path);
+    return; /* Never reached */
+  }
+  is_first_record = 1;
+  for (other = entries->first; other != NULL; other = other->next) {
+    if (strlen(other->runs) == 0 || strcmp(other->info_file_name, entry->info_file_name) != 0)
+      continue;
+    observer_bbob_write_entry(info_file, other, is_first_record ? "" : "\n");
+    is_first_record = 0;
+  }
+  fclose(info_file);
+}
+
+/**
+ * @brief Starts a run on the given instance in the (open) entry by writing ", instance" into its .info
+ * file.
+ *
+ * The run is indexed before its data are written, such that the data of runs that do not finish
+ * (for example, because the process crashes) can still be found. Must be called with the mutex locked.
+ */
+static void observer_bbob_start_run(observer_bbob_entries_t *entries,
+                                    observer_bbob_entry_t *entry,
+                                    const size_t instance_id) {
+
+  char *record = coco_strdupf(", %lu", (unsigned long) instance_id);
+
+  observer_bbob_write_record(entries, entry, record);
+  coco_free_memory(record);
+}
+
+/**
+ * @brief Finishes the started run of the entry by writing ":evaluations|f-value" into its .info file
+ * and adds the timing of the run (which can be empty), then marks the entry as closed.
+ *
+ * Must be called with the mutex locked.
+ */
+static void observer_bbob_close_entry(observer_bbob_entries_t *entries,
+                                      observer_bbob_entry_t *entry,
+                                      const char *result,
+                                      const char *timing) {
+
+  char *timings;
+
+  timings = coco_strdupf("%s%s", entry->timings, timing);
+  coco_free_memory(entry->timings);
+  entry->timings = timings;
+  observer_bbob_write_record(entries, entry, result);
+  entry->is_open = 0;
+}
+
 /**
  * @brief Initializes the bbob observer.
  */
 static void observer_bbob(coco_observer_t *observer, const char *options, coco_option_keys_t **option_keys) {
 
+  observer_bbob_data_t *observer_data;
+  observer_bbob_entries_t *entries;
+
+  entries = (observer_bbob_entries_t *) coco_allocate_memory(sizeof(*entries));
+  coco_mutex_init(&entries->mutex);
+  entries->number_of_references = 1;
+  entries->number_of_concurrent = 0;
+  entries->result_folder = coco_strdup(observer->result_folder);
+  entries->algorithm_name = coco_strdup(observer->algorithm_name);
+  entries->first = NULL;
+
+  observer_data = (observer_bbob_data_t *) coco_allocate_memory(sizeof(*observer_data));
+  observer_data->entries = entries;
+
   observer->logger_allocate_function = logger_bbob;
   observer->logger_free_function = logger_bbob_free;
-  observer->data_free_function = NULL;
-  observer->data = NULL;
+  observer->data_free_function = observer_bbob_free;
+  observer->data = observer_data;
 
   *option_keys = NULL;
 
@@ -19,12 +19,19 @@ typedef enum {
   LOG_VARS_NEVER, LOG_VARS_LOW_DIM, LOG_VARS_ALWAYS
 } observer_biobj_log_vars_e;
 
+/** @brief Enum for denoting the format of the archive files with nondominated solutions. */
+typedef enum {
+  ARCHIVE_FORMAT_TEXT, ARCHIVE_FORMAT_BINARY
+} observer_biobj_archive_format_e;
+
 /**
  * @brief The bbob-biobj observer data type.
  */
 typedef struct {
   observer_biobj_log_nondom_e log_nondom_mode; /**< @brief Handling of the nondominated solutions. */
   observer_biobj_log_vars_e log_vars_mode;     /**< @brief When the decision variables are logged. */
+  observer_biobj_archive_format_e archive_format;
+                                               /**< @brief Format of the archive files. */
 
   int compute_indicators;                      /**< @brief Whether to compute indicators. */
   int produce_all_data;                        /**< @brief Whether to produce all data. */
@@ -53,6 +60,12 @@ static void logger_biobj_free(void *logger);
  * (don't output decision variables), "low_dim"(output decision variables only for dimensions lower or equal
  * to 5) and "all" (output all decision variables). The default value is "low_dim".
  *
+ * - "archive_format: STRING" determines the format of the archive files with nondominated solutions. STRING
+ * can take on the values "text" (one line of text per solution) and "binary" (a compact binary format that
+ * keeps the full precision of all values and is much faster to read, see logger_biobj.c for its layout).
+ * Both formats use the .adat ending and can be converted into each other with the archive_convert.py script
+ * of the archive-update preprocessing tools. The default value is "text".
+ *
  * - "compute_indicators: VALUE" determines whether to compute and output performance indicators (1) or not
  * (0). The default value is 1.
  *
@@ -68,8 +81,8 @@ static void observer_biobj(coco_observer_t *observer, const char *options, coco_
 
   /* Sets the valid keys for bbob-biobj observer options
    * IMPORTANT: This list should be up-to-date with the code and the documentation */
-  const char *known_keys[] = { "log_nondominated", "log_decision_variables", "compute_indicators",
-      "produce_all_data" };
+  const char *known_keys[] = { "log_nondominated", "log_decision_variables", "archive_format",
+      "compute_indicators", "produce_all_data" };
   *option_keys = coco_option_keys_allocate(sizeof(known_keys) / sizeof(char *), known_keys);
 
   observer_data = (observer_biobj_data_t *) coco_allocate_memory(sizeof(*observer_data));
@@ -96,6 +109,14 @@ static void observer_biobj(coco_observer_t *observer, const char *options, coco_
       observer_data->log_vars_mode = LOG_VARS_LOW_DIM;
   }
 
+  observer_data->archive_format = ARCHIVE_FORMAT_TEXT;
+  if (coco_options_read_string(options, "archive_format", string_value) > 0) {
+    if (strcmp(string_value, "text") == 0)
+      observer_data->archive_format = ARCHIVE_FORMAT_TEXT;
+    else if (strcmp(string_value, "binary") == 0)
+      observer_data->archive_format = ARCHIVE_FORMAT_BINARY;
+  }
+
   if (coco_options_read_int(options, "compute_indicators", &(observer_data->compute_indicators)) == 0)
     observer_data->compute_indicators = 1;
 
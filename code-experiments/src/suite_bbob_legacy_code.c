@@ -10,6 +10,7 @@
 #include <stdio.h>
 #include <assert.h>
 #include "coco.h"
+#include "coco_cache.c"
 
 /** @brief Maximal dimension used in BBOB2009. */
 #define SUITE_BBOB2009_MAX_DIM 40
@@ -129,15 +130,28 @@ static void bbob2009_gauss(double *g, const size_t N, const long seed) {
 
 /**
  * @brief Computes a DIM by DIM rotation matrix based on seed and stores it in B.
+ *
+ * The matrices are cached, such that constructing the same problem again does not recompute them.
  */
 static void bbob2009_compute_rotation(double **B, const long seed, const size_t DIM) {
   /* To ensure temporary data fits into gvec */
   double prod;
   double gvect[2000];
   size_t i, j, k; /* Loop over pairs of column vectors. */
+  char *key;
 
   assert(DIM * DIM < 2000);
 
+  key = coco_strdupf("rotation_s%ld_d%lu", seed, (unsigned long) DIM);
+  if (coco_cache_get(key, gvect, DIM * DIM)) {
+    for (i = 0; i < DIM; i++) {
+      for (j = 0; j < DIM; j++)
+        B[i][j] = gvect[i * DIM + j];
+    }
+    coco_free_memory(key);
+    return;
+  }
+
   bbob2009_gauss(gvect, DIM * DIM, seed);
   bbob2009_reshape(B, gvect, DIM, DIM);
   /*1st coordinate is row, 2nd is column.*/
@@ -157,6 +171,12 @@ static void bbob2009_compute_rotation(double **B, const long seed, const size_t
       B[k][i] /= sqrt(prod);
   }
 
+  for (i = 0; i < DIM; i++) {
+    for (j = 0; j < DIM; j++)
+      gvect[i * DIM + j] = B[i][j];
+  }
+  coco_cache_put(key, gvect, DIM * DIM);
+  coco_free_memory(key);
 }
 
 static void bbob2009_copy_rotation_matrix(double **rot, double *M, double *b, const size_t DIM) {
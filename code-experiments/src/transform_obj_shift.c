@@ -20,8 +20,6 @@ typedef struct {
  */
 static void transform_obj_shift_evaluate_function(coco_problem_t *problem, const double *x, double *y) {
   transform_obj_shift_data_t *data;
-  double *cons_values;
-  int is_feasible;
   size_t i;
   
   if (coco_vector_contains_nan(x, coco_problem_get_dimension(problem))) {
@@ -35,14 +33,7 @@ static void transform_obj_shift_evaluate_function(coco_problem_t *problem, const
   for (i = 0; i < problem->number_of_objectives; i++)
     y[i] += data->offset;
   
-  if (problem->number_of_constraints > 0) {
-    cons_values = coco_allocate_vector(problem->number_of_constraints);
-    is_feasible = coco_is_feasible(problem, x, cons_values);
-    coco_free_memory(cons_values);    
-    if (is_feasible)
-      assert(y[0] + 1e-13 >= problem->best_value[0]);
-  }
-  else assert(y[0] + 1e-13 >= problem->best_value[0]);
+  coco_problem_assert_feasible_above_optimum(problem, x, y);
 }
 
 /**
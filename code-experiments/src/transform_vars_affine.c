@@ -28,8 +28,6 @@ typedef struct {
  */
 static void transform_vars_affine_evaluate_function(coco_problem_t *problem, const double *x, double *y) {
   size_t i, j;
-  double *cons_values;
-  int is_feasible;
   transform_vars_affine_data_t *data;
   coco_problem_t *inner_problem;
   
@@ -52,14 +50,7 @@ static void transform_vars_affine_evaluate_function(coco_problem_t *problem, con
   
   coco_evaluate_function(inner_problem, data->x, y);
   
-  if (problem->number_of_constraints > 0) {
-    cons_values = coco_allocate_vector(problem->number_of_constraints);
-    is_feasible = coco_is_feasible(problem, x, cons_values);
-    coco_free_memory(cons_values);    
-    if (is_feasible)
-      assert(y[0] + 1e-13 >= problem->best_value[0]);
-  }
-  else assert(y[0] + 1e-13 >= problem->best_value[0]);
+  coco_problem_assert_feasible_above_optimum(problem, x, y);
 }
 
 /**
@@ -107,11 +98,6 @@ static void transform_vars_affine_evaluate_gradient(coco_problem_t *problem, con
   data = (transform_vars_affine_data_t *) coco_problem_transformed_get_data(problem);
   inner_problem = coco_problem_transformed_get_inner_problem(problem);
 
-  gradient = coco_allocate_vector(inner_problem->number_of_variables);
-  
-  for (i = 0; i < inner_problem->number_of_variables; ++i)
-    gradient[i] = 0.0;
-
   for (i = 0; i < inner_problem->number_of_variables; ++i) {
     /* data->M has problem->number_of_variables columns and inner_problem->number_of_variables rows. */
     current_row = data->M + i * problem->number_of_variables;
@@ -123,6 +109,11 @@ static void transform_vars_affine_evaluate_gradient(coco_problem_t *problem, con
   
   bbob_evaluate_gradient(inner_problem, data->x, y);
   
+  /* data->x is not needed anymore and holds the gradient from here on */
+  gradient = data->x;
+  for (i = 0; i < inner_problem->number_of_variables; ++i)
+    gradient[i] = 0.0;
+
   /* grad_(f o g )(x), where g(x) = M * x + b, equals to
    * M^T * grad_f(M *x + b) 
    */
@@ -137,7 +128,6 @@ static void transform_vars_affine_evaluate_gradient(coco_problem_t *problem, con
      y[i] = gradient[i];
   
   current_row = NULL;
-  coco_free_memory(gradient);
 }
 
 /**
@@ -14,6 +14,7 @@
  */
 typedef struct {
   double *x;
+  double *scales;
   double alpha;
 } transform_vars_conditioning_data_t;
 
@@ -34,11 +35,7 @@ static void transform_vars_conditioning_evaluate(coco_problem_t *problem, const
   inner_problem = coco_problem_transformed_get_inner_problem(problem);
 
   for (i = 0; i < problem->number_of_variables; ++i) {
-    /* OME: We could precalculate the scaling coefficients if we
-     * really wanted to.
-     */
-    data->x[i] = pow(data->alpha, 0.5 * (double) (long) i / ((double) (long) problem->number_of_variables - 1.0))
-        * x[i];
+    data->x[i] = data->scales[i] * x[i];
   }
   coco_evaluate_function(inner_problem, data->x, y);
   assert(y[0] + 1e-13 >= problem->best_value[0]);
@@ -51,7 +48,6 @@ static void transform_vars_conditioning_evaluate_gradient(coco_problem_t *proble
   size_t i;
   transform_vars_conditioning_data_t *data;
   coco_problem_t *inner_problem;
-  double *gradient;
 
   if (coco_vector_contains_nan(x, coco_problem_get_dimension(problem))) {
   	coco_vector_set_to_nan(y, coco_problem_get_number_of_objectives(problem));
@@ -61,26 +57,19 @@ static void transform_vars_conditioning_evaluate_gradient(coco_problem_t *proble
   data = (transform_vars_conditioning_data_t *) coco_problem_transformed_get_data(problem);
   inner_problem = coco_problem_transformed_get_inner_problem(problem);
 
-  gradient = coco_allocate_vector(inner_problem->number_of_variables);
-  
   for (i = 0; i < problem->number_of_variables; ++i) {
-    gradient[i] = pow(data->alpha, 0.5 * (double) (long) i / ((double) (long) problem->number_of_variables - 1.0));
-    data->x[i] = gradient[i] * x[i];
+    data->x[i] = data->scales[i] * x[i];
   }
   bbob_evaluate_gradient(inner_problem, data->x, y);
   
   for (i = 0; i < inner_problem->number_of_variables; ++i)
-    gradient[i] *= y[i];
-  
-  for (i = 0; i < inner_problem->number_of_variables; ++i)
-    y[i] = gradient[i];
-    
-  coco_free_memory(gradient);
+    y[i] *= data->scales[i];
 }
 
 static void transform_vars_conditioning_free(void *thing) {
   transform_vars_conditioning_data_t *data = (transform_vars_conditioning_data_t *) thing;
   coco_free_memory(data->x);
+  coco_free_memory(data->scales);
 }
 
 /**
@@ -89,10 +78,16 @@ static void transform_vars_conditioning_free(void *thing) {
 static coco_problem_t *transform_vars_conditioning(coco_problem_t *inner_problem, const double alpha) {
   transform_vars_conditioning_data_t *data;
   coco_problem_t *problem;
+  size_t i;
 
   data = (transform_vars_conditioning_data_t *) coco_allocate_memory(sizeof(*data));
   data->x = coco_allocate_vector(inner_problem->number_of_variables);
   data->alpha = alpha;
+  /* The scaling coefficients are computed once instead of in each evaluation */
+  data->scales = coco_allocate_vector(inner_problem->number_of_variables);
+  for (i = 0; i < inner_problem->number_of_variables; ++i) {
+    data->scales[i] = pow(alpha, 0.5 * (double) (long) i / ((double) (long) inner_problem->number_of_variables - 1.0));
+  }
   problem = coco_problem_transformed_allocate(inner_problem, data, transform_vars_conditioning_free, "transform_vars_conditioning");
   problem->evaluate_function = transform_vars_conditioning_evaluate;
   problem->evaluate_gradient = transform_vars_conditioning_evaluate_gradient;
@@ -28,6 +28,7 @@
  */
 typedef struct {
   double *offset;
+  double *x;
 } transform_vars_discretize_data_t;
 
 /**
@@ -50,7 +51,9 @@ static void transform_vars_discretize_evaluate_function(coco_problem_t *problem,
   inner_problem = coco_problem_transformed_get_inner_problem(problem);
 
   /* Transform x to fit in the discretized space */
-  discretized_x = coco_duplicate_vector(x, problem->number_of_variables);
+  discretized_x = data->x;
+  for (i = 0; i < problem->number_of_variables; ++i)
+    discretized_x[i] = x[i];
   for (i = 0; i < problem->number_of_integer_variables; ++i) {
     outer_l = problem->smallest_values_of_interest[i];
     outer_u = problem->largest_values_of_interest[i];
@@ -70,7 +73,6 @@ static void transform_vars_discretize_evaluate_function(coco_problem_t *problem,
   }
 
   coco_evaluate_function(inner_problem, discretized_x, y);
-  coco_free_memory(discretized_x);
 }
 
 /**
@@ -79,6 +81,7 @@ static void transform_vars_discretize_evaluate_function(coco_problem_t *problem,
 static void transform_vars_discretize_free(void *thing) {
   transform_vars_discretize_data_t *data = (transform_vars_discretize_data_t *) thing;
   coco_free_memory(data->offset);
+  coco_free_memory(data->x);
 }
 
 /**
@@ -98,6 +101,7 @@ static coco_problem_t *transform_vars_discretize(coco_problem_t *inner_problem,
 
   data = (transform_vars_discretize_data_t *) coco_allocate_memory(sizeof(*data));
   data->offset = coco_allocate_vector(inner_problem->number_of_variables);
+  data->x = coco_allocate_vector(inner_problem->number_of_variables);
 
   problem = coco_problem_transformed_allocate(inner_problem, data, transform_vars_discretize_free, "transform_vars_discretize");
   assert(number_of_integer_variables > 0);
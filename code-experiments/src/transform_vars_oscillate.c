@@ -21,8 +21,7 @@ typedef struct {
  */
 static void transform_vars_oscillate_evaluate_function(coco_problem_t *problem, const double *x, double *y) {
   static const double alpha = 0.1;
-  double tmp, base, *oscillated_x, *cons_values;
-  int is_feasible;
+  double tmp, base, *oscillated_x;
   size_t i;
   transform_vars_oscillate_data_t *data;
   coco_problem_t *inner_problem;
@@ -51,14 +50,7 @@ static void transform_vars_oscillate_evaluate_function(coco_problem_t *problem,
   }
   coco_evaluate_function(inner_problem, oscillated_x, y);
   
-  if (problem->number_of_constraints > 0) {
-    cons_values = coco_allocate_vector(problem->number_of_constraints);
-    is_feasible = coco_is_feasible(problem, x, cons_values);
-    coco_free_memory(cons_values);    
-    if (is_feasible)
-      assert(y[0] + 1e-13 >= problem->best_value[0]);
-  }
-  else assert(y[0] + 1e-13 >= problem->best_value[0]);
+  coco_problem_assert_feasible_above_optimum(problem, x, y);
 }
 
 /**
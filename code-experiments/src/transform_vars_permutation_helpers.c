@@ -14,35 +14,67 @@
 
 /* TODO: Document this file in doxygen style! */
 
-static double *perm_random_data;/* global variable used to generate the random permutations */
+/**
+ * @brief A value and its index, such that sorting the values gives the permutation of their indices.
+ *
+ * Sorting these pairs instead of the indices avoids the comparison function depending on global data,
+ * such that permutations can be computed in different threads at the same time.
+ */
+typedef struct {
+  double value;
+  size_t index;
+} coco_permutation_pair_t;
 
 /**
  * @brief Comparison function used for sorting. In our case, it serves as a random permutation generator
+ *
+ * Equal values are ordered by their index, such that the permutation does not depend on the sorting algorithm.
  */
 static int f_compare_doubles_for_random_permutation(const void *a, const void *b) {
-  double temp = perm_random_data[*(const size_t *) a] - perm_random_data[*(const size_t *) b];
+  const coco_permutation_pair_t *pair_a = (const coco_permutation_pair_t *) a;
+  const coco_permutation_pair_t *pair_b = (const coco_permutation_pair_t *) b;
+  double temp = pair_a->value - pair_b->value;
   if (temp > 0)
     return 1;
   else if (temp < 0)
     return -1;
+  else if (pair_a->index > pair_b->index)
+    return 1;
+  else if (pair_a->index < pair_b->index)
+    return -1;
   else
     return 0;
 }
 
+/**
+ * @brief puts the indices of the length values in P in the order of increasing values
+ */
+static void coco_compute_sorting_permutation(size_t *P, const double *values, size_t length) {
+  size_t i;
+  coco_permutation_pair_t *pairs;
+
+  pairs = (coco_permutation_pair_t *) coco_allocate_memory(sizeof(*pairs) * length);
+  for (i = 0; i < length; i++) {
+    pairs[i].value = values[i];
+    pairs[i].index = i;
+  }
+  qsort(pairs, length, sizeof(*pairs), f_compare_doubles_for_random_permutation);
+  for (i = 0; i < length; i++)
+    P[i] = pairs[i].index;
+  coco_free_memory(pairs);
+}
+
 /**
  * @brief generates a random, uniformly sampled, permutation and puts it in P
  * Wassim: move to coco_utilities?
  */
 static void coco_compute_random_permutation(size_t *P, long seed, size_t n) {
-  size_t i;
+  double *random_data;
 
-  perm_random_data = coco_allocate_vector(n);
-  bbob2009_gauss(perm_random_data, n, seed);
-  for (i = 0; i < n; i++){
-    P[i] = i;
-  }
-  qsort(P, n, sizeof(size_t), f_compare_doubles_for_random_permutation);
-  coco_free_memory(perm_random_data);
+  random_data = coco_allocate_vector(n);
+  bbob2009_gauss(random_data, n, seed);
+  coco_compute_sorting_permutation(P, random_data, n);
+  coco_free_memory(random_data);
 }
 
 
@@ -50,15 +82,7 @@ static void coco_compute_random_permutation(size_t *P, long seed, size_t n) {
  * @brief generates a permutation by sorting a sequence and puts it in P
  */
 static void coco_compute_permutation_from_sequence(size_t *P, double *seq, size_t length) {
-  size_t i;
-    
-  perm_random_data = coco_allocate_vector(length);
-  for (i = 0; i < length; i++){
-      P[i] = i;
-      perm_random_data[i] = seq[i];
-  }
-  qsort(P, length, sizeof(size_t), f_compare_doubles_for_random_permutation);
-  coco_free_memory(perm_random_data);
+  coco_compute_sorting_permutation(P, seq, length);
 }
 
 
@@ -89,6 +113,7 @@ static void coco_compute_truncated_uniform_swap_permutation(size_t *P, long seed
   size_t i, idx_swap;
   size_t lower_bound, upper_bound, first_swap_var, second_swap_var, tmp;
   size_t *idx_order;
+  double *random_data;
 
   if (n <= 40) {
     /* Do an identity permutation for dimensions <= 40 */
@@ -97,8 +122,8 @@ static void coco_compute_truncated_uniform_swap_permutation(size_t *P, long seed
     return;
   }
 
-  perm_random_data = coco_allocate_vector(n);
-  bbob2009_unif(perm_random_data, n, seed);
+  random_data = coco_allocate_vector(n);
+  bbob2009_unif(random_data, n, seed);
 
   idx_order = coco_allocate_vector_size_t(n);
   for (i = 0; i < n; i++) {
@@ -107,9 +132,9 @@ static void coco_compute_truncated_uniform_swap_permutation(size_t *P, long seed
   }
 
   if (swap_range > 0) {
-    /*sort the random data in perm_random_data and arrange idx_order accordingly*/
+    /*sort the random data in random_data and arrange idx_order accordingly*/
     /*did not use coco_compute_random_permutation to only use the seed once*/
-    qsort(idx_order, n, sizeof(size_t), f_compare_doubles_for_random_permutation);
+    coco_compute_sorting_permutation(idx_order, random_data, n);
     for (idx_swap = 0; idx_swap < nb_swaps; idx_swap++) {
       first_swap_var = idx_order[idx_swap];
       if (first_swap_var < swap_range) {
@@ -141,7 +166,7 @@ static void coco_compute_truncated_uniform_swap_permutation(size_t *P, long seed
     coco_compute_random_permutation(P, seed, n);
   }
   coco_free_memory(idx_order);
-  coco_free_memory(perm_random_data);
+  coco_free_memory(random_data);
 }
 
 
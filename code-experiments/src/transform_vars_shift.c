@@ -22,8 +22,6 @@ typedef struct {
  */
 static void transform_vars_shift_evaluate_function(coco_problem_t *problem, const double *x, double *y) {
   size_t i;
-  double *cons_values;
-  int is_feasible;
   transform_vars_shift_data_t *data;
   coco_problem_t *inner_problem;
   
@@ -41,14 +39,7 @@ static void transform_vars_shift_evaluate_function(coco_problem_t *problem, cons
   
   coco_evaluate_function(inner_problem, data->shifted_x, y);
   
-  if (problem->number_of_constraints > 0) {
-    cons_values = coco_allocate_vector(problem->number_of_constraints);
-    is_feasible = coco_is_feasible(problem, x, cons_values);
-    coco_free_memory(cons_values);    
-    if (is_feasible)
-      assert(y[0] + 1e-13 >= problem->best_value[0]);
-  }
-  else assert(y[0] + 1e-13 >= problem->best_value[0]);
+  coco_problem_assert_feasible_above_optimum(problem, x, y);
 }
 
 /**
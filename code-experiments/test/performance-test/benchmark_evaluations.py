@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""micro-benchmark of the function evaluations of a suite, per function
+and dimension.
+
+Usage::
+
+    python benchmark_evaluations.py [suite_name [dimensions [evaluations]]]
+
+for example ``python benchmark_evaluations.py bbob-largescale 20,80,640``.
+By default, the bbob suite is benchmarked in dimensions 2,10,40 with
+1000 evaluations per problem. For each function and dimension, the
+printed value is the smallest time per evaluation in microseconds over
+the (first three) instances, such that the output of two builds of
+`cocoex` can be compared line by line.
+"""
+from __future__ import division, print_function
+import sys
+import time
+import numpy as np
+import cocoex
+
+default_dimensions = {'bbob': '2,10,40',
+                      'bbob-largescale': '20,80,640',
+                      'bbob-constrained': '2,10,40',
+                      'bbob-mixint': '5,20,80',
+                      'bbob-biobj': '2,10,40'}
+
+def benchmark_problem(problem, evaluations, repetitions=3):
+    """return the smallest time in seconds per evaluation of `problem`
+    over `repetitions` batches of `evaluations` uniform random points
+    in the region of interest
+    """
+    X = problem.lower_bounds + (problem.upper_bounds - problem.lower_bounds
+        ) * np.random.rand(evaluations, problem.dimension)
+    out = None
+    timings = []
+    for _ in range(repetitions):
+        t0 = time.time()
+        out = problem.evaluate_batch(X, out)
+        timings.append((time.time() - t0) / evaluations)
+    return min(timings)
+
+def benchmark_suite(suite_name, dimensions, evaluations=1000):
+    """print the time per evaluation in microseconds for each function
+    and dimension of the suite and return them in a `dict`
+    """
+    np.random.seed(1)
+    suite = cocoex.Suite(suite_name, "instances: 1-3",
+                         "dimensions: " + dimensions)
+    timings = {}
+    for problem in suite:
+        key = (problem.id_function, problem.dimension)
+        t = benchmark_problem(problem, evaluations)
+        timings[key] = min(timings.get(key, t), t)
+        problem.free()
+    for f, d in sorted(timings):
+        print("%s f%02d %4dD: %10.2f us" % (suite_name, f, d, 1e6 * timings[(f, d)]))
+    print("%s total: %.2f us per evaluation on average" % (
+        suite_name, 1e6 * sum(timings.values()) / len(timings)))
+    return timings
+
+if __name__ == "__main__":
+    suite_name = sys.argv[1] if len(sys.argv) > 1 else 'bbob'
+    dimensions = sys.argv[2] if len(sys.argv) > 2 else default_dimensions.get(suite_name, '2,10,40')
+    evaluations = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    benchmark_suite(suite_name, dimensions, evaluations)
@@ -0,0 +1,105 @@
+#include "coco.h"
+#include "minunit_c89.h"
+
+/**
+ * Tests adding data to the cache and getting them back.
+ */
+MU_TEST(test_coco_cache_get_put) {
+
+  double values[3] = { 1, 2, 3 };
+  double result[3] = { 0, 0, 0 };
+
+  coco_cache_clear();
+  mu_check(!coco_cache_get("test_a", result, 3));
+  coco_cache_put("test_a", values, 3);
+  mu_check(coco_cache_get("test_a", result, 3));
+  mu_check(result[0] == 1 && result[1] == 2 && result[2] == 3);
+  /* Data of another size or with another key are not found */
+  mu_check(!coco_cache_get("test_a", result, 2));
+  mu_check(!coco_cache_get("test_b", result, 3));
+  coco_cache_clear();
+  mu_check(!coco_cache_get("test_a", result, 3));
+}
+
+/**
+ * Tests that the least recently used entries are dropped when the cache is full.
+ */
+MU_TEST(test_coco_cache_eviction) {
+
+  double values[4] = { 1, 2, 3, 4 };
+  double result[4];
+  size_t max_size = coco_cache_max_size;
+
+  coco_cache_clear();
+  coco_cache_max_size = 10;
+  coco_cache_put("test_a", values, 4);
+  coco_cache_put("test_b", values, 4);
+  mu_check(coco_cache_get("test_a", result, 4));
+  coco_cache_put("test_c", values, 4);
+  mu_check(coco_cache_get("test_a", result, 4));
+  mu_check(!coco_cache_get("test_b", result, 4));
+  mu_check(coco_cache_get("test_c", result, 4));
+  /* Data larger than the cache are not added */
+  coco_cache_put("test_d", values, 11);
+  mu_check(!coco_cache_get("test_d", result, 11));
+  /* Data added again replace the cached ones */
+  coco_cache_put("test_c", values, 4);
+  mu_check(coco_cache_size == 8);
+  mu_check(coco_cache_get("test_a", result, 4) && coco_cache_get("test_c", result, 4));
+  coco_cache_clear();
+  mu_check(coco_cache_size == 0 && coco_cache_first == NULL && coco_cache_last == NULL);
+  coco_cache_max_size = max_size;
+}
+
+/**
+ * Tests that problems constructed from cached data are the same as problems constructed from scratch
+ * and that the cache is cleared when the last suite is freed.
+ */
+MU_TEST(test_coco_cache_problems) {
+
+  const char *suite_names[2] = { "bbob", "bbob-largescale" };
+  const char *suite_options[2] = { "dimensions: 40 function_indices: 10,21,22 instance_indices: 1",
+                                   "dimensions: 80 function_indices: 10,21,22 instance_indices: 1" };
+  coco_suite_t *suite[2];
+  coco_problem_t *problem;
+  coco_random_state_t *random_generator;
+  double *x, y_first[3], y_second[3];
+  size_t i, j, k;
+
+  random_generator = coco_random_new(0xdeadbeef);
+  x = coco_allocate_vector(80);
+  for (i = 0; i < 80; i++)
+    x[i] = 10 * coco_random_uniform(random_generator) - 5;
+
+  for (i = 0; i < 2; i++) {
+    mu_check(coco_cache_first == NULL);
+    /* The second suite is constructed from the data cached by the first one */
+    for (k = 0; k < 2; k++) {
+      suite[k] = coco_suite(suite_names[i], "", suite_options[i]);
+      j = 0;
+      while ((problem = coco_suite_get_next_problem(suite[k], NULL)) != NULL) {
+        coco_evaluate_function(problem, x, (k == 0) ? &y_first[j] : &y_second[j]);
+        j++;
+      }
+      mu_check(coco_cache_first != NULL);
+    }
+    for (j = 0; j < 3; j++)
+      mu_check(y_first[j] == y_second[j]);
+    coco_suite_free(suite[0]);
+    mu_check(coco_cache_first != NULL);
+    coco_suite_free(suite[1]);
+    mu_check(coco_cache_size == 0 && coco_cache_first == NULL && coco_cache_last == NULL);
+  }
+
+  coco_free_memory(x);
+  coco_random_free(random_generator);
+}
+
+/**
+ * Run all tests in this file.
+ */
+MU_TEST_SUITE(test_all_coco_cache) {
+  MU_RUN_TEST(test_coco_cache_get_put);
+  MU_RUN_TEST(test_coco_cache_eviction);
+  MU_RUN_TEST(test_coco_cache_problems);
+}
@@ -0,0 +1,187 @@
+#include "coco.h"
+#include "minunit_c89.h"
+
+/**
+ * Reads the (beginning of the) file with the given name within the result folder of the observer into
+ * the buffer.
+ */
+static void test_logger_bbob_read_file(coco_observer_t *observer, const char *file_name,
+                                       char *buffer, const size_t size) {
+
+  char path_name[COCO_PATH_MAX + 1];
+  FILE *file;
+  size_t length = 0;
+
+  memcpy(path_name, observer->result_folder, strlen(observer->result_folder) + 1);
+  coco_join_path(path_name, COCO_PATH_MAX, file_name, NULL);
+  file = fopen(path_name, "r");
+  if (file != NULL) {
+    length = fread(buffer, 1, size - 1, file);
+    fclose(file);
+  }
+  buffer[length] = '\0';
+}
+
+/**
+ * Tests that the bbob logger can observe several problems at the same time.
+ */
+MU_TEST(test_logger_bbob_concurrent_problems) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_problem_t *problem1, *problem2, *problem3;
+  logger_bbob_data_t *logger1, *logger2, *logger3;
+  observer_bbob_entry_t *entry1, *entry2;
+  double x[2] = { 0, 0 }, y;
+  char buffer[512];
+
+  suite = coco_suite("bbob", "", "dimensions: 2 function_indices: 1 instance_indices: 1-3");
+  observer = coco_observer("bbob", "result_folder: test_logger_bbob");
+
+  /* Two problems of the same function and dimension are logged into different data files */
+  problem1 = coco_problem_add_observer(coco_suite_get_problem(suite, 0), observer);
+  problem2 = coco_problem_add_observer(coco_suite_get_problem(suite, 1), observer);
+  logger1 = (logger_bbob_data_t *) coco_problem_transformed_get_data(problem1);
+  logger2 = (logger_bbob_data_t *) coco_problem_transformed_get_data(problem2);
+  coco_evaluate_function(problem1, x, &y);
+  coco_evaluate_function(problem2, x, &y);
+  coco_evaluate_function(problem1, x, &y);
+  entry1 = logger1->entry;
+  entry2 = logger2->entry;
+  mu_check(entry1 != entry2);
+  mu_check(strcmp(entry1->data_file_name, entry2->data_file_name) != 0);
+  mu_check(strcmp(entry1->info_file_name, "bbobexp_f1_i1.info") == 0);
+  mu_check(strcmp(entry2->info_file_name, "bbobexp_f1_i2-1.info") == 0);
+
+  /* A run is written into the .info file when it starts and completed when the problem is freed */
+  test_logger_bbob_read_file(observer, entry1->info_file_name, buffer, sizeof(buffer));
+  mu_check(strncmp(buffer, "suite = 'bbob', funcId = 1, DIM = 2", 35) == 0);
+  mu_check(strcmp(strstr(buffer, "\n%\n"), "\n%\ndata_f1/bbobexp_f1_DIM2_i1.dat, 1") == 0);
+  coco_problem_free(problem2);
+  test_logger_bbob_read_file(observer, entry2->info_file_name, buffer, sizeof(buffer));
+  mu_check(strncmp(buffer, "suite = 'bbob', funcId = 1, DIM = 2", 35) == 0);
+  mu_check(strstr(buffer, "\n%\ndata_f1/bbobexp_f1_DIM2_i2-1.dat, 2:1|") != NULL);
+
+  /* A problem opened after a problem was freed reuses its data files */
+  problem3 = coco_problem_add_observer(coco_suite_get_problem(suite, 2), observer);
+  logger3 = (logger_bbob_data_t *) coco_problem_transformed_get_data(problem3);
+  coco_evaluate_function(problem3, x, &y);
+  mu_check(logger3->entry == entry2);
+  coco_problem_free(problem3);
+  coco_problem_free(problem1);
+  test_logger_bbob_read_file(observer, entry1->info_file_name, buffer, sizeof(buffer));
+  mu_check(strstr(buffer, "\ndata_f1/bbobexp_f1_DIM2_i1.dat, 1:2|") != NULL);
+  test_logger_bbob_read_file(observer, entry2->info_file_name, buffer, sizeof(buffer));
+  mu_check(strstr(buffer, ", 2:1|") != NULL && strstr(buffer, ", 3:1|") != NULL);
+  mu_check(strchr(strstr(buffer, ", 2:1|"), '\n') == NULL);
+
+  coco_observer_free(observer);
+  coco_suite_free(suite);
+}
+
+/**
+ * Tests that sequentially observed problems are logged into the .info files of the baseline layout and
+ * that a logger can outlive its observer.
+ */
+MU_TEST(test_logger_bbob_sequential_problems) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_problem_t *problem;
+  double x[3] = { 0, 0, 0 }, y;
+  char result_folder[COCO_PATH_MAX + 1];
+  char path_name[COCO_PATH_MAX + 1];
+  char buffer[1024];
+  size_t i;
+  FILE *file;
+
+  suite = coco_suite("bbob", "", "dimensions: 2,3 function_indices: 1 instance_indices: 1-2");
+  observer = coco_observer("bbob", "result_folder: test_logger_bbob");
+  memcpy(result_folder, observer->result_folder, strlen(observer->result_folder) + 1);
+
+  /* The dimensions of a function are written into the same .info file */
+  for (i = 0; i < 4; i++) {
+    problem = coco_problem_add_observer(
+        coco_suite_get_problem_by_function_dimension_instance(suite, 1, 2 + i / 2, 1 + i % 2), observer);
+    coco_evaluate_function(problem, x, &y);
+    if (i < 3)
+      coco_problem_free(problem);
+  }
+  test_logger_bbob_read_file(observer, "bbobexp_f1_i1.info", buffer, sizeof(buffer));
+  mu_check(strncmp(buffer, "suite = 'bbob', funcId = 1, DIM = 2", 35) == 0);
+  mu_check(strstr(buffer, "%\ndata_f1/bbobexp_f1_DIM2_i1.dat, 1:1|") != NULL);
+  mu_check(strstr(buffer, ", 2:1|") != NULL);
+  mu_check(strstr(buffer, "\nsuite = 'bbob', funcId = 1, DIM = 3") != NULL);
+
+  /* The last run is completed in the .info file when the problem is freed after the observer */
+  coco_observer_free(observer);
+  coco_problem_free(problem);
+  memcpy(path_name, result_folder, strlen(result_folder) + 1);
+  coco_join_path(path_name, COCO_PATH_MAX, "bbobexp_f1_i1.info", NULL);
+  file = fopen(path_name, "r");
+  mu_check(file != NULL);
+  buffer[fread(buffer, 1, sizeof(buffer) - 1, file)] = '\0';
+  fclose(file);
+  mu_check(strstr(buffer, "%\ndata_f1/bbobexp_f1_DIM3_i1.dat, 1:1|") != NULL);
+  mu_check(strstr(strstr(buffer, "DIM3_i1.dat"), ", 2:1|") != NULL);
+
+  coco_suite_free(suite);
+}
+
+/**
+ * Tests that the times measured with the timing option are added to the observed problem and written
+ * into the comment line of the entry.
+ */
+MU_TEST(test_logger_bbob_timing) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_problem_t *inner_problem, *problem;
+  logger_bbob_data_t *logger;
+  observer_bbob_entry_t *entry;
+  double x[2] = { 0, 0 }, y;
+  size_t i;
+  char buffer[512], *comment;
+
+  suite = coco_suite("bbob", "", "dimensions: 2 function_indices: 1 instance_indices: 1-2");
+  observer = coco_observer("bbob", "result_folder: test_logger_bbob timing: 1");
+
+  inner_problem = coco_suite_get_problem(suite, 0);
+  mu_check(coco_problem_get_construction_time(inner_problem) >= 0);
+  problem = coco_problem_add_observer(inner_problem, observer);
+  mu_check(coco_problem_get_construction_time(problem) == coco_problem_get_construction_time(inner_problem));
+  for (i = 0; i < 1000; i++)
+    coco_evaluate_function(problem, x, &y);
+  mu_check(coco_problem_get_evaluation_time(problem) > 0);
+  mu_check(coco_problem_get_logging_time(problem) > 0);
+  mu_check(coco_problem_get_evaluation_time(inner_problem) == 0);
+
+  /* The times are kept when the observer is removed */
+  problem = coco_problem_remove_observer(problem, observer);
+  mu_check(problem == inner_problem);
+  mu_check(coco_problem_get_evaluation_time(problem) > 0);
+  coco_evaluate_function(problem, x, &y);
+  coco_problem_free(problem);
+
+  problem = coco_problem_add_observer(coco_suite_get_problem(suite, 1), observer);
+  logger = (logger_bbob_data_t *) coco_problem_transformed_get_data(problem);
+  coco_evaluate_function(problem, x, &y);
+  entry = logger->entry;
+  coco_problem_free(problem);
+  test_logger_bbob_read_file(observer, entry->info_file_name, buffer, sizeof(buffer));
+  mu_check(strstr(buffer, "\n% timing (instance:construction|evaluation|logging seconds), 1:") != NULL);
+  comment = strstr(buffer, "% timing");
+  mu_check(strstr(comment, ", 2:") != NULL && strstr(comment, ", 2:") < strstr(comment, "\ndata_f1/"));
+
+  coco_observer_free(observer);
+  coco_suite_free(suite);
+}
+
+/**
+ * Run all tests in this file.
+ */
+MU_TEST_SUITE(test_all_logger_bbob) {
+  MU_RUN_TEST(test_logger_bbob_concurrent_problems);
+  MU_RUN_TEST(test_logger_bbob_sequential_problems);
+  MU_RUN_TEST(test_logger_bbob_timing);
+}
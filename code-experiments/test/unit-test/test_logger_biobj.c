@@ -188,6 +188,113 @@ MU_TEST(test_coco_logger_biobj_feed_solution) {
   coco_suite_free(suite);
 }
 
+/**
+ * Tests the coco_logger_biobj_feed_solutions function on the solutions of the previous test.
+ */
+MU_TEST(test_coco_logger_biobj_feed_solutions) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_problem_t *problem;
+
+  size_t evaluations[4] = { 1, 3, 7, 15 };
+  double y[8] = { 3.998010498047934e+06, 3.032832203646995e+05,
+                  2.455928115758100e+06, 4.832453316303584e+05,
+                  1.905500967744320e+06, 7.225364079041419e+05,
+                  5.134664589788270e+06, 2.859068205979772e+05 };
+  int updates[4];
+  size_t number_of_updates;
+
+  logger_biobj_data_t *logger;
+  logger_biobj_indicator_t *indicator;
+
+  suite = coco_suite("bbob-biobj", "instances: 7", "dimensions: 10 function_indices: 12");
+  observer = coco_observer("bbob-biobj", "log_nondominated: read");
+  problem = coco_suite_get_next_problem(suite, observer);
+
+  mu_check(problem != NULL);
+
+  logger = (logger_biobj_data_t *) coco_problem_transformed_get_data(problem);
+  indicator = (logger_biobj_indicator_t *) (logger->indicators[0]);
+
+  indicator->best_value = 9.999545292785900e-01;
+
+  number_of_updates = coco_logger_biobj_feed_solutions(problem, 4, evaluations, y, updates);
+  mu_check(number_of_updates == 4);
+  mu_check(updates[0] == 1 && updates[1] == 1 && updates[2] == 1 && updates[3] == 1);
+  mu_check(logger->number_of_evaluations == 15);
+  mu_check(about_equal_value(indicator->overall_value, 5.282781576255882e-01));
+
+  coco_observer_free(observer);
+  coco_suite_free(suite);
+}
+
+/**
+ * Tests the layout of the archive file written in the binary format.
+ */
+MU_TEST(test_logger_biobj_binary_archive) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_problem_t *problem;
+  char *file_name;
+  char path_name[COCO_PATH_MAX + 1];
+  unsigned char buffer[64];
+  unsigned long length;
+  double x[2] = { 1, 2 }, y[2], values[5];
+  FILE *file;
+
+  suite = coco_suite("bbob-biobj", "", "dimensions: 2 function_indices: 1 instance_indices: 1");
+  observer = coco_observer("bbob-biobj", "result_folder: test_logger_biobj archive_format: binary "
+      "log_decision_variables: all compute_indicators: 0");
+  problem = coco_suite_get_next_problem(suite, observer);
+  mu_check(problem != NULL);
+
+  memcpy(path_name, observer->result_folder, strlen(observer->result_folder) + 1);
+  file_name = coco_strdupf("%s_nondom_all.adat", coco_problem_get_id(problem));
+  coco_join_path(path_name, COCO_PATH_MAX, "archive", file_name, NULL);
+  coco_free_memory(file_name);
+
+  /* The second evaluation does not update the archive */
+  coco_evaluate_function(problem, x, y);
+  coco_evaluate_function(problem, x, y);
+  coco_suite_free(suite);
+
+  file = fopen(path_name, "rb");
+  mu_check(file != NULL);
+  mu_check(fread(buffer, 1, 12, file) == 12);
+  mu_check(memcmp(buffer, "COCOADAT\1\0\0\0", 12) == 0);
+
+  /* Two comments with the instance and the header, the format and the solution */
+  mu_check(fread(buffer, 1, 5, file) == 5);
+  mu_check(buffer[0] == 'C');
+  length = buffer[1] + 256ul * buffer[2];
+  mu_check(length < sizeof(buffer) && fread(buffer, 1, length, file) == length);
+  mu_check(strncmp((char *) buffer, "% instance = 1, name = ", 23) == 0 && buffer[length - 1] == '\n');
+  mu_check(fread(buffer, 1, 5, file) == 5);
+  mu_check(buffer[0] == 'C');
+  length = buffer[1] + 256ul * buffer[2];
+  mu_check(length < sizeof(buffer) && fread(buffer, 1, length, file) == length);
+  mu_check(fread(buffer, 1, 17, file) == 17);
+  mu_check(buffer[0] == 'F' && buffer[1] == 2 && buffer[5] == 0 && buffer[9] == 15 && buffer[13] == 8);
+  mu_check(fread(buffer, 1, 1 + sizeof(values), file) == 1 + sizeof(values));
+  mu_check(buffer[0] == 'S');
+  if (coco_is_little_endian()) {
+    memcpy(values, buffer + 1, sizeof(values));
+    mu_check(values[0] == 1 && values[1] == y[0] && values[2] == y[1] && values[3] == x[0] && values[4] == x[1]);
+  }
+
+  /* The final comment with the number of evaluations */
+  mu_check(fread(buffer, 1, 5, file) == 5);
+  mu_check(buffer[0] == 'C' && buffer[1] == 18);
+  mu_check(fread(buffer, 1, 18, file) == 18);
+  mu_check(strncmp((char *) buffer, "% evaluations = 2\n", 18) == 0);
+  mu_check(fread(buffer, 1, 1, file) == 0);
+  fclose(file);
+
+  coco_observer_free(observer);
+}
+
 /**
  * Run all tests in this file.
  */
@@ -195,4 +302,6 @@ MU_TEST_SUITE(test_all_logger_biobj) {
   MU_RUN_TEST(test_logger_biobj_evaluate);
   MU_RUN_TEST(test_logger_biobj_evaluate2);
   MU_RUN_TEST(test_coco_logger_biobj_feed_solution);
+  MU_RUN_TEST(test_coco_logger_biobj_feed_solutions);
+  MU_RUN_TEST(test_logger_biobj_binary_archive);
 }
@@ -87,6 +87,7 @@ array([  59.87335291,  441.17409304])
 # TODO: funId is expected to be a number since it is used as rseed.
 
 import warnings
+from collections import OrderedDict
 from pdb import set_trace
 import numpy as np
 from math import floor as floor
@@ -163,6 +164,34 @@ from numpy.random import random as _rand # TODO: may bring confusion
 
 ### FUNCTION DEFINITION ###
 
+_cache = OrderedDict()
+"""cache of the results of compute_xopt and compute_rotation, which depend
+only on the seed and the dimension and are needed each time a function is
+instantiated, ordered from the least to the most recently used one"""
+_cache_maxsize = 1000
+"""maximal number of results in `_cache`, the least recently used ones are
+dropped first"""
+
+def _cached(function):
+    """Decorator that stores the result of `function(seed, dim)` in `_cache`
+    and returns a copy of it, such that the caller may modify it.
+
+    """
+    def cached_function(seed, dim):
+        key = (function.__name__, seed, dim)
+        try:
+            result = _cache.pop(key)
+        except KeyError:
+            result = function(seed, dim)
+        _cache[key] = result
+        if len(_cache) > _cache_maxsize:
+            _cache.popitem(last=False)
+        return result.copy()
+    cached_function.__name__ = function.__name__
+    cached_function.__doc__ = function.__doc__
+    return cached_function
+
+@_cached
 def compute_xopt(rseed, dim):
     """Generate a random vector used as optimum argument.
     
@@ -174,6 +203,7 @@ def compute_xopt(rseed, dim):
     xopt[idx] = -1e-5
     return xopt
 
+@_cached
 def compute_rotation(seed, dim):
     """Returns an orthogonal basis. 
     
@@ -262,7 +292,7 @@ def unif(N, inseed):
         r[i] = aktrand / 2.147483647e9
     r = np.asarray(r)
     if (r == 0).any():
-        warning.warn('zero sampled(?), set to 1e-99')
+        warnings.warn('zero sampled(?), set to 1e-99')
         r[r == 0] = 1e-99
     return r
 
@@ -311,7 +341,7 @@ def fGauss(ftrue, beta):
     idx = ftrue < tol
     try:
         fval[idx] = ftrue[idx]
-    except IndexError: # fval is a scalar
+    except (IndexError, TypeError): # fval is a scalar
         if idx:
             fval = ftrue
     return fval
@@ -327,7 +357,7 @@ def fUniform(ftrue, alpha, beta):
     idx = ftrue < tol
     try:
         fval[idx] = ftrue[idx]
-    except IndexError: # fval is a scalar
+    except (IndexError, TypeError): # fval is a scalar
         if idx:
             fval = ftrue
     return fval
@@ -349,7 +379,7 @@ def fCauchy(ftrue, alpha, p):
     idx = ftrue < tol
     try:
         fval[idx] = ftrue[idx]
-    except IndexError: # fval is a scalar
+    except (IndexError, TypeError): # fval is a scalar
         if idx:
             fval = ftrue
     return fval
@@ -993,7 +1023,7 @@ class _FStepEllipsoid(BBOBFunction):
             x1 = x[0]
         idx = np.abs(x) > .5
         x[idx] = np.round(x[idx])
-        x[np.negative(idx)] = np.round(self.alpha * x[np.negative(idx)]) / self.alpha
+        x[~idx] = np.round(self.alpha * x[~idx]) / self.alpha
         x = dot(x, self.rotation)
 
         # COMPUTATION core
@@ -1571,18 +1601,11 @@ class F16(BBOBNfreeFunction):
         x = dot(x, self.linearTF)
 
         # COMPUTATION core
-        if len(curshape) < 2: # popsize is one
-            ftrue = np.sum(dot(self.aK, np.cos(dot(self.bK.T, 2 * np.pi * (np.reshape(x, (1, len(x))) + 0.5)))))
-        else:
-            ftrue = np.zeros(curshape[0]) # curshape[0] is popsize
-            for k, i in enumerate(x):
-                # TODO: simplify next line
-                ftrue[k] = np.sum(dot(self.aK, np.cos(dot(self.bK.T, 2 * np.pi * (np.reshape(i, (1, len(i))) + 0.5)))))
-        ftrue = 10. * (ftrue / dim - self.f0) ** 3
-        try:
-            ftrue = np.hstack(ftrue)
-        except TypeError:
-            pass
+        x = 2 * np.pi * (x + 0.5)
+        ftrue = 0.
+        for a, b in zip(self.aK[0], self.bK[0]):
+            ftrue = ftrue + a * np.cos(b * x)
+        ftrue = 10. * (np.sum(ftrue, -1) / dim - self.f0) ** 3
         fval = self.noise(ftrue)
 
         # FINALIZE
@@ -1844,11 +1867,6 @@ class _FGallagher(BBOBFunction):
             self.arrscales = np.vstack(self.arrscales)
             # compute peak values, 10 is global optimum 
             self.peakvalues = np.insert(linspace(self.fitvalues[0], self.fitvalues[1], self.nhighpeaks - 1), 0, 10.)
-
-        # DIM- and POPSI-dependent initialisations of DIM*POPSI matrices
-        if self.lastshape != curshape:
-            self.dim = dim
-            self.lastshape = curshape
             self.xlocal = dot(self.fac2 * np.reshape(10. * unif(dim * self.nhighpeaks, self.rseed) - 5., (self.nhighpeaks, dim)),
                               self.rotation)
             if self.zerox:
@@ -1858,6 +1876,11 @@ class _FGallagher(BBOBFunction):
                 self.xlocal[0, :] = 0.8 * self.xlocal[0, :]
             self.xopt = dot(self.xlocal[0, :], self.rotation.T)
 
+        # DIM- and POPSI-dependent initialisations of DIM*POPSI matrices
+        if self.lastshape != curshape:
+            self.dim = dim
+            self.lastshape = curshape
+
     def _evalfull(self, x):
         fadd = self.fopt
         curshape, dim = self.shape_(x)
@@ -1874,23 +1897,12 @@ class _FGallagher(BBOBFunction):
 
         # COMPUTATION core
         fac = -0.5 / dim
-        # f = NaN(nhighpeaks, popsi)
-        # TODO: optimize
-        if len(curshape) < 2: # popsize is 1 in this case
-            f = np.zeros(self.nhighpeaks)
-            xx = tile(x, (self.nhighpeaks, 1)) - self.xlocal
-            f[:] = self.peakvalues * np.exp(fac * np.sum(self.arrscales * xx ** 2, 1))
-        elif curshape[0] < .5 * self.nhighpeaks:
-            f = np.zeros((curshape[0], self.nhighpeaks))
-            for k, e in enumerate(x):
-                xx = tile(e, (self.nhighpeaks, 1)) - self.xlocal
-                f[k, :] = self.peakvalues * np.exp(fac * np.sum(self.arrscales * xx ** 2, 1))
-        else:
-            f = np.zeros((curshape[0], self.nhighpeaks))
-            for i in range(self.nhighpeaks):
-                xx = (x - tile(self.xlocal[i, :], (curshape[0], 1)))
-                f[:, i] = self.peakvalues[i] * np.exp(fac * (dot(xx ** 2, self.arrscales[i, :])))
-        ftrue = monotoneTFosc(10 - np.max(f, -1)) ** 2
+        # maximum over the peaks, computed for all rows of x at once
+        f = 0.
+        for i in range(self.nhighpeaks):
+            xx = x - self.xlocal[i, :]
+            f = np.maximum(f, self.peakvalues[i] * np.exp(fac * dot(xx ** 2, self.arrscales[i, :])))
+        ftrue = monotoneTFosc(10 - f) ** 2
         fval = self.noise(ftrue)
 
         # FINALIZE
@@ -1986,18 +1998,12 @@ class F23(BBOBNfreeFunction):
         x = dot(x, self.linearTF)
 
         # COMPUTATION core
-        if len(curshape) < 2: # popsize is 1 in this case
-            arr = dot(np.reshape(x, (dim, 1)), self.arr2k) # dim times d array
-            ftrue = (-10. / dim ** 2. +
-                     10. / dim ** 2. *
-                     np.prod(1 + np.arange(1, dim + 1) * np.dot(np.abs(arr - np.round(arr)), self.arr2k.T ** -1.).T) ** (10. / dim ** 1.2))
-        else:
-            ftrue = zeros(curshape[0])
-            for k, e in enumerate(x):
-                arr = dot(np.reshape(e, (dim, 1)), self.arr2k) # dim times d array
-                ftrue[k] = (-10. / dim ** 2. +
-                            10. / dim ** 2. *
-                            np.prod(1 + np.arange(1, dim + 1) * np.dot(np.abs(arr - np.round(arr)), self.arr2k.T ** -1.).T) ** (10. / dim ** 1.2))
+        s = 0.
+        for p in self.arr2k[0]:
+            s = s + np.abs(x * p - np.round(x * p)) / p
+        ftrue = (-10. / dim ** 2. +
+                 10. / dim ** 2. *
+                 np.prod(1 + np.arange(1, dim + 1) * s, -1) ** (10. / dim ** 1.2))
         fval = self.noise(ftrue)
 
         # FINALIZE
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""micro-benchmark of the pure-Python functions of `bbobbenchmarks`
+against the C implementation of the bbob suite in `cocoex`.
+
+Usage::
+
+    python benchmark_bbobbenchmarks.py [dimensions [evaluations]]
+
+for example ``python benchmark_bbobbenchmarks.py 2,10,40 10000``. By
+default, the functions are benchmarked in dimensions 2,10,40 with 1000
+evaluations per batch. For each function and dimension, the printed
+values are the smallest times per evaluation in microseconds of
+`bbobbenchmarks` and of `cocoex` on the first instance, their ratio and
+the largest difference of the function values, which are expected to
+agree up to numerical precision.
+"""
+from __future__ import division, print_function
+import sys
+import time
+import numpy as np
+import cocoex
+import bbobbenchmarks as bm
+
+def benchmark(evaluate, X, repetitions=3):
+    """return the smallest time in seconds per evaluation of the rows
+    of `X` over `repetitions` batches, and the function values
+    """
+    timings = []
+    for _ in range(repetitions):
+        t0 = time.time()
+        f = evaluate(X)
+        timings.append((time.time() - t0) / len(X))
+    return min(timings), f
+
+def benchmark_functions(dimensions, evaluations=1000):
+    """print the time per evaluation in microseconds of `bbobbenchmarks`
+    and `cocoex` for each function and dimension and return them in a
+    `dict`
+    """
+    np.random.seed(1)
+    suite = cocoex.Suite('bbob', 'instances: 1', 'dimensions: ' + dimensions)
+    timings = {}
+    for problem in suite:
+        X = problem.lower_bounds + (problem.upper_bounds - problem.lower_bounds
+            ) * np.random.rand(evaluations, problem.dimension)
+        f = bm.instantiate(problem.id_function, problem.id_instance)[0]
+        t_python, f_python = benchmark(f.evaluate, X)
+        t_c, f_c = benchmark(problem.evaluate_batch, X)
+        timings[(problem.id_function, problem.dimension)] = (t_python, t_c)
+        print("f%02d %4dD: %10.2f us %10.2f us (cocoex) %8.1f x  max diff %.1e" % (
+            problem.id_function, problem.dimension, 1e6 * t_python, 1e6 * t_c,
+            t_python / t_c, np.max(np.abs(f_python - f_c))))
+        problem.free()
+    print("total: %.2f us (bbobbenchmarks) and %.2f us (cocoex) per evaluation on average" % (
+        1e6 * np.mean([t[0] for t in timings.values()]),
+        1e6 * np.mean([t[1] for t in timings.values()])))
+    return timings
+
+if __name__ == "__main__":
+    dimensions = sys.argv[1] if len(sys.argv) > 1 else '2,10,40'
+    evaluations = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    benchmark_functions(dimensions, evaluations)
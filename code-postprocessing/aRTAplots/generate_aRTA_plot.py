@@ -185,6 +185,7 @@ def get_all_aRT_values_in_objective_space(f_id, dim, f1_id, f2_id,
         else:
             print('reading in data...')
         
+        crop = eval(cropbudget)
         with open(inputfolder + filename) as f:
             for line in f:
                 if "function eval_number" in line:
@@ -219,7 +220,7 @@ def get_all_aRT_values_in_objective_space(f_id, dim, f1_id, f2_id,
                     splitline = line.split()
                     newline = np.array(splitline[:3], dtype=np.float)
                                         
-                    if newline[0] <= eval(cropbudget):
+                    if newline[0] <= crop:
                         # normalize objective vector:
                         newline[1] = (newline[1]-ideals[instance][0])/(nadirs[instance][0]-ideals[instance][0])
                         newline[2] = (newline[2]-ideals[instance][1])/(nadirs[instance][1]-ideals[instance][1])
@@ -429,36 +430,40 @@ def compute_aRT(points, A):
     """
     
     
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+
+    # all grid points spanned by the coordinates of the points:
+    ticks_1, index_1 = np.unique(points[:, 0], return_inverse=True)
+    ticks_2, index_2 = np.unique(points[:, 1], return_inverse=True)
+
     sum_runtimes = np.zeros(len(points))
     num_runtimes_successful = np.zeros(len(points))
-    
+
     for key in A:
-        points_finished = [False] * len(points)
-        runtime_to_attain_points = [np.nan] * len(points)
-        max_runtimes = np.zeros(len(points))
-        for a in A[key]:
-            for i in range(len(points)):
-                if not points_finished[i]:
-                    if weakly_dominates([a[1], a[2]], points[i]):
-                        runtime_to_attain_points[i] = a[0]
-                        points_finished[i] = True
-                    else:
-                        max_runtimes[i] = a[0]
-                        
-        for i in range(len(points)):
-            if runtime_to_attain_points[i] is np.nan:
-                sum_runtimes[i] = sum_runtimes[i] + max_runtimes[i]
-            else:
-                sum_runtimes[i] = sum_runtimes[i] + runtime_to_attain_points[i]
-                num_runtimes_successful[i] = num_runtimes_successful[i] + 1                
-
-    aRT = np.zeros(len(points), dtype=float)
-
-    for i in range(len(points)):
-        if num_runtimes_successful[i] > 0:
-            aRT[i] = sum_runtimes[i]/num_runtimes_successful[i]
-        else:
-            aRT[i] = np.nan
+        a = np.asarray(A[key], dtype=float).reshape(-1, 3)
+        if len(a) == 0:
+            continue
+        # index of the first entry that weakly dominates each grid point,
+        # len(a) if there is none: put each entry into the grid cell of the
+        # smallest grid point it dominates and take running minima of the
+        # entry indices along both objectives
+        first = np.full((len(ticks_1), len(ticks_2)), len(a), dtype=int)
+        cells_1 = np.searchsorted(ticks_1, a[:, 1], side='left')
+        cells_2 = np.searchsorted(ticks_2, a[:, 2], side='left')
+        inside = (cells_1 < len(ticks_1)) & (cells_2 < len(ticks_2))
+        np.minimum.at(first, (cells_1[inside], cells_2[inside]),
+                      np.flatnonzero(inside))
+        first = np.minimum.accumulate(np.minimum.accumulate(first, axis=0), axis=1)
+        first = first[index_1, index_2]
+
+        # points not attained count with the runtime of the last entry:
+        attained = first < len(a)
+        sum_runtimes += a[np.where(attained, first, len(a) - 1), 0]
+        num_runtimes_successful += attained
+
+    aRT = np.nan * np.ones(len(points), dtype=float)
+    successful = num_runtimes_successful > 0
+    aRT[successful] = sum_runtimes[successful] / num_runtimes_successful[successful]
 
     return aRT
     
@@ -471,7 +476,9 @@ def sample_down(B, n, logscale=True):
     """
         Samples down the data by only keeping one solution from B in each
         grid box (nxn grid within [0,maxplot] or [precision, maxplot] in the
-        logscale case).
+        logscale case), namely the one with the smallest number of function
+        evaluations. All solutions in a grid box dominate the same grid
+        points, so the aRT values on the grid do not change.
         
         The points, given in B (as [feval, f_1, f_2] vectors) are expected
         to be normalized such that ideal and nadir are [0,0] and [1,1]
@@ -479,37 +486,22 @@ def sample_down(B, n, logscale=True):
         
     """
     
-    C = np.array(B)
-    C = C[C[:, 2].argsort(kind='mergesort')][::-1] # sort in descending order wrt second objective
-    C = C[C[:, 1].argsort(kind='mergesort')][::-1] # now in descending order wrt first objective
+    C = np.asarray(B, dtype=float).reshape(-1, 3)
 
     if logscale:
         # downsampling according to
         # np.logspace(np.log10(precision), np.log10(maxplot), num=n, endpoint=True, base=10.0)
-        X = np.ceil((np.log10(C)-np.log10(precision))*(n-1)/(np.log10(maxplot)-np.log10(precision)))/((n-1)/(np.log10(maxplot)-np.log10(precision)))
+        X = np.ceil((np.log10(C[:, 1:])-np.log10(precision))*(n-1)/(np.log10(maxplot)-np.log10(precision)))/((n-1)/(np.log10(maxplot)-np.log10(precision)))
     else:
-        X = np.ceil(C*(n-1)/maxplot)/((n-1)/maxplot)
-
-    # sort wrt second objective first
-    idx_1 = X[:, 2].argsort(kind='mergesort')
-    X = X[idx_1]
-    # now wrt first objective to finally get a stable sort
-    idx_2 = X[:, 1].argsort(kind='mergesort')
-    X = X[idx_2]
-    xflag = np.array([False] * len(X), dtype=bool)
-    xflag[0] = True # always take the first point
-    bestincell = 1
-    for i in range(1, len(X)):
-        if not (X[i, 1] == X[i-1, 1] and
-                X[i, 2] == X[i-1, 2]):
-            xflag[i] = True
-            bestincell = i
-        else:
-            if X[i, 0] < X[bestincell, 0]:
-                xflag[bestincell] = False
-                xflag[i] = True
-                bestincell = i
-    X = ((C[idx_1])[idx_2])[xflag]
+        X = np.ceil(C[:, 1:]*(n-1)/maxplot)/((n-1)/maxplot)
+
+    # sort wrt. grid cells and within each cell wrt. #FEs and keep the first
+    # point of each cell:
+    idx = np.lexsort((C[:, 0], X[:, 1], X[:, 0]))
+    X = X[idx]
+    xflag = np.ones(len(X), dtype=bool)
+    xflag[1:] = (X[1:] != X[:-1]).any(axis=1)
+    X = C[idx[xflag]]
     B = X[X[:, 0].argsort(kind='mergesort')] # sort again wrt. #FEs
 
     return B
@@ -24,13 +24,15 @@ import os
 import sys
 import pickle
 import gzip
+import hashlib
+import tempfile
 import warnings
 import numpy as np
 import tarfile
 import pkg_resources
 from six import advance_iterator
 
-from . import readalign, pproc
+from . import readalign, pproc, archiving
 from .toolsdivers import print_done
 from .ppfig import Usage
 from . import toolsstats, toolsdivers, testbedsettings, genericsettings
@@ -38,6 +40,18 @@ from .pproc import DataSet
 
 bestAlgorithmEntries = {}
 
+cache_version = 1
+"""version of the reference algorithm cache, to be incremented whenever
+`BestAlgSet` or the simulated runlengths change in an incompatible way"""
+
+cache_folder = os.path.join(archiving.cocopp_home, 'cache',
+                            'reference-algorithms-v%d' % cache_version)
+"""root folder of the reference algorithm cache, one subfolder per
+hash of the reference data"""
+
+_reference_data_hash = None  # hash of the currently loaded reference data
+_reference_ecdf_samples = {}  # in-memory cache of `reference_ecdf_samples`
+
 algs2009 = ("ALPS", "AMALGAM", "BAYEDA", "BFGS", "Cauchy-EDA", "BIPOP-CMA-ES",
             "CMA-ESPLUSSEL", "DASA", "DE-PSO", "DIRECT", "EDA-PSO",
             "FULLNEWUOA", "G3PCX", "GA", "GLOBAL", "iAMALGAM",
@@ -372,8 +386,145 @@ class BestAlgSet(DataSet):
 
 # FUNCTION DEFINITIONS
 def reset_reference_algorithm():
-    global bestAlgorithmEntries
+    global bestAlgorithmEntries, _reference_data_hash
     bestAlgorithmEntries = {}
+    _reference_data_hash = None
+    _reference_ecdf_samples.clear()
+
+
+def _data_hash(path):
+    """return sha256 hash of the file `path` or of all files in folder `path`.
+
+    >>> from cocopp import bestalg, toolsdivers
+    >>> h = bestalg._data_hash(toolsdivers.path_in_package(
+    ...                           'refalgs/best2009-bbob.tar.gz'))
+    >>> len(h) == 64 and h == bestalg._data_hash(toolsdivers.path_in_package(
+    ...                                            'refalgs/best2009-bbob.tar.gz'))
+    True
+
+    """
+    if os.path.isfile(path):
+        return archiving._hash(path)
+    hash_ = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()  # walk in a reproducible order
+        for name in sorted(files):
+            filename = os.path.join(root, name)
+            hash_.update(os.path.relpath(filename, path).encode('utf-8'))
+            with open(filename, 'rb') as file_:
+                hash_.update(file_.read())
+    return hash_.hexdigest()
+
+
+def _cache_filename(name):
+    """return full cache filename of `name` for the current reference data"""
+    return os.path.join(cache_folder, _reference_data_hash, name)
+
+
+def _write_cache_file(filename, write):
+    """call ``write(file_object)`` and move the result to `filename`.
+
+    The data are first written to a temporary file in the same folder
+    such that concurrent processes never read an incomplete cache file.
+    Failure to write the cache is not an error.
+    """
+    try:
+        archiving._makedirs(os.path.dirname(filename))
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(filename),
+                                        prefix='.tmp_')
+        with os.fdopen(fd, 'wb') as file_:
+            write(file_)
+        try:
+            os.rename(tmp_name, filename)
+        except OSError:  # on Windows, when another process was faster
+            os.remove(tmp_name)
+    except (IOError, OSError, pickle.PicklingError) as e:
+        warnings.warn("could not write reference algorithm cache file"
+                      " %s (%s)" % (filename, str(e)))
+
+
+def _load_cached_reference_algorithm():
+    """return ``(entries, algId, reference_values)`` from the cache or ``None``"""
+    filename = _cache_filename('bestalg.pickle.gz')
+    if not os.path.exists(filename):
+        return None
+    try:
+        with gzip.open(filename, 'rb') as file_:
+            return pickle.load(file_)
+    except Exception as e:  # cache files are disposable
+        warnings.warn("ignoring unreadable reference algorithm cache file"
+                      " %s (%s)" % (filename, str(e)))
+        return None
+
+
+def _save_cached_reference_algorithm(entries, algId, reference_values):
+    """save ``(entries, algId, reference_values)`` to the cache"""
+    def write(file_):
+        with gzip.GzipFile(fileobj=file_, mode='wb') as gzip_file:
+            pickle.dump((entries, algId, reference_values), gzip_file,
+                        protocol=2)
+    _write_cache_file(_cache_filename('bestalg.pickle.gz'), write)
+
+
+def reference_ecdf_samples(refalgentry, targets, divisor=1,
+                           samplesize=genericsettings.simulated_runlength_bootstrap_sample_size):
+    """return ``(samples, maxevals)`` of the reference algorithm entry.
+
+    `samples` are the simulated runlengths for each target in `targets`
+    concatenated in a single array, each runlength divided by `divisor`,
+    where ``samplesize`` `inf` values are used if a target is not
+    reached by `refalgentry`. `maxevals` are the runlengths of the
+    unsuccessful runs divided by `divisor`. These data serve to draw the
+    reference algorithm in `compall.pprldmany`.
+
+    The result is cached in memory and, if
+    ``genericsettings.use_reference_algorithm_cache``, on disk for each
+    testbed, dimension, function and set of target values of the reference
+    data loaded with `load_reference_algorithm`.
+    """
+    targets = np.asarray(targets, dtype=float)
+    testbed_name = refalgentry.testbed
+    if testbedsettings.current_testbed:
+        testbed_name = testbedsettings.current_testbed.name
+    key = '%s_f%03d_%02dD_%s' % (
+        testbed_name, refalgentry.funcId, refalgentry.dim,
+        hashlib.sha1(np.hstack((targets, divisor, samplesize)).tobytes()
+                     ).hexdigest()[:16])
+    if key in _reference_ecdf_samples:
+        return _reference_ecdf_samples[key]
+    use_disk = (genericsettings.use_reference_algorithm_cache and
+                _reference_data_hash is not None)
+    filename = _cache_filename('ecdf_%s.npz' % key) if use_disk else None
+    if use_disk and os.path.exists(filename):
+        try:
+            with np.load(filename) as data:
+                res = data['samples'], data['maxevals']
+            _reference_ecdf_samples[key] = res
+            return res
+        except Exception as e:  # cache files are disposable
+            warnings.warn("ignoring unreadable reference algorithm cache"
+                          " file %s (%s)" % (filename, str(e)))
+
+    samples = []
+    maxevals = []
+    refalgevals = refalgentry.detEvals(targets)
+    for j in range(len(refalgevals[0])):
+        if refalgevals[1][j]:
+            evals = refalgevals[0][j]
+            runlengthsucc = evals[np.isnan(evals) == False] / divisor
+            runlengthunsucc = refalgentry.maxevals[refalgevals[1][j]][np.isnan(evals)] / divisor
+            samples.extend(toolsstats.drawSP(runlengthsucc, runlengthunsucc,
+                                             percentiles=[50],
+                                             samplesize=samplesize)[1])
+            maxevals.extend(runlengthunsucc)
+        else:
+            samples.extend(int(samplesize) * [np.inf])
+    res = np.asarray(samples, dtype=float), np.asarray(maxevals, dtype=float)
+    _reference_ecdf_samples[key] = res
+    if use_disk:
+        _write_cache_file(filename, lambda file_: np.savez(
+            file_, samples=res[0], maxevals=res[1]))
+    return res
 
 
 def load_reference_algorithm(best_algo_filename, force=False, relative_load=True):
@@ -394,12 +545,19 @@ def load_reference_algorithm(best_algo_filename, force=False, relative_load=True
     of :py:class:`BestAlgSet`.
     The data is that of specific algorithms (depending on the Testbed used).
 
+    Unless ``genericsettings.use_reference_algorithm_cache is False``,
+    the generated entries are stored in `cache_folder` under the hash of
+    the reference data and reused by any later call or process that loads
+    the same data.
+
     """
-    global bestAlgorithmEntries
+    global bestAlgorithmEntries, _reference_data_hash
     # global statement necessary to change the variable bestalg.bestAlgorithmEntries
 
     if not force and bestAlgorithmEntries:
         return bestAlgorithmEntries
+    _reference_data_hash = None
+    _reference_ecdf_samples.clear()
 
     # If the file or folder name is not specified then we skip the load.
     if not best_algo_filename:
@@ -438,12 +596,28 @@ def load_reference_algorithm(best_algo_filename, force=False, relative_load=True
         fid.close()
     else:
         algList = [os.path.join(best_alg_file_path, best_algo_filename)]
-        dsList, sortedAlgs, dictAlg = pproc.processInputArgs(algList)
-        bestAlgorithmEntries = generate(dictAlg, dsList[0].algId)
+        cached = None
+        if genericsettings.use_reference_algorithm_cache and os.path.exists(algList[0]):
+            _reference_data_hash = _data_hash(algList[0])
+            cached = _load_cached_reference_algorithm()
+        if cached is not None:
+            bestAlgorithmEntries, algId, reference_values = cached
+            for key, value in reference_values:  # as in processInputArgs
+                testbedsettings.update_reference_values(key, value)
+        else:
+            dsList, sortedAlgs, dictAlg = pproc.processInputArgs(algList)
+            algId = dsList[0].algId
+            bestAlgorithmEntries = generate(dictAlg, algId)
+            if _reference_data_hash is not None:
+                reference_values = [
+                    (key[0], value.get_reference_values_hash()) for key, value
+                    in pproc.DataSetList(dsList).dictByAlg().items()]
+                _save_cached_reference_algorithm(bestAlgorithmEntries, algId,
+                                                 reference_values)
         # set reference_algorithm_displayname in testbedsetting if not present:
         if testbedsettings.current_testbed:
             if testbedsettings.current_testbed.reference_algorithm_displayname is None:
-                testbedsettings.current_testbed.reference_algorithm_displayname = dsList[0].algId
+                testbedsettings.current_testbed.reference_algorithm_displayname = algId
 
     print_done()
 
@@ -8,7 +8,7 @@ import numpy
 import warnings
 from pdb import set_trace
 from .. import toolsdivers, toolsstats, bestalg, pproc, genericsettings, htmldesc, ppfigparam, ppfig
-from .. import testbedsettings
+from .. import testbedsettings, ppexport
 from .. import captions
 from ..ppfig import save_figure, get_plotting_styles, getFontSize
 from ..pptex import color_to_latex, marker_to_latex, marker_to_html, writeLabels
@@ -462,6 +462,31 @@ def main(dictAlg, html_file_prefix, sorted_algorithms=None, output_dir='ppdata',
     default_styles = [d.copy() for d in genericsettings.line_styles]
     if not os.path.isdir(output_dir):
         os.mkdir(output_dir)
+    if genericsettings.export_data:
+        refalgentries = bestalg.load_reference_algorithm(testbedsettings.current_testbed.reference_algorithm_filename)
+        for f in sorted(dictFunc):
+            rows = []
+            for alg in sorted_algorithms:
+                for dim, dsl in sorted(dictFunc[f][alg].dictByDim().items()):
+                    # (ert, success rate, number of successes, max evals,
+                    #  median of successful runs)
+                    rows.append([alg, dim, target((f, dim))[0]] +
+                                list(generateData(dsl[0], target((f, dim))[0])) +
+                                [dsl[0].nbRuns()])
+            if refalgentries:
+                for dim in sorted(df[0] for df in refalgentries if df[1] == f):
+                    rows.append([testbedsettings.current_testbed.reference_algorithm_displayname,
+                                 dim, target((f, dim))[0],
+                                 refalgentries[(dim, f)].detERT(target((f, dim)))[0]] +
+                                5 * [numpy.nan])
+            ppexport.save(os.path.join(output_dir, 'ppfigs_f%03d' % f),
+                          list(zip(('algorithm', 'dimension', 'target', 'ert', 'success_rate',
+                                    'nbsucc', 'max_evals', 'median_evals_succ', 'nbruns'),
+                                   zip(*rows))),
+                          {'function': f})
+    if genericsettings.data_only:
+        return
+
     for f in dictFunc:
         filename = os.path.join(output_dir, 'ppfigs_f%03d' % (f))
         handles = []
@@ -32,6 +32,7 @@ from __future__ import absolute_import, print_function
 
 import os
 import warnings
+from collections import OrderedDict
 from pdb import set_trace
 import numpy as np
 import matplotlib.pyplot as plt
@@ -42,6 +43,7 @@ from .. import toolsdivers  # strip_pathname, str_to_latex
 from .. import pprldistr  # plotECDF, beautifyECDF
 from .. import ppfig  # consecutiveNumbers, save_figure, plotUnifLogXMarkers, logxticks
 from .. import pptex  # numtotex
+from .. import ppexport
 
 PlotType = ppfig.enum('ALG', 'DIM', 'FUNC')
 
@@ -54,6 +56,12 @@ annotation_space_end_relative = 1.24  # figure space end relative to x_limit
 save_zoom = False  # save zoom into left and right part of the figures
 perfprofsamplesize = genericsettings.simulated_runlength_bootstrap_sample_size  # number of bootstrap samples drawn for each fct+target in the performance profile
 nbperdecade = 1
+ecdf_steps_per_decade = 'auto'
+"""maximal number of steps per decade drawn for each ECDF graph, steps
+closer than this are merged, see `ppfig.downsample_steps`. With 'auto'
+at most one step per pixel of the saved figure is drawn, which is
+invisible but keeps figure files small for large sample sizes, while
+the exported data contain all steps. `None` draws all steps."""
 median_max_evals_marker_format = ['x', 24, 1]
 label_fontsize = 17
 title_fontsize = 20
@@ -184,6 +192,28 @@ def beautify():
     pprldistr.beautifyECDF()
 
 
+def ecdf_steps(data, CrE=0.):
+    """return the steps ``(x, y)`` of the ECDF of `data` as drawn in `plotdata`.
+
+    `x` are the sorted distinct finite values of `data` multiplied by
+    ``exp(CrE)``, `y` the fraction of non-nan values of `data` not larger
+    than `x`. Infinite values contribute to the denominator only.
+
+    >>> import numpy as np
+    >>> from cocopp.compall import pprldmany
+    >>> x, y = pprldmany.ecdf_steps(np.array([3, 1, 3, np.inf, np.nan]))
+    >>> list(x), list(y)
+    ([1.0, 3.0], [0.25, 0.75])
+
+    """
+    x = data[np.isnan(data) == False]  # Take away the nans
+    nn = len(x)
+    x = x[np.isinf(x) == False]  # Take away the infs
+    x = np.exp(CrE) * x  # correction by crafting effort CrE
+    x, counts = np.unique(x, return_counts=True)  # x is not a multiset anymore
+    return x, np.cumsum(counts) / float(max((nn, 1)))
+
+
 def plotdata(data, maxval=None, maxevals=None, CrE=0., **kwargs):
     """Draw a normalized ECDF. What means normalized?
     
@@ -199,32 +229,25 @@ def plotdata(data, maxval=None, maxevals=None, CrE=0., **kwargs):
     
     """
 
-    # Expect data to be a ndarray.
-    x = data[np.isnan(data) == False]  # Take away the nans
-    nn = len(x)
-
-    x = x[np.isinf(x) == False]  # Take away the infs
-    n = len(x)
+    x, y = ecdf_steps(data, CrE)
 
-    x = np.exp(CrE) * x  # correction by crafting effort CrE
-
-    if n == 0:
+    if len(x) == 0:
         # res = plt.plot((1., ), (0., ), **kwargs)
         res = pprldistr.plotECDF(np.array((1.,)), n=np.inf, **kwargs)
     else:
-        dictx = {}  # number of appearances of each value in x
-        for i in x:
-            dictx[i] = dictx.get(i, 0) + 1
-
-        x = np.array(sorted(dictx))  # x is not a multiset anymore
-        y = np.cumsum(list(dictx[i] for i in x))  # cumsum of size of y-steps (nb of appearences)
-        idx = sum(x <= x_limit ** annotation_space_end_relative) - 1
-        y_last, x_last = y[idx] / float(nn), x[idx]
+        idx = np.sum(x <= x_limit ** annotation_space_end_relative) - 1
+        y_last, x_last = y[idx], x[idx]
         if maxval is None:
             maxval = max(x)
         end = np.sum(x <= maxval)
         x = x[:end]
         y = y[:end]
+        if ecdf_steps_per_decade == 'auto':
+            # the x-axis spans log10(maxval) decades over less than the figure width
+            pixels = plt.gcf().get_size_inches()[0] * ppfig.save_figure_dpi()
+            x, y = ppfig.downsample_steps(x, y, max((1, int(pixels / max((1., np.log10(maxval)))))))
+        elif ecdf_steps_per_decade:
+            x, y = ppfig.downsample_steps(x, y, ecdf_steps_per_decade)
 
         try:  # plot the very last point outside of the "normal" plotting area
             c = kwargs['color']
@@ -232,13 +255,13 @@ def plotdata(data, maxval=None, maxevals=None, CrE=0., **kwargs):
         except:
             pass
         x2 = np.hstack([np.repeat(x, 2), maxval])  # repeat x-values for each step in the cdf
-        y2 = np.hstack([0.0, np.repeat(y / float(nn), 2)])
+        y2 = np.hstack([0.0, np.repeat(y, 2)])
 
         res = ppfig.plotUnifLogXMarkers(x2, y2, nbperdecade * 3 / np.log10(maxval),
                                         logscale=False, clip_on=False, **kwargs)
         # res = plotUnifLogXMarkers(x2, y2, nbperdecade, logscale=False, **kwargs)
 
-        if maxevals:  # Should cover the case where maxevals is None or empty
+        if maxevals is not None and len(maxevals):  # cover None or empty
             x3 = np.median(maxevals)
             if (x3 <= maxval and
                 # np.any(x2 <= x3) and   # maxval < median(maxevals)
@@ -461,8 +484,63 @@ def plot(dsList, targets=None, craftingeffort=0., **kwargs):
     return res
 
 
+def _collect_runlengths(cells, samplesize, simulate_restarts=True):
+    """return ``(dictData, dictMaxEvals)`` of simulated runlengths.
+
+    `cells` is a list of ``(key, evals, maxevals)`` triples, where `evals`
+    is a 2-D array with one row of runlengths per target and `np.nan` for
+    unsuccessful runs, and `maxevals` are the runlengths of all runs.
+    An `evals` array without columns stands for missing data.
+
+    For each key, `dictData` contains `samplesize` simulated runlengths
+    per target, `dictMaxEvals` the runlengths of the unsuccessful runs,
+    both as preallocated arrays. The simulated runlengths of all cells
+    with the same number of runs are drawn in a single call of
+    `toolsstats.simulated_restarts`.
+    """
+    samplesize = int(samplesize)
+    sizes = OrderedDict()
+    sizes_unsucc = OrderedDict()
+    groups = OrderedDict()  # cells by number of runs
+    for key, evals, maxevals in cells:
+        sizes[key] = sizes.get(key, 0) + len(evals) * samplesize
+        sizes_unsucc[key] = sizes_unsucc.get(key, 0) + np.sum(np.isnan(evals))
+        groups.setdefault(evals.shape[1], []).append((key, evals, maxevals))
+    dictData = OrderedDict((key, np.empty(n)) for key, n in sizes.items())
+    dictMaxEvals = OrderedDict((key, np.empty(n)) for key, n in sizes_unsucc.items())
+    filled = dict((key, 0) for key in sizes)
+    filled_unsucc = dict((key, 0) for key in sizes)
+
+    for nruns, group in groups.items():
+        if not simulate_restarts and nruns and samplesize % nruns:
+            warnings.warn("without simulated restarts nbsamples=%d"
+                          " should be a multiple of nbruns=%d"
+                          % (samplesize, nruns))
+        samples = toolsstats.simulated_restarts(
+            np.vstack([evals for _, evals, _ in group]),
+            np.vstack([np.broadcast_to(maxevals, evals.shape)
+                       for _, evals, maxevals in group]),
+            samplesize, simulate_restarts)
+        row = 0
+        for key, evals, maxevals in group:
+            x = samples[row:row + len(evals)].ravel()
+            dictData[key][filled[key]:filled[key] + len(x)] = x
+            filled[key] += len(x)
+            row += len(evals)
+            unsucc = np.broadcast_to(maxevals, evals.shape)[np.isnan(evals)]
+            dictMaxEvals[key][filled_unsucc[key]:filled_unsucc[key] + len(unsucc)] = unsucc
+            filled_unsucc[key] += len(unsucc)
+    return dictData, dictMaxEvals
+
+
 def all_single_functions(dict_alg, is_single_algorithm, sorted_algs=None,
-                         output_dir='.', parent_html_file_name=None, settings=genericsettings):
+                         output_dir='.', parent_html_file_name=None, settings=genericsettings,
+                         dimensions=None):
+    """generate the ECDF figures for each single function.
+
+    `dimensions` are listed in the html pages of the multiple algorithm
+    case, by default the dimensions found in `dict_alg`.
+    """
     single_fct_output_dir = (output_dir.rstrip(os.sep) + os.sep +
                              'pprldmany-single-functions'
                              # + os.sep + ('f%03d' % fg)
@@ -515,7 +593,7 @@ def all_single_functions(dict_alg, is_single_algorithm, sorted_algs=None,
             ppfig.save_single_functions_html(
                 os.path.join(single_fct_output_dir, genericsettings.pprldmany_file_name),
                 '',  # algorithms names are clearly visible in the figure
-                dimensions=dims,
+                dimensions=dimensions or dims,
                 htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
                 parentFileName='../%s' % parent_html_file_name if parent_html_file_name else None,
                 header=ppfig.pprldmany_per_func_dim_header
@@ -615,96 +693,102 @@ def main(dictAlg, order=None, outputdir='.', info='default',
         if CrE != 0.0:
             print('Crafting effort for', alg, 'is', CrE)
 
-    dictData = {}  # list of (ert per function) per algorithm
-    dictMaxEvals = {}  # list of (maxevals per function) per algorithm
-
     # funcsolved = [set()] * len(targets) # number of functions solved per target
+    cells = []  # (key, evals, maxevals) per algorithm, function and dimension
     xbest = []
     maxevalsbest = []
     target_values = testbedsettings.current_testbed.pprldmany_target_values
 
+    displaybest = plotType == PlotType.ALG
+    if displaybest:
+        refalgentries = bestalg.load_reference_algorithm(testbedsettings.current_testbed.reference_algorithm_filename)
+        if not refalgentries:
+            displaybest = False
+
     dictDimList = pp.dictAlgByDim(dictAlg)
     dims = sorted(dictDimList)
+    funcs = set()  # functions with data in any dimension
     for i, dim in enumerate(dims):
         divisor = dim if divide_by_dimension else 1
 
         dictDim = dictDimList[dim]
         dictFunc = pp.dictAlgByFun(dictDim)
+        funcs.update(dictFunc)
         for f, dictAlgperFunc in sorted(dictFunc.items()):
-            # print(target_values((f, dim)))
-            for j, t in enumerate(target_values((f, dim))):
-                # for j, t in enumerate(testbedsettings.current_testbed.ecdf_target_values(1e2, f)):
-                # funcsolved[j].add(f)
-
-                for alg in algorithms_with_data:
-                    x = [np.inf] * perfprofsamplesize
-                    runlengthunsucc = []
-                    try:
-                        entry = dictAlgperFunc[alg][0]  # one element per fun and per dim.
-                        evals = entry.detEvals([t])[0]
-                        assert entry.dim == dim
-                        runlengthsucc = evals[np.isnan(evals) == False] / divisor
-                        runlengthunsucc = entry.maxevals[np.isnan(evals)] / divisor
-                        if len(runlengthsucc) > 0:  # else x == [inf, inf,...]
-                            if testbedsettings.current_testbed.instances_are_uniform:
-                                x = toolsstats.drawSP(runlengthsucc, runlengthunsucc,
-                                                      percentiles=[50],
-                                                      samplesize=perfprofsamplesize)[1]
-                            else:
-                                nruns = len(runlengthsucc) + len(runlengthunsucc)
-                                if perfprofsamplesize % nruns:
-                                    warnings.warn("without simulated restarts nbsamples=%d"
-                                                  " should be a multiple of nbruns=%d"
-                                                  % (perfprofsamplesize, nruns))
-                                idx = toolsstats.randint_derandomized(nruns, size=perfprofsamplesize)
-                                x = np.hstack((runlengthsucc, len(runlengthunsucc) * [np.inf]))[idx]
-                    except (KeyError, IndexError):
-                        # set_trace()
-                        warntxt = ('Data for algorithm %s on function %d in %d-D '
-                                   % (alg, f, dim)
-                                   + 'are missing.\n')
-                        warnings.warn(warntxt)
-
-                    keyValue = alg
-                    if plotType == PlotType.DIM:
-                        keyValue = '%d-D' % (dim)
-                        if keyValue not in order:
-                            order.append(keyValue)
-                    elif plotType == PlotType.FUNC:
-                        keyValue = 'f%d' % (f)
-                    dictData.setdefault(keyValue, []).extend(x)
-                    dictMaxEvals.setdefault(keyValue, []).extend(runlengthunsucc)
-
-            displaybest = plotType == PlotType.ALG
-            if displaybest:
-                # set_trace()
-                refalgentries = bestalg.load_reference_algorithm(testbedsettings.current_testbed.reference_algorithm_filename)
+            targets = target_values((f, dim))
+            for alg in algorithms_with_data:
+                keyValue = alg
+                if plotType == PlotType.DIM:
+                    keyValue = '%d-D' % (dim)
+                    if keyValue not in order:
+                        order.append(keyValue)
+                elif plotType == PlotType.FUNC:
+                    keyValue = 'f%d' % (f)
+                try:
+                    entry = dictAlgperFunc[alg][0]  # one element per fun and per dim.
+                    assert entry.dim == dim
+                    # all targets at once, one row per target
+                    cells.append((keyValue,
+                                  np.asarray(entry.detEvals(targets)) / divisor,
+                                  entry.maxevals / divisor))
+                except (KeyError, IndexError):
+                    # set_trace()
+                    warntxt = ('Data for algorithm %s on function %d in %d-D '
+                               % (alg, f, dim)
+                               + 'are missing.\n')
+                    warnings.warn(warntxt)
+                    cells.append((keyValue, np.zeros((len(targets), 0)),
+                                  np.zeros(0)))
 
-                if not refalgentries:
-                    displaybest = False
-                else:
-                    refalgentry = refalgentries[(dim, f)]
-                    refalgevals = refalgentry.detEvals(target_values((f, dim)))
-                    # print(refalgevals)
-                    for j in range(len(refalgevals[0])):
-                        if refalgevals[1][j]:
-                            evals = refalgevals[0][j]
-                            # set_trace()
-                            assert dim == refalgentry.dim
-                            runlengthsucc = evals[np.isnan(evals) == False] / divisor
-                            runlengthunsucc = refalgentry.maxevals[refalgevals[1][j]][np.isnan(evals)] / divisor
-                            x = toolsstats.drawSP(runlengthsucc, runlengthunsucc,
-                                                  percentiles=[50],
-                                                  samplesize=perfprofsamplesize)[1]
-                        else:
-                            x = perfprofsamplesize * [np.inf]
-                            runlengthunsucc = []
-                        xbest.extend(x)
-                        maxevalsbest.extend(runlengthunsucc)
+            if displaybest:
+                refalgentry = refalgentries[(dim, f)]
+                assert dim == refalgentry.dim
+                # simulated runlengths are cached per reference data
+                x, runlengthunsucc = bestalg.reference_ecdf_samples(
+                    refalgentry, targets, divisor, perfprofsamplesize)
+                xbest.extend(x)
+                maxevalsbest.extend(runlengthunsucc)
+
+    dictData, dictMaxEvals = _collect_runlengths(
+        cells, perfprofsamplesize,
+        testbedsettings.current_testbed.instances_are_uniform)
 
     if order is None:
         order = dictData.keys()
 
+    def algname_to_label(algname, dirname=None):
+        """to be extended to become generally useful"""
+        if isinstance(algname, (tuple, list)):  # not sure this is needed
+            return ' '.join([str(name) for name in algname])
+        return str(algname)
+
+    if info:
+        figureName = os.path.join(outputdir, '%s_%s' % (genericsettings.pprldmany_file_name, info))
+    else:
+        figureName = os.path.join(outputdir, '%s' % genericsettings.pprldmany_file_name)
+
+    if genericsettings.export_data:
+        ecdfs = [(key, dictData[key]) for key in order if key in dictData]
+        if displaybest:
+            ecdfs.insert(0, (testbedsettings.current_testbed.reference_algorithm_displayname,
+                             np.array(xbest)))
+        columns = [[], [], []]
+        for key, data in ecdfs:
+            x, y = ecdf_steps(data, CrEperAlg.get(key, 0.))
+            if ecdf_steps_per_decade and ecdf_steps_per_decade != 'auto':
+                x, y = ppfig.downsample_steps(x, y, ecdf_steps_per_decade)
+            columns[0].extend(len(x) * [algname_to_label(key)])
+            columns[1].extend(x)
+            columns[2].extend(y)
+        ppexport.save(figureName,
+                      list(zip(('algorithm', 'evals_per_dim' if divide_by_dimension
+                                else 'evals', 'proportion'), columns)),
+                      {'dimensions': dims, 'functions': sorted(funcs),
+                       'nb_targets': len(target_values),
+                       'samplesize': int(perfprofsamplesize)})
+    if genericsettings.data_only:
+        return
+
     # Display data
     lines = []
     if displaybest:
@@ -716,12 +800,6 @@ def main(dictAlg, order=None, outputdir='.', info='default',
         lines.append(plotdata(np.array(xbest), x_limit, maxevalsbest,
                               CrE=0., **args))
 
-    def algname_to_label(algname, dirname=None):
-        """to be extended to become generally useful"""
-        if isinstance(algname, (tuple, list)):  # not sure this is needed
-            return ' '.join([str(name) for name in algname])
-        return str(algname)
-
     plotting_style_list = ppfig.get_plotting_styles(order)
     for plotting_style in plotting_style_list:
         for i, alg in enumerate(plotting_style.algorithm_list):
@@ -796,10 +874,6 @@ def main(dictAlg, order=None, outputdir='.', info='default',
             if genericsettings.verbose:
                 print('Wrote right-hand legend in %s' % file_name)
 
-    if info:
-        figureName = os.path.join(outputdir, '%s_%s' % (genericsettings.pprldmany_file_name, info))
-    else:
-        figureName = os.path.join(outputdir, '%s' % genericsettings.pprldmany_file_name)
     # beautify(figureName, funcsolved, x_limit*x_annote_factor, False, fileFormat=figformat)
     beautify()
 
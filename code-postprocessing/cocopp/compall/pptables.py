@@ -10,6 +10,7 @@ import warnings
 import numpy
 
 from .. import genericsettings, bestalg, toolsstats, pproc, ppfigparam, testbedsettings, captions, ppfig
+from .. import ppexport
 from ..pptex import writeFEvals2, writeFEvalsMaxPrec, tableXLaTeX, numtotext
 from ..toolsstats import significancetest, significance_all_best_vs_other
 from ..toolsdivers import str_to_latex, strip_pathname1, replace_in_file, get_version_label, prepend_to_file
@@ -521,6 +522,7 @@ def main(dict_alg, sorted_algs, output_dir='.', function_targets_line=True, late
         extraeol.append('')
 
         additional_commands = ['\\providecommand{\\ntables}{%d}' % len(targets_of_interest)]
+        exported = []  # one row per algorithm and target
         for i, alg in enumerate(algnames):
             tableHtml.append('<tr>\n')
             # algname, entries, irs, line, line2, succ, runs, testres1alg in zip(algnames,
@@ -550,10 +552,12 @@ def main(dict_alg, sorted_algs, output_dir='.', function_targets_line=True, late
                 # write star for significance against all other algorithms
                 str_significance_subsup = ''
                 str_significance_subsup_html = ''
+                significance_others, significance_ref = 0, 0
                 if (len(best_alg_idx) > 0 and len(significance_versus_others) > 0 and
                             i == best_alg_idx[j] and nbtests * significance_versus_others[j][1] < 0.05):
                     logp = -numpy.ceil(numpy.log10(nbtests * significance_versus_others[j][1]))
                     logp = numpy.min((9, logp))  # not messing up the format and handling inf
+                    significance_others = int(logp)
                     str_significance_subsup = r"^{%s%s}" % (
                     significance_vs_others_symbol, str(int(logp)) if logp > 1 else '')
                     str_significance_subsup_html = '<sup>%s%s</sup>' % (
@@ -576,6 +580,7 @@ def main(dict_alg, sorted_algs, output_dir='.', function_targets_line=True, late
                         # all(sorted(FEvals_best) > sorted(FEvals_current)).
                         if numpy.isinf(refalgert[j]) or all(tmpevals < bestevals):
                             nbstars = -numpy.ceil(numpy.log10(nbtests * p))
+                            significance_ref = int(nbstars)
                             # tmp2[-1] += r'$^{%s}$' % superscript
                             str_significance_subsup += r'_{%s%s}' % (significance_vs_ref_symbol,
                                                                      str(int(nbstars)) if nbstars > 1 else '')
@@ -584,6 +589,10 @@ def main(dict_alg, sorted_algs, output_dir='.', function_targets_line=True, late
                                                                                     nbstars)) if nbstars > 1 else '')
                 if str_significance_subsup:
                     str_significance_subsup = '$%s$' % str_significance_subsup
+                exported.append((algnames[i], targets[j], ert, dispersion,
+                                 refalgert[j] if refalgentries else numpy.nan,
+                                 bool(isBold), significance_others, significance_ref,
+                                 algnbsucc[i], algnbruns[i]))
 
                 # format number in variable data
                 if numpy.isnan(data):
@@ -677,6 +686,17 @@ def main(dict_alg, sorted_algs, output_dir='.', function_targets_line=True, late
             tableHtml.extend(curlineHtml[:])
             extraeol.append('')
 
+        if genericsettings.export_data:
+            ppexport.save(os.path.join(output_dir, 'pptables_f%03d_%02dD' % (df[1], df[0])),
+                          list(zip(('algorithm', 'target', 'ert', 'dispersion', 'ert_ref',
+                                    'is_best', 'significance_vs_others', 'significance_vs_ref',
+                                    'nbsucc', 'nbruns'),
+                                   zip(*exported) if exported else 10 * [[]])),
+                          {'function': df[1], 'dimension': df[0], 'nbtests': nbtests,
+                           'nbsucc_target': targetf})
+        if genericsettings.data_only:
+            continue
+
         # Write table
         res = tableXLaTeX(table, spec=spec, extra_eol=extraeol, add_begin_tabular=False, add_end_tabular=False)
         try:
@@ -714,6 +734,8 @@ def main(dict_alg, sorted_algs, output_dir='.', function_targets_line=True, late
             f.close()
             # TODO: return status
 
+    if genericsettings.data_only:
+        return
     if len(additional_commands) > 0:
         for command in additional_commands:
             prepend_to_file(latex_commands_file, [command])
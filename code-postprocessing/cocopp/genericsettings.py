@@ -49,6 +49,11 @@ dim_related_colors = ('c', 'g', 'b', 'k', 'r', 'm', 'k', 'y', 'k', 'c', 'r', 'm'
 simulated_runlength_bootstrap_sample_size = 10 + 990 // (1 + 10 * max((0, in_a_hurry)))  # for tables and plots
 """10000 would be better for a final camera-ready paper version"""
 
+use_reference_algorithm_cache = True
+"""keep the parsed reference algorithm data and their simulated runlengths
+in ``~/.cocopp/cache`` such that later calls and parallel processes do not
+need to recompute them, see `bestalg.load_reference_algorithm`"""
+
 
 # single_target_pprldistr_values = (10., 1e-1, 1e-4, 1e-8)  # used as default in pprldistr.plot method, on graph for each
 # single_target_function_values = (1e1, 1e0, 1e-1, 1e-2, 1e-4, 1e-6, 1e-8)  # one figure for each, seems not in use
@@ -276,6 +281,19 @@ isPickled = False  # only affects rungeneric1
 ##    
 isScatter = True  # only affects rungenericmany
 
+export_data = False
+"""write the data underlying the ECDF, scaling figures and the tables
+additionally into machine-readable files, see `ppexport`"""
+data_only = False
+"""export the data (as with `export_data`) but generate neither figures
+nor tables, set with the ``--data-only`` option"""
+export_data_formats = ('csv', 'json', 'npz')
+"""file formats written by `ppexport.save`"""
+load_per_dimension = False
+"""load and process the data of multiple algorithms one dimension (and
+for the scaling figures one function) at a time to bound the memory
+usage, set with the ``--per-dimension`` option of `rungenericmany`"""
+
 # Used by getopt:
 shortoptlist = "hvpo:"
 longoptlist = ["help", "output-dir=", "noisy", "noise-free",
@@ -283,7 +301,8 @@ longoptlist = ["help", "output-dir=", "noisy", "noise-free",
                "verbose", "settings=", "conv",
                "expensive", "runlength-based",
                "los-only", "crafting-effort=", "pickle",
-               "sca-only", "no-svg", "constrained"]
+               "sca-only", "no-svg", "constrained",
+               "export-data", "data-only", "per-dimension"]
 
 
 # thereby, "los-only", "crafting-effort=", and "pickle" affect only rungeneric1
@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Export the data behind figures and tables in machine-readable form.
+
+Each export is a table in "long" format, that is, a set of columns of
+equal length, written next to the respective figure or table. For
+example, the data of ``pprldmany_05D_noiselessall.svg`` are written to
+``pprldmany_05D_noiselessall.csv``, ``.json`` and ``.npz``, depending on
+`genericsettings.export_data_formats`.
+
+The export is switched on with the ``--export-data`` option of
+`rungeneric`. With ``--data-only``, the data are exported and all
+figures and tables are skipped.
+
+In the ``.csv`` and ``.npz`` files, unsuccessful or missing values
+remain ``inf`` and ``nan``, whereas in the ``.json`` file they become
+``null``, because json has no representation of either. Additional
+information, like the dimension or the target values, is written as
+``meta`` into the ``.json`` file and as ``meta`` json string into the
+``.npz`` file.
+
+Example::
+
+    >>> import os, tempfile
+    >>> import numpy as np
+    >>> from cocopp import ppexport
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'test')
+    >>> _ = ppexport.save(filename, [('algorithm', ['A', 'B']),
+    ...                              ('ert', [1.5, np.inf])], {'dim': 5})
+    >>> with open(filename + '.csv') as f:
+    ...     print(f.read().strip())
+    algorithm,ert
+    A,1.5
+    B,inf
+    >>> ppexport.load(filename + '.json')['ert']
+    [1.5, None]
+    >>> list(np.load(filename + '.npz')['ert'])
+    [1.5, inf]
+
+"""
+from __future__ import absolute_import, division, print_function
+
+import csv
+import json
+from collections import OrderedDict
+import numpy as np
+
+from . import genericsettings
+
+__all__ = ['save', 'load']
+
+
+def _json_value(value):
+    """return `value` as json-serializable Python scalar or list"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_json_value(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def save(filename, columns, meta=None, formats=None):
+    """write `columns` to `filename` with the extensions in `formats`.
+
+    :param str filename: file name without extension
+    :param seq columns: ``(name, values)`` pairs, all `values` of the
+        same length
+    :param dict meta: information about the data as scalars, strings or
+        lists thereof, not written to the ``.csv`` file
+    :param seq formats: subset of ``('csv', 'json', 'npz')``, by default
+        `genericsettings.export_data_formats`
+
+    :returns: the list of written file names.
+    """
+    if formats is None:
+        formats = genericsettings.export_data_formats
+    columns = OrderedDict((name, np.asarray(values)) for name, values in columns)
+    meta = OrderedDict(sorted((meta or {}).items()))
+    lengths = set(len(values) for values in columns.values())
+    if len(lengths) > 1:
+        raise ValueError('columns of different length %s cannot be exported'
+                         % str(dict((name, len(values)) for name, values in columns.items())))
+    written = []
+    if 'csv' in formats:
+        with open(filename + '.csv', 'w') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(list(columns))
+            writer.writerows(zip(*[values.tolist() for values in columns.values()]))
+        written.append(filename + '.csv')
+    if 'json' in formats:
+        data = OrderedDict([('meta', OrderedDict((key, _json_value(value))
+                                                 for key, value in meta.items()))])
+        for name, values in columns.items():
+            data[name] = [_json_value(value) for value in values.tolist()]
+        with open(filename + '.json', 'w') as f:
+            json.dump(data, f, allow_nan=False)
+        written.append(filename + '.json')
+    if 'npz' in formats:
+        arrays = dict(columns)
+        arrays['meta'] = np.array(json.dumps(dict((key, _json_value(value))
+                                                  for key, value in meta.items())))
+        np.savez_compressed(filename + '.npz', **arrays)
+        written.append(filename + '.npz')
+    if genericsettings.verbose:
+        print('Exported data to %s' % ', '.join(written))
+    return written
+
+
+def load(filename):
+    """return the `OrderedDict` of columns written to a ``.json`` file by
+    `save`, the ``meta`` information under the key ``'meta'``"""
+    with open(filename) as f:
+        return json.load(f, object_pairs_hook=OrderedDict)
@@ -36,6 +36,11 @@ HtmlPage = enum('NON_SPECIFIED', 'ONE', 'MANY', 'PPRLDMANY_BY_GROUP', 'PPRLDMANY
                 'PPTABLE', 'PPTABLE2', 'PPTABLES', 'PPRLDISTR', 'PPRLDISTR2', 'PPLOGLOSS', 'PPSCATTER', 'PPFIGS')
 
 
+def save_figure_dpi():
+    """return the resolution in dots per inch used by `save_figure`"""
+    return 60 if genericsettings.in_a_hurry else 300
+
+
 def save_figure(filename,
                 algorithm=None,
                 format=None,
@@ -94,7 +99,7 @@ def save_figure(filename,
                     (plt.matplotlib.__version__, str(e)))
         try:
             plt.savefig(filename + '.' + format,
-                        dpi=60 if genericsettings.in_a_hurry else 300,
+                        dpi=save_figure_dpi(),
                         format=format,
                         bbox_inches=bbox_inches,
                         # pad_inches=0,  # default is 0.1?, 0 leads to cut label text
@@ -542,6 +547,36 @@ def marker_positions(xdata, ydata, nbperdecade, maxnb,
     return xpos, ypos
 
 
+def downsample_steps(x, y, nbperdecade):
+    """return `x` and `y` of a step function with at most `nbperdecade`
+    steps per decade of `x`.
+
+    `x` must be sorted and positive. Only the last point within each cell
+    of a grid with `nbperdecade` cells per decade on the log x-scale is
+    kept. Hence no step moves by more than the cell width, which does not
+    change the displayed graph when the cells are smaller than the figure
+    resolution.
+
+    >>> import numpy as np
+    >>> import cocopp
+    >>> x = 10**np.linspace(0, 3, 3001)
+    >>> x2, y2 = cocopp.ppfig.downsample_steps(x, np.arange(1, 3002), 100)
+    >>> len(x2) <= 301, x2[-1] == x[-1], y2[-1] == 3001
+    (True, True, True)
+    >>> len(cocopp.ppfig.downsample_steps([], [], 100)[0])
+    0
+
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if not len(x):  # no successful run
+        return x, y
+    with np.errstate(divide='ignore'):  # x == 0 lands in the -inf cell
+        cells = np.floor(nbperdecade * np.log10(x))
+    last = np.hstack((cells[1:] != cells[:-1], True))  # last point per cell
+    return x[last], y[last]
+
+
 def plotUnifLogXMarkers(x, y, nbperdecade, logscale=False, **kwargs):
     """Proxy plot function: markers are evenly spaced on the log x-scale
 
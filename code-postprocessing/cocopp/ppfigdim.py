@@ -61,7 +61,7 @@ import numpy as np
 from six import advance_iterator
 
 from . import genericsettings, toolsstats, bestalg, pproc, ppfig, ppfigparam, htmldesc, toolsdivers
-from . import testbedsettings
+from . import testbedsettings, ppexport
 from . import captions
 
 xlim_max = None
@@ -525,6 +525,27 @@ def main(dsList, _valuesOfInterest, outputdir):
     
     """
 
+    _valuesOfInterest = pproc.TargetValues.cast(_valuesOfInterest)
+
+    dictFunc = dsList.dictByFunc()
+
+    if genericsettings.export_data:
+        for func in sorted(dictFunc):
+            rows = []
+            for dim, dsl in sorted(dictFunc[func].dictByDim().items()):
+                for i_target, target in enumerate(_valuesOfInterest((func, dim))):
+                    # (ert, success rate, number of success, mean of
+                    #  function evaluations, median of successful runs)
+                    rows.append([dim, target] + list(generateData(dsl[0], target)) +
+                                [dsl[0].nbRuns(), max(dsl[0].maxevals)])
+            ppexport.save(os.path.join(outputdir, 'ppfigdim_f%03d' % func),
+                          list(zip(('dimension', 'target', 'ert', 'success_rate', 'nbsucc',
+                                    'mean_evals', 'median_evals_succ', 'nbruns', 'max_evals'),
+                                   zip(*rows))),
+                          {'function': func, 'algorithm': dsList[0].algId})
+    if genericsettings.data_only:
+        return
+
     plt.rc("axes", **genericsettings.rcaxes)
     plt.rc("xtick", **genericsettings.rctick)
     plt.rc("ytick", **genericsettings.rctick)
@@ -532,9 +553,6 @@ def main(dsList, _valuesOfInterest, outputdir):
     plt.rc("legend", **genericsettings.rclegend)
     plt.rc('pdf', fonttype=42)
 
-    _valuesOfInterest = pproc.TargetValues.cast(_valuesOfInterest)
-
-    dictFunc = dsList.dictByFunc()
     values_of_interest = testbedsettings.current_testbed.ppfigdim_target_values
 
     key = 'bbobppfigdimlegend' + testbedsettings.current_testbed.scenario
@@ -48,7 +48,7 @@ import pickle, gzip
 import matplotlib.pyplot as plt
 import numpy as np
 from pdb import set_trace
-from . import genericsettings, pproc, toolsdivers
+from . import genericsettings, pproc, toolsdivers, ppexport
 from . import testbedsettings
 from .ppfig import consecutiveNumbers, plotUnifLogXMarkers, save_figure, logxticks
 from .pptex import color_to_latex, marker_to_latex
@@ -443,7 +443,7 @@ def erld_data(dsList, target, max_fun_evals=np.inf):
     `max_fun_evals` is only used to compute `function_ids_solved`,
     that is elements in `sorted_runlengths...` can be larger.
 
-    copy-paste from `plotRLDistr` and not used.
+    copy-paste from `plotRLDistr`, used for the data export.
     """
     runlength_data = []
     nruns = 0
@@ -452,7 +452,7 @@ def erld_data(dsList, target, max_fun_evals=np.inf):
     for ds in dsList: # ds is a DataSet
         funcs.add(ds.funcId)
         evals = ds.detEvals((target((ds.funcId, ds.dim)),))[0] / ds.dim
-        evals = evals[not np.isnan(evals)] # keep only success
+        evals = evals[np.isnan(evals) == False] # keep only success
         if len(evals) > 0 and sum(evals <= max_fun_evals):
             fsolved.add(ds.funcId)
         runlength_data.extend(evals)
@@ -837,6 +837,23 @@ def main(dsList, isStoringXMax=False, outputdir='',
 
         # first figure: Run Length Distribution
         filename = os.path.join(outputdir, 'pprldistr_%02dD_%s' % (d, info))
+        if genericsettings.export_data:
+            columns = [[], [], []]
+            for j in range(len(targets)):
+                x, nruns, _funcs, _fsolved = erld_data(
+                    dictdim, lambda fun_dim: targets(fun_dim)[j], evalfmax)
+                columns[0].extend(len(x) * [
+                    targets.label(j) if isinstance(targets, pproc.RunlengthBasedTargetValues)
+                    else targets.loglabel(j)])
+                columns[1].extend(x)
+                columns[2].extend(np.arange(1, len(x) + 1) / float(nruns))
+            ppexport.save(filename,
+                          list(zip(('target', 'evals_per_dim', 'proportion'), columns)),
+                          {'dimension': d, 'algorithm': dsList[0].algId,
+                           'functions': sorted(set(i.funcId for i in dictdim)),
+                           'max_evals_per_dim': maxEvalsFactor})
+        if genericsettings.data_only:
+            continue
         fig = plt.figure()
         for j in range(len(targets)):
             plotRLDistr(dictdim,
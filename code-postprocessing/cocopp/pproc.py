@@ -1739,13 +1739,18 @@ class DataSetList(list):
     #Do not inherit from set because DataSet instances are mutable which means
     #they might change over time.
 
-    def __init__(self, args=[], check_data_type=True):
+    def __init__(self, args=[], check_data_type=True, dimensions=None,
+                 functions=None):
         """Instantiate self from a list of folder- or filenames or 
         ``DataSet`` instances.
 
         :keyword list args: strings being either info file names, folder
                             containing info files or pickled data files,
                             or a list of DataSets.
+        :keyword seq dimensions: if given, only data of these dimensions
+                                 are read from the files
+        :keyword seq functions: if given, only data of these function
+                                ids are read from the files
 
         Exceptions:
         Warning -- Unexpected user input.
@@ -1783,7 +1788,7 @@ class DataSetList(list):
             if isinstance(name, DataSet):
                 self.append(name)
             elif name.endswith('.info'):
-                self.processIndexFile(name)
+                self.processIndexFile(name, dimensions, functions)
             elif name.endswith('.pickle') or name.endswith('.pickle.gz'):
                 try:
                     # cocofy(name)
@@ -1804,7 +1809,9 @@ class DataSetList(list):
                     except:
                         pass
                     # if not hasattr(entry, 'detAverageEvals')
-                    self.append(entry)
+                    if ((dimensions is None or entry.dim in dimensions) and
+                            (functions is None or entry.funcId in functions)):
+                        self.append(entry)
                     #set_trace()
                 except IOError as e:
                     print("I/O error(%s): %s" % (e.errno, e.strerror))
@@ -1823,8 +1830,12 @@ class DataSetList(list):
         if len(self) and data_consistent:
             print("  Data consistent according to consistency_check() in pproc.DataSet")
             
-    def processIndexFile(self, indexFile):
-        """Reads in an index (.info?) file information on the different runs."""
+    def processIndexFile(self, indexFile, dimensions=None, functions=None):
+        """Reads in an index (.info?) file information on the different runs.
+
+        Entries with a dimension not in `dimensions` or a function not in
+        `functions` are skipped without reading their data files.
+        """
 
         try:
             f = openfile(indexFile)
@@ -1853,6 +1864,11 @@ class DataSetList(list):
                     data = advance_iterator(f)  # this is the filename of the data file!?
                     data_file_names.append(data)
                     nbLine += 3
+                    if dimensions is not None or functions is not None:
+                        attributes = parse_header_attributes(header)
+                        if (dimensions is not None and attributes.get('dim') not in dimensions
+                                or functions is not None and attributes.get('funcId') not in functions):
+                            continue
                     #TODO: check that something is not wrong with the 3 lines.
                     ds = DataSet(header, comment, data, indexFile)                    
                     if len(ds.instancenumbers) > 0:                    
@@ -2646,6 +2662,53 @@ def parseinfoold(s):
 
     return res
 
+def parse_header_attributes(header):
+    """return a `dict` of the `DataSet` attributes given in an index file
+    header line, in particular ``'dim'`` and ``'funcId'``.
+
+    >>> from cocopp import pproc
+    >>> a = pproc.parse_header_attributes(
+    ...         "funcId = 3, DIM = 5, Precision = 1.000e-08, algId = 'A'")
+    >>> a['funcId'], a['dim'], a['algId']
+    (3, 5, 'A')
+
+    """
+    res = {}
+    for name, value in parseinfo(header):
+        if name in DataSet._attributes:
+            name, cast = DataSet._attributes[name]
+            value = cast(value)
+        res[name] = value
+    return res
+
+
+def index_file_problems(args):
+    """return the sorted list of ``(dimension, function_id)`` pairs listed
+    in the index files found in `args`, without reading any data file.
+
+    `args` are file or folder names as in `processInputArgs`.
+    """
+    problems = set()
+    for name in args:
+        name = name.strip()
+        if not name or not findfiles.is_recognized_repository_filetype(name):
+            continue
+        for filename in findfiles.main(name):
+            if filename.endswith('.info'):
+                with openfile(filename) as f:
+                    for line in f:
+                        if line.startswith('%'):  # comment line
+                            continue
+                        if 'funcId' in line or 'function' in line:
+                            attributes = parse_header_attributes(line)
+                            if 'dim' in attributes and 'funcId' in attributes:
+                                problems.add((attributes['dim'], attributes['funcId']))
+            elif filename.endswith('.pickle') or filename.endswith('.pickle.gz'):
+                for ds in DataSetList(filename):
+                    problems.add((ds.dim, ds.funcId))
+    return sorted(problems)
+
+
 def parseinfo(s):
     """Extract data from a header line in an index entry.
 
@@ -2702,7 +2765,8 @@ def set_unique_algId(ds_list, ds_list_reference, taken_ids=None):
             ds.algId = algId + ' ' + str(i)
 
 
-def processInputArgs(args, process_background_algorithms=False):
+def processInputArgs(args, process_background_algorithms=False,
+                     dimensions=None, functions=None):
     """Process command line arguments.
 
     Returns several instances of :py:class:`DataSetList`, and a list of 
@@ -2716,6 +2780,8 @@ def processInputArgs(args, process_background_algorithms=False):
 
     :keyword list args: string arguments for folder names
     :keyword bool process_background_algorithms: option to process also background algorithms
+    :keyword seq dimensions: if given, load only the data of these dimensions
+    :keyword seq functions: if given, load only the data of these function ids
 
     :returns (all_datasets, pathnames, datasetlists_by_alg):
       all_datasets
@@ -2734,19 +2800,22 @@ def processInputArgs(args, process_background_algorithms=False):
     sortedAlgs = list()
     dictAlg = {}
     current_hash = None
-    process_arguments(args, current_hash, dictAlg, dsList, sortedAlgs)
+    process_arguments(args, current_hash, dictAlg, dsList, sortedAlgs,
+                      dimensions, functions)
     if process_background_algorithms:
         genericsettings.foreground_algorithm_list.extend(sortedAlgs)
         for value in genericsettings.background.values():
             assert isinstance(value, (list, tuple, set))
-            process_arguments(value, current_hash, dictAlg, dsList, sortedAlgs)
+            process_arguments(value, current_hash, dictAlg, dsList, sortedAlgs,
+                              dimensions, functions)
 
     store_reference_values(DataSetList(dsList))
 
     return dsList, sortedAlgs, dictAlg
 
 
-def process_arguments(args, current_hash, dictAlg, dsList, sortedAlgs):
+def process_arguments(args, current_hash, dictAlg, dsList, sortedAlgs,
+                      dimensions=None, functions=None):
     for i in args:
         i = i.strip()
         if i == '':  # might cure an lf+cr problem when using cywin under Windows
@@ -2755,7 +2824,8 @@ def process_arguments(args, current_hash, dictAlg, dsList, sortedAlgs):
             filelist = findfiles.main(i)
             # Do here any sorting or filtering necessary.
             # filelist = list(i for i in filelist if i.count('ppdata_f005'))
-            tmpDsList = DataSetList(filelist)
+            tmpDsList = DataSetList(filelist, dimensions=dimensions,
+                                    functions=functions)
             for ds in tmpDsList:
                 ds._data_folder = i
             # Nota: findfiles will find all info AND pickle files in folder i.
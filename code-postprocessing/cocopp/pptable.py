@@ -26,7 +26,7 @@ from __future__ import absolute_import, print_function
 import os
 import warnings
 import numpy as np
-from . import genericsettings, bestalg, toolsstats, pproc
+from . import genericsettings, bestalg, toolsstats, pproc, ppexport
 from . import testbedsettings
 from .pptex import tableLaTeX, writeFEvals2, writeFEvalsMaxPrec
 from .toolsstats import significancetest
@@ -244,6 +244,7 @@ def main(dsList, dims_of_interest, outputdir, latex_commands_file):
                 else: 
                     dispersion.append(None)
             assert data == ertdata
+            significance = []
             for i, ert in enumerate(data):
                 alignment = 'c'
                 if i == len(data) - 1: # last element
@@ -269,6 +270,7 @@ def main(dsList, dims_of_interest, outputdir, latex_commands_file):
                 is_bold = False
                 if nbstars > 0:
                     is_bold = True
+                significance.append((p if refalgentries else np.nan, nbstars))
 
                 if refalgentries and np.isinf(refalgdata[i]): # if the reference algorithm did not solve the problem
                     tmp = writeFEvalsMaxPrec(float(ert), 2)
@@ -392,15 +394,30 @@ def main(dsList, dims_of_interest, outputdir, latex_commands_file):
 
             tmp = entry.evals[entry.evals[:, 0] <= targetf, 1:]
             try:
-                tmp = tmp[0]
-                curline.append('%d' % np.sum(np.isnan(tmp) == False))
-                curlineHtml.append('<td>%d' % np.sum(np.isnan(tmp) == False))
+                nbsucc = np.sum(np.isnan(tmp[0]) == False)
             except IndexError:
-                curline.append('%d' % 0)
-                curlineHtml.append('<td>%d' % 0)
+                nbsucc = 0
+            curline.append('%d' % nbsucc)
+            curlineHtml.append('<td>%d' % nbsucc)
             curline.append('/%d' % entry.nbRuns())
             curlineHtml.append('/%d</td>\n' % entry.nbRuns())
 
+            output_file = os.path.join(outputdir, 'pptable_f%03d_%02dD.tex' % (f, d))
+            if genericsettings.export_data:
+                targets = targetsOfInterest((f, d))
+                ppexport.save(os.path.splitext(output_file)[0], [
+                    ('target', targets),
+                    ('ert', data),
+                    ('dispersion', [np.nan if x is None else x for x in dispersion]),
+                    ('ert_ref', refalgdata if refalgentries else len(data) * [np.nan]),
+                    ('p_value', [x[0] for x in significance]),
+                    ('significance', [int(x[1]) for x in significance])],
+                    {'function': f, 'dimension': d, 'algorithm': entry.algId,
+                     'nbsucc': nbsucc, 'nbruns': entry.nbRuns(),
+                     'nbsucc_target': targetf, 'nbtests': nbtests})
+            if genericsettings.data_only:
+                continue
+
             table.append(curline[:])
             tableHtml.extend(curlineHtml[:])
             tableHtml.append('</tr>\n')
@@ -408,7 +425,6 @@ def main(dsList, dims_of_interest, outputdir, latex_commands_file):
         
             extraeol[-1] = ''
 
-            output_file = os.path.join(outputdir, 'pptable_f%03d_%02dD.tex' % (f, d))
             if isinstance(targetsOfInterest, pproc.RunlengthBasedTargetValues):
                 spec = r'@{}c@{}|' + '*{%d}{@{ }r@{}@{}l@{}}' % len(targetsOfInterest) + '|@{}r@{}@{}l@{}'
             else:
@@ -419,6 +435,9 @@ def main(dsList, dims_of_interest, outputdir, latex_commands_file):
             f.write(res)
             f.close()
 
+        if genericsettings.data_only:
+            continue
+
         res = ("").join(str(item) for item in tableHtml)
         res = '<table>\n%s</table>\n' % res
 
@@ -438,7 +457,7 @@ def main(dsList, dims_of_interest, outputdir, latex_commands_file):
         if genericsettings.verbose:
             print("Table written in %s" % output_file)
 
-    if len(dims_of_interest) > 0:
+    if len(dims_of_interest) > 0 and not genericsettings.data_only:
         extraeol = [r'\hline']
         res = tableLaTeX([header], spec=spec, extra_eol=extraeol, add_end_tabular=False)
         prepend_to_file(latex_commands_file, ['\\providecommand{\\pptableheader}{', res, '}'])
@@ -179,6 +179,22 @@ def main(argv=None):
 
             do not generate the svg figures which are used in html files
 
+        --export-data
+
+            additionally write the data of the ECDF and scaling figures
+            and of the tables into csv, json and npz files next to the
+            respective figures and tables, see `cocopp.ppexport`.
+
+        --data-only
+
+            write only these data files, but neither figures nor tables.
+
+        --per-dimension
+
+            with two or more algorithms, load and process the data one
+            dimension at a time (and one function at a time for the
+            scaling figures) to bound the memory usage.
+
 
     Exceptions raised:
 
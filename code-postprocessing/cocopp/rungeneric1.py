@@ -100,6 +100,12 @@ def main(argv=None):
             useful with comparatively small budgets.
         --no-svg
             do not generate the svg figures which are used in html files
+        --export-data
+            additionally write the data of the ECDF and scaling figures
+            and of the tables into csv, json and npz files, see
+            `cocopp.ppexport`.
+        --data-only
+            write only these data files, neither figures nor tables.
         --runlength-based
             runlength-based f-target values, such that the
             "level of difficulty" is similar for all functions. 
@@ -221,11 +227,22 @@ def main(argv=None):
                 genericsettings.isExpensive = True  # comprises runlength-based
             elif o == "--no-svg":
                 genericsettings.generate_svg_files = False
+            elif o == "--export-data":
+                genericsettings.export_data = True
+            elif o == "--data-only":
+                genericsettings.export_data = True
+                genericsettings.data_only = True
             elif o == "--sca-only":
                 warnings.warn("option --sca-only will have no effect with rungeneric1.py")
+            elif o == "--per-dimension":
+                warnings.warn("option --per-dimension will have no effect with rungeneric1.py")
             else:
                 assert False, "unhandled option"
 
+        if genericsettings.data_only:  # these figures have no data export
+            prepare_log_loss = False
+            genericsettings.isConv = False
+
         # from cocopp import bbob2010 as inset # input settings
         from . import genericsettings as inset  # input settings
         if genericsettings.inputsettings == "color":
@@ -17,6 +17,7 @@ import os
 import sys
 import getopt
 import warnings
+from collections import OrderedDict
 
 from . import genericsettings, ppfig, testbedsettings, findfiles
 from . import pproc, pptex, pprldistr
@@ -36,9 +37,13 @@ def usage():
     print(main.__doc__)
 
 
-def grouped_ecdf_graphs(alg_dict, order, output_dir, function_groups, settings, parent_file_name):
+def grouped_ecdf_graphs(alg_dict, order, output_dir, function_groups, settings, parent_file_name,
+                        dimensions=None):
     """ Generates ecdf graphs, aggregated over groups as
         indicated via algdict
+
+        `dimensions` are listed in the html page, by default the
+        dimensions of `alg_dict`.
     """
     for gr, tmpdictAlg in alg_dict.items():
         dictDim = pproc.dictAlgByDim(tmpdictAlg)
@@ -47,7 +52,7 @@ def grouped_ecdf_graphs(alg_dict, order, output_dir, function_groups, settings,
         ppfig.save_single_functions_html(
             os.path.join(output_dir, genericsettings.pprldmany_file_name),
             '',  # algorithms names are clearly visible in the figure
-            dimensions=dims,
+            dimensions=dimensions or dims,
             htmlPage=ppfig.HtmlPage.PPRLDMANY_BY_GROUP_MANY,
             function_groups=function_groups,
             parentFileName=parent_file_name
@@ -68,6 +73,423 @@ def grouped_ecdf_graphs(alg_dict, order, output_dir, function_groups, settings,
             replace_in_file(file_name, '??COCOVERSION??', '<br />Data produced with COCO %s' % (get_version_label(None)))
 
 
+def _merge_latex_commands(slice_file, latex_commands_file, defined):
+    """prepend the commands from `slice_file` to `latex_commands_file`,
+    skip those in `defined` and remove `slice_file`.
+
+    A command is a block of lines starting with a ``\\providecommand``
+    line. The names of the prepended commands are added to the set
+    `defined`, such that commands written by several slices appear only
+    once. A slice without data writes no `slice_file`, in which case
+    nothing is prepended.
+
+    >>> import os, tempfile
+    >>> from cocopp.rungenericmany import _merge_latex_commands
+    >>> folder = tempfile.mkdtemp()
+    >>> commands = os.path.join(folder, 'commands.tex')
+    >>> slice_file = os.path.join(folder, 'commands.tex.slice')
+    >>> defined = set()
+    >>> for command in ('\\\\providecommand{\\\\a}{1}', '\\\\providecommand{\\\\b}{2}'):
+    ...     with open(slice_file, 'w') as f:
+    ...         print(command, file=f)
+    ...     _merge_latex_commands(slice_file, commands, defined)
+    >>> _merge_latex_commands(slice_file, commands, defined)  # slice without data
+    >>> with open(commands) as f:
+    ...     print(f.read().strip())
+    \\providecommand{\\b}{2}
+    \\providecommand{\\a}{1}
+    >>> os.path.exists(slice_file)
+    False
+
+    """
+    if not os.path.exists(slice_file):
+        return
+    blocks = []
+    with open(slice_file) as f:
+        for line in f:
+            if line.startswith('\\providecommand') or not blocks:
+                blocks.append([])
+            blocks[-1].append(line.rstrip('\n'))
+    os.remove(slice_file)
+    lines = []
+    for block in blocks:
+        name = block[0].split('}')[0]
+        if name not in defined:
+            defined.add(name)
+            lines.extend(block)
+    prepend_to_file(latex_commands_file, lines, 5000)
+
+
+def _save_html_pages(many_algorithms_output, dimensions, function_groups):
+    """write the html pages which are filled by the output of all
+    dimensions and functions into `many_algorithms_output`."""
+    ppfig.copy_js_files(many_algorithms_output)
+
+    ppfig.save_single_functions_html(
+        os.path.join(many_algorithms_output, genericsettings.many_algorithm_file_name),
+        '',  # algorithms names are clearly visible in the figure
+        htmlPage=ppfig.HtmlPage.MANY,
+        function_groups=function_groups
+    )
+
+    ppfig.save_single_functions_html(
+        os.path.join(many_algorithms_output, genericsettings.ppfigs_file_name),
+        '',  # algorithms names are clearly visible in the figure
+        htmlPage=ppfig.HtmlPage.PPFIGS,
+        function_groups=function_groups,
+        parentFileName=genericsettings.many_algorithm_file_name
+    )
+
+    ppfig.save_single_functions_html(
+        os.path.join(many_algorithms_output, genericsettings.pptables_file_name),
+        '',  # algorithms names are clearly visible in the figure
+        dimensions=dimensions,
+        htmlPage=ppfig.HtmlPage.PPTABLES,
+        function_groups=function_groups,
+        parentFileName=genericsettings.many_algorithm_file_name
+    )
+
+
+def _main_slice(args, outputdir, latex_commands_file, inset,
+                prepare_RLDistr, prepare_tables, prepare_scatter, prepare_figures,
+                slice_dimensions=None, slice_functions=None,
+                all_dimensions=None, function_groups=None,
+                write_html_pages=True):
+    """load the data of `args` restricted to `slice_dimensions` and
+    `slice_functions` and generate the output of the prepared parts.
+
+    `all_dimensions` and `function_groups` are the dimensions and
+    function groups of all slices, used in the html pages, by default
+    those of the loaded data. The html pages which are filled by the
+    different slices are only written when `write_html_pages` is true.
+
+    Return the data as dictionary of `DataSetList` by algorithm.
+    """
+    from . import config
+
+    print("  loading data...")
+    dsList, sortedAlgs, dictAlg = processInputArgs(args, True,
+                                                   slice_dimensions,
+                                                   slice_functions)
+    # TODO: dictAlg not really needed here anymore as we filter
+    #       dsList and then get dictAlg from there...
+
+    # filter data set lists to be compliant with all suites
+    # (useful right now only for bbob-biobj and bbob-biobj-ext data)
+    dsList = DataSetList(testbedsettings.current_testbed.filter(dsList))
+    dictAlg = dsList.dictByAlgName()
+    config.config() # make sure that the filtered settings are taken into account
+
+    if not dsList:
+        if slice_dimensions or slice_functions:
+            return {}  # no data in this slice, e.g. filtered by the testbed
+        sys.exit()
+
+    algorithm_folder = findfiles.get_output_directory_sub_folder(genericsettings.foreground_algorithm_list)
+    prepend_to_file(latex_commands_file, ['\\providecommand{\\algsfolder}{' + algorithm_folder + '/}'])
+    many_algorithms_output = os.path.join(outputdir, algorithm_folder)
+
+    print("  Will generate output data in folder %s" % many_algorithms_output)
+    print("    this might take several minutes.")
+
+    if not os.path.exists(many_algorithms_output):
+        os.makedirs(many_algorithms_output)
+        if genericsettings.verbose:
+            print('Folder %s was created.' % many_algorithms_output)
+
+    for i in dictAlg:
+        if genericsettings.isNoisy and not genericsettings.isNoiseFree:
+            dictAlg[i] = dictAlg[i].dictByNoise().get('nzall', DataSetList())
+        if genericsettings.isNoiseFree and not genericsettings.isNoisy:
+            dictAlg[i] = dictAlg[i].dictByNoise().get('noiselessall', DataSetList())
+
+    # set target values
+    config.config_target_values_setting(genericsettings.isExpensive,
+                                        genericsettings.runlength_based_targets)
+    config.config(dsList[0].get_testbed_name())
+
+    for i in dsList:
+        if i.dim not in testbedsettings.current_testbed.dimensions_to_display:
+            continue
+        # check whether current set of instances correspond to correct
+        # setting of a BBOB workshop and issue a warning otherwise:            
+        curr_instances = (dict((j, i.instancenumbers.count(j)) for j in set(i.instancenumbers)))
+        correct = False
+        for instance_set_of_interest in inset.instancesOfInterest:
+            if curr_instances == instance_set_of_interest:
+                correct = True
+        try: last_incorrect_instances
+        except: last_incorrect_instances = None
+        if not correct and curr_instances != last_incorrect_instances:
+            warnings.warn('The data of %s ' % i +
+                          '(and possibly further data) do not ' +
+                          'list the correct instances ' +
+                          'of function F%d.' % i.funcId)
+            last_incorrect_instances = curr_instances
+
+    plt.rc("axes", **inset.rcaxes)
+    plt.rc("xtick", **inset.rctick)
+    plt.rc("ytick", **inset.rctick)
+    plt.rc("font", **inset.rcfont)
+    plt.rc("legend", **inset.rclegend)
+    plt.rc('pdf', fonttype=42)
+
+    if function_groups is None:
+        function_groups = dictAlg[sortedAlgs[0]].getFuncGroups()
+    dimensions = all_dimensions or sorted(pproc.dictAlgByDim(dictAlg))
+
+    if write_html_pages:
+        _save_html_pages(many_algorithms_output, dimensions, function_groups)
+
+    # empirical cumulative distribution functions (ECDFs) aka Data profiles
+    if prepare_RLDistr:
+        config.config(dsList[0].get_testbed_name())
+
+        if (len(genericsettings.foreground_algorithm_list) == 2
+                and not genericsettings.data_only):
+            print("ECDF runlength ratio graphs...")
+
+            ds_list0 = dictAlg[sortedAlgs[0]]
+            dict_fun0 = ds_list0.dictByNoise()
+            ds_list1 = dictAlg[sortedAlgs[1]]
+            dict_fun1 = ds_list1.dictByNoise()
+
+            if len(dict_fun0) > 1 or len(dict_fun1) > 1:
+                warnings.warn('Data for functions from both the noisy and ' +
+                              'non-noisy testbeds have been found. Their ' +
+                              'results will be mixed in the "all functions" ' +
+                              'ECDF figures.')
+
+            algorithm_name0 = str_to_latex(strip_pathname1(sortedAlgs[0]))
+            algorithm_name1 = str_to_latex(strip_pathname1(sortedAlgs[1]))
+
+            algorithm_name = "%s vs %s" % (algorithm_name1, algorithm_name0)
+            ppfig.save_single_functions_html(
+                os.path.join(many_algorithms_output, genericsettings.pprldistr2_file_name),
+                algname=algorithm_name,
+                htmlPage=ppfig.HtmlPage.PPRLDISTR2,
+                function_groups=function_groups,
+                parentFileName=genericsettings.many_algorithm_file_name
+            )
+
+            # ECDFs of ERT ratios
+            dic_dim0 = ds_list0.dictByDim()
+            dic_dim1 = ds_list1.dictByDim()
+            for dim in set(dic_dim0.keys()) & set(dic_dim1.keys()):
+                if dim in testbedsettings.current_testbed.rldDimsOfInterest:
+                    # ECDF for all functions altogether
+                    try:
+                        pprldistr2.main(dic_dim0[dim], dic_dim1[dim], dim,
+                                        testbedsettings.current_testbed.rldValsOfInterest,
+                                        many_algorithms_output,
+                                        '%02dD_all' % dim)
+                    except KeyError:
+                        warnings.warn('Could not find some data in %d-D.' % dim)
+                        continue
+
+                    # ECDFs per function groups
+                    dict_fun_group0 = dic_dim0[dim].dictByFuncGroup()
+                    dict_fun_group1 = dic_dim1[dim].dictByFuncGroup()
+
+                    for fGroup in set(dict_fun_group0.keys()) & set(dict_fun_group1.keys()):
+                        pprldistr2.main(dict_fun_group1[fGroup], dict_fun_group0[fGroup], dim,
+                                        testbedsettings.current_testbed.rldValsOfInterest,
+                                        many_algorithms_output,
+                                        '%02dD_%s' % (dim, fGroup))
+
+                    # ECDFs per noise groups
+                    dict_fun0 = dic_dim0[dim].dictByNoise()
+                    dict_fun1 = dic_dim1[dim].dictByNoise()
+
+                    for fGroup in set(dict_fun0.keys()) & set(dict_fun1.keys()):
+                        pprldistr2.main(dict_fun1[fGroup], dict_fun0[fGroup], dim,
+                                        testbedsettings.current_testbed.rldValsOfInterest,
+                                        many_algorithms_output,
+                                        '%02dD_%s' % (dim, fGroup))
+
+            prepend_to_file(latex_commands_file,
+                            ['\\providecommand{\\bbobpprldistrlegendtwo}[1]{',
+                             pprldistr.caption_two(),  # depends on the config
+                             # setting, should depend
+                             # on maxfevals
+                             '}'
+                             ])
+            print_done()
+
+            if testbedsettings.current_testbed not in [testbedsettings.GECCOBiObjBBOBTestbed,
+                                                       testbedsettings.GECCOBiObjExtBBOBTestbed]:
+                print("ECDF runlength graphs...")
+                for dim in set(dic_dim0.keys()) & set(dic_dim1.keys()):
+                    pprldistr.fmax = None  # Resetting the max final value
+                    pprldistr.evalfmax = None  # Resetting the max #fevalsfactor
+                    # ECDFs of all functions altogether
+                    if dim in testbedsettings.current_testbed.rldDimsOfInterest:
+                        try:
+                            pprldistr.comp(dic_dim1[dim], dic_dim0[dim],
+                                           testbedsettings.current_testbed.rldValsOfInterest,
+                                           # TODO: let rldVals... possibly be RL-based targets
+                                           True,
+                                           many_algorithms_output, 'all')
+                        except KeyError:
+                            warnings.warn('Could not find some data in %d-D.' % dim)
+                            continue
+
+                        # ECDFs per function groups
+                        dict_fun_group0 = dic_dim0[dim].dictByFuncGroup()
+                        dict_fun_group1 = dic_dim1[dim].dictByFuncGroup()
+
+                        for fGroup in set(dict_fun_group0.keys()) & set(dict_fun_group1.keys()):
+                            pprldistr.comp(dict_fun_group1[fGroup], dict_fun_group0[fGroup],
+                                           testbedsettings.current_testbed.rldValsOfInterest, True,
+                                           many_algorithms_output,
+                                           '%s' % fGroup)
+
+                        # ECDFs per noise groups
+                        dict_fun0 = dic_dim0[dim].dictByNoise()
+                        dict_fun1 = dic_dim1[dim].dictByNoise()
+                        for fGroup in set(dict_fun0.keys()) & set(dict_fun1.keys()):
+                            pprldistr.comp(dict_fun1[fGroup], dict_fun0[fGroup],
+                                           testbedsettings.current_testbed.rldValsOfInterest, True,
+                                           many_algorithms_output,
+                                           '%s' % fGroup)
+                print_done()  # of "ECDF runlength graphs..."
+
+        # ECDFs per noise groups
+        print("ECDF graphs per noise group...")
+        grouped_ecdf_graphs(pproc.dictAlgByNoi(dictAlg),
+                            sortedAlgs,
+                            many_algorithms_output,
+                            function_groups,
+                            inset,
+                            genericsettings.many_algorithm_file_name,
+                            dimensions)
+        print_done()
+
+        # ECDFs per function groups
+        print("ECDF graphs per function group...")
+        grouped_ecdf_graphs(pproc.dictAlgByFuncGroup(dictAlg),
+                            sortedAlgs,
+                            many_algorithms_output,
+                            function_groups,
+                            inset,
+                            genericsettings.many_algorithm_file_name,
+                            dimensions)
+        print_done()
+
+        # copy-paste from above, here for each function instead of function groups:
+        print("ECDF graphs per function...")
+        if genericsettings.isRldOnSingleFcts:
+            # ECDFs for each function
+            if 1 < 3:
+                pprldmany.all_single_functions(dictAlg,
+                                               False,
+                                               sortedAlgs,
+                                               many_algorithms_output,
+                                               genericsettings.many_algorithm_file_name,
+                                               settings=inset,
+                                               dimensions=dimensions)
+            else:  # subject to removal
+                dictFG = pproc.dictAlgByFun(dictAlg)
+                for fg, tmpdictAlg in dictFG.items():
+                    dictDim = pproc.dictAlgByDim(tmpdictAlg)
+                    dims = sorted(dictDim)
+                    for i, d in enumerate(dims):
+                        entries = dictDim[d]
+                        single_fct_output_dir = (many_algorithms_output.rstrip(os.sep) + os.sep +
+                                                 'pprldmany-single-functions'
+                                                 # + os.sep + ('f%03d' % fg)
+                                                 )
+                        if not os.path.exists(single_fct_output_dir):
+                            os.makedirs(single_fct_output_dir)
+                        pprldmany.main(entries,
+                                       order=sortedAlgs,
+                                       outputdir=single_fct_output_dir,
+                                       info=('f%03d_%02dD' % (fg, d)),
+                                       settings=inset
+                                       )
+
+                    ppfig.save_single_functions_html(
+                        os.path.join(single_fct_output_dir, genericsettings.pprldmany_file_name),
+                        '',  # algorithms names are clearly visible in the figure
+                        dimensions=dims,
+                        htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
+                        header=ppfig.pprldmany_per_func_dim_header)
+        print_done()
+
+    if prepare_tables:
+        print("Generating comparison tables...")
+        prepend_to_file(latex_commands_file,
+                        ['\providecommand{\\bbobpptablesmanylegend}[1]{' +
+                         pptables.get_table_caption() + '}'])
+        dictNoi = pproc.dictAlgByNoi(dictAlg)
+        for ng, tmpdictng in dictNoi.items():
+            dictDim = pproc.dictAlgByDim(tmpdictng)
+            for d, tmpdictdim in sorted(dictDim.items()):
+                pptables.main(
+                    tmpdictdim,
+                    sortedAlgs,
+                    many_algorithms_output,
+                    ([1, 20, 38] if (testbedsettings.current_testbed.name ==
+                                     testbedsettings.testbed_name_bi) else True),
+                    latex_commands_file)
+        print_done()
+
+    if prepare_scatter and len(genericsettings.foreground_algorithm_list) == 2:
+        print("Scatter plots...")
+
+        ds_list0 = dictAlg[sortedAlgs[0]]
+        algorithm_name0 = str_to_latex(strip_pathname1(sortedAlgs[0]))
+        ds_list1 = dictAlg[sortedAlgs[1]]
+        algorithm_name1 = str_to_latex(strip_pathname1(sortedAlgs[1]))
+
+        algorithm_name = "%s vs %s" % (algorithm_name1, algorithm_name0)
+        ppfig.save_single_functions_html(
+            os.path.join(many_algorithms_output, genericsettings.ppscatter_file_name),
+            algname=algorithm_name,
+            htmlPage=ppfig.HtmlPage.PPSCATTER,
+            function_groups=function_groups,
+            parentFileName=genericsettings.many_algorithm_file_name
+        )
+
+        html_file_name = os.path.join(many_algorithms_output, genericsettings.ppscatter_file_name + '.html')
+
+        ppscatter.main(ds_list1, ds_list0, many_algorithms_output, inset)
+        prepend_to_file(latex_commands_file,
+                        ['\\providecommand{\\bbobppscatterlegend}[1]{',
+                         ppscatter.figure_caption(),
+                         '}'
+                         ])
+
+        replace_in_file(html_file_name, '##bbobppscatterlegend##', ppscatter.figure_caption(for_html=True))
+        for i, alg in enumerate(args):
+            replace_in_file(html_file_name, 'algorithm' + pptex.numtotext(i), str_to_latex(strip_pathname1(alg)))
+
+        print_done()
+
+    if prepare_figures:
+        print("Scaling figures...")
+        plt.rc("axes", labelsize=20, titlesize=24)
+        plt.rc("xtick", labelsize=20)
+        plt.rc("ytick", labelsize=20)
+        plt.rc("font", size=20)
+        plt.rc("legend", fontsize=20)
+        plt.rc('pdf', fonttype=42)
+
+        ppfigs.main(dictAlg,
+                    genericsettings.ppfigs_file_name,
+                    sortedAlgs,
+                    many_algorithms_output,
+                    latex_commands_file)
+        plt.rcdefaults()
+        print_done()
+    print("Output data written to folder %s" %
+          os.path.join(os.getcwd(), many_algorithms_output))
+
+    plt.rcdefaults()
+
+    return DataSetList(dsList).dictByAlg()
+
+
 def main(argv=None):
     r"""Main routine for post-processing the data of multiple algorithms.
 
@@ -122,6 +544,17 @@ def main(argv=None):
             useful with comparatively small budgets.
         --no-svg
             do not generate the svg figures which are used in html files
+        --export-data
+            additionally write the data of the ECDF and scaling figures
+            and of the tables into csv, json and npz files, see
+            `cocopp.ppexport`.
+        --data-only
+            write only these data files, neither figures nor tables.
+        --per-dimension
+            load and process the data one dimension at a time, and one
+            function at a time for the scaling figures and scatter
+            plots, which bounds the memory usage to the data of a
+            single dimension. No data are returned in this case.
         -
 
     Exceptions raised:
@@ -220,6 +653,13 @@ def main(argv=None):
                 genericsettings.isExpensive = True  # comprises runlength-based
             elif o == "--no-svg":
                 genericsettings.generate_svg_files = False
+            elif o == "--export-data":
+                genericsettings.export_data = True
+            elif o == "--data-only":
+                genericsettings.export_data = True
+                genericsettings.data_only = True
+            elif o == "--per-dimension":
+                genericsettings.load_per_dimension = True
             elif o == "--los-only":
                 warnings.warn("option --los-only will have no effect with rungenericmany.py")
             elif o == "--crafting-effort=":
@@ -229,6 +669,9 @@ def main(argv=None):
             else:
                 assert False, "unhandled option"
 
+        if genericsettings.data_only:  # these figures have no data export
+            prepare_scatter = False
+
         # from cocopp import bbob2010 as inset # input settings
         # TODO: conditional imports are NOT the way to go here
         if genericsettings.inputsettings == "color":
@@ -286,341 +729,54 @@ def main(argv=None):
                         + 'the file before the text run'
                         )
 
-        print("  loading data...")
-        dsList, sortedAlgs, dictAlg = processInputArgs(args, True)
-        # TODO: dictAlg not really needed here anymore as we filter
-        #       dsList and then get dictAlg from there...
-
-        # filter data set lists to be compliant with all suites
-        # (useful right now only for bbob-biobj and bbob-biobj-ext data)
-        dsList = DataSetList(testbedsettings.current_testbed.filter(dsList))
-        dictAlg = dsList.dictByAlgName()
-        config.config() # make sure that the filtered settings are taken into account
-
-        if not dsList:
-            sys.exit()
-
-        algorithm_folder = findfiles.get_output_directory_sub_folder(genericsettings.foreground_algorithm_list)
-        prepend_to_file(latex_commands_file, ['\\providecommand{\\algsfolder}{' + algorithm_folder + '/}'])
-        many_algorithms_output = os.path.join(outputdir, algorithm_folder)
-
-        print("  Will generate output data in folder %s" % many_algorithms_output)
-        print("    this might take several minutes.")
-
-        if not os.path.exists(many_algorithms_output):
-            os.makedirs(many_algorithms_output)
-            if genericsettings.verbose:
-                print('Folder %s was created.' % many_algorithms_output)
-
-        for i in dictAlg:
-            if genericsettings.isNoisy and not genericsettings.isNoiseFree:
-                dictAlg[i] = dictAlg[i].dictByNoise().get('nzall', DataSetList())
-            if genericsettings.isNoiseFree and not genericsettings.isNoisy:
-                dictAlg[i] = dictAlg[i].dictByNoise().get('noiselessall', DataSetList())
-
-        # set target values
-        from . import config
-        config.config_target_values_setting(genericsettings.isExpensive,
-                                            genericsettings.runlength_based_targets)
-        config.config(dsList[0].get_testbed_name())
-
-        for i in dsList:
-            if i.dim not in testbedsettings.current_testbed.dimensions_to_display:
-                continue
-            # check whether current set of instances correspond to correct
-            # setting of a BBOB workshop and issue a warning otherwise:            
-            curr_instances = (dict((j, i.instancenumbers.count(j)) for j in set(i.instancenumbers)))
-            correct = False
-            for instance_set_of_interest in inset.instancesOfInterest:
-                if curr_instances == instance_set_of_interest:
-                    correct = True
-            try: last_incorrect_instances
-            except: last_incorrect_instances = None
-            if not correct and curr_instances != last_incorrect_instances:
-                warnings.warn('The data of %s ' % i +
-                              '(and possibly further data) do not ' +
-                              'list the correct instances ' +
-                              'of function F%d.' % i.funcId)
-                last_incorrect_instances = curr_instances
-
-        plt.rc("axes", **inset.rcaxes)
-        plt.rc("xtick", **inset.rctick)
-        plt.rc("ytick", **inset.rctick)
-        plt.rc("font", **inset.rcfont)
-        plt.rc("legend", **inset.rclegend)
-        plt.rc('pdf', fonttype=42)
-
-        ppfig.copy_js_files(many_algorithms_output)
-
-        ppfig.save_single_functions_html(
-            os.path.join(many_algorithms_output, genericsettings.many_algorithm_file_name),
-            '',  # algorithms names are clearly visible in the figure
-            htmlPage=ppfig.HtmlPage.MANY,
-            function_groups=dictAlg[sortedAlgs[0]].getFuncGroups()
-        )
-
-        ppfig.save_single_functions_html(
-            os.path.join(many_algorithms_output, genericsettings.ppfigs_file_name),
-            '',  # algorithms names are clearly visible in the figure
-            htmlPage=ppfig.HtmlPage.PPFIGS,
-            function_groups=dictAlg[sortedAlgs[0]].getFuncGroups(),
-            parentFileName=genericsettings.many_algorithm_file_name
-        )
-
-        dimensions = sorted(pproc.dictAlgByDim(dictAlg))
-
-        ppfig.save_single_functions_html(
-            os.path.join(many_algorithms_output, genericsettings.pptables_file_name),
-            '',  # algorithms names are clearly visible in the figure
-            dimensions=dimensions,
-            htmlPage=ppfig.HtmlPage.PPTABLES,
-            function_groups=dictAlg[sortedAlgs[0]].getFuncGroups(),
-            parentFileName=genericsettings.many_algorithm_file_name
-        )
-
-        # empirical cumulative distribution functions (ECDFs) aka Data profiles
-        if prepare_RLDistr:
-            config.config(dsList[0].get_testbed_name())
-
-            if len(genericsettings.foreground_algorithm_list) == 2:
-                print("ECDF runlength ratio graphs...")
-
-                ds_list0 = dictAlg[sortedAlgs[0]]
-                dict_fun0 = ds_list0.dictByNoise()
-                ds_list1 = dictAlg[sortedAlgs[1]]
-                dict_fun1 = ds_list1.dictByNoise()
-
-                if len(dict_fun0) > 1 or len(dict_fun1) > 1:
-                    warnings.warn('Data for functions from both the noisy and ' +
-                                  'non-noisy testbeds have been found. Their ' +
-                                  'results will be mixed in the "all functions" ' +
-                                  'ECDF figures.')
-
-                algorithm_name0 = str_to_latex(strip_pathname1(sortedAlgs[0]))
-                algorithm_name1 = str_to_latex(strip_pathname1(sortedAlgs[1]))
-
-                algorithm_name = "%s vs %s" % (algorithm_name1, algorithm_name0)
-                ppfig.save_single_functions_html(
-                    os.path.join(many_algorithms_output, genericsettings.pprldistr2_file_name),
-                    algname=algorithm_name,
-                    htmlPage=ppfig.HtmlPage.PPRLDISTR2,
-                    function_groups=ds_list0.getFuncGroups(),
-                    parentFileName=genericsettings.many_algorithm_file_name
-                )
-
-                # ECDFs of ERT ratios
-                dic_dim0 = ds_list0.dictByDim()
-                dic_dim1 = ds_list1.dictByDim()
-                for dim in set(dic_dim0.keys()) & set(dic_dim1.keys()):
-                    if dim in testbedsettings.current_testbed.rldDimsOfInterest:
-                        # ECDF for all functions altogether
-                        try:
-                            pprldistr2.main(dic_dim0[dim], dic_dim1[dim], dim,
-                                            testbedsettings.current_testbed.rldValsOfInterest,
-                                            many_algorithms_output,
-                                            '%02dD_all' % dim)
-                        except KeyError:
-                            warnings.warn('Could not find some data in %d-D.' % dim)
-                            continue
-
-                        # ECDFs per function groups
-                        dict_fun_group0 = dic_dim0[dim].dictByFuncGroup()
-                        dict_fun_group1 = dic_dim1[dim].dictByFuncGroup()
-
-                        for fGroup in set(dict_fun_group0.keys()) & set(dict_fun_group1.keys()):
-                            pprldistr2.main(dict_fun_group1[fGroup], dict_fun_group0[fGroup], dim,
-                                            testbedsettings.current_testbed.rldValsOfInterest,
-                                            many_algorithms_output,
-                                            '%02dD_%s' % (dim, fGroup))
-
-                        # ECDFs per noise groups
-                        dict_fun0 = dic_dim0[dim].dictByNoise()
-                        dict_fun1 = dic_dim1[dim].dictByNoise()
-
-                        for fGroup in set(dict_fun0.keys()) & set(dict_fun1.keys()):
-                            pprldistr2.main(dict_fun1[fGroup], dict_fun0[fGroup], dim,
-                                            testbedsettings.current_testbed.rldValsOfInterest,
-                                            many_algorithms_output,
-                                            '%02dD_%s' % (dim, fGroup))
-
-                prepend_to_file(latex_commands_file,
-                                ['\\providecommand{\\bbobpprldistrlegendtwo}[1]{',
-                                 pprldistr.caption_two(),  # depends on the config
-                                 # setting, should depend
-                                 # on maxfevals
-                                 '}'
-                                 ])
-                print_done()
-
-                if testbedsettings.current_testbed not in [testbedsettings.GECCOBiObjBBOBTestbed,
-                                                           testbedsettings.GECCOBiObjExtBBOBTestbed]:
-                    print("ECDF runlength graphs...")
-                    for dim in set(dic_dim0.keys()) & set(dic_dim1.keys()):
-                        pprldistr.fmax = None  # Resetting the max final value
-                        pprldistr.evalfmax = None  # Resetting the max #fevalsfactor
-                        # ECDFs of all functions altogether
-                        if dim in testbedsettings.current_testbed.rldDimsOfInterest:
-                            try:
-                                pprldistr.comp(dic_dim1[dim], dic_dim0[dim],
-                                               testbedsettings.current_testbed.rldValsOfInterest,
-                                               # TODO: let rldVals... possibly be RL-based targets
-                                               True,
-                                               many_algorithms_output, 'all')
-                            except KeyError:
-                                warnings.warn('Could not find some data in %d-D.' % dim)
-                                continue
-
-                            # ECDFs per function groups
-                            dict_fun_group0 = dic_dim0[dim].dictByFuncGroup()
-                            dict_fun_group1 = dic_dim1[dim].dictByFuncGroup()
-
-                            for fGroup in set(dict_fun_group0.keys()) & set(dict_fun_group1.keys()):
-                                pprldistr.comp(dict_fun_group1[fGroup], dict_fun_group0[fGroup],
-                                               testbedsettings.current_testbed.rldValsOfInterest, True,
-                                               many_algorithms_output,
-                                               '%s' % fGroup)
-
-                            # ECDFs per noise groups
-                            dict_fun0 = dic_dim0[dim].dictByNoise()
-                            dict_fun1 = dic_dim1[dim].dictByNoise()
-                            for fGroup in set(dict_fun0.keys()) & set(dict_fun1.keys()):
-                                pprldistr.comp(dict_fun1[fGroup], dict_fun0[fGroup],
-                                               testbedsettings.current_testbed.rldValsOfInterest, True,
-                                               many_algorithms_output,
-                                               '%s' % fGroup)
-                    print_done()  # of "ECDF runlength graphs..."
-
-            # ECDFs per noise groups
-            print("ECDF graphs per noise group...")
-            grouped_ecdf_graphs(pproc.dictAlgByNoi(dictAlg),
-                                sortedAlgs,
-                                many_algorithms_output,
-                                dictAlg[sortedAlgs[0]].getFuncGroups(),
-                                inset,
-                                genericsettings.many_algorithm_file_name)
-            print_done()
-
-            # ECDFs per function groups
-            print("ECDF graphs per function group...")
-            grouped_ecdf_graphs(pproc.dictAlgByFuncGroup(dictAlg),
-                                sortedAlgs,
-                                many_algorithms_output,
-                                dictAlg[sortedAlgs[0]].getFuncGroups(),
-                                inset,
-                                genericsettings.many_algorithm_file_name)
-            print_done()
-
-            # copy-paste from above, here for each function instead of function groups:
-            print("ECDF graphs per function...")
-            if genericsettings.isRldOnSingleFcts:
-                # ECDFs for each function
-                if 1 < 3:
-                    pprldmany.all_single_functions(dictAlg,
-                                                   False,
-                                                   sortedAlgs,
-                                                   many_algorithms_output,
-                                                   genericsettings.many_algorithm_file_name,
-                                                   settings=inset)
-                else:  # subject to removal
-                    dictFG = pproc.dictAlgByFun(dictAlg)
-                    for fg, tmpdictAlg in dictFG.items():
-                        dictDim = pproc.dictAlgByDim(tmpdictAlg)
-                        dims = sorted(dictDim)
-                        for i, d in enumerate(dims):
-                            entries = dictDim[d]
-                            single_fct_output_dir = (many_algorithms_output.rstrip(os.sep) + os.sep +
-                                                     'pprldmany-single-functions'
-                                                     # + os.sep + ('f%03d' % fg)
-                                                     )
-                            if not os.path.exists(single_fct_output_dir):
-                                os.makedirs(single_fct_output_dir)
-                            pprldmany.main(entries,
-                                           order=sortedAlgs,
-                                           outputdir=single_fct_output_dir,
-                                           info=('f%03d_%02dD' % (fg, d)),
-                                           settings=inset
-                                           )
-
-                        ppfig.save_single_functions_html(
-                            os.path.join(single_fct_output_dir, genericsettings.pprldmany_file_name),
-                            '',  # algorithms names are clearly visible in the figure
-                            dimensions=dims,
-                            htmlPage=ppfig.HtmlPage.NON_SPECIFIED,
-                            header=ppfig.pprldmany_per_func_dim_header)
-            print_done()
-
-        if prepare_tables:
-            print("Generating comparison tables...")
-            prepend_to_file(latex_commands_file,
-                            ['\providecommand{\\bbobpptablesmanylegend}[1]{' +
-                             pptables.get_table_caption() + '}'])
-            dictNoi = pproc.dictAlgByNoi(dictAlg)
-            for ng, tmpdictng in dictNoi.items():
-                dictDim = pproc.dictAlgByDim(tmpdictng)
-                for d, tmpdictdim in sorted(dictDim.items()):
-                    pptables.main(
-                        tmpdictdim,
-                        sortedAlgs,
-                        many_algorithms_output,
-                        ([1, 20, 38] if (testbedsettings.current_testbed.name ==
-                                         testbedsettings.testbed_name_bi) else True),
-                        latex_commands_file)
-            print_done()
-
-        if prepare_scatter and len(genericsettings.foreground_algorithm_list) == 2:
-            print("Scatter plots...")
-
-            ds_list0 = dictAlg[sortedAlgs[0]]
-            algorithm_name0 = str_to_latex(strip_pathname1(sortedAlgs[0]))
-            ds_list1 = dictAlg[sortedAlgs[1]]
-            algorithm_name1 = str_to_latex(strip_pathname1(sortedAlgs[1]))
-
-            algorithm_name = "%s vs %s" % (algorithm_name1, algorithm_name0)
-            ppfig.save_single_functions_html(
-                os.path.join(many_algorithms_output, genericsettings.ppscatter_file_name),
-                algname=algorithm_name,
-                htmlPage=ppfig.HtmlPage.PPSCATTER,
-                function_groups=ds_list0.getFuncGroups(),
-                parentFileName=genericsettings.many_algorithm_file_name
-            )
-
-            html_file_name = os.path.join(many_algorithms_output, genericsettings.ppscatter_file_name + '.html')
-
-            ppscatter.main(ds_list1, ds_list0, many_algorithms_output, inset)
-            prepend_to_file(latex_commands_file,
-                            ['\\providecommand{\\bbobppscatterlegend}[1]{',
-                             ppscatter.figure_caption(),
-                             '}'
-                             ])
-
-            replace_in_file(html_file_name, '##bbobppscatterlegend##', ppscatter.figure_caption(for_html=True))
-            for i, alg in enumerate(args):
-                replace_in_file(html_file_name, 'algorithm' + pptex.numtotext(i), str_to_latex(strip_pathname1(alg)))
-
-            print_done()
-
-        if prepare_figures:
-            print("Scaling figures...")
-            plt.rc("axes", labelsize=20, titlesize=24)
-            plt.rc("xtick", labelsize=20)
-            plt.rc("ytick", labelsize=20)
-            plt.rc("font", size=20)
-            plt.rc("legend", fontsize=20)
-            plt.rc('pdf', fonttype=42)
-
-            ppfigs.main(dictAlg,
-                        genericsettings.ppfigs_file_name,
-                        sortedAlgs,
-                        many_algorithms_output,
-                        latex_commands_file)
-            plt.rcdefaults()
-            print_done()
-        print("Output data written to folder %s" %
-              os.path.join(os.getcwd(), many_algorithms_output))
-
-        plt.rcdefaults()
-
-        return DataSetList(dsList).dictByAlg()
+        if not genericsettings.load_per_dimension:
+            return _main_slice(args, outputdir, latex_commands_file, inset,
+                               prepare_RLDistr, prepare_tables,
+                               prepare_scatter, prepare_figures)
+
+        # each slice extends the foreground algorithm list again
+        foreground_algorithm_list = list(genericsettings.foreground_algorithm_list)
+        # each slice writes its commands, merged without duplicates
+        slice_commands_file = latex_commands_file + '.slice'
+        defined_commands = set()
+        if os.path.exists(slice_commands_file):
+            os.remove(slice_commands_file)
+        problems = pproc.index_file_problems(list(args) + [
+            name for names in genericsettings.background.values() for name in names])
+        dimensions = sorted(set(dim for dim, _ in problems))
+        function_groups = OrderedDict()
+        for dim in dimensions:
+            print("  Dimension %d..." % dim)
+            genericsettings.foreground_algorithm_list[:] = foreground_algorithm_list
+            dict_alg = _main_slice(args, outputdir, slice_commands_file, inset,
+                                   prepare_RLDistr, prepare_tables, False, False,
+                                   slice_dimensions=[dim],
+                                   all_dimensions=dimensions,
+                                   write_html_pages=False)
+            for ds_list in dict_alg.values():
+                function_groups.update(ds_list.getFuncGroups())
+            del dict_alg
+            _merge_latex_commands(slice_commands_file, latex_commands_file,
+                                  defined_commands)
+        if not function_groups:
+            sys.exit()  # no data in any dimension
+        # the html pages are written once, as the first dimensions may have no data
+        _save_html_pages(
+            os.path.join(outputdir, findfiles.get_output_directory_sub_folder(
+                genericsettings.foreground_algorithm_list)),
+            dimensions, function_groups)
+        if prepare_scatter or prepare_figures:
+            for fun in sorted(set(fun for _, fun in problems)):
+                print("  Function %d..." % fun)
+                genericsettings.foreground_algorithm_list[:] = foreground_algorithm_list
+                _main_slice(args, outputdir, slice_commands_file, inset,
+                            False, False, prepare_scatter, prepare_figures,
+                            slice_functions=[fun],
+                            all_dimensions=dimensions,
+                            function_groups=function_groups,
+                            write_html_pages=False)
+                _merge_latex_commands(slice_commands_file, latex_commands_file,
+                                      defined_commands)
 
 
 
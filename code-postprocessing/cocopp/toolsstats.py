@@ -395,6 +395,63 @@ def simulated_evals(evals, nfails,
                                if indices[i] >= len(evals) - nfails]
     return sorted(sums)
 
+def simulated_restarts(evals, maxevals, samplesize, restarts=True):
+    """return simulated runlengths for many targets or problems at once.
+
+    Input:
+      - *evals* -- 2-D array, one row of runlengths per target or
+        problem, `np.nan` for unsuccessful runs
+      - *maxevals* -- array of the runlengths of all runs, broadcastable
+        to the shape of `evals`
+      - *samplesize* -- number of simulated runlengths per row
+      - *restarts* -- if `False`, an unsuccessful run gives `np.inf`
+        instead of a restart
+
+    Return:
+       array of shape ``(len(evals), samplesize)``, all `np.inf` in rows
+       without any successful run.
+
+    This is the vectorized equivalent of calling `drawSP` on each row:
+    the first run of each sample is drawn as in `randint_derandomized`
+    and unsuccessful runs are restarted with a uniformly drawn run until
+    a successful run is drawn.
+
+    >>> import numpy as np
+    >>> from cocopp.toolsstats import simulated_restarts
+    >>> np.random.seed(3)
+    >>> evals = [[10, 20, np.nan], [np.nan, np.nan, np.nan]]
+    >>> x = simulated_restarts(evals, [10, 20, 30], 6)
+    >>> x.shape, all(np.isfinite(x[0])), all(np.isinf(x[1]))
+    ((2, 6), True, True)
+    >>> sorted(simulated_restarts(evals, [10, 20, 30], 6, restarts=False)[0])
+    [10.0, 10.0, 20.0, 20.0, inf, inf]
+
+    """
+    evals = np.asarray(evals, dtype=float)
+    nrows, nruns = evals.shape
+    samplesize = int(samplesize)
+    if nruns == 0:
+        return np.inf * np.ones((nrows, samplesize))
+    maxevals = np.broadcast_to(np.asarray(maxevals, dtype=float), evals.shape)
+    successful = np.isnan(evals) == False
+    solved = successful.any(axis=1)
+    rows = np.arange(nrows)[:, None]
+    # derandomized first runs: each chunk of nruns samples is a permutation
+    nchunks = -(-samplesize // nruns)
+    idx = np.argsort(np.random.rand(nrows, nchunks, nruns), axis=2
+                     ).reshape(nrows, nchunks * nruns)[:, :samplesize]
+    sums = np.zeros((nrows, samplesize))
+    if restarts:
+        failing = (successful[rows, idx] == False) & solved[:, None]
+        while failing.any():
+            i, j = np.nonzero(failing)
+            sums[i, j] += maxevals[i, idx[i, j]]
+            idx[i, j] = np.random.randint(0, nruns, len(i))
+            failing[i, j] = successful[i, idx[i, j]] == False
+    sums += np.where(successful[rows, idx], evals[rows, idx], np.inf)
+    sums[solved == False] = np.inf
+    return sums
+
 
 def draw(data, percentiles, samplesize=1e3, func=sp1, args=()):
     """Generates the empirical bootstrap distribution from a sample.
@@ -6,6 +6,7 @@ import argparse
 
 from cocoprep.archive_load_data import parse_range, create_path, remove_empty_file
 from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, parse_problem_instance_file_name
+from cocoprep.archive_load_data import read_archive_lines
 from cocoprep.archive_exceptions import PreprocessingException, PreprocessingWarning
 
 
@@ -44,15 +45,13 @@ def summary_analysis(input_path, output_file, lower_bound, upper_bound, function
             lowest = [float(lower_bound)] * dimension
             highest = [float(upper_bound)] * dimension
 
-            with open(input_file, 'r') as f_in:
-                for line in f_in:
-                    for idx, number in enumerate(line.split()[column_start:column_end]):
-                        num = float(number)
-                        if num > highest[idx]:
-                            highest[idx] = num
-                        if num < lowest[idx]:
-                            lowest[idx] = num
-                f_in.close()
+            for line in read_archive_lines(input_file):
+                for idx, number in enumerate(line.split()[column_start:column_end]):
+                    num = float(number)
+                    if num > highest[idx]:
+                        highest[idx] = num
+                    if num < lowest[idx]:
+                        lowest[idx] = num
 
             f_out.write('{}_f{:02d}_i{:02d}_d{:02d}'.format(suite_name, function, instance, dimension))
             for number in lowest:
@@ -106,15 +105,14 @@ def archive_analysis(input_paths, output_path, lower_bound, upper_bound, functio
                                                                                                  dimension))
         f_out = open(output_file, 'a')
 
-        with open(input_file, 'r') as f_in:
-            for line in f_in:
-                if len(line) == 0 or line[0] == '%' or len(line.split()) < 4:
-                    continue
-                else:
-                    for number in line.split()[column_start:column_end]:
-                        if (float(number) > upper_bound) or (float(number) < lower_bound):
-                            string = '\t'.join(line.split()[:column_end])
-                            f_out.write('{}\n'.format(string))
+        for line in read_archive_lines(input_file):
+            if len(line) == 0 or line[0] == '%' or len(line.split()) < 4:
+                continue
+            else:
+                for number in line.split()[column_start:column_end]:
+                    if (float(number) > upper_bound) or (float(number) < lower_bound):
+                        string = '\t'.join(line.split()[:column_end])
+                        f_out.write('{}\n'.format(string))
 
         f_out.close()
         remove_empty_file(output_file)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import argparse
+
+import numpy as np
+
+from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, create_path, parse_range
+from cocoprep.archive_load_data import is_binary_archive, read_binary_archive, BinaryArchiveBlock
+from cocoprep.archive_load_data import write_binary_archive_header, write_binary_archive_comment
+from cocoprep.archive_load_data import write_binary_archive_solutions
+from cocoprep.archive_exceptions import PreprocessingException, PreprocessingWarning
+
+# The number of solutions that are converted at once
+_LINES_PER_BLOCK = 65536
+
+
+def _get_precision(word):
+    """Returns the number of digits after the decimal point of the given number in exponential notation.
+    """
+    mantissa = word.lower().split('e')[0]
+    return len(mantissa.split('.')[1]) if '.' in mantissa else 0
+
+
+def _is_integer(word):
+    """Returns True if the given number is output as an integer and False otherwise.
+    """
+    return not any(character in word for character in '.eEnN')
+
+
+def _write_binary_solutions(f_out, lines):
+    """Writes the solutions in the given lines of an archive file with the same number of columns to the file in the
+       binary format. The number of decimal values output as integers and the precisions are inferred from the first
+       line.
+    """
+    words = lines[0].split()
+    integer_variables = 0
+    while 3 + integer_variables < len(words) and _is_integer(words[3 + integer_variables]):
+        integer_variables += 1
+    precision_x = 8
+    if 3 + integer_variables < len(words):
+        precision_x = _get_precision(words[3 + integer_variables])
+    values = np.array([line.split() for line in lines], dtype=float).reshape(len(lines), len(words))
+    write_binary_archive_solutions(f_out, values[:, 0], values[:, 1:3], values[:, 3:], integer_variables,
+                                   _get_precision(words[1]), precision_x)
+
+
+def text_to_binary(input_file, output_file):
+    """Converts the given archive file in the text format to an archive file in the binary format. The comments are
+       kept, while empty lines and lines that cannot be parsed are skipped. Converting the result back to the text
+       format gives the original lines for files written by the logger.
+       :param input_file: name of the archive file in the text format
+       :param output_file: name of the archive file in the binary format
+    """
+    with open(input_file, 'r') as f_in:
+        with open(output_file, 'wb') as f_out:
+            write_binary_archive_header(f_out)
+            lines = []
+            for line in f_in:
+                if line[:1] == '%' or len(line.split()) < 3 or (len(lines) > 0 and (
+                        len(lines) == _LINES_PER_BLOCK or len(line.split()) != len(lines[0].split()))):
+                    # Output the solutions read so far
+                    if len(lines) > 0:
+                        _write_binary_solutions(f_out, lines)
+                        lines = []
+                if line[:1] == '%':
+                    write_binary_archive_comment(f_out, line)
+                elif len(line.split()) >= 3:
+                    lines.append(line)
+                elif line.strip():
+                    print('Problem in file {}, line {}, skipping line'.format(input_file, line))
+            if len(lines) > 0:
+                _write_binary_solutions(f_out, lines)
+            f_out.close()
+        f_in.close()
+
+
+def binary_to_text(input_file, output_file):
+    """Converts the given archive file in the binary format to an archive file in the text format (with the lines as
+       they would have been output by the logger).
+       :param input_file: name of the archive file in the binary format
+       :param output_file: name of the archive file in the text format
+    """
+    with open(output_file, 'w') as f_out:
+        for record in read_binary_archive(input_file):
+            if isinstance(record, BinaryArchiveBlock):
+                f_out.writelines(record.lines())
+            else:
+                f_out.write(record)
+        f_out.close()
+
+
+def archive_convert(input_path, output_path, output_format, functions, instances, dimensions):
+    """Converts all archives in the input path to the given output format ('text' or 'binary') and stores them in the
+       output path under the same names. Archives that are already in the output format are copied.
+    """
+    # Check whether input path exists
+    input_files = get_file_name_list(input_path, ".adat")
+    if len(input_files) == 0:
+        raise PreprocessingException('Folder {} does not exist or is empty'.format(input_path))
+
+    for input_file in input_files:
+        try:
+            (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
+            if (function not in functions) or (dimension not in dimensions) or (instance and instance not in instances):
+                continue
+        except PreprocessingWarning as warning:
+            print('Skipping file {}\n{}'.format(input_file, warning))
+            continue
+
+        print(input_file)
+
+        output_file = input_file.replace(input_path, output_path)
+        create_path(os.path.dirname(output_file))
+        binary = is_binary_archive(input_file)
+        if binary and output_format == 'text':
+            binary_to_text(input_file, output_file)
+        elif not binary and output_format == 'binary':
+            text_to_binary(input_file, output_file)
+        else:
+            with open(input_file, 'rb') as f_in:
+                with open(output_file, 'wb') as f_out:
+                    f_out.write(f_in.read())
+                    f_out.close()
+                f_in.close()
+
+
+if __name__ == '__main__':
+    """Converts archives from the text to the binary format or the other way around.
+
+       The binary format is written by the logger with the observer option `archive_format: binary` and described in
+       logger_biobj.c. Since the text format contains rounded values, converting an archive from the binary to the text
+       format and back does not give the original values, while the opposite conversion is exact.
+    """
+    import timing
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-f', '--functions', type=parse_range, default=range(1, 56),
+                        help='function numbers to be included in the processing of archives')
+    parser.add_argument('-i', '--instances', type=parse_range, default=range(1, 11),
+                        help='instance numbers to be included in the processing of archives')
+    parser.add_argument('-d', '--dimensions', type=parse_range, default=[2, 3, 5, 10, 20, 40],
+                        help='dimensions to be included in the processing of archives')
+    parser.add_argument('format', choices=['text', 'binary'], help='format of the output archives')
+    parser.add_argument('output', help='path to the output folder')
+    parser.add_argument('input', help='path to the input folder')
+    args = parser.parse_args()
+
+    print('Program called with arguments: \ninput folder = {}\noutput folder = {}'.format(args.input, args.output))
+    print('functions = {} \ninstances = {}\ndimensions = {}'.format(args.functions, args.instances, args.dimensions))
+    print('format = {}\n'.format(args.format))
+
+    # Convert the archives
+    archive_convert(args.input, args.output, args.format, args.functions, args.instances, args.dimensions)
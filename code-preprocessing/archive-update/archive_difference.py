@@ -2,45 +2,153 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
-import difflib
+import sys
 import argparse
+import difflib
+import multiprocessing
+
+import numpy as np
 
-from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, parse_range
+from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, parse_range, read_archive_lines
 from cocoprep.archive_exceptions import PreprocessingException, PreprocessingWarning
 
 
-def archive_difference(first_path, second_path, differences, functions, instances, dimensions):
-    """Outputs the differences between the matching archive files found in the first and second path.
+def _solution_keys(lines):
+    """Returns the positions of the solutions among the given archive lines and their objective vectors (f1, f2) in an
+       array with two columns. Comments, empty lines and lines that cannot be parsed are skipped.
     """
-    # Check whether first paths exist
-    first_files = get_file_name_list(first_path, ".adat")
-    if len(first_files) == 0:
-        raise PreprocessingException('Folder {} does not exist or is empty'.format(first_path))
-
-    for i, first_file in enumerate(first_files):
+    positions = []
+    values = []
+    for position, line in enumerate(lines):
+        if line[:1] == '%':
+            continue
+        words = line.split()
+        if len(words) < 3:
+            continue
         try:
-            (suite_name, function, instance, dimension) = parse_archive_file_name(first_file)
-            if (function not in functions) or (dimension not in dimensions):
-                continue
-            if not instance:
-                raise PreprocessingWarning('Checking for differences does not work on files with multiple archives, '
-                                           'use archive_split')
-            if instance not in instances:
-                continue
-        except PreprocessingWarning as warning:
-            print('Skipping file {}\n{}'.format(first_file, warning))
-            first_files[i] = ''
+            values.append((float(words[1]), float(words[2])))
+        except ValueError:
             continue
-        print(first_file)
+        positions.append(position)
+    return np.array(positions, dtype=np.int64), np.array(values, dtype=float).reshape(-1, 2)
+
+
+def matching_lines(first_lines, second_lines):
+    """Returns the positions of the lines of the first and second list that match each other in two arrays of equal
+       length, increasing in both lists.
+
+       The solutions of both lists are merge-joined on their objective vectors (f1, f2): both are sorted together and
+       a solution is paired with the solution of the other list that has the same objective vector (the k-th solution
+       with a vector in one list with the k-th one in the other). Two paired solutions match if their lines are equal,
+       that is, also their evaluation numbers and decision variables are equal. Of the matching pairs, those that keep
+       the order of both lists are returned.
+    """
+    first_positions, first_f = _solution_keys(first_lines)
+    second_positions, second_f = _solution_keys(second_lines)
+    positions = np.concatenate((first_positions, second_positions))
+    f = np.concatenate((first_f, second_f))
+    source = np.concatenate((np.zeros(len(first_f), dtype=np.int64), np.ones(len(second_f), dtype=np.int64)))
+    # Sort on (f1, f2) and, for equal vectors, the solutions of the first list before those of the second one
+    order = np.lexsort((positions, source, f[:, 1], f[:, 0]))
+    f, source, positions = f[order], source[order], positions[order]
+
+    # Within each run of equal vectors, the k-th solution of the first list is paired with the k-th of the second one
+    is_new_vector = np.ones(len(f), dtype=bool)
+    is_new_vector[1:] = np.any(f[1:] != f[:-1], axis=1)
+    run_starts = np.flatnonzero(is_new_vector)
+    run = np.cumsum(is_new_vector) - 1
+    run_end = np.append(run_starts[1:], len(f))[run]
+    first_count = np.add.reduceat(1 - source, run_starts)[run] if len(f) > 0 else source
+    partner = np.arange(len(f)) + first_count
+    is_paired = (source == 0) & (partner < run_end)
+    first_matches = positions[is_paired]
+    second_matches = positions[partner[is_paired]]
+
+    # Keep the pairs with equal lines in the order of the first list, as long as they are also in the order of the
+    # second one
+    is_equal = np.array([first_lines[i] == second_lines[j]
+                         for i, j in zip(first_matches.tolist(), second_matches.tolist())], dtype=bool)
+    first_matches, second_matches = first_matches[is_equal], second_matches[is_equal]
+    order = np.argsort(first_matches, kind='mergesort')
+    first_matches, second_matches = first_matches[order], second_matches[order]
+    is_ordered = second_matches > np.maximum.accumulate(np.append(-1, second_matches))[:-1]
+    return first_matches[is_ordered], second_matches[is_ordered]
 
-    # Check whether second paths exist
-    second_files = get_file_name_list(second_path, ".adat")
-    if len(second_files) == 0:
-        raise PreprocessingException('Folder {} does not exist or is empty'.format(second_path))
 
-    for i, second_file in enumerate(second_files):
+def _shift_hunk_header(line, first_offset, second_offset):
+    """Returns the hunk header of a unified diff of parts of two lists, such that it refers to the whole lists, where
+       the parts begin at the given offsets.
+    """
+    first_range, second_range = line.split()[1:3]
+    result = []
+    for line_range, offset in ((first_range[1:], first_offset), (second_range[1:], second_offset)):
+        beginning = line_range.split(',')
+        beginning[0] = str(int(beginning[0]) + offset)
+        result.append(','.join(beginning))
+    return '@@ -{} +{} @@\n'.format(*result)
+
+
+def file_difference(first_file, second_file, n=3):
+    """Returns the differences between the lines (including comments) of the given archive files in the unified diff
+       format with n lines of context, as difflib.unified_diff does. An empty string is returned if the files are equal.
+
+       Instead of searching the whole files for their longest common subsequence, the lines that match in both files
+       are found with a merge-join of their solutions (see matching_lines). The regions between them that differ are
+       grouped into hunks like difflib does and only these regions (with their context) are passed to
+       difflib.unified_diff.
+    """
+    first_lines = list(read_archive_lines(first_file))
+    second_lines = list(read_archive_lines(second_file))
+    first_matches, second_matches = matching_lines(first_lines, second_lines)
+
+    # The regions between the matching lines (and before the first and after the last one) that differ
+    first_starts = np.append(0, first_matches + 1)
+    first_ends = np.append(first_matches, len(first_lines))
+    second_starts = np.append(0, second_matches + 1)
+    second_ends = np.append(second_matches, len(second_lines))
+    regions = [(i1, i2, j1, j2) for (i1, i2, j1, j2) in
+               zip(first_starts.tolist(), first_ends.tolist(), second_starts.tolist(), second_ends.tolist())
+               if first_lines[i1:i2] != second_lines[j1:j2]]
+    if len(regions) == 0:
+        return ''
+
+    # Regions with up to 2 * n equal lines between them belong to the same hunk
+    groups = [list(regions[0])]
+    for (i1, i2, j1, j2) in regions[1:]:
+        if i1 - groups[-1][1] <= 2 * n:
+            groups[-1][1], groups[-1][3] = i2, j2
+        else:
+            groups.append([i1, i2, j1, j2])
+
+    result = ['--- f1\n', '+++ f2\n']
+    for (i1, i2, j1, j2) in groups:
+        i1, j1 = max(i1 - n, 0), max(j1 - n, 0)
+        i2, j2 = min(i2 + n, len(first_lines)), min(j2 + n, len(second_lines))
+        for line in list(difflib.unified_diff(first_lines[i1:i2], second_lines[j1:j2], n=n))[2:]:
+            result.append(_shift_hunk_header(line, i1, j1) if line.startswith('@@ ') else line)
+    return ''.join(result)
+
+
+def _file_difference(args):
+    """Calls file_difference with the given tuple of file names in a worker process and returns the name of the
+       files together with their differences.
+    """
+    return os.path.basename(args[0]), file_difference(*args)
+
+
+def _get_archive_files(path, functions, instances, dimensions):
+    """Returns the names of the archive files in the given path that correspond to the given functions, instances
+       and dimensions.
+    """
+    # Check whether the path exists
+    input_files = get_file_name_list(path, ".adat")
+    if len(input_files) == 0:
+        raise PreprocessingException('Folder {} does not exist or is empty'.format(path))
+
+    result = []
+    for input_file in input_files:
         try:
-            (suite_name, function, instance, dimension) = parse_archive_file_name(second_file)
+            (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
             if (function not in functions) or (dimension not in dimensions):
                 continue
             if not instance:
@@ -49,28 +157,40 @@ def archive_difference(first_path, second_path, differences, functions, instance
             if instance not in instances:
                 continue
         except PreprocessingWarning as warning:
-            print('Skipping file {}\n{}'.format(second_file, warning))
-            second_files[i] = ''
+            print('Skipping file {}\n{}'.format(input_file, warning))
             continue
-        print(second_file)
-
-    with open(differences, 'a') as f_out:
-        for first_file in first_files:
-            if first_file != '':
-                file_name = os.path.basename(first_file)
-                if file_name in [os.path.basename(second_file) for second_file in second_files]:
-                    second_file = os.path.join(second_path, file_name)
-                    with open(first_file, 'r') as f1:
-                        with open(second_file, 'r') as f2:
-                            # Find and output the differences
-                            diff = difflib.unified_diff(f1.readlines(), f2.readlines(), fromfile='f1', tofile='f2')
-                            f_out.write('{}\n'.format(file_name))
-                            print(file_name)
-                            for line in diff:
-                                f_out.write(line)
-                        f2.close()
-                    f1.close()
-        f_out.close()
+        print(input_file)
+        result.append(input_file)
+    return result
+
+
+def archive_difference(first_path, second_path, differences, functions, instances, dimensions, processes=1):
+    """Outputs the differences between the matching archive files found in the first and second path.
+       :param processes: number of worker processes among which the pairs of files are distributed (the files are
+       compared in this process if 1 and the number of CPUs is used if None)
+    """
+    first_files = _get_archive_files(first_path, functions, instances, dimensions)
+    second_files = _get_archive_files(second_path, functions, instances, dimensions)
+
+    second_names = set(os.path.basename(second_file) for second_file in second_files)
+    arguments = [(first_file, os.path.join(second_path, os.path.basename(first_file))) for first_file in first_files
+                 if os.path.basename(first_file) in second_names]
+
+    # The pairs of files are compared by the workers, while the differences are output in the order of the files
+    pool = None if processes == 1 else multiprocessing.Pool(processes)
+    try:
+        results = map(_file_difference, arguments) if pool is None else pool.imap(_file_difference, arguments)
+        with open(differences, 'a') as f_out:
+            for file_name, difference in results:
+                f_out.write('{}\n'.format(file_name))
+                f_out.write(difference)
+                print(file_name)
+                sys.stdout.flush()
+            f_out.close()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
 
 if __name__ == '__main__':
@@ -85,6 +205,9 @@ if __name__ == '__main__':
                         help='instance numbers to be included in the processing of archives')
     parser.add_argument('-d', '--dimensions', type=parse_range, default=[2, 3, 5, 10, 20, 40],
                         help='dimensions to be included in the processing of archives')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='number of processes among which the pairs of files are distributed (0 for the number '
+                             'of CPUs)')
     parser.add_argument('first', help='path to the folder with the first archives')
     parser.add_argument('second', help='path to the folder with the second archives')
     parser.add_argument('differences', help='name of the file with the differences')
@@ -95,5 +218,6 @@ if __name__ == '__main__':
     print('functions = {} \ninstances = {}\ndimensions = {}'.format(args.functions, args.instances, args.dimensions))
 
     # Analyze the archives
-    archive_difference(args.first, args.second, args.differences, args.functions, args.instances, args.dimensions)
+    archive_difference(args.first, args.second, args.differences, args.functions, args.instances, args.dimensions,
+                       args.processes or None)
 
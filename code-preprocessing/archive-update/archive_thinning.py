@@ -3,8 +3,11 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import os
 import argparse
+import itertools
 
-from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name
+import numpy as np
+
+from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, read_archive_lines
 from cocoprep.archive_load_data import create_path, parse_range
 from cocoprep.archive_exceptions import PreprocessingException, PreprocessingWarning
 from cocoprep.coco_archive import Archive, log_level
@@ -20,6 +23,9 @@ def archive_thinning(input_path, output_path, thinning_precision, currently_nond
        are currently nondominated within the thinned archive are output. The two extreme solutions are not output.
        If currently_nondominated is False, only the solutions that are contained in the final archive are output.
        In this case, the two extreme solutions are also output.
+
+       The solutions are read into arrays and only the first solution in each cell of the thinning grid is added to
+       the thinned archive, since the others are equal to it.
     """
     # Check whether input path exists
     input_files = get_file_name_list(input_path, ".adat")
@@ -54,42 +60,44 @@ def archive_thinning(input_path, output_path, thinning_precision, currently_nond
         extreme2_text = thinned_archive.get_next_solution_text()
         extreme1 = [float(x) for x in extreme1_text.split()[1:3]]
         extreme2 = [float(x) for x in extreme2_text.split()[1:3]]
-        ideal = [min(x, y) for x, y in zip(extreme1, extreme2)]
-        nadir = [max(x, y) for x, y in zip(extreme1, extreme2)]
-        normalization = [x - y for x, y in zip(nadir, ideal)]
-
-        with open(input_file, 'r') as f_in:
-            for line in f_in:
-
-                if line[0] == '%':
-                    f_out.write(line)
-
-                elif len(line) == 0 or len(line.split()) < 3:
-                    continue
-
-                elif line.split()[0] == '0':
-                    # The line contains an extreme solution, do nothing
-                    all_solutions += 1
-                    continue
-
-                else:
-                    # The line contains a 'regular' solution
-                    try:
-                        # Fill the archives with the rounded solutions values wrt the different precisions
-                        f_original = [float(x) for x in line.split()[1:3]]
-                        f_normalized = [(f_original[i] - ideal[i]) / normalization[i] for i in range(2)]
-                        f_normalized = [round(f_normalized[i] / thinning_precision) for i in range(2)]
-                        f_normalized = [ideal[i] + f_normalized[i] * thinning_precision for i in range(2)]
-                        updated = thinned_archive.add_solution(f_normalized[0], f_normalized[1], line)
-                    except IndexError:
-                        print('Problem in file {}, line {}, skipping line'.format(input_file, line))
-                        continue
-                    finally:
-                        all_solutions += 1
-
-                    if currently_nondominated and (updated == 1):
-                        thinned_solutions += 1
-                        f_out.write(line)
+        ideal = np.minimum(extreme1, extreme2)
+        normalization = np.maximum(extreme1, extreme2) - ideal
+
+        lines = list(read_archive_lines(input_file))
+
+        # Find the comments and the 'regular' solutions (the lines containing extreme solutions are only counted)
+        fields = [line.split(None, 3) for line in lines]
+        is_comment = np.array([line[:1] == '%' for line in lines], dtype=bool)
+        is_solution = np.array([len(values) >= 3 for values in fields], dtype=bool) & ~is_comment
+        all_solutions = int(np.count_nonzero(is_solution))
+        is_solution &= np.array([values[:1] != ['0'] for values in fields], dtype=bool)
+        solution_indices = np.flatnonzero(is_solution)
+        solution_fields = list(itertools.compress(fields, is_solution))
+
+        # Round the solution values wrt the thinning precision to get their cells in the grid
+        f_original = np.array([value for values in solution_fields for value in values[1:3]], dtype=float)
+        cells = np.round((f_original.reshape(-1, 2) - ideal) / normalization / thinning_precision) + 0.0
+        f_thinned = ideal + cells * thinning_precision
+
+        # All but the first solution in each cell are equal to it and cannot update the archive
+        _, first_in_cell = np.unique(np.ascontiguousarray(cells).view(np.dtype((np.void, 16))).ravel(),
+                                     return_index=True)
+        first_in_cell = np.sort(first_in_cell)
+
+        if currently_nondominated:
+            # The solutions need to be added in the original order to know which ones update the archive
+            is_output = is_comment.copy()
+            for i, (f1, f2) in zip(solution_indices[first_in_cell].tolist(), f_thinned[first_in_cell].tolist()):
+                if thinned_archive.add_solution(f1, f2, lines[i]) == 1:
+                    is_output[i] = True
+                    thinned_solutions += 1
+            f_out.writelines(itertools.compress(lines, is_output))
+        else:
+            f_out.writelines(itertools.compress(lines, is_comment))
+            thinned_archive.add_solutions(f_thinned[first_in_cell],
+                                          np.array([solution_fields[i][0] for i in first_in_cell.tolist()],
+                                                   dtype=float),
+                                          text=[lines[i] for i in solution_indices[first_in_cell].tolist()])
 
         if not currently_nondominated and (thinned_archive.number_of_solutions == 2):
             # Output the two extreme solutions if they are the only two in the archive
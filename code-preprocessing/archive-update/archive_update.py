@@ -4,8 +4,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import os
 import sys
 import argparse
+import multiprocessing
 
-from cocoprep.archive_load_data import parse_range, read_best_values, write_best_values
+from cocoprep.archive_load_data import create_path, parse_range, read_best_values, write_best_values
 from cocoprep.archive_functions import ArchiveInfo
 from cocoprep.coco_archive import Archive, log_level
 
@@ -55,7 +56,38 @@ def update_best_hypervolume(old_best_files, new_best_data, new_best_file):
     sys.stdout.flush()
 
 
-def merge_archives(input_path, output_path, functions, instances, dimensions, crop_variables):
+def merge_problem_instance(problem_instance_info, output_path, crop_variables):
+    """Merges the archives of the given problem instance (removes any dominated solutions) and stores the
+       consolidated archive in the output_path. Returns the hypervolume of the consolidated archive.
+       :param problem_instance_info: information on the problem instance and the files with its archives
+       :param output_path: output path (created if not existing before)
+       :param crop_variables: whether output archives should contain information on solution variables
+    """
+    old_level = log_level('warning')
+
+    # Create an archive for this problem instance
+    archive = Archive(problem_instance_info.suite_name, problem_instance_info.function,
+                      problem_instance_info.instance, problem_instance_info.dimension)
+
+    # Read the solutions from the files and add them to the archive
+    problem_instance_info.fill_archive(archive)
+
+    # Write the non-dominated solutions into output folder
+    problem_instance_info.write_archive_solutions(output_path, archive, crop_variables)
+
+    log_level(old_level)
+    return archive.hypervolume
+
+
+def _merge_problem_instance(args):
+    """Calls merge_problem_instance with the given tuple of arguments in a worker process and returns the name of
+       the problem instance together with the hypervolume.
+    """
+    problem_instance_info = args[0]
+    return str(problem_instance_info), merge_problem_instance(*args)
+
+
+def merge_archives(input_path, output_path, functions, instances, dimensions, crop_variables, processes=1):
     """Merges all archives from the input_path (removes any dominated solutions) and stores the consolidated archives
        in the output_path. Returns problem names and their new best hypervolume values in the form of a dictionary.
        :param input_path: input path
@@ -64,6 +96,8 @@ def merge_archives(input_path, output_path, functions, instances, dimensions, cr
        :param instances: instances to be included in the merging
        :param dimensions: dimensions to be included in the merging
        :param crop_variables: whether output archives should contain information on solution variables
+       :param processes: number of worker processes among which the problem instances are distributed (the problem
+       instances are merged in this process if 1 and the number of CPUs is used if None)
     """
     result = {}
 
@@ -71,31 +105,34 @@ def merge_archives(input_path, output_path, functions, instances, dimensions, cr
     sys.stdout.flush()
     archive_info = ArchiveInfo(input_path, functions, instances, dimensions)
 
-    print('Processing archives...')
-    sys.stdout.flush()
+    problem_instance_infos = []
     while True:
         # Get information about the next problem instance
         problem_instance_info = archive_info.get_next_problem_instance_info()
         if problem_instance_info is None:
             break
+        problem_instance_infos.append(problem_instance_info)
 
-        old_level = log_level('warning')
-
-        # Create an archive for this problem instance
-        archive = Archive(problem_instance_info.suite_name, problem_instance_info.function,
-                          problem_instance_info.instance, problem_instance_info.dimension)
-
-        # Read the solutions from the files and add them to the archive
-        problem_instance_info.fill_archive(archive)
-
-        # Write the non-dominated solutions into output folder
-        problem_instance_info.write_archive_solutions(output_path, archive, crop_variables)
-
-        result.update({str(problem_instance_info): archive.hypervolume})
-        print('{}: {:.15f}'.format(problem_instance_info, archive.hypervolume))
-        sys.stdout.flush()
-
-        log_level(old_level)
+    print('Processing archives...')
+    sys.stdout.flush()
+    # The output path is created here, such that the workers do not race to create it
+    create_path(output_path)
+    arguments = [(problem_instance_info, output_path, crop_variables)
+                 for problem_instance_info in problem_instance_infos]
+    # Each problem instance is merged into its own output file by one of the workers, while the results are
+    # collected in the order of the problem instances
+    pool = None if processes == 1 else multiprocessing.Pool(processes)
+    try:
+        merged = map(_merge_problem_instance, arguments) if pool is None else \
+            pool.imap(_merge_problem_instance, arguments)
+        for problem_name, hypervolume in merged:
+            result.update({problem_name: hypervolume})
+            print('{}: {:.15f}'.format(problem_name, hypervolume))
+            sys.stdout.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
     return result
 
@@ -123,6 +160,9 @@ if __name__ == '__main__':
                         help='don\'t include information on the variables in the output archives')
     parser.add_argument('--hyp-file', default='new_best_values_hyp.c',
                         help='name of the file to store new hypervolume values')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='number of processes among which the problem instances are distributed (0 for the '
+                             'number of CPUs)')
     parser.add_argument('output', help='path to the output folder')
     parser.add_argument('input', default=[], nargs='+', help='path(s) to the input folder(s)')
     args = parser.parse_args()
@@ -132,7 +172,7 @@ if __name__ == '__main__':
 
     # Merge the archives
     new_hypervolumes = merge_archives(args.input, args.output, args.functions, args.instances, args.dimensions,
-                                      args.crop_variables)
+                                      args.crop_variables, args.processes or None)
 
     timing.log('Finished merging', timing.now())
 
@@ -1,22 +1,58 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import sys
 import argparse
+import multiprocessing
 
-from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, get_key_value, parse_range
+import numpy as np
+
+from cocoprep.archive_load_data import get_file_name_list, parse_archive_file_name, parse_range, get_instance_index
+from cocoprep.archive_load_data import read_archive_solutions
 from cocoprep.archive_exceptions import PreprocessingException, PreprocessingWarning
 
 
-def extract_extremes(input_paths, output_file, functions, instances, dimensions):
+def file_extremes(input_file, suite_name, function, dimension):
+    """Returns the extreme points of all instances in the given archive file in the form of a string with the
+       following line for each instance:
+       [problem_name] [extreme_point_1] [extreme_point_2]
+
+       The solutions of each instance are loaded in bulk and the extreme points are found as the solutions with the
+       smallest second and first objective, respectively (ties are broken by the other objective).
+    """
+    result = ''
+    for (instance, start, end) in get_instance_index(input_file):
+        solutions = read_archive_solutions(input_file, start, end)
+        if len(solutions) < 2:
+            print('Skipping instance {} in file {}'.format(instance, input_file))
+            continue
+        extremes = [np.lexsort((solutions.f[:, 0], solutions.f[:, 1]))[0],
+                    np.lexsort((solutions.f[:, 1], solutions.f[:, 0]))[0]]
+        extreme1, extreme2 = [line.split()[1:3] for line in solutions.lines(extremes)]
+        result += '{}_f{:02d}_i{:02d}_d{:02d}\t'.format(suite_name, function, instance, dimension)
+        result += '\t'.join(extreme1) + '\t' + '\t'.join(extreme2) + '\n'
+    return result
+
+
+def _file_extremes(args):
+    """Calls file_extremes with the given tuple of arguments in a worker process and returns the name of the file
+       together with the extreme points.
+    """
+    return args[0], file_extremes(*args)
+
+
+def extract_extremes(input_paths, output_file, functions, instances, dimensions, processes=1):
     """
     Extracts the extreme points from the archives contained in input_paths and outputs them to the output_file in
     the following format:
     [problem_name] [extreme_point_1] [extreme_point_2]
 
-    Assumes the two extreme points are contained in the first two lines of every instance archive. If not, that
-    instance is skipped.
+    The extreme points are the solutions with the smallest value of the second and the first objective, respectively.
+    Instances with less than two solutions are skipped.
     Performs no kind of sorting or filtering of the problems, therefore if multiple copies of one problem are present
     in the input, multiple lines for one problem will be also present in the output.
+    :param processes: number of worker processes among which the files are distributed (the files are processed in
+    this process if 1 and the number of CPUs is used if None)
     """
 
     # Check whether input paths exist
@@ -24,44 +60,32 @@ def extract_extremes(input_paths, output_file, functions, instances, dimensions)
     if len(input_files) == 0:
         raise PreprocessingException('Folder {} does not exist or is empty'.format(input_paths))
 
-    # Read the input files one by one and save the result in the output_file
-    with open(output_file, 'a') as f_out:
-        for input_file in input_files:
-            try:
-                (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
-                if (function not in functions) or (instance not in instances) or (dimension not in dimensions):
-                    continue
-            except PreprocessingWarning as warning:
-                print('Skipping file {}\n{}'.format(input_file, warning))
+    arguments = []
+    for input_file in input_files:
+        try:
+            (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
+            if (function not in functions) or (instance not in instances) or (dimension not in dimensions):
                 continue
+        except PreprocessingWarning as warning:
+            print('Skipping file {}\n{}'.format(input_file, warning))
+            continue
+        arguments.append((input_file, suite_name, function, dimension))
 
-            print(input_file)
-
-            with open(input_file, 'r') as f_in:
-                extreme1 = None
-                count = 0
-                for line in f_in:
-                    if line[0] == '%' and 'instance' in line:
-                        instance = int(get_key_value(line[1:], 'instance').strip(' \t\n\r'))
-                        count = 0
-                    elif count > 1 or (len(line) == 0) or line[0] == '%':
-                        continue
-                    elif count == 0:
-                        extreme1 = line.split()[1:3]
-                        count = 1
-                    elif count == 1:
-                        extreme2 = line.split()[1:3]
-                        count = 2
-                        try:
-                            string = '{}_f{:02d}_i{:02d}_d{:02d}\t'.format(suite_name, function, instance, dimension)
-                            string = string + '\t'.join(extreme1) + '\t' + '\t'.join(extreme2) + '\n'
-                            f_out.write(string)
-                        except ValueError:
-                            print('Skipping instance {} in file {}'.format(instance, input_file))
-
-                f_in.close()
+    # The files are processed by the workers, while the results are saved in the output_file in the order of the files
+    pool = None if processes == 1 else multiprocessing.Pool(processes)
+    try:
+        results = map(_file_extremes, arguments) if pool is None else pool.imap(_file_extremes, arguments)
+        with open(output_file, 'a') as f_out:
+            for input_file, extremes in results:
+                print(input_file)
+                sys.stdout.flush()
+                f_out.write(extremes)
                 f_out.flush()
-        f_out.close()
+            f_out.close()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
 
 if __name__ == '__main__':
@@ -77,6 +101,8 @@ if __name__ == '__main__':
                         help='instance numbers to be included in the processing of archives')
     parser.add_argument('-d', '--dimensions', type=parse_range, default=[2, 3, 5, 10, 20, 40],
                         help='dimensions to be included in the processing of archives')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='number of processes among which the files are distributed (0 for the number of CPUs)')
     parser.add_argument('output', help='path to the output file')
     parser.add_argument('input', default=[], nargs='+', help='path(s) to the input folder(s)')
     args = parser.parse_args()
@@ -84,4 +110,5 @@ if __name__ == '__main__':
     print('Program called with arguments: \ninput folders = {}\noutput file = {}'.format(args.input, args.output))
     print('functions = {} \ninstances = {}\ndimensions = {}\n'.format(args.functions, args.instances, args.dimensions))
 
-    extract_extremes(args.input, args.output, args.functions, args.instances, args.dimensions)
+    extract_extremes(args.input, args.output, args.functions, args.instances, args.dimensions,
+                     args.processes or None)
@@ -42,6 +42,7 @@ cdef class Archive:
     cdef size_t _number_of_solutions
     cdef double _hypervolume    
     cdef bytes _tmp_text
+    cdef list _solutions
     
     cdef up_to_date
     
@@ -57,6 +58,7 @@ cdef class Archive:
         self._instance = instance
         self._dimension = dimension
         self.up_to_date = False
+        self._solutions = []
         
         self.archive = coco_archive(self._suite_name, self._function, 
                                     self._dimension, self._instance)
@@ -70,11 +72,77 @@ cdef class Archive:
             self.up_to_date = False            
         return updated
         
+    def add_solutions(self, F, evaluations, X=None, text=None, precision_f=15, precision_x=8):
+        """Adds the solutions with objective values in the rows of F, the given evaluation numbers and (optionally)
+           variables in the rows of X to the archive. Returns the number of solutions that updated the archive.
+
+           The solutions that are dominated by (or equal to) other solutions from F are removed beforehand by sorting
+           them by the first objective and comparing the second objective to its running minimum. Only the remaining
+           ones are added to the archive. Their text (the line of the archive file) is either given in text or
+           formatted from evaluations, F and X (using precision_f and precision_x digits after the decimal point) only
+           when it is returned by get_next_solution_text. Solutions with NaN objective values are ignored.
+           :param F: array of shape (number_of_solutions, 2) with the objective values
+           :param evaluations: array of evaluation numbers
+           :param X: optional array of shape (number_of_solutions, dimension) with the variables
+           :param text: optional sequence of lines with the text of the solutions
+        """
+        cdef double[:, ::1] _F
+        cdef size_t i
+        cdef int updates = 0
+        F = np.array(F, dtype=np.float64, ndmin=2)
+        evaluations = np.asarray(evaluations, dtype=np.int64).ravel()
+        if F.shape[1] != 2 or evaluations.shape[0] != F.shape[0]:
+            raise ValueError('F must have two columns and as many rows (%d) as there are evaluations (%d)' %
+                             (F.shape[0], evaluations.shape[0]))
+        if X is not None:
+            X = np.asarray(X, dtype=np.float64)
+            if X.ndim != 2 or X.shape[0] != F.shape[0]:
+                raise ValueError('X must be a 2-D array with %d rows' % F.shape[0])
+        if text is not None and len(text) != F.shape[0]:
+            raise ValueError('text must contain %d lines' % F.shape[0])
+
+        # Keep only the solutions that are nondominated among the given ones, ordered by the first objective
+        order = np.flatnonzero(~np.isnan(F).any(axis=1))
+        order = order[np.lexsort((F[order, 1], F[order, 0]))]
+        if len(order) > 1:
+            f2 = F[order, 1]
+            is_nondominated = np.ones(len(order), dtype=bool)
+            is_nondominated[1:] = f2[1:] < np.minimum.accumulate(f2)[:-1]
+            order = order[is_nondominated]
+        if len(order) == 0:
+            return 0
+
+        chunk = len(self._solutions)
+        self._solutions.append((evaluations[order], F[order], None if X is None else X[order],
+                                None if text is None else [text[j] for j in order], precision_f, precision_x))
+        _F = np.ascontiguousarray(F[order])
+        for i in range(_F.shape[0]):
+            # The text of the solution refers to its entry in self._solutions
+            if coco_archive_add_solution(self.archive, _F[i, 0], _F[i, 1], _bstring('#%d:%d' % (chunk, i))):
+                updates += 1
+        if updates:
+            self.up_to_date = False
+        return updates
+
+    def _solution_text(self, key):
+        """Returns the text of the solution added by add_solutions that is referred to by the given key.
+        """
+        chunk, row = (int(value) for value in key[1:].split(':'))
+        evaluations, F, X, text, precision_f, precision_x = self._solutions[chunk]
+        if text is not None:
+            return text[row]
+        result = '%d\t%.*e\t%.*e\t' % (evaluations[row], precision_f, F[row, 0], precision_f, F[row, 1])
+        if X is not None:
+            result += ''.join('%.*e\t' % (precision_x, x) for x in X[row])
+        return result + '\n'
+
     def get_next_solution_text(self):
         self._tmp_text = coco_archive_get_next_solution_text(self.archive)
         tmp_text = self._tmp_text.decode('ascii')
         if tmp_text == "":
             return None
+        if tmp_text[0] == '#':
+            return self._solution_text(tmp_text)
         return tmp_text
         
     def update(self):
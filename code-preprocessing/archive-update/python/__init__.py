@@ -4,6 +4,10 @@ from .archive_exceptions import PreprocessingException, PreprocessingWarning
 from .archive_load_data import get_file_name_list, create_path, remove_empty_file, get_key_value, get_range
 from .archive_load_data import parse_problem_instance_file_name, parse_archive_file_name, parse_old_arhive_file_name
 from .archive_load_data import get_instances, get_archive_file_info, read_best_values, write_best_values, parse_range
+from .archive_load_data import get_instance_index, read_instance_block
+from .archive_load_data import BinaryArchiveBlock, is_binary_archive, read_binary_archive, read_archive_lines
+from .archive_load_data import ArchiveSolutions, read_archive_solutions
+from .archive_load_data import write_binary_archive_header, write_binary_archive_comment, write_binary_archive_solutions
 
 import pkg_resources
 __version__ = pkg_resources.require('cocoprep')[0].version
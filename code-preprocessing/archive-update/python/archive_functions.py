@@ -3,23 +3,28 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import os
 import sys
 
+import numpy as np
+
 from .archive_exceptions import PreprocessingWarning, PreprocessingException
-from .archive_load_data import create_path, get_key_value, get_file_name_list, get_archive_file_info, get_range
+from .archive_load_data import create_path, get_file_name_list, get_archive_file_info, get_range
+from .archive_load_data import get_instance_index, read_instance_block, is_binary_archive, read_binary_archive
+from .archive_load_data import BinaryArchiveBlock
 
 
 class ProblemInstanceInfo:
     """Contains information on the problem instance: suite_name, function, instance, dimension and a list of file names
-       with archived solutions for this problem instance.
+       with archived solutions for this problem instance. For files with multiple instances, the byte offsets of the
+       instance in the file are stored as well (see get_instance_index).
     """
 
-    def __init__(self, _file_name, single_instance, suite_name, _function, instance, dimension):
+    def __init__(self, _file_name, single_instance, suite_name, _function, instance, dimension, block=None):
         """Instantiates a ProblemInstanceInfo object.
         """
         self.suite_name = suite_name
         self.function = _function
         self.instance = instance
         self.dimension = dimension
-        self.file_info = [{'file_name': _file_name, 'single_instance': single_instance}]
+        self.file_info = [{'file_name': _file_name, 'single_instance': single_instance, 'block': block}]
 
         self.current_file_initialized = False
         self.current_position = 0
@@ -48,54 +53,82 @@ class ProblemInstanceInfo:
 
     def fill_archive(self, archive):
         """Reads the solutions from the files and feeds them to the given archive. If a file contains a single
-        instance, all comments are skipped. If a file contains multiple instances, only the solutions up to the next
-        instance are read. If the file contains no solutions for the given problem instance, an exception is raised.
+        instance, all comments are skipped. If a file contains multiple instances, only the block of lines belonging to
+        the given instance is read (the file is not scanned again if the byte offsets of the block are known). If the
+        file contains no solutions for the given problem instance, an exception is raised. Files in the binary format
+        are read in blocks of solutions without parsing any text.
            :param archive: archive to be filled with solutions
         """
         for f_info in self.file_info:
             f_name = f_info.get('file_name')
-            single_instance = f_info.get('single_instance')
-            with open(f_name, 'r') as f:
-
-                instance_found = single_instance
-                solution_found = False
-
-                for line in f:
-                    if not line.strip() or (single_instance and line[0] == '%'):
-                        # Ignore empty lines and all comments if the file contains a single instance
-                        continue
-
-                    elif line[0] == '%' and 'instance' not in line:
-                        # If a file has multiple instances, ignore all comments not containing instance information
-                        continue
-
-                    elif not single_instance and line[0] == '%' and 'instance' in line:
-                        if instance_found:
-                            # If a file has multiple instances, stop when you encounter another instance
-                            break
-                        else:
-                            value = get_key_value(line[1:], 'instance')
-                            if int(value) == self.instance:
-                                instance_found = True
-
-                    elif instance_found:
-                        if line[0] != '%':
-                            # Solution found, feed it to the archive
-                            try:
-                                archive.add_solution(float(line.split()[1]), float(line.split()[2]), line)
-                                solution_found = True
-                            except IndexError:
-                                print('Problem in file {}, line {}, skipping line'.format(f_name, line))
-                                sys.stdout.flush()
-                                continue
-
-                f.close()
-                if not instance_found:
-                    raise PreprocessingException('File \'{}\' does not contain \'instance = {}\''.format(f_name,
-                                                                                                         self.instance))
-                if not solution_found:
-                    raise PreprocessingException('File \'{}\' contains no solutions for \'instance = {}\''.format(
-                        f_name, self.instance))
+            block = (None, None)
+            if not f_info.get('single_instance'):
+                block = f_info.get('block')
+                if block is None:
+                    blocks = [(start, end) for (instance, start, end) in get_instance_index(f_name)
+                              if instance == self.instance]
+                    if len(blocks) == 0:
+                        raise PreprocessingException('File \'{}\' does not contain \'instance = {}\''.format(
+                            f_name, self.instance))
+                    block = blocks[0]
+
+            if is_binary_archive(f_name):
+                solution_found = self._feed_binary_solutions(archive, read_binary_archive(f_name, *block))
+            elif f_info.get('single_instance'):
+                with open(f_name, 'r') as f:
+                    solution_found = self._feed_solutions(archive, f, f_name)
+                    f.close()
+            else:
+                # The first line of the block is the comment containing the instance
+                solution_found = self._feed_solutions(archive, read_instance_block(f_name, *block)[1:], f_name)
+
+            if not solution_found:
+                raise PreprocessingException('File \'{}\' contains no solutions for \'instance = {}\''.format(
+                    f_name, self.instance))
+
+    @staticmethod
+    def _feed_solutions(archive, lines, f_name):
+        """Feeds the solutions from the given lines to the archive at once, ignoring empty lines and comments. Returns
+        true if at least one solution was found and false otherwise.
+           :param archive: archive to be filled with solutions
+           :param lines: lines of an archive file
+           :param f_name: name of the archive file (used in messages)
+        """
+        solutions = []
+        for line in lines:
+            if not line.strip() or line[0] == '%':
+                continue
+            values = line.split(None, 3)
+            if len(values) < 3:
+                print('Problem in file {}, line {}, skipping line'.format(f_name, line))
+                sys.stdout.flush()
+                continue
+            solutions.append((values[0], values[1], values[2], line))
+
+        if len(solutions) == 0:
+            return False
+        evaluations, f1, f2, text = zip(*solutions)
+        archive.add_solutions(np.array([f1, f2], dtype=float).T, np.array(evaluations, dtype=float), text=text)
+        return True
+
+    @staticmethod
+    def _feed_binary_solutions(archive, records):
+        """Feeds the blocks of solutions among the given records of a binary archive file to the archive without
+        any parsing of text (see read_binary_archive). Returns true if at least one solution was found and false
+        otherwise.
+           :param archive: archive to be filled with solutions
+           :param records: records of a binary archive file
+        """
+        solution_found = False
+        for record in records:
+            if not isinstance(record, BinaryArchiveBlock) or len(record) == 0:
+                continue
+            # The text is formatted only for the solutions that end up in the archive, unless it contains integers
+            archive.add_solutions(record.f, record.evaluations, record.x if record.x.shape[1] > 0 else None,
+                                  text=record.lines() if record.integer_variables > 0 else None,
+                                  precision_f=record.precision_f, precision_x=record.precision_x)
+            solution_found = True
+        return solution_found
 
     # noinspection PyTypeChecker
     def write_archive_solutions(self, output_path, archive, crop_variables):
@@ -176,22 +209,23 @@ class ArchiveInfo:
                 result += str(problem_instance) + '\n'
         return result
 
-    def _add_entry(self, _file_name, single_instance, suite_name, _function, instance, dimension):
+    def _add_entry(self, _file_name, single_instance, suite_name, _function, instance, dimension, block=None):
         """Adds a new ProblemInstanceInfo instance with the given suite_name, function, instance, dimension to the list
            of problem instances if an instance with these exact values does not exist yet. If it already exists, the
-           current file_name and single_instance entries are added to its list of file information dictionaries.
+           current file_name, single_instance and block entries are added to its list of file information dictionaries.
         """
 
         found = False
         for problem_instance in self.problem_instances:
             if problem_instance.equals(suite_name, _function, instance, dimension):
-                problem_instance.file_info.append({'file_name': _file_name, 'single_instance': single_instance})
+                problem_instance.file_info.append({'file_name': _file_name, 'single_instance': single_instance,
+                                                   'block': block})
                 found = True
                 break
 
         if not found:
             self.problem_instances.append(ProblemInstanceInfo(_file_name, single_instance, suite_name, _function,
-                                                              instance, dimension))
+                                                              instance, dimension, block))
 
     def get_next_problem_instance_info(self):
         """Returns the current ProblemInstanceInfo and increases the counter. If there are no more instances left,
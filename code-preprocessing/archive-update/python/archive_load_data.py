@@ -3,10 +3,14 @@
 """
 from __future__ import division, print_function, unicode_literals
 
+import io
+import mmap
 import os
 import os.path
 import re
+import struct
 import six
+import numpy as np
 from time import gmtime, strftime
 from itertools import groupby
 from operator import itemgetter
@@ -35,11 +39,14 @@ def get_file_name_list(paths, ending=None):
 
 
 def create_path(path):
-    """Creates path if it does not already exist.
+    """Creates path if it does not already exist (also if another process creates it at the same time).
     :param path: path
     """
-    if not os.path.exists(path):
+    try:
         os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
 
 
 def remove_empty_file(file_name):
@@ -158,18 +165,388 @@ def parse_old_arhive_file_name(file_name):
     return function, instance, dimension
 
 
-def get_instances(file_name):
-    """Returns the list of instances contained in the given archive file's comments (lines beginning with %).
+# The binary archive format written by the bi-objective logger with the observer option `archive_format: binary`
+# (see logger_biobj.c for the description of its layout)
+BINARY_ARCHIVE_MAGIC = b'COCOADAT'
+BINARY_ARCHIVE_VERSION = 1
+_BINARY_HEADER_SIZE = 12
+# Solutions are returned in blocks of at most this many solutions to limit the memory needed to read large archives
+_BINARY_BLOCK_SIZE = 262144
+
+
+class BinaryArchiveBlock(object):
+    """Contains consecutive solutions read from a binary archive file: their evaluation numbers, objective vectors and
+       decision vectors (x has zero columns if the decision variables were not logged) together with the information
+       needed to output them in the text format (the number of leading decision values output as integers and the
+       precisions of the objective and decision values).
+    """
+
+    def __init__(self, evaluations, f, x, integer_variables=0, precision_f=15, precision_x=8):
+        """Instantiates a BinaryArchiveBlock object.
+        """
+        self.evaluations = evaluations
+        self.f = f
+        self.x = x
+        self.integer_variables = integer_variables
+        self.precision_f = precision_f
+        self.precision_x = precision_x
+
+    def __len__(self):
+        return len(self.evaluations)
+
+    def lines(self):
+        """Returns the solutions as lines of the text format (the same as the ones output by the logger).
+        """
+        x = self.x
+        if self.integer_variables > 0:
+            x = x.copy()
+            x[:, :self.integer_variables] = np.trunc(x[:, :self.integer_variables] + 0.5)
+        line_format = ('%d\t' + '%.{}e\t'.format(self.precision_f) * 2 + '%d\t' * self.integer_variables +
+                       '%.{}e\t'.format(self.precision_x) * (x.shape[1] - self.integer_variables) + '\n')
+        values = np.column_stack((self.evaluations, self.f, x))
+        return [line_format % tuple(row) for row in values.tolist()]
+
+
+def is_binary_archive(file_name):
+    """Returns True if the given archive file is written in the binary format and False otherwise.
+       :param file_name: archive file name
+    """
+    with open(file_name, 'rb') as f:
+        magic = f.read(len(BINARY_ARCHIVE_MAGIC))
+        f.close()
+    return magic == BINARY_ARCHIVE_MAGIC
+
+
+def _count_binary_solutions(buffer, position, end, record_size):
+    """Returns the number of consecutive solution records of the given size in the buffer starting at position and
+       ending before end. The tags of the records are checked in windows of increasing size, so that the records after
+       the last solution are only checked a few times.
+    """
+    available = (end - position) // record_size
+    count = 0
+    window = 1024
+    while count < available:
+        number = min(window, available - count)
+        tags = np.frombuffer(buffer, dtype=np.uint8, count=number * record_size,
+                             offset=position + count * record_size)[::record_size]
+        other = np.flatnonzero(tags != ord('S'))
+        if len(other) > 0:
+            return count + int(other[0])
+        count += number
+        window *= 2
+    return count
+
+
+def _read_binary_records(file_name, start=None, end=None, skip_solutions=False):
+    """Generator of the records of the given binary archive file between the byte offsets start and end in the form of
+       (offset, record) pairs, where record is either a comment line or a BinaryArchiveBlock. The file is mapped to
+       memory and the solutions are read in bulk. If skip_solutions is True, only the comments are returned.
+       :param file_name: archive file name
+       :param start: byte offset of the first record (the first record after the file header if None)
+       :param end: byte offset after the last record (the size of the file if None)
+       :param skip_solutions: whether to skip the solutions
+    """
+    with open(file_name, 'rb') as f:
+        header = f.read(_BINARY_HEADER_SIZE)
+        if len(header) < _BINARY_HEADER_SIZE or header[:len(BINARY_ARCHIVE_MAGIC)] != BINARY_ARCHIVE_MAGIC:
+            raise PreprocessingException('File \'{}\' is not a binary archive file'.format(file_name))
+        version = struct.unpack('<I', header[len(BINARY_ARCHIVE_MAGIC):])[0]
+        if version != BINARY_ARCHIVE_VERSION:
+            raise PreprocessingException('File \'{}\' has an unsupported binary format version {}'.format(
+                file_name, version))
+        size = os.fstat(f.fileno()).st_size
+        position = _BINARY_HEADER_SIZE if start is None else start
+        end = size if end is None else min(end, size)
+        if position >= end:
+            return
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            layout = None
+            while position < end:
+                tag = buffer[position:position + 1]
+                if tag == b'C' and position + 5 <= end:
+                    length = struct.unpack('<I', buffer[position + 1:position + 5])[0]
+                    if position + 5 + length > end:
+                        break
+                    yield position, buffer[position + 5:position + 5 + length].decode('utf-8')
+                    position += 5 + length
+                elif tag == b'F' and position + 17 <= end:
+                    layout = struct.unpack('<4I', buffer[position + 1:position + 17])
+                    position += 17
+                elif tag == b'S' and layout is not None:
+                    record_size = 1 + 8 * (3 + layout[0])
+                    count = min(_count_binary_solutions(buffer, position, end, record_size), _BINARY_BLOCK_SIZE)
+                    if count == 0:
+                        break
+                    if not skip_solutions:
+                        dtype = np.dtype([('tag', 'S1'), ('values', '<f8', (3 + layout[0],))])
+                        values = np.frombuffer(buffer, dtype=dtype, count=count, offset=position)['values'].astype(
+                            np.float64)
+                        yield position, BinaryArchiveBlock(values[:, 0].astype(np.int64), values[:, 1:3],
+                                                           values[:, 3:], *layout[1:])
+                    position += count * record_size
+                else:
+                    raise PreprocessingException('File \'{}\' is corrupted at byte {}'.format(file_name, position))
+            if position < end:
+                print('Problem in file {}, incomplete record at byte {}, skipping the rest of the file'.format(
+                    file_name, position))
+        finally:
+            buffer.close()
+        f.close()
+
+
+def read_binary_archive(file_name, start=None, end=None, skip_solutions=False):
+    """Generator of the contents of the given binary archive file between the byte offsets start and end (as given by
+       get_instance_index), which are comment lines (strings) and blocks of solutions (BinaryArchiveBlock objects).
+       :param file_name: archive file name
+       :param start: byte offset of the first record (the beginning of the file if None)
+       :param end: byte offset after the last record (the end of the file if None)
+       :param skip_solutions: whether to return only the comment lines
+    """
+    for (_, record) in _read_binary_records(file_name, start, end, skip_solutions):
+        yield record
+
+
+def read_archive_lines(file_name, start=None, end=None):
+    """Generator of the lines of the given archive file between the byte offsets start and end (as given by
+       get_instance_index) in the text format. Files in the binary format are converted to text on the fly.
        :param file_name: archive file name
+       :param start: byte offset of the first line (the beginning of the file if None)
+       :param end: byte offset after the last line (the end of the file if None)
     """
+    if is_binary_archive(file_name):
+        for record in read_binary_archive(file_name, start, end):
+            if isinstance(record, BinaryArchiveBlock):
+                for line in record.lines():
+                    yield line
+            else:
+                yield record
+    elif start is None and end is None:
+        with open(file_name, 'r') as f:
+            for line in f:
+                yield line
+            f.close()
+    else:
+        for line in read_instance_block(file_name, 0 if start is None else start,
+                                        os.path.getsize(file_name) if end is None else end):
+            yield line
+
+
+class ArchiveSolutions(object):
+    """Contains the solutions read in bulk from (a part of) an archive file: their objective vectors in an array f
+       with two columns (in the order of the file) and the blocks they come from, which are either lists of text lines
+       or BinaryArchiveBlock objects. The text lines of the solutions are only constructed when needed.
+    """
+
+    def __init__(self, f, blocks):
+        """Instantiates an ArchiveSolutions object.
+        """
+        self.f = f
+        self.blocks = blocks
+
+    def __len__(self):
+        return len(self.f)
+
+    def lines(self, indices):
+        """Returns the text lines of the solutions with the given indices (in the order of the indices).
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        result = [None] * len(indices)
+        offset = 0
+        for block in self.blocks:
+            positions = np.flatnonzero((indices >= offset) & (indices < offset + len(block)))
+            if len(positions) > 0:
+                selected = indices[positions] - offset
+                if isinstance(block, BinaryArchiveBlock):
+                    lines = BinaryArchiveBlock(block.evaluations[selected], block.f[selected], block.x[selected],
+                                               block.integer_variables, block.precision_f,
+                                               block.precision_x).lines()
+                else:
+                    lines = [block[i] for i in selected.tolist()]
+                for position, line in zip(positions.tolist(), lines):
+                    result[position] = line
+            offset += len(block)
+        return result
+
+
+def read_archive_solutions(file_name, start=None, end=None):
+    """Returns the solutions of the given archive file between the byte offsets start and end (as given by
+       get_instance_index) in the form of an ArchiveSolutions object. Comments, empty lines and lines that cannot be
+       parsed are skipped.
+       :param file_name: archive file name
+       :param start: byte offset of the first line (the beginning of the file if None)
+       :param end: byte offset after the last line (the end of the file if None)
+    """
+    if is_binary_archive(file_name):
+        blocks = [record for record in read_binary_archive(file_name, start, end)
+                  if isinstance(record, BinaryArchiveBlock)]
+        f = np.concatenate([block.f for block in blocks]) if len(blocks) > 0 else np.zeros((0, 2))
+        return ArchiveSolutions(f, blocks)
+
+    lines = []
+    values = []
+    for line in read_archive_lines(file_name, start, end):
+        if line[:1] == '%':
+            continue
+        words = line.split()
+        if len(words) < 3:
+            continue
+        try:
+            values.append((float(words[1]), float(words[2])))
+        except ValueError:
+            print('Problem in file {}, line {}, skipping line'.format(file_name, line))
+            continue
+        lines.append(line)
+    return ArchiveSolutions(np.array(values, dtype=float).reshape(-1, 2), [lines])
+
+
+def write_binary_archive_header(f):
+    """Writes the header of the binary archive format to the given file (opened in binary mode).
+       :param f: archive file
+    """
+    f.write(BINARY_ARCHIVE_MAGIC + struct.pack('<I', BINARY_ARCHIVE_VERSION))
+
+
+def write_binary_archive_comment(f, comment):
+    """Writes the given comment line (including the trailing newline) in the binary archive format to the given file.
+       :param f: archive file
+       :param comment: comment line
+    """
+    data = comment.encode('utf-8')
+    f.write(b'C' + struct.pack('<I', len(data)) + data)
+
+
+def write_binary_archive_solutions(f, evaluations, F, X=None, integer_variables=0, precision_f=15, precision_x=8):
+    """Writes the solutions with the given evaluation numbers, objective values in the rows of F and (optionally)
+       decision values in the rows of X in the binary archive format to the given file, preceded by their format.
+       :param f: archive file
+       :param evaluations: array of evaluation numbers
+       :param F: array of shape (number_of_solutions, 2) with the objective values
+       :param X: optional array of shape (number_of_solutions, dimension) with the decision values
+       :param integer_variables: number of leading decision values output as integers in the text format
+       :param precision_f: precision of the objective values in the text format
+       :param precision_x: precision of the decision values in the text format
+    """
+    F = np.asarray(F, dtype=np.float64).reshape(-1, 2)
+    X = np.zeros((len(F), 0)) if X is None else np.asarray(X, dtype=np.float64).reshape(len(F), -1)
+    f.write(b'F' + struct.pack('<4I', X.shape[1], integer_variables, precision_f, precision_x))
+    records = np.empty(len(F), dtype=np.dtype([('tag', 'S1'), ('values', '<f8', (3 + X.shape[1],))]))
+    records['tag'] = b'S'
+    records['values'] = np.column_stack((np.asarray(evaluations, dtype=np.float64), F, X))
+    f.write(records.tobytes())
+
+
+def _read_instance_index(file_name, index_file_name):
+    """Returns the list of instance blocks stored in the index file or None if the index file does not exist, cannot
+       be read or does not match the size and modification time of the archive file.
+       :param file_name: archive file name
+       :param index_file_name: index file name
+    """
+    try:
+        stat = os.stat(file_name)
+        with open(index_file_name, 'r') as f:
+            header = f.readline().strip()
+            if (get_key_value(header[1:], 'file_size') != str(stat.st_size) or
+                    get_key_value(header[1:], 'file_mtime') != repr(stat.st_mtime)):
+                return None
+            result = []
+            for line in f:
+                (instance, start, end) = line.split()
+                result.append((int(instance), int(start), int(end)))
+            f.close()
+        return result
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _write_instance_index(file_name, index_file_name, index):
+    """Writes the list of instance blocks to the index file. If the index file cannot be written (for example, because
+       the archive is in a read-only folder), nothing is done.
+       :param file_name: archive file name
+       :param index_file_name: index file name
+       :param index: list of instance blocks
+    """
+    try:
+        stat = os.stat(file_name)
+        with open(index_file_name, 'w') as f:
+            f.write('% file_size = {}, file_mtime = {}\n'.format(stat.st_size, repr(stat.st_mtime)))
+            for (instance, start, end) in index:
+                f.write('{}\t{}\t{}\n'.format(instance, start, end))
+            f.close()
+    except (IOError, OSError):
+        try:
+            if os.path.isfile(index_file_name):
+                os.remove(index_file_name)
+        except OSError:
+            pass
+
+
+def get_instance_index(file_name, use_index_file=True):
+    """Returns the list of instance blocks contained in the given archive file in the form of (instance, start, end)
+       tuples, where start is the byte offset of the comment line containing the instance and end is the byte offset
+       of the next such line (or the size of the file). The blocks can be read with read_instance_block.
+       The file is scanned only once. If use_index_file is True, the result is stored next to the archive file (in a
+       file with the additional ending '.idx') and read from there as long as the size and modification time of the
+       archive file do not change.
+       :param file_name: archive file name
+       :param use_index_file: whether to read and write the index file
+    """
+    index_file_name = file_name + '.idx'
+    if use_index_file:
+        result = _read_instance_index(file_name, index_file_name)
+        if result is not None:
+            return result
+
     result = []
-    with open(file_name, 'r') as f:
-        for line in f:
-            if line[0] == '%' and 'instance' in line:
-                value = get_key_value(line[1:], 'instance')
+    position = 0
+    if is_binary_archive(file_name):
+        for (position, comment) in _read_binary_records(file_name, skip_solutions=True):
+            if 'instance' in comment:
+                value = get_key_value(comment[1:], 'instance')
                 if value is not None:
-                    result.append(int(value))
+                    if len(result) > 0:
+                        result[-1][2] = position
+                    result.append([int(value), position, None])
+        position = os.path.getsize(file_name)
+    else:
+        with open(file_name, 'rb') as f:
+            for line in f:
+                if line[:1] == b'%' and b'instance' in line:
+                    value = get_key_value(line[1:].decode('utf-8'), 'instance')
+                    if value is not None:
+                        if len(result) > 0:
+                            result[-1][2] = position
+                        result.append([int(value), position, None])
+                position += len(line)
+            f.close()
+
+    result = [(instance, start, position if end is None else end) for (instance, start, end) in result]
+    if use_index_file and len(result) > 0:
+        _write_instance_index(file_name, index_file_name, result)
+    return result
+
+
+def read_instance_block(file_name, start, end):
+    """Returns the lines of the given archive file between the byte offsets start and end (as given by
+       get_instance_index) without reading the rest of the file. Files in the binary format are converted to text.
+       :param file_name: archive file name
+       :param start: byte offset of the first line
+       :param end: byte offset after the last line
+    """
+    if is_binary_archive(file_name):
+        return list(read_archive_lines(file_name, start, end))
+    with open(file_name, 'rb') as f:
+        f.seek(start)
+        block = f.read(end - start)
         f.close()
+    return io.StringIO(block.decode('utf-8'), newline=None).readlines()
+
+
+def get_instances(file_name):
+    """Returns the list of instances contained in the given archive file's comments (lines beginning with %).
+       :param file_name: archive file name
+    """
+    result = [instance for (instance, _, _) in get_instance_index(file_name)]
 
     if len(result) == 0:
         raise PreprocessingWarning('File \'{}\' does not contain an \'instance\' string'.format(file_name))
@@ -180,12 +557,14 @@ def get_instances(file_name):
 def get_archive_file_info(file_name, functions, instances, dimensions):
     """Returns information on the problem instances contained in the given archive file that also correspond to the
        given functions, instances and dimensions in the form of the following list of lists:
-       file_name, single_instance, suite_name, function, instance1, dimension
-       file_name, single_instance, suite_name, function, instance2, dimension
+       file_name, single_instance, suite_name, function, instance1, dimension, block1
+       file_name, single_instance, suite_name, function, instance2, dimension, block2
        ...
        The suite_name, function and dimension are always retrieved from the file name, while instances are either (1)
        retrieved from the file name, if the file name is in form [suite-name]_f[function]_i[instance]_d[dimension]_*.*,
-       or (2) read from the file. Value of single_instance is set to True if (1) and False if (2).
+       or (2) read from the file. Value of single_instance is set to True if (1) and False if (2). In case (2), block
+       contains the byte offsets (start, end) of the instance in the file (see get_instance_index), otherwise it is
+       None.
        :param file_name: archive file name
        :param functions: functions to be considered
        :param instances: instances to be considered
@@ -196,18 +575,21 @@ def get_archive_file_info(file_name, functions, instances, dimensions):
         if (function not in functions) or (dimension not in dimensions):
             return None
         if not instance:
-            instance_list = get_instances(file_name)
+            instance_list = get_instance_index(file_name)
+            if len(instance_list) == 0:
+                raise PreprocessingWarning('File \'{}\' does not contain an \'instance\' string'.format(file_name))
             single_instance = False
         else:
-            instance_list = [instance]
+            instance_list = [(instance, None, None)]
             single_instance = True
     except PreprocessingWarning as warning:
         raise PreprocessingWarning('Skipping file {}\n{}'.format(file_name, warning))
 
     result = []
-    for instance in instance_list:
+    for (instance, start, end) in instance_list:
         if instance in instances:
-            result.append((file_name, single_instance, suite_name, function, instance, dimension))
+            block = None if single_instance else (start, end)
+            result.append((file_name, single_instance, suite_name, function, instance, dimension, block))
     return result
 
 
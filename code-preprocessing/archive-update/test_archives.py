@@ -94,7 +94,7 @@ def cleanup_archive_data(delete_all=False):
     data_folder = abspath(join(dirname(__file__), 'test-data'))
 
     def can_delete(path):
-        if delete_all:
+        if delete_all or path.endswith('.adat.idx'):
             return True
         keep = [abspath(join(data_folder, 'archives-input')),
                 abspath(join(data_folder, 'archives-results'))]
@@ -155,6 +155,21 @@ def run_archive_update():
     assert almost_equal(new_hypervolumes.get('bbob-biobj_f51_i02_d05'), 0.920488608198097, precision)
     assert almost_equal(new_hypervolumes.get('bbob-biobj_f52_i07_d02'), 0.920581303184137, precision)
 
+    # Merging in parallel gives the same results
+    parallel_hypervolumes = merge_archives(abspath(join(base_path, 'test-data', 'archives-input')),
+                                           abspath(join(base_path, 'test-data', 'archives-output-parallel')),
+                                           parse_range('1-55'),
+                                           parse_range('1-10'),
+                                           parse_range('2,3,5,10,20,40'),
+                                           False,
+                                           processes=2)
+
+    assert parallel_hypervolumes == new_hypervolumes
+    for root, dirs, files in walk(abspath(join(base_path, 'test-data', 'archives-output'))):
+        for name in files:
+            assert compare_files(join(root, name), join(root, name).replace('archives-output',
+                                                                           'archives-output-parallel'))
+
 
 def run_archive_reformat():
     """
@@ -181,7 +196,7 @@ def run_archive_split():
     Tests whether archive_split() from archive_split.py works correctly for the given input.
     """
     from archive_split import archive_split
-    from cocoprep.archive_load_data import parse_range
+    from cocoprep.archive_load_data import parse_range, get_instance_index, read_instance_block
 
     base_path = dirname(__file__)
     archive_split(abspath(join(base_path, 'test-data', 'archives-input')),
@@ -195,6 +210,16 @@ def run_archive_split():
             assert compare_files(abspath(join(base_path, 'test-data', 'archives-results', name)),
                                  abspath(join(base_path, 'test-data', 'archives-split', name)))
 
+    # The index of instances stored next to a multi-instance archive is the same as the one obtained by scanning it
+    input_file = abspath(join(base_path, 'test-data', 'archives-input', 'bbob-biobj_f03_d05_nondominated.adat'))
+    index = get_instance_index(input_file)
+    assert exists(input_file + '.idx')
+    assert index == get_instance_index(input_file, use_index_file=False)
+    assert [instance for (instance, _, _) in index] == [6, 7, 8, 9, 10]
+    for (instance, start, end) in index:
+        lines = read_instance_block(input_file, start, end)
+        assert lines[0].startswith('% instance = {}'.format(instance))
+
 
 def run_archive_thinning():
     """
@@ -282,12 +307,62 @@ def run_extract_extremes():
                      abspath(join(base_path, 'test-data', 'archives-extremes.txt')),
                      parse_range('1-55'),
                      parse_range('1-10'),
-                     parse_range('2,3,5,10,20,40'))
+                     parse_range('2,3,5,10,20,40'),
+                     processes=2)
 
     assert compare_files(abspath(join(base_path, 'test-data', 'archives-extremes.txt')),
                          abspath(join(base_path, 'test-data', 'archives-results', 'archives-extremes.txt')))
 
 
+def run_archive_convert():
+    """
+    Tests whether archive_convert() from archive_convert.py works correctly for the given input and whether archives in
+    the binary format give the same results as the ones in the text format.
+    """
+    from archive_convert import archive_convert
+    from archive_update import merge_archives
+    from archive_split import archive_split
+    from cocoprep.archive_load_data import parse_range, is_binary_archive, get_instance_index
+
+    base_path = dirname(__file__)
+    input_path = abspath(join(base_path, 'test-data', 'archives-input'))
+    binary_path = abspath(join(base_path, 'test-data', 'archives-binary'))
+    text_path = abspath(join(base_path, 'test-data', 'archives-text'))
+    archive_convert(input_path, binary_path, 'binary', parse_range('1-55'), parse_range('1-10'),
+                    parse_range('2,3,5,10,20,40'))
+    archive_convert(binary_path, text_path, 'text', parse_range('1-55'), parse_range('1-10'),
+                    parse_range('2,3,5,10,20,40'))
+
+    # Converting to the binary format and back gives the original values
+    for root, dirs, files in walk(binary_path):
+        for name in files:
+            if name.endswith('.adat'):
+                assert is_binary_archive(join(root, name))
+                assert compare_files(join(root, name).replace(binary_path, input_path),
+                                     join(root, name).replace(binary_path, text_path), 1e-300)
+
+    # The archives in the binary format are indexed, merged and split in the same way as those in the text format
+    input_file = join(binary_path, 'bbob-biobj_f03_d05_nondominated.adat')
+    assert [instance for (instance, _, _) in get_instance_index(input_file)] == [6, 7, 8, 9, 10]
+
+    merge_archives(binary_path, abspath(join(base_path, 'test-data', 'archives-output-binary')), parse_range('1-55'),
+                   parse_range('1-10'), parse_range('2,3,5,10,20,40'), False)
+    for root, dirs, files in walk(abspath(join(base_path, 'test-data', 'archives-output'))):
+        for name in files:
+            assert compare_files(join(root, name), join(root, name).replace('archives-output',
+                                                                           'archives-output-binary'))
+
+    archive_split(binary_path, abspath(join(base_path, 'test-data', 'archives-split-binary')), parse_range('1-55'),
+                  parse_range('1-10'), parse_range('2,3,5,10,20,40'))
+    archive_convert(abspath(join(base_path, 'test-data', 'archives-split-binary')),
+                    abspath(join(base_path, 'test-data', 'archives-split-text')), 'text', parse_range('1-55'),
+                    parse_range('1-10'), parse_range('2,3,5,10,20,40'))
+    for root, dirs, files in walk(abspath(join(base_path, 'test-data', 'archives-split-text'))):
+        for name in files:
+            assert is_binary_archive(join(root, name).replace('archives-split-text', 'archives-split-binary'))
+            assert compare_files(abspath(join(base_path, 'test-data', 'archives-results', name)), join(root, name))
+
+
 def test_all():
     """
     Runs a number of tests to check whether the python scripts of archive-update perform correctly.
@@ -319,6 +394,9 @@ def test_all():
     run_extract_extremes()
     timing.log('run_extract_extremes done', timing.now())
 
+    run_archive_convert()
+    timing.log('run_archive_convert done', timing.now())
+
     cleanup_archive_data()
     timing.log('cleanup_archive_data done', timing.now())
 
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import io
+import os
 import sys
 import argparse
-import fileinput
+import multiprocessing
 
 from cocoprep.archive_exceptions import PreprocessingException, PreprocessingWarning
 from cocoprep.archive_load_data import parse_archive_file_name, parse_range, get_key_value, get_file_name_list
+from cocoprep.archive_load_data import get_instance_index, is_binary_archive, read_binary_archive, BinaryArchiveBlock
+from cocoprep.archive_load_data import write_binary_archive_comment
 
 
 def parse_info_file(file_name):
@@ -33,36 +37,11 @@ def parse_info_file(file_name):
     return info_data_list
 
 
-def check_file_complete(input_paths, functions, instances, dimensions, max_diff=1000):
-    """Checks the .adat files created by the bbob-biobj logger to see if they have been properly written. Outputs the
-       difference between the last evaluation from the .adat file and the one noted in the .info file if they are
-       greater than max_diff.
-
-       Takes into account only the given functions, instances and dimensions.
+def get_input_files(input_paths, functions, instances, dimensions):
+    """Returns the numbers of evaluations read from the .info files in the form of a dictionary with (function,
+       instance, dimension) keys together with the list of .adat files in the input_paths that correspond to the given
+       functions, instances and dimensions.
     """
-
-    def inspect_line(input_file, line_string, evaluations, max_diff=1e5):
-        """Check that the line_string contains at least three numbers and that they are correctly written. Outputs a
-           message if the difference between the evaluations and the first number in the line_string is grater than
-           max_diff.
-        """
-        num_items = len(line_string.split())
-        if num_items < 3:
-            print("File {}, line {} too short".format(input_file, line_string))
-        for i in range(num_items):
-            try:
-                float(line_string.split()[i])
-            except ValueError:
-                print('File {}, line {}, number {} incorrect'.format(input_file, line_string, line_string.split()[i]))
-                continue
-
-        if evaluations - int(line_string.split()[0]) > max_diff:
-            print('Mismatch in evaluations in file {}\n'
-                  '.info  = {}\n'
-                  '.adat  = {}\n'
-                  ' diff  = {}\n'.format(input_file, evaluations, line_string.split()[0],
-                                         evaluations - int(line_string.split()[0])))
-
     # Check whether .info and .adat files exist in the input paths
     info_files = get_file_name_list(input_paths, ".info")
     if len(info_files) == 0:
@@ -73,7 +52,6 @@ def check_file_complete(input_paths, functions, instances, dimensions, max_diff=
         raise PreprocessingException('Folder {} does not contain .adat files'.format(input_paths))
 
     info_dict = {}
-    print('Reading .info files...')
     for input_file in info_files:
         # Store the data from the .info files
         try:
@@ -87,7 +65,7 @@ def check_file_complete(input_paths, functions, instances, dimensions, max_diff=
                 continue
             info_dict[(function, instance, dimension)] = evaluations
 
-    print('Reading .adat files...')
+    result = []
     for input_file in adat_files:
         try:
             (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
@@ -97,110 +75,266 @@ def check_file_complete(input_paths, functions, instances, dimensions, max_diff=
         except PreprocessingWarning as warning:
             print('Skipping file {}\n{}'.format(input_file, warning))
             continue
+        result.append(input_file)
 
-        with open(input_file, 'r') as f:
+    return info_dict, result
 
-            instance_found = False
-            last_line = None
 
-            for line in f:
-                if not line.strip() or (line[0] == '%' and 'instance' not in line):
-                    # Ignore empty lines and lines with comments
-                    continue
+def read_last_line(f, start, end, skip_comments=False, chunk_size=65536):
+    """Returns the last nonempty line (or the last line that is not a comment if skip_comments is True) between the
+       byte offsets start and end of the given file opened in binary mode or None if there is no such line. The file is
+       read backwards in chunks of chunk_size bytes, so that only the end of the block needs to be read.
+    """
+    position = end
+    data = b''
+    while position > start:
+        length = min(chunk_size, position - start)
+        position -= length
+        f.seek(position)
+        data = f.read(length) + data
+        lines = data.split(b'\n')
+        # Unless the beginning of the block has been reached, the first line can be incomplete
+        for line in reversed(lines if position == start else lines[1:]):
+            line = line.decode('utf-8').strip()
+            if line and not (skip_comments and line[0] == '%'):
+                return line
+        data = lines[0]
+    return None
+
+
+def insert_in_place(file_name, insertions, chunk_size=1 << 22):
+    """Inserts the given data into the file with the given name without rewriting it. The insertions are (offset, data)
+       pairs sorted by offset. The file is extended and its contents after the first offset are moved backwards, from
+       the end of the file on and in chunks of chunk_size bytes, so that the memory use is bounded. Data inserted at the
+       end of the file is simply appended.
+       :param file_name: name of the file
+       :param insertions: list of (offset, data) pairs, where data are bytes
+       :param chunk_size: number of bytes that are moved at once
+    """
+    end = os.path.getsize(file_name)
+    shift = sum(len(data) for (_, data) in insertions)
+    with open(file_name, 'r+b') as f:
+        for (offset, data) in reversed(insertions):
+            # Move the contents between offset and end by shift bytes
+            position = end
+            while position > offset:
+                length = min(chunk_size, position - offset)
+                position -= length
+                f.seek(position)
+                chunk = f.read(length)
+                f.seek(position + shift)
+                f.write(chunk)
+            shift -= len(data)
+            f.seek(offset + shift)
+            f.write(data)
+            end = offset
+        f.close()
 
-                elif line[0] == '%' and 'instance' in line:
-                    if last_line:
-                        inspect_line(input_file, last_line, info_dict[(function, instance, dimension)])
-                    instance = int(get_key_value(line[1:], 'instance'))
-                    instance_found = (instance in instances)
 
-                elif instance_found and line[0] != '%':
-                    last_line = line
+def _get_first_instance(input_file, binary):
+    """Returns the first instance found in the comments of the given archive file (read from its beginning) or None.
+    """
+    if binary:
+        comments = read_binary_archive(input_file, skip_solutions=True)
+    else:
+        comments = io.open(input_file, 'r')
+    try:
+        for line in comments:
+            if line[:1] == '%' and 'instance' in line:
+                return int(get_key_value(line[1:], 'instance'))
+    finally:
+        comments.close()
+    return None
+
+
+def _evaluations_comment(evaluations, binary):
+    """Returns the bytes of the comment `% evaluations = NUMBER` in the text or binary format.
+    """
+    comment = '% evaluations = {}\n'.format(evaluations)
+    if not binary:
+        return comment.encode('utf-8')
+    f = io.BytesIO()
+    write_binary_archive_comment(f, comment)
+    return f.getvalue()
+
+
+def append_file_evaluations(input_file, info_dict, instances, fast=False):
+    """Appends the comment `% evaluations = NUMBER` to the end of every instance in the given .adat file, where the
+       NUMBER is retrieved from the info_dict. Returns a list of messages on the encountered problems.
+
+       The instances are found using the index of instance blocks (see get_instance_index) and the last line of each
+       block is read backwards from its end. The comment is added only to the blocks that do not end with it yet,
+       which makes it safe to run this function repeatedly. The comments are appended at the end of the file or
+       inserted in place, so the file is never rewritten as a whole. If fast is True, the file is assumed to contain
+       only one instance (read from the file contents, not the file name) and the comment is appended to its end
+       without any checks.
+    """
+    messages = []
+    (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
+    binary = is_binary_archive(input_file)
+    size = os.path.getsize(input_file)
+
+    if fast:
+        blocks = [(_get_first_instance(input_file, binary), None, size)]
+    else:
+        blocks = get_instance_index(input_file)
+        if len(blocks) == 0:
+            messages.append('File {} does not contain an \'instance\' string'.format(input_file))
+        blocks = [block for block in blocks if block[0] in instances]
+
+    insertions = []
+    with open(input_file, 'rb') as f:
+        for (instance, start, end) in blocks:
+            if (function, instance, dimension) not in info_dict:
+                messages.append('Encountered problem in file {}\nMissing instance {} in the .info files'.format(
+                    input_file, instance))
+                continue
+            if not fast:
+                if binary:
+                    comments = list(read_binary_archive(input_file, start, end, skip_solutions=True))
+                    last_line = comments[-1] if len(comments) > 0 else None
+                else:
+                    last_line = read_last_line(f, start, end)
+                if last_line is not None and last_line[0] == '%' and 'evaluations' in last_line:
+                    continue
+            data = _evaluations_comment(info_dict[(function, instance, dimension)], binary)
+            if not binary and end > 0:
+                # Make sure the comment starts in a new line
+                f.seek(end - 1)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data
+            insertions.append((end, data))
+        f.close()
 
-            if instance_found:
-                inspect_line(input_file, last_line, info_dict[(function, instance, dimension)])
+    if len(insertions) == 1 and insertions[0][0] == size:
+        with open(input_file, 'ab') as f:
+            f.write(insertions[0][1])
             f.close()
+    elif len(insertions) > 0:
+        insert_in_place(input_file, insertions)
+    return messages
 
 
-def evaluations_append(input_paths, functions, instances, dimensions, fast=False):
-    """Appends the comment `% evaluations = NUMBER` to the end of every instance in the .adat files created by the
-       bbob-biobj logger.
+def inspect_line(input_file, line_string, evaluations, max_diff=1e5):
+    """Checks that the line_string contains at least three numbers and that they are correctly written. Returns a
+       list of messages, including one if the difference between the evaluations and the first number in the
+       line_string is greater than max_diff.
+    """
+    messages = []
+    num_items = len(line_string.split())
+    if num_items < 3:
+        messages.append("File {}, line {} too short".format(input_file, line_string))
+    for i in range(num_items):
+        try:
+            float(line_string.split()[i])
+        except ValueError:
+            messages.append('File {}, line {}, number {} incorrect'.format(input_file, line_string,
+                                                                          line_string.split()[i]))
+            continue
 
-       If fast is True, it assumes the file contains only one instance (the instance is read from the file contents,
-       not the file name) and appends the comment only once - at the end of the file. No check whether this should be
-       done is performed - the user should know when it is safe to choose this option.
+    if evaluations - int(line_string.split()[0]) > max_diff:
+        messages.append('Mismatch in evaluations in file {}\n'
+                        '.info  = {}\n'
+                        '.adat  = {}\n'
+                        ' diff  = {}\n'.format(input_file, evaluations, line_string.split()[0],
+                                               evaluations - int(line_string.split()[0])))
+    return messages
 
-       The NUMBER is retrieved from the corresponding .info file.
-       Takes into account only the given functions, instances and dimensions.
+
+def check_file(input_file, info_dict, instances, max_diff=1000):
+    """Checks the last solution of every instance in the given .adat file against the number of evaluations in the
+       info_dict (see inspect_line). Returns a list of messages on the encountered problems.
+
+       The last solution of each instance is read backwards from the end of its block in the text format and from the
+       last block of solutions in the binary format.
     """
+    messages = []
+    (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
+    binary = is_binary_archive(input_file)
+    with open(input_file, 'rb') as f:
+        for (instance, start, end) in get_instance_index(input_file):
+            if instance not in instances:
+                continue
+            if (function, instance, dimension) not in info_dict:
+                messages.append('Encountered problem in file {}\nMissing instance {} in the .info files'.format(
+                    input_file, instance))
+                continue
+            if binary:
+                last_line = None
+                for record in read_binary_archive(input_file, start, end):
+                    if isinstance(record, BinaryArchiveBlock) and len(record) > 0:
+                        last_line = BinaryArchiveBlock(record.evaluations[-1:], record.f[-1:], record.x[-1:],
+                                                       record.integer_variables, record.precision_f,
+                                                       record.precision_x).lines()[0]
+            else:
+                last_line = read_last_line(f, start, end, skip_comments=True)
+            if last_line is not None:
+                messages += inspect_line(input_file, last_line, info_dict[(function, instance, dimension)], max_diff)
+        f.close()
+    return messages
 
-    # Check whether .info and .adat files exist in the input paths
-    info_files = get_file_name_list(input_paths, ".info")
-    if len(info_files) == 0:
-        raise PreprocessingException('Folder {} does not contain .info files'.format(input_paths))
 
-    adat_files = get_file_name_list(input_paths, ".adat")
-    if len(adat_files) == 0:
-        raise PreprocessingException('Folder {} does not contain .adat files'.format(input_paths))
+def _append_file_evaluations(args):
+    """Calls append_file_evaluations with the given tuple of arguments in a worker process.
+    """
+    return append_file_evaluations(*args)
 
-    info_dict = {}
-    for input_file in info_files:
-        try:
-            info_data_list = parse_info_file(input_file)
-        except ValueError as error:
-            raise PreprocessingException('Cannot read file {}\n{}'.format(input_file, error))
 
-        for info_data_item in info_data_list:
-            (function, instance, dimension, evaluations) = info_data_item
-            if (function not in functions) or (instance not in instances) or (dimension not in dimensions):
-                continue
-            info_dict[(function, instance, dimension)] = evaluations
+def _check_file(args):
+    """Calls check_file with the given tuple of arguments in a worker process.
+    """
+    return check_file(*args)
 
-    for input_file in adat_files:
-        try:
-            (suite_name, function, instance, dimension) = parse_archive_file_name(input_file)
-            if (function not in functions) or (instance and instance not in instances) or \
-                    (dimension not in dimensions):
-                continue
-        except PreprocessingWarning as warning:
-            print('Skipping file {}\n{}'.format(input_file, warning))
-            continue
 
-        try:
-            if instance or fast:
-                # Assumes only one instance is contained in the file
-                with open(input_file, 'r') as f:
-                    for line in f:
-                        if (line[0] == '%') and ('instance' in line):
-                            instance = int(get_key_value(line[1:], 'instance'))
-                            break
-                    f.close()
-                with open(input_file, 'a') as f:
-                    f.write('% evaluations = {}'.format(info_dict[(function, instance, dimension)]))
-                    f.close()
+def _process_files(function, arguments, processes):
+    """Calls the function on each tuple of arguments, distributed among the given number of worker processes (in this
+       process if 1 and using the number of CPUs if None), and prints the returned messages in the order of the files.
+    """
+    pool = None if processes == 1 else multiprocessing.Pool(processes)
+    try:
+        results = map(function, arguments) if pool is None else pool.imap(function, arguments)
+        for messages in results:
+            for message in messages:
+                print(message)
+            sys.stdout.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def check_file_complete(input_paths, functions, instances, dimensions, max_diff=1000, processes=1):
+    """Checks the .adat files created by the bbob-biobj logger to see if they have been properly written. Outputs the
+       difference between the last evaluation from the .adat file and the one noted in the .info file if they are
+       greater than max_diff.
+
+       Takes into account only the given functions, instances and dimensions. The files are checked by the given
+       number of worker processes (see evaluations_append).
+    """
+    print('Reading .info files...')
+    info_dict, adat_files = get_input_files(input_paths, functions, instances, dimensions)
+
+    print('Reading .adat files...')
+    _process_files(_check_file, [(input_file, info_dict, instances, max_diff) for input_file in adat_files],
+                   processes)
+
+
+def evaluations_append(input_paths, functions, instances, dimensions, fast=False, processes=1):
+    """Appends the comment `% evaluations = NUMBER` to the end of every instance in the .adat files created by the
+       bbob-biobj logger (see append_file_evaluations).
+
+       If fast is True, it assumes the file contains only one instance (the instance is read from the file contents,
+       not the file name) and appends the comment only once - at the end of the file. No check whether this should be
+       done is performed - the user should know when it is safe to choose this option.
+
+       The NUMBER is retrieved from the corresponding .info file.
+       Takes into account only the given functions, instances and dimensions. The files are processed by the given
+       number of worker processes (in this process if 1 and using the number of CPUs if None).
+    """
+    info_dict, adat_files = get_input_files(input_paths, functions, instances, dimensions)
+    _process_files(_append_file_evaluations,
+                   [(input_file, info_dict, instances, fast) for input_file in adat_files], processes)
 
-            else:
-                first_instance = True
-                # Take care of the non-last instances in the file
-                for line in fileinput.input(input_file, inplace=True):
-                    if (line[0] == '%') and ('instance' in line):
-                        instance = int(get_key_value(line[1:], 'instance'))
-                        if first_instance:
-                            first_instance = False
-                        else:
-                            sys.stdout.write('% evaluations = {}\n'.format(info_dict[(function, instance, dimension)]))
-                    sys.stdout.write(line)
-                fileinput.close()
-
-                # Take care of the last instance in the file
-                with open(input_file, 'a') as f:
-                    f.write('% evaluations = {}'.format(info_dict[(function, instance, dimension)]))
-                    f.close()
-
-        except KeyError as error:
-            print('Encountered problem in file {}\n{}'.format(input_file, error))
-            fileinput.close()
-            continue
 
 if __name__ == '__main__':
     """Appends the comment `% evaluations = NUMBER` to the end of every instance in the algorithm archives.
@@ -217,11 +351,13 @@ if __name__ == '__main__':
                         help='dimensions to be included in the processing of archives')
     parser.add_argument('--fast', action='store_true',
                         help='fast option that assumes all archive files contain only one instance')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='number of processes among which the files are distributed (0 for the number of CPUs)')
     parser.add_argument('input', default=[], nargs='+', help='path(s) to the input folder(s)')
     args = parser.parse_args()
 
     print('Program called with arguments: \ninput folders = {}\nfast = {}'.format(args.input, args.fast))
     print('functions = {} \ninstances = {}\ndimensions = {}\n'.format(args.functions, args.instances, args.dimensions))
 
-    evaluations_append(args.input, args.functions, args.instances, args.dimensions, args.fast)
+    evaluations_append(args.input, args.functions, args.instances, args.dimensions, args.fast, args.processes or None)
     #check_file_complete(args.input, args.functions, args.instances, args.dimensions)
@@ -6,15 +6,64 @@ import numpy as np
 
 from cocoprep.archive_exceptions import PreprocessingWarning
 from cocoprep.archive_load_data import parse_archive_file_name, parse_range, get_key_value
+from cocoprep.archive_load_data import is_binary_archive, read_binary_archive, BinaryArchiveBlock
 from cocoprep.archive_functions import ArchiveInfo
 from cocoex import Suite, Observer
 
 
+def parse_solutions(lines, input_file):
+    """Returns the evaluation numbers and objective vectors of the solutions in the given lines of an archive
+       file as arrays.
+
+       All lines are parsed at once. If this is not possible, they are parsed one by one and the lines that cannot
+       be parsed are skipped.
+    """
+    try:
+        values = np.array(''.join(lines).split(), dtype=float)
+        number_of_columns = len(lines[0].split())
+        if values.size != len(lines) * number_of_columns or number_of_columns < 3:
+            raise ValueError()
+        values = values.reshape(len(lines), number_of_columns)
+    except ValueError:
+        rows = []
+        for line in lines:
+            try:
+                split = line.split()
+                rows.append([int(split[0]), float(split[1]), float(split[2])])
+            except ValueError as error:
+                print('Problem in file {}, line {}, skipping line\n{}'.format(input_file, line, error))
+        values = np.array(rows, dtype=float).reshape(len(rows), 3)
+    return values[:, 0].astype(int), values[:, 1:3]
+
+
+def feed_solutions(problem, lines, input_file, blocks=()):
+    """Feeds the solutions in the given lines of an archive file in the text format or in the given blocks of
+       solutions of an archive file in the binary format to the logger of the problem in one call.
+
+       Returns the number of solutions that did not update the archive and the evaluation number and objective
+       vector of the last solution (None if there are no solutions).
+    """
+    if len(blocks) > 0:
+        evaluations = np.concatenate([block.evaluations for block in blocks])
+        objective_vectors = np.concatenate([block.f for block in blocks])
+    elif len(lines) > 0:
+        evaluations, objective_vectors = parse_solutions(lines, input_file)
+    else:
+        return 0, None, None
+    if len(evaluations) == 0:
+        return 0, None, None
+    updated = problem.logger_biobj_feed_solutions(evaluations, objective_vectors)
+    return len(updated) - np.count_nonzero(updated), evaluations[-1], objective_vectors[-1]
+
+
 def log_reconstruct(input_path, output_path, algorithm_name, algorithm_info, functions, instances, dimensions):
     """Reconstructs the .info, .dat and .tdat files produced by the logger from the .adat files in the input_path.
 
        Takes into account only the given functions, instances and dimensions. If any .info, .dat and .tdat files of
        the same names already exist in the output_path, the new data is appended to them.
+
+       The solutions of each instance are read at once and fed to the logger in a single call. Archives in the binary
+       format are read without parsing any text.
     """
     ext_suite_name = 'bbob-biobj-ext'
     suite_name = 'bbob-biobj'
@@ -43,6 +92,7 @@ def log_reconstruct(input_path, output_path, algorithm_name, algorithm_info, fun
 
         (_suite_name, function, _instance, dimension) = parse_archive_file_name(input_file)
 
+        binary = is_binary_archive(input_file)
         with open(input_file, 'r') as f_in:
             print(input_file)
 
@@ -52,13 +102,29 @@ def log_reconstruct(input_path, output_path, algorithm_name, algorithm_info, fun
             instance = None
             count_not_updated = 0
             evaluation = 0
+            # The lines (or blocks) with solutions of the current instance that have not been fed to the logger yet
+            solution_lines = []
+            solution_blocks = []
+
+            for line in (read_binary_archive(input_file) if binary else f_in):
 
-            for line in f_in:
+                if isinstance(line, BinaryArchiveBlock):
+                    if instance in instances:
+                        solution_blocks.append(line)
+                    continue
 
-                if len(line.split()) < 3:
+                elif len(line.split()) < 3:
                     continue
 
                 elif line[0] == '%' and 'instance' in line:
+                    if problem is not None:
+                        count, last_evaluation, last_vector = feed_solutions(problem, solution_lines, input_file,
+                                                                             solution_blocks)
+                        count_not_updated += count
+                        if last_evaluation is not None:
+                            evaluation, objective_vector = last_evaluation, last_vector
+                        solution_lines = []
+                        solution_blocks = []
                     instance = int(get_key_value(line[1:], 'instance'))
                     if instance in instances:
                         if problem is not None:
@@ -74,18 +140,17 @@ def log_reconstruct(input_path, output_path, algorithm_name, algorithm_info, fun
                         evaluation_found = False
 
                 elif line[0] != '%' and instance in instances:
-                    try:
-                        split = line.split()
-                        evaluation = int(split[0])
-                        objective_vector = np.array(split[1:3])
-                        updated = problem.logger_biobj_feed_solution(evaluation, objective_vector)
-                        if updated == 0:
-                            count_not_updated += 1
-                    except ValueError as error:
-                        print('Problem in file {}, line {}, skipping line\n{}'.format(input_file, line, error))
-                        continue
+                    solution_lines.append(line)
 
                 elif line[0] == '%' and 'evaluations' in line:
+                    if problem is not None:
+                        count, last_evaluation, last_vector = feed_solutions(problem, solution_lines, input_file,
+                                                                             solution_blocks)
+                        count_not_updated += count
+                        if last_evaluation is not None:
+                            evaluation, objective_vector = last_evaluation, last_vector
+                        solution_lines = []
+                        solution_blocks = []
                     old_evaluation = evaluation
                     evaluation = int(get_key_value(line[1:], 'evaluations'))
                     evaluation_found = True
@@ -93,6 +158,9 @@ def log_reconstruct(input_path, output_path, algorithm_name, algorithm_info, fun
                         problem.logger_biobj_feed_solution(evaluation, objective_vector)
 
             if problem is not None:
+                count, _last_evaluation, _last_vector = feed_solutions(problem, solution_lines, input_file,
+                                                                       solution_blocks)
+                count_not_updated += count
                 if not evaluation_found:
                     print('Missing the line `% evaluations = ` in this or the previous problem. This is file = {}, '
                           'instance = {}' .format(input_file, instance))
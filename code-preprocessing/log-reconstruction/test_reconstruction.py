@@ -154,6 +154,49 @@ def run_merge_lines():
                           abspath(join(root, name)).replace('exdata', 'test-data'))
 
 
+def run_evaluations_append():
+    """
+    Tests whether evaluations_append() from evaluations_append.py works correctly for the given input (the archives
+    without the lines with evaluations and the .info files from the reconstruction).
+    """
+    from evaluations_append import evaluations_append
+    from cocoprep.archive_load_data import parse_range
+    import shutil
+
+    base_path = dirname(__file__)
+    in_path = abspath(join(base_path, 'test-data', 'archives-input'))
+    out_path = abspath(join(base_path, 'exdata', 'evaluations'))
+    mkdir(out_path)
+    for name in ['1-separable_1-separable_hyp.info', '1-separable_2-moderate_hyp.info']:
+        shutil.copyfile(abspath(join(base_path, 'test-data', 'reconstruction', name)), join(out_path, name))
+
+    # Remove the lines with evaluations and put two instances into the same file
+    expected = {}
+    for root, dirs, files in walk(in_path):
+        for name in files:
+            lines = [line.rstrip('\n') + '\n' for line in get_lines(join(root, name))]
+            expected[name] = [line for line in lines if 'evaluations' in line]
+            with open(join(out_path, name), 'w') as f:
+                f.writelines([line for line in lines if 'evaluations' not in line])
+    multi_name = 'bbob-biobj_f01_d02_nondom_all.adat'
+    with open(join(out_path, multi_name), 'w') as f:
+        for name in ['bbob-biobj_f01_i01_d02_nondom_all.adat', 'bbob-biobj_f01_i02_d02_nondom_all.adat']:
+            f.writelines(get_lines(join(out_path, name)))
+            expected[multi_name] = expected.get(multi_name, []) + expected[name]
+
+    evaluations_append(out_path, parse_range('1-55'), parse_range('1-10'), parse_range('2,3,5,10,20,40'),
+                       processes=2)
+    for name in expected:
+        lines = get_lines(join(out_path, name))
+        assert [line for line in lines if 'evaluations' in line] == expected[name]
+        assert lines[-1] == expected[name][-1]
+
+    # The lines are not appended again
+    lines = get_lines(join(out_path, multi_name))
+    evaluations_append(out_path, parse_range('1-55'), parse_range('1-10'), parse_range('2,3,5,10,20,40'))
+    assert get_lines(join(out_path, multi_name)) == lines
+
+
 def test_all():
     """
     Runs a number of tests to check whether the python scripts of log-reconstruction perform correctly.
@@ -166,6 +209,8 @@ def test_all():
 
     run_merge_lines()
 
+    run_evaluations_append()
+
     cleanup_reconstruction_data()
 
 